@@ -0,0 +1,51 @@
+"""Operación elemento a elemento sobre N enteros: arreglo vectorizado frente a un bucle en el lenguaje."""
+
+from src.interpreter.interpreter import Interpreter
+from benchmarks.common import parse, quiet, timed
+
+N = 200_000
+
+LITERAL = f"[{', '.join(str(i) for i in range(N))}]"
+
+# Solo construir el literal: se descuenta de las otras dos mediciones
+BASELINE = f'''
+let xs = {LITERAL};
+{(N - 1) * 3 + 1};
+'''
+
+# La operación vectorizada es demasiado rápida para medirla una sola vez
+REPEAT = 50
+
+VECTORIZED = f'''
+let xs = {LITERAL};
+{"let ys = xs * 3 + 1;" * REPEAT}
+ys[{N - 1}];
+'''
+
+LOOP = f'''
+let xs = {LITERAL};
+let last = 0;
+for (x in xs) {{ let last = x * 3 + 1; }}
+last;
+'''
+
+
+def run(source: str) -> float:
+    with quiet():
+        program = parse(source)
+        result, seconds = timed(lambda: Interpreter().interpret(program))
+    assert result.value == (N - 1) * 3 + 1
+    return seconds
+
+
+def main() -> None:
+    baseline = run(BASELINE)
+    vectorized = (run(VECTORIZED) - baseline) / REPEAT
+    loop = run(LOOP) - baseline
+    print(f"literal de {N} enteros: {baseline:.3f}s")
+    print(f"xs * 3 + 1 vectorizado: {vectorized:.4f}s")
+    print(f"bucle for equivalente:  {loop:.3f}s  ({loop / vectorized:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Muchos scripts concurrentes en un solo hilo con AsyncInterpreter.
+
+10 000 scripts duermen 100 ms cada uno y hacen un poco de cálculo; si la
+E/S no bloquea, el total tarda poco más que una sola espera más el
+cálculo acumulado (que se mide aparte, sin sleep). Después, 1 000 scripts hacen `http_get` contra un
+servidor local de prueba.
+"""
+
+import asyncio
+
+from src.builtins import OutputSink
+from src.interpreter import AsyncInterpreter
+from benchmarks.common import parse
+
+SCRIPTS = 10_000
+HTTP_SCRIPTS = 1_000
+
+WORK = '''
+let square = function(x) { x * x };
+let total = 0;
+for (i in range(10)) { let total = total + square(i); }
+total;
+'''
+SLEEPER = parse('sleep(100);' + WORK)
+COMPUTE = parse(WORK)
+
+
+async def _serve(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    await reader.readuntil(b"\r\n\r\n")
+    writer.write(b"HTTP/1.0 200 OK\r\nContent-Type: text/plain\r\n\r\nok")
+    await writer.drain()
+    writer.close()
+
+
+async def main() -> None:
+    interpreter = AsyncInterpreter(output=OutputSink.capture())
+
+    _, compute = await _timed_gather(interpreter.interpret_async(COMPUTE) for _ in range(SCRIPTS))
+    results, seconds = await _timed_gather(interpreter.interpret_async(SLEEPER) for _ in range(SCRIPTS))
+    assert all(result.value == 285 for result in results)
+    print(f"{SCRIPTS} scripts con sleep(100): {seconds:.2f}s "
+          f"(solo cálculo: {compute:.2f}s; espera secuencial: {SCRIPTS * 0.1:.0f}s)")
+
+    server = await asyncio.start_server(_serve, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    program = parse(f"http_get('http://127.0.0.1:{port}/');")
+    async with server:
+        results, seconds = await _timed_gather(interpreter.interpret_async(program) for _ in range(HTTP_SCRIPTS))
+    assert all(result.inspect() == "ok" for result in results), results[0].inspect()
+    print(f"{HTTP_SCRIPTS} scripts con http_get: {seconds:.2f}s ({HTTP_SCRIPTS / seconds:.0f} peticiones/s)")
+
+
+async def _timed_gather(coroutines):
+    start = asyncio.get_running_loop().time()
+    results = await asyncio.gather(*coroutines)
+    return results, asyncio.get_running_loop().time() - start
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,39 @@
+"""Rendimiento del ejecutor por lotes según el número de workers.
+
+Compara un bucle secuencial Lexer → Parser → Interpreter (un intérprete
+caliente en el propio proceso) con el pool de procesos, enviando fuente o
+AST serializado. El rendimiento del pool debería crecer con los núcleos.
+"""
+
+import os
+
+from src.builtins import OutputSink
+from src.interpreter.interpreter import Interpreter
+from src.runner import BatchRunner, Job, execute
+from benchmarks.common import timed
+
+JOBS = 2000
+
+SOURCE = '''
+let fib = function(n) {{ if (n < 2) {{ return n; }} fib(n - 1) + fib(n - 2) }};
+fib({n});
+'''
+
+
+def main() -> None:
+    jobs = [Job(str(index), source=SOURCE.format(n=8 + index % 5)) for index in range(JOBS)]
+    interpreter = Interpreter(output=OutputSink.capture())
+    _, seconds = timed(lambda: [execute(interpreter, job) for job in jobs])
+    print(f"secuencial      : {JOBS / seconds:8.1f} trabajos/s")
+    cpus = os.cpu_count() or 1
+    for workers in sorted({1, 2, cpus}):
+        for ship_ast in (False, True):
+            with BatchRunner(workers=workers, ship_ast=ship_ast) as runner:
+                results, seconds = timed(lambda: list(runner.run(jobs)))
+            assert all(result.ok for result in results)
+            label = "ast" if ship_ast else "fuente"
+            print(f"{workers:>2} workers {label:>6}: {JOBS / seconds:8.1f} trabajos/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Sumar N enteros: recursión interpretada frente a los builtins nativos."""
+
+import sys
+
+from src.interpreter.interpreter import Interpreter
+from benchmarks.common import parse, quiet, timed
+
+N = 300
+REPEAT = 20
+
+RECURSIVE = f'''
+let total = function(i, acc) {{
+    if (i < {N}) {{ return total(i + 1, acc + i); }} else {{ return acc; }}
+}};
+total(0, 0);
+'''
+
+REDUCE = f'''
+reduce(function(acc, x) {{ acc + x }}, range({N}), 0);
+'''
+
+SUM_RANGE = f'''
+sum(range({N}));
+'''
+
+SUM_ARRAY = f'''
+sum([{', '.join(str(i) for i in range(N))}]);
+'''
+
+
+def per_element(source: str) -> float:
+    with quiet():
+        program = parse(source)
+        interpreter = Interpreter()
+        results, seconds = timed(lambda: [interpreter.interpret(program) for _ in range(REPEAT)])
+    assert results[-1].value == N * (N - 1) // 2
+    return seconds / (N * REPEAT)
+
+
+def main() -> None:
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 50 * N))
+    baseline = per_element(RECURSIVE)
+    print(f"{'recursión':>16}: {baseline * 1e6:.3f} µs/elemento")
+    for label, source in (("reduce", REDUCE), ("sum(range)", SUM_RANGE), ("sum(arreglo)", SUM_ARRAY)):
+        cost = per_element(source)
+        print(f"{label:>16}: {cost * 1e6:.3f} µs/elemento ({baseline / cost:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
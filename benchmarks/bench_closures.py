@@ -0,0 +1,51 @@
+"""Memoria retenida por clausuras de larga vida, con y sin conversión de clausuras.
+
+Cada llamada a `make` crea una cadena grande en su marco y devuelve una
+clausura que solo usa `base`. Sin conversión, cada clausura mantiene viva la
+cadena; con conversión solo retiene la celda de `base`.
+"""
+
+import gc
+import tracemalloc
+
+from src.interpreter.interpreter import Interpreter
+from benchmarks.common import parse, quiet
+
+CLOSURES = 200
+CHUNK = "x" * 10_000
+
+
+def build_source(count: int) -> str:
+    lines = [
+        "let make = function(base, seed) {",
+        "    let big = seed + seed;",
+        "    return function(x) { return x + base; };",
+        "};",
+    ]
+    lines += [f"let c{i} = make({i}, '{CHUNK}');" for i in range(count)]
+    lines.append("c0(1);")
+    return "\n".join(lines)
+
+
+def peak_bytes(closure_conversion: bool) -> int:
+    with quiet():
+        program = parse(build_source(CLOSURES))
+    interpreter = Interpreter(closure_conversion=closure_conversion)
+    gc.collect()
+    tracemalloc.start()
+    with quiet():
+        interpreter.interpret(program)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main() -> None:
+    for enabled in (False, True):
+        peak = peak_bytes(enabled)
+        label = "con conversión" if enabled else "sin conversión"
+        print(f"{label:>16}: pico {peak / 1024:,.0f} KiB para {CLOSURES} clausuras")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Evaluación por columnas frente a fila a fila, en registros por segundo.
+
+La misma regla (aritmética entera, comparaciones, `if` y una llamada a una
+función del preludio) se evalúa con `PreparedProgram.run` para cada
+registro y con `run_batch` sobre el lote completo.
+"""
+
+from src.builtins import OutputSink
+from src.interpreter import Interpreter, PreparedProgram
+from benchmarks.common import parse, timed
+
+RECORDS = 100000
+
+RULE = parse('''
+let total = importe * cantidad - descuento;
+if (total > limite(vip)) { 'revisar' } else { total / cantidad };
+''')
+
+
+def main() -> None:
+    interpreter = Interpreter(output=OutputSink.capture())
+    prelude = interpreter.snapshot(parse('let limite = function(vip) { if (vip) { return 5000; } 1000 };'))
+    prepared = PreparedProgram(RULE, ["importe", "cantidad", "descuento", "vip"], interpreter, prelude)
+    columns = {
+        "importe": [index % 700 for index in range(RECORDS)],
+        "cantidad": [index % 9 for index in range(RECORDS)],
+        "descuento": [index % 50 for index in range(RECORDS)],
+        "vip": [index % 4 == 0 for index in range(RECORDS)],
+    }
+    rows = [dict(zip(columns, values)) for values in zip(*columns.values())]
+    by_row, row_seconds = timed(lambda: [prepared.run(row) for row in rows])
+    batch, batch_seconds = timed(lambda: prepared.run_batch(columns))
+    assert [value.inspect() for value in batch] == [value.inspect() for value in by_row]
+    print(f"fila a fila : {RECORDS / row_seconds:10.0f} registros/s")
+    print(f"por columnas: {RECORDS / batch_seconds:10.0f} registros/s")
+
+
+if __name__ == "__main__":
+    main()
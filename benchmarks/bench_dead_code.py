@@ -0,0 +1,59 @@
+"""Tamaño del AST y tiempo de compilar y ejecutar código generado, con y sin código muerto.
+
+El script imita la salida de un generador: funciones con temporales que
+nadie lee y sentencias tras el `return`. Se compara parsear y ejecutar
+con parsear, optimizar con `eliminate_dead_code` y ejecutar.
+"""
+
+from src.builtins import OutputSink
+from src.interpreter import Interpreter
+from src.optimizer import eliminate_dead_code
+from src.optimizer.tree import count_nodes
+from benchmarks.common import parse, timed
+
+FUNCTIONS = 300
+CALLS = 20
+
+TEMPLATE = '''
+let regla_{index} = function(importe, vip) {{
+    let tmp_a = importe;
+    let tmp_b = [tmp_a, vip, 'regla_{index}'];
+    let tmp_c = {{'id': {index}, 'activa': true}};
+    let tmp_d = !vip;
+    if (vip) {{ return importe * 2; }} else {{ return importe + {index}; }}
+    let tmp_e = importe * 3;
+    print(tmp_e);
+}};
+'''
+
+
+def main() -> None:
+    source = "".join(TEMPLATE.format(index=index) for index in range(FUNCTIONS))
+    source += "".join(f"regla_{index % FUNCTIONS}({index}, {str(index % 2 == 0).lower()});"
+                      for index in range(FUNCTIONS * CALLS))
+    interpreter = Interpreter(output=OutputSink.capture())
+
+    program = parse(source)
+    nodes_before = count_nodes(program)
+    report = eliminate_dead_code(program)
+    print(f"nodos      : {nodes_before:8d} -> {nodes_before - report.nodes_removed:8d}"
+          f" ({report.statements_removed} sentencias eliminadas)")
+
+    _, plain_seconds = timed(lambda: interpreter.interpret(parse(source)))
+
+    def optimized() -> None:
+        program = parse(source)
+        eliminate_dead_code(program)
+        interpreter.interpret(program)
+
+    _, optimized_seconds = timed(optimized)
+    original = parse(source)
+    _, run_original = timed(lambda: interpreter.interpret(original))
+    _, run_optimized = timed(lambda: interpreter.interpret(program))
+    print(f"sin pasada : {plain_seconds * 1000:8.1f} ms (parsear + ejecutar)")
+    print(f"con pasada : {optimized_seconds * 1000:8.1f} ms (parsear + optimizar + ejecutar)")
+    print(f"solo ejecutar: {run_original * 1000:8.1f} ms -> {run_optimized * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Latencia de arranque: proceso nuevo frente al servidor fork.
+
+Un proceso Python nuevo paga importaciones y parseo del preludio en cada
+trabajo. Con el servidor fork solo queda el viaje por el socket Unix: el
+hijo ya está creado, caliente y esperando en `accept`. Se muestra también
+el tiempo de ejecución medido dentro del hijo.
+"""
+
+import multiprocessing
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from src.runner.forkserver import ForkServer, ForkServerClient
+
+RUNS = 200
+PRELUDE = "let doble = function(x) { x * 2 };"
+SOURCE = "doble(21);"
+
+COLD = f'''
+from src.builtins import OutputSink
+from src.interpreter.interpreter import Interpreter
+from src.runner import Job, execute, parse_source
+execute(Interpreter(output=OutputSink.capture()), Job("0", source={SOURCE!r}), prelude=[parse_source({PRELUDE!r})])
+'''
+
+
+def main() -> None:
+    cold = []
+    for _ in range(20):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", COLD], check=True, cwd=os.getcwd())
+        cold.append(time.perf_counter() - start)
+    print(f"proceso nuevo     : {statistics.median(cold) * 1000:8.2f} ms (mediana)")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "lpp.sock")
+        server = ForkServer(path, preludes=[PRELUDE])
+        process = multiprocessing.get_context("fork").Process(target=server.serve_forever, args=(RUNS,))
+        process.start()
+        client = ForkServerClient(path)
+        client.wait_ready()
+        round_trips, executions = [], []
+        for _ in range(RUNS):
+            start = time.perf_counter()
+            result = client.run(SOURCE)
+            round_trips.append(time.perf_counter() - start)
+            executions.append(result.seconds)
+            # Deja que el padre reponga el hijo consumido, como entre peticiones reales
+            time.sleep(0.002)
+        process.join()
+    print(f"servidor fork     : {statistics.median(round_trips) * 1000:8.2f} ms (mediana, ida y vuelta)")
+    print(f"  ejecución hijo  : {statistics.median(executions) * 1000:8.2f} ms (mediana)")
+
+
+if __name__ == "__main__":
+    main()
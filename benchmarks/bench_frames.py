@@ -0,0 +1,33 @@
+"""Asignaciones de marcos por llamada en una carga recursiva (fibonacci ingenuo)."""
+
+from src.interpreter.interpreter import Interpreter
+from benchmarks.common import parse, quiet, timed
+
+SOURCE = '''
+let fib = function(n) {
+    if (n < 2) { return n; } else { return fib(n - 1) + fib(n - 2); }
+};
+fib(18);
+'''
+
+
+def main() -> None:
+    with quiet():
+        program = parse(SOURCE)
+    for frame_pool in (False, True):
+        interpreter = Interpreter(frame_pool=frame_pool)
+        with quiet():
+            result, seconds = timed(lambda: interpreter.interpret(program))
+        stats = interpreter.frame_stats
+        label = "con pool" if frame_pool else "sin pool"
+        if stats is None:
+            print(f"{label:>9}: fib={result.inspect()} en {seconds:.3f}s (un Environment por llamada)")
+        else:
+            calls = stats.allocated + stats.reused
+            print(f"{label:>9}: fib={result.inspect()} en {seconds:.3f}s, "
+                  f"{stats.allocated} marcos asignados para {calls} llamadas "
+                  f"({stats.allocated / calls:.4f} por llamada)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Escalado del Hash persistente (HAMT) de 10^3 a 10^6 claves.
+
+Para cada tamaño mide, por operación:
+- build: insertar todas las claves una a una (cada inserción crea un mapa nuevo);
+- lookup: búsquedas de claves existentes;
+- update: `set` sobre el mapa completo, conservando la versión anterior;
+- copia dict: lo que costaría la misma actualización copiando un dict.
+"""
+
+import random
+
+from src.config.object import Hash, Integer, String
+from benchmarks.common import timed
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+SAMPLES = 20_000
+
+
+def main() -> None:
+    rng = random.Random(0)
+    print(f"{'claves':>9} {'build':>9} {'lookup':>9} {'update':>9} {'copia dict':>11}  (µs/op)")
+    for size in SIZES:
+        keys = [String(f"clave{index}") for index in range(size)]
+        values = [Integer(index) for index in range(size)]
+
+        def build() -> Hash:
+            mapping = Hash()
+            for key, value in zip(keys, values):
+                mapping = mapping.set(key, value)
+            return mapping
+
+        mapping, build_seconds = timed(build)
+        probes = [rng.choice(keys) for _ in range(SAMPLES)]
+        _, lookup_seconds = timed(lambda: [mapping.get(key) for key in probes])
+        _, update_seconds = timed(lambda: [mapping.set(key, values[0]) for key in probes])
+
+        plain = {(key.type(), key.value): value for key, value in zip(keys, values)}
+        copies = max(1, SAMPLES // size)
+        _, copy_seconds = timed(lambda: [dict(plain) for _ in range(copies)])
+
+        print(f"{size:>9} {build_seconds / size * 1e6:>9.2f} {lookup_seconds / SAMPLES * 1e6:>9.2f} "
+              f"{update_seconds / SAMPLES * 1e6:>9.2f} {copy_seconds / copies * 1e6:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
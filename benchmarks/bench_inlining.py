@@ -0,0 +1,44 @@
+"""Coste de llamadas a funciones pequeñas con y sin inlining.
+
+Un bucle caliente llama a funciones de una expresión (acceso, escala,
+comparación), el patrón típico de reglas generadas. Se compara la
+ejecución del programa original con la del programa tras
+`inline_functions`.
+"""
+
+from src.interpreter import Interpreter
+from src.optimizer import inline_functions
+from benchmarks.common import parse, timed
+
+ITERATIONS = 20000
+
+SOURCE = f'''
+let factor = 3;
+let escala = function(x) {{ x * factor }};
+let mas = function(a, b) {{ a + b }};
+let dentro = function(x, limite) {{ if (x < limite) {{ true }} else {{ false }} }};
+let total = 0;
+let contados = 0;
+for (i in range({ITERATIONS})) {{
+    let total = mas(total, escala(i));
+    if (dentro(i, 5000)) {{ let contados = mas(contados, 1); }}
+}};
+[total, contados];
+'''
+
+
+def main() -> None:
+    interpreter = Interpreter()
+    original = parse(SOURCE)
+    optimized = parse(SOURCE)
+    report = inline_functions(optimized)
+    expected, plain_seconds = timed(lambda: interpreter.interpret(original))
+    result, inlined_seconds = timed(lambda: interpreter.interpret(optimized))
+    assert result.inspect() == expected.inspect()
+    print(f"sitios inlineados: {report.sites}")
+    print(f"sin inlining: {plain_seconds * 1000:8.1f} ms")
+    print(f"con inlining: {inlined_seconds * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
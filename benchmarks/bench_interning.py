@@ -0,0 +1,34 @@
+"""Memoria del AST de un script generado con y sin hash-consing.
+
+El script repite miles de veces las mismas subexpresiones y cuerpos de
+función, como el código que produce una plantilla. Se informa de nodos y
+bytes antes y después de `Interner.intern` y de lo que cuesta la pasada.
+"""
+
+from src.astNode import Interner
+from benchmarks.common import parse, timed
+
+RULES = 2000
+
+TEMPLATE = '''
+let regla_{index} = function(importe, vip) {{
+    if (vip) {{ return importe * 2 + 100; }}
+    importe * 2 + 10
+}};
+let umbral_{index} = [1, 2, 3, 4, 5];
+let aplicada_{index} = regla_{index}(umbral_{index}[0] * 2 + 1, true);
+'''
+
+
+def main() -> None:
+    source = "".join(TEMPLATE.format(index=index) for index in range(RULES))
+    program = parse(source)
+    report, seconds = timed(lambda: Interner().intern(program))
+    print(f"nodos : {report.nodes_before:9d} -> {report.nodes_after:9d}")
+    print(f"bytes : {report.bytes_before:9d} -> {report.bytes_after:9d}"
+          f" ({report.saved_bytes / report.bytes_before:.0%} menos)")
+    print(f"pasada: {seconds * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
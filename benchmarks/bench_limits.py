@@ -0,0 +1,37 @@
+"""Sobrecoste de los límites de ejecución (fuel + timeout) frente a no usarlos.
+
+Cada carga se ejecuta alternando con y sin límites y se compara el mejor
+tiempo de cada serie (el menos afectado por el ruido); el objetivo es
+mantener el sobrecoste por debajo del 5%.
+"""
+
+from src.builtins import OutputSink
+from src.interpreter.interpreter import Interpreter
+from benchmarks.common import parse, timed
+
+REPEAT = 9
+
+WORKLOADS = {
+    "while": 'let i = 0; while (i < 100000) { let i = i + 1; } i;',
+    "for": 'let total = 0; for (i in range(100000)) { let total = total + i; } total;',
+    "fib": 'let fib = function(n) { if (n < 2) { return n; } fib(n - 1) + fib(n - 2) }; fib(20);',
+    "map": 'sum(map(function(x) { x * 2 }, range(100000)));',
+}
+
+
+def main() -> None:
+    for name, source in WORKLOADS.items():
+        program = parse(source)
+        interpreter = Interpreter(output=OutputSink.capture())
+        plain, limited = [], []
+        for _ in range(REPEAT):
+            plain.append(timed(lambda: interpreter.interpret(program))[1])
+            limited.append(timed(lambda: interpreter.interpret(program, fuel=10**9, timeout=3600))[1])
+        base = min(plain)
+        with_limits = min(limited)
+        print(f"{name:>6}: sin límites {base * 1000:7.1f} ms, con límites {with_limits * 1000:7.1f} ms "
+              f"({(with_limits / base - 1) * 100:+.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Coste por iteración: while/for nativos frente a la recursión equivalente."""
+
+import sys
+
+from src.interpreter.interpreter import Interpreter
+from benchmarks.common import parse, quiet, timed
+
+N = 300
+REPEAT = 20
+
+RECURSIVE = f'''
+let sum = function(i, acc) {{
+    if (i < {N}) {{ return sum(i + 1, acc + i); }} else {{ return acc; }}
+}};
+sum(0, 0);
+'''
+
+WHILE = f'''
+let i = 0;
+let acc = 0;
+while (i < {N}) {{ let acc = acc + i; let i = i + 1; }}
+acc;
+'''
+
+FOR = f'''
+let acc = 0;
+for (i in range({N})) {{ let acc = acc + i; }}
+acc;
+'''
+
+
+def per_iteration(source: str) -> float:
+    with quiet():
+        program = parse(source)
+        interpreter = Interpreter()
+        _, seconds = timed(lambda: [interpreter.interpret(program) for _ in range(REPEAT)])
+    return seconds / (N * REPEAT)
+
+
+def main() -> None:
+    # La versión recursiva necesita varios marcos Python por llamada del lenguaje
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 50 * N))
+    baseline = per_iteration(RECURSIVE)
+    print(f"{'recursión':>10}: {baseline * 1e6:.2f} µs/iteración")
+    for label, source in (("while", WHILE), ("for", FOR)):
+        cost = per_iteration(source)
+        print(f"{label:>10}: {cost * 1e6:.2f} µs/iteración ({baseline / cost:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""Informe de memoria (pico por tipo) y coste de la contabilidad en varias cargas.
+
+Sirve para dimensionar los workers: el pico informado es una cota superior
+de lo que un script retiene durante la ejecución.
+"""
+
+from src.builtins import OutputSink
+from src.interpreter.interpreter import Interpreter
+from benchmarks.common import parse, timed
+
+REPEAT = 5
+
+WORKLOADS = {
+    "strings": "let s = ''; for (i in range(20000)) { let s = s + 'abc'; } len(s);",
+    "fib": 'let fib = function(n) { if (n < 2) { return n; } fib(n - 1) + fib(n - 2) }; fib(18);',
+    "deep": 'let f = function(n) { if (n == 0) { return 0; } 1 + f(n - 1) }; f(300);',
+}
+
+
+def main() -> None:
+    for name, source in WORKLOADS.items():
+        program = parse(source)
+        plain = Interpreter(output=OutputSink.capture())
+        tracked = Interpreter(output=OutputSink.capture(), track_memory=True)
+        base = min(timed(lambda: plain.interpret(program))[1] for _ in range(REPEAT))
+        with_tracking = min(timed(lambda: tracked.interpret(program))[1] for _ in range(REPEAT))
+        report = tracked.memory_report
+        peaks = ", ".join(f"{kind} {usage.peak / 1024:.1f} KiB" for kind, usage in report.by_type.items())
+        print(f"{name:>8}: pico {report.peak / 1024:8.1f} KiB ({peaks}); "
+              f"contabilidad {(with_tracking / base - 1) * 100:+.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""Programa que imprime N líneas: salida en búfer frente a un write por línea."""
+
+import os
+import tempfile
+
+from src.builtins.output import FlushPolicy, OutputSink
+from src.interpreter.interpreter import Interpreter
+from benchmarks.common import parse, timed
+
+N = 50_000
+
+SOURCE = f'''
+for (i in range({N})) {{ print('linea', i); }}
+'''
+
+
+def run(program, path: str, flush_policy: FlushPolicy) -> None:
+    # Fichero con búfer de línea: cada vaciado del sink llega al sistema operativo
+    with open(path, "w", buffering=1) as handle:
+        sink = OutputSink(handle, flush_policy=flush_policy)
+        _, seconds = timed(lambda: Interpreter(output=sink).interpret(program))
+    print(f"{flush_policy.name:>9}: {seconds:.3f}s, {sink.flushes} escrituras al fichero")
+    assert os.path.getsize(path) > 0
+
+
+def main() -> None:
+    program = parse(SOURCE)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "salida.txt")
+        for flush_policy in (FlushPolicy.LINE, FlushPolicy.BUFFERED):
+            run(program, path, flush_policy)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""Coste de arranque con un preludio: reevaluarlo en cada ejecución o usar una instantánea.
+
+Con la instantánea cada `interpret` solo crea una capa vacía sobre el
+entorno congelado, así que el tiempo por ejecución no debería crecer con
+el número de definiciones del preludio.
+"""
+
+import src.astNode as ast
+from src.builtins import OutputSink
+from src.interpreter.interpreter import Interpreter
+from benchmarks.common import parse, timed
+
+RUNS = 2000
+
+PROGRAM = parse("f0(20);")
+
+
+def prelude(size: int) -> ast.Program:
+    return parse("".join(f"let f{index} = function(x) {{ x + {index} }};\n" for index in range(size)))
+
+
+def main() -> None:
+    interpreter = Interpreter(output=OutputSink.capture())
+    for size in (10, 100, 1000):
+        definitions = prelude(size)
+        combined = ast.Program(definitions.statements + PROGRAM.statements)
+        _, reevaluated = timed(lambda: [interpreter.interpret(combined) for _ in range(RUNS)])
+        snapshot = interpreter.snapshot(definitions)
+        _, layered = timed(lambda: [interpreter.interpret(PROGRAM, prelude=snapshot) for _ in range(RUNS)])
+        print(f"{size:>5} definiciones: reevaluar {reevaluated / RUNS * 1e6:9.1f} µs/ejecución"
+              f" | instantánea {layered / RUNS * 1e6:7.1f} µs/ejecución")
+
+
+if __name__ == "__main__":
+    main()
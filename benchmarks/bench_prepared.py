@@ -0,0 +1,36 @@
+"""Rendimiento de una regla evaluada sobre muchos registros, en registros por segundo.
+
+Compara insertar los valores en el texto fuente (lexer + parser en cada
+registro) con un `PreparedProgram` que liga las entradas en cada `run`.
+"""
+
+from src.builtins import OutputSink
+from src.interpreter import Interpreter, PreparedProgram
+from benchmarks.common import parse, timed
+
+RECORDS = 20000
+
+RULE = '''
+let limite = function(vip) {{ if (vip) {{ return 1000; }} return 100; }};
+if (importe > limite(vip)) {{ 'revisar' }} else {{ 'aprobar' }};
+'''
+
+
+def main() -> None:
+    records = [{"importe": index % 1500, "vip": index % 3 == 0} for index in range(RECORDS)]
+    interpreter = Interpreter(output=OutputSink.capture())
+
+    def spliced() -> None:
+        for record in records:
+            source = f"let importe = {record['importe']}; let vip = {str(record['vip']).lower()};" + RULE
+            interpreter.interpret(parse(source.format()))
+
+    prepared = PreparedProgram(parse(RULE.format()), ["importe", "vip"], interpreter)
+    _, spliced_seconds = timed(spliced)
+    _, prepared_seconds = timed(lambda: [prepared.run(record) for record in records])
+    print(f"fuente por registro: {RECORDS / spliced_seconds:9.0f} registros/s")
+    print(f"PreparedProgram    : {RECORDS / prepared_seconds:9.0f} registros/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Rendimiento de ejecuciones repetidas con y sin caché de resultados.
+
+Una regla costosa (Fibonacci recursivo) se ejecuta con un conjunto pequeño
+de entradas que se repiten, como un servicio que recibe los mismos
+parámetros muchas veces. Se mide también el acierto desde SQLite con una
+caché nueva sobre el mismo fichero.
+"""
+
+import os
+import tempfile
+
+from src.interpreter import Interpreter, PreparedProgram, ResultCache
+from benchmarks.common import parse, timed
+
+RUNS = 2000
+DISTINCT = 5
+
+RULE = '''
+let fib = function(n) { if (n < 2) { return n; } fib(n - 1) + fib(n - 2) };
+fib(base + 10);
+'''
+
+
+def main() -> None:
+    inputs = [{"base": index % DISTINCT} for index in range(RUNS)]
+    program = parse(RULE)
+
+    plain = PreparedProgram(program, ["base"], Interpreter())
+    _, plain_seconds = timed(lambda: [plain.run(bindings) for bindings in inputs])
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "results.db")
+        cache = ResultCache(path=path)
+        cached = PreparedProgram(program, ["base"], Interpreter(result_cache=cache))
+        _, cached_seconds = timed(lambda: [cached.run(bindings) for bindings in inputs])
+        cache.close()
+
+        reopened = ResultCache(path=path)
+        from_disk = PreparedProgram(program, ["base"], Interpreter(result_cache=reopened))
+        _, disk_seconds = timed(lambda: [from_disk.run(bindings) for bindings in inputs])
+        reopened.close()
+
+    print(f"sin caché            : {RUNS / plain_seconds:9.0f} ejecuciones/s")
+    print(f"con caché en memoria : {RUNS / cached_seconds:9.0f} ejecuciones/s"
+          f" (acierto {cache.stats.hit_rate:.1%})")
+    print(f"caché nueva (SQLite) : {RUNS / disk_seconds:9.0f} ejecuciones/s"
+          f" ({reopened.stats.disk_hits} aciertos en disco)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""Memoria de una tubería perezosa (generador + map + filter + sum) según N.
+
+La memoria pico debe mantenerse constante al crecer N: ningún paso
+materializa la secuencia.
+"""
+
+import tracemalloc
+
+from src.builtins import OutputSink
+from src.interpreter.interpreter import Interpreter
+from benchmarks.common import parse, timed
+
+SIZES = (10_000, 100_000, 1_000_000)
+
+SOURCE = '''
+let naturals = function(n) {{ let i = 0; while (i < n) {{ yield i; let i = i + 1; }} }};
+sum(filter(function(x) {{ x / 3 * 3 == x }}, map(function(x) {{ x * 2 }}, naturals({n}))));
+'''
+
+
+def main() -> None:
+    for size in SIZES:
+        program = parse(SOURCE.format(n=size))
+        interpreter = Interpreter(output=OutputSink.capture())
+        tracemalloc.start()
+        result, seconds = timed(lambda: interpreter.interpret(program))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        expected = sum(2 * x for x in range(size) if (2 * x) % 3 == 0)
+        assert result.value == expected, result.inspect()
+        print(f"N={size:>9}: pico {peak / 1024:>7.1f} KiB, {seconds / size * 1e6:.2f} µs/elemento")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Construcción de una cadena de 10 MB por concatenación repetida en el lenguaje."""
+
+from unittest import mock
+
+from src.config.object import String
+from src.interpreter.interpreter import Interpreter
+from benchmarks.common import parse, quiet, timed
+
+CHUNK = "x" * 1000
+
+
+def build_source(size_bytes: int) -> str:
+    iterations = size_bytes // len(CHUNK)
+    return f'''
+        let chunk = '{CHUNK}';
+        let s = '';
+        for (i in range({iterations})) {{ let s = s + chunk; }}
+        s == s;
+        s;
+    '''
+
+
+def run(size_bytes: int) -> float:
+    with quiet():
+        program = parse(build_source(size_bytes))
+        result, seconds = timed(lambda: Interpreter().interpret(program).value)
+    assert len(result) == size_bytes
+    return seconds
+
+
+def flat_concat(left: String, right: String) -> String:
+    """Comportamiento anterior: copiar en cada concatenación."""
+    return String(left.value + right.value)
+
+
+def main() -> None:
+    for size in (1_000_000, 10_000_000):
+        print(f"rope  {size / 1e6:>4.0f} MB: {run(size):.3f}s")
+    with mock.patch.object(String, "concat", staticmethod(flat_concat)):
+        # A 10 MB la versión plana copia ~50 GB; se mide solo hasta 2 MB
+        for size in (1_000_000, 2_000_000):
+            print(f"plana {size / 1e6:>4.0f} MB: {run(size):.3f}s")
+
+
+if __name__ == "__main__":
+    main()
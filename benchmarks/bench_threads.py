@@ -0,0 +1,42 @@
+"""Rendimiento de un mismo Program ejecutado desde varios hilos.
+
+Con el GIL (CPython normal) el rendimiento total apenas cambia con los
+hilos; en un CPython sin GIL (p. ej. 3.13t, `python3.13t -X gil=0`) debería
+escalar con los núcleos, porque cada ejecución usa su propio contexto y
+solo se comparten cachés de análisis de solo lectura.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+import sys
+
+from src.builtins import OutputSink
+from src.interpreter.interpreter import Interpreter
+from benchmarks.common import parse, timed
+
+RUNS = 32
+THREADS = (1, 2, 4, 8)
+
+SOURCE = '''
+let fib = function(n) { if (n < 2) { return n; } fib(n - 1) + fib(n - 2) };
+fib(15);
+'''
+
+
+def main() -> None:
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'activo' if gil else 'desactivado'}, {os.cpu_count()} CPUs")
+    program = parse(SOURCE)
+    interpreter = Interpreter(output=OutputSink.capture())
+    baseline = None
+    for threads in THREADS:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            results, seconds = timed(lambda: list(pool.map(lambda _: interpreter.interpret(program), range(RUNS))))
+        assert all(result.value == 610 for result in results)
+        throughput = RUNS / seconds
+        baseline = baseline or throughput
+        print(f"{threads:>2} hilos: {throughput:7.1f} ejecuciones/s (x{throughput / baseline:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Coste de los operadores con y sin tipos inferidos.
+
+Un bucle caliente de aritmética entera y comparaciones sobre variables,
+el caso en que el evaluador sondea los tipos de ambos operandos en cada
+operación. Se compara la ejecución del programa original con la del
+programa anotado por `infer_types`, y se mide lo que cuesta la pasada.
+"""
+
+from src.interpreter import Interpreter
+from src.optimizer import infer_types
+from benchmarks.common import parse, timed
+
+ITERATIONS = 30000
+
+SOURCE = f'''
+let paso = function(acumulado, i) {{
+    let cuadrado = i * i;
+    if (cuadrado - i * 3 > acumulado / 1000) {{ acumulado + cuadrado / 7 }} else {{ acumulado - i }}
+}};
+let total = 0;
+let i = 0;
+while (i < {ITERATIONS}) {{
+    let total = paso(total, i);
+    let i = i + 1;
+}};
+total;
+'''
+
+
+def main() -> None:
+    interpreter = Interpreter()
+    original = parse(SOURCE)
+    annotated = parse(SOURCE)
+    report, inference_seconds = timed(lambda: infer_types(annotated))
+    interpreter.interpret(parse(SOURCE))  # calentamiento: la primera ejecución paga cachés e imports
+    expected, plain_seconds = timed(lambda: interpreter.interpret(original))
+    result, typed_seconds = timed(lambda: interpreter.interpret(annotated))
+    assert result.inspect() == expected.inspect()
+    print(f"nodos anotados: {report.annotated} ({report.iterations} vueltas, "
+          f"{inference_seconds * 1000:.1f} ms)")
+    print(f"sin tipos: {plain_seconds * 1000:8.1f} ms")
+    print(f"con tipos: {typed_seconds * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Utilidades compartidas por los benchmarks.
+
+Ejecutar desde la raíz del repositorio, por ejemplo:
+
+    python -m benchmarks.bench_closures
+"""
+
+import contextlib
+import io
+import time
+from typing import Callable, Iterator, Tuple, TypeVar
+
+import src.astNode as ast
+from src.lexer.lexer import Lexer
+from src.parser.parser_core import Parser
+
+T = TypeVar("T")
+
+
+def parse(source: str) -> ast.Program:
+    """Parsea `source` y falla si hay errores de sintaxis."""
+    parser = Parser(Lexer(source))
+    program = parser.parse_program()
+    if parser.errors:
+        raise SyntaxError("; ".join(parser.errors))
+    return program
+
+
+@contextlib.contextmanager
+def quiet() -> Iterator[None]:
+    """Descarta la salida estándar mientras se mide."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def timed(fn: Callable[[], T]) -> Tuple[T, float]:
+    """Ejecuta `fn` y devuelve (resultado, segundos)."""
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
@@ -18,19 +18,23 @@ parser = Parser(lexer)
 # Parsear el código fuente para obtener el AST
 program = parser.getProgram()
 
+# Toda la salida pasa por el canal del intérprete (un único write al final)
+interpreter = Interpreter()
+salida = interpreter.output
+
 # Verificar errores de parseo
 if parser.errors:
-    print("Errores de parseo:")
+    salida.write("Errores de parseo:\n")
     for error in parser.errors:
-        print(error)
+        salida.write(f"{error}\n")
 else:
     # Si no hay errores, interpretar el programa
-    interpreter = Interpreter()
     resultado = interpreter.interpret(program)
     
     # Si el resultado es un objeto Integer, muestra su valor
     if isinstance(resultado, Integer):
-        print(f"Resultado del programa: {resultado.value}")
+        salida.write(f"Resultado del programa: {resultado.value}\n")
     else:
-        print(f"Resultado del programa: {resultado}")
+        salida.write(f"Resultado del programa: {resultado}\n")
 
+salida.flush()
@@ -11,14 +11,19 @@ from .astNode import ASTNode, Statement, Expression, Program
 # Importar expresiones
 from .expression import (
     Identifier, Integer, Prefix, Infix, Boolean,
-    If, Function, Call, StringLiteral
+    If, Function, Call, StringLiteral, ArrayLiteral, Index, HashLiteral
 )
 
 # Importar declaraciones
 from .statement import (
-    LetStatement, ReturnStatement, ExpressionStatement, Block
+    LetStatement, ReturnStatement, ExpressionStatement, Block,
+    WhileStatement, ForStatement, YieldStatement
 )
 
+# Utilidades sobre árboles
+from .structural import structural_hash
+from .interning import Interner, InternReport, intern_tree
+
 # Exportar todas las clases para compatibilidad
 __all__ = [
     # Clases base
@@ -26,8 +31,12 @@ __all__ = [
     
     # Expresiones
     'Identifier', 'Integer', 'Prefix', 'Infix', 'Boolean',
-    'If', 'Function', 'Call', 'StringLiteral',
+    'If', 'Function', 'Call', 'StringLiteral', 'ArrayLiteral', 'Index', 'HashLiteral',
     
     # Declaraciones
-    'LetStatement', 'ReturnStatement', 'ExpressionStatement', 'Block'
+    'LetStatement', 'ReturnStatement', 'ExpressionStatement', 'Block',
+    'WhileStatement', 'ForStatement', 'YieldStatement',
+
+    # Utilidades
+    'structural_hash', 'Interner', 'InternReport', 'intern_tree'
 ]
\ No newline at end of file
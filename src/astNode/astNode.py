@@ -34,6 +34,10 @@ class Statement(ASTNode):
 
 class Expression(ASTNode):
     """Clase base para todas las expresiones."""
+
+    # Tipo (`ObjectType`) que la inferencia de tipos ha probado para el nodo;
+    # None = desconocido. Los literales lo fijan en su clase.
+    _static_type = None
     
     def __init__(self, token: Token) -> None:
         super().__init__(token)
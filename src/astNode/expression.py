@@ -1,6 +1,7 @@
 """Nodos de expresiones del AST."""
 
-from typing import List, Optional, TYPE_CHECKING
+from typing import List, Optional, Tuple, TYPE_CHECKING
+from src.config.object import ObjectType
 from src.config.token_1 import Token
 from .astNode import Expression
 
@@ -21,6 +22,8 @@ class Identifier(Expression):
 
 class Integer(Expression):
     """Expresión literal entero."""
+
+    _static_type = ObjectType.INTEGER
     
     def __init__(self, token: Token, value: Optional[int] = None) -> None:
         super().__init__(token)
@@ -58,6 +61,8 @@ class Infix(Expression):
 
 class Boolean(Expression):
     """Expresión booleana."""
+
+    _static_type = ObjectType.BOOLEAN
     
     def __init__(self, token: Token, value: Optional[bool] = None) -> None:
         super().__init__(token)
@@ -88,6 +93,8 @@ class If(Expression):
 
 class Function(Expression):
     """Expresión literal de función."""
+
+    _static_type = ObjectType.FUNCTION
     
     def __init__(self, token: Token, parameters: Optional[List[Identifier]] = None,
                  body: Optional['Block'] = None) -> None:
@@ -122,10 +129,47 @@ class Call(Expression):
 
 class StringLiteral(Expression):
     """Expresión literal de cadena."""
+
+    _static_type = ObjectType.STRING
     
     def __init__(self, token: Token, value: str) -> None:
         super().__init__(token)
         self.value = value
 
     def __str__(self) -> str:
-        return self.value
\ No newline at end of file
+        return self.value
+
+
+class ArrayLiteral(Expression):
+    """Expresión literal de arreglo (ej: [1, 2, 3])."""
+    
+    def __init__(self, token: Token, elements: Optional[List[Expression]] = None) -> None:
+        super().__init__(token)
+        self.elements = elements if elements is not None else []
+
+    def __str__(self) -> str:
+        return f'[{", ".join(str(element) for element in self.elements)}]'
+
+
+class Index(Expression):
+    """Expresión de acceso por índice (ej: xs[0])."""
+    
+    def __init__(self, token: Token, left: Expression, index: Optional[Expression] = None) -> None:
+        super().__init__(token)
+        self.left = left
+        self.index = index
+
+    def __str__(self) -> str:
+        return f'({str(self.left)}[{str(self.index)}])'
+
+
+class HashLiteral(Expression):
+    """Expresión literal de mapa (ej: {'a': 1, 2: true})."""
+    
+    def __init__(self, token: Token, pairs: Optional[List[Tuple[Expression, Expression]]] = None) -> None:
+        super().__init__(token)
+        self.pairs = pairs if pairs is not None else []
+
+    def __str__(self) -> str:
+        pairs: List[str] = [f'{str(key)}: {str(value)}' for key, value in self.pairs]
+        return '{' + ', '.join(pairs) + '}'
@@ -0,0 +1,187 @@
+"""
+Hash-consing de subárboles del AST.
+
+`Interner.intern(program)` sustituye cada subárbol por un representante
+único de los que son estructuralmente iguales (mismo `structural_hash`),
+de modo que las expresiones y funciones repetidas se guardan una vez. El
+programa se modifica en su sitio; los nodos siguen siendo inmutables para
+el intérprete, que puede evaluar nodos compartidos sin cambios.
+
+Las cachés de análisis del intérprete se indexan por nodo y algunas
+dependen del contexto del nodo, no solo de su contenido:
+
+- la pureza y el escape de marcos se calculan por cuerpo de función
+  (`Block`) junto con los parámetros de su función;
+- la conversión de clausuras recuerda la función que contiene cada
+  literal de función anidado.
+
+Por eso un `Block` nunca se comparte por separado, y un literal de
+función solo se comparte entero si no está dentro de otra función. Lo que
+contiene una función anidada se sigue compartiendo, salvo los nodos que
+envuelven a esa función.
+
+Los nodos anotados por la inferencia de tipos (`_static_type`) solo se
+comparten con nodos iguales y anotados igual: el resumen que usa la tabla
+incluye la anotación, aunque `structural_hash` no la tenga en cuenta.
+
+Los nodos compartidos conservan el token de la primera aparición.
+"""
+
+from dataclasses import dataclass
+import hashlib
+import sys
+from typing import Dict, List, Set, Tuple
+
+from src.config.token_1 import Token
+from .astNode import ASTNode, Program
+from .expression import Function
+from .statement import Block
+from .structural import fields, node_digest
+
+
+@dataclass
+class InternReport:
+    """Resultado de una pasada: nodos y bytes (aproximados) antes y después."""
+    nodes_before: int = 0
+    nodes_after: int = 0
+    bytes_before: int = 0
+    bytes_after: int = 0
+
+    @property
+    def shared(self) -> int:
+        """Nodos que han dejado de existir por apuntar a un representante."""
+        return self.nodes_before - self.nodes_after
+
+    @property
+    def saved_bytes(self) -> int:
+        return self.bytes_before - self.bytes_after
+
+
+class Interner:
+    """
+    Tabla de representantes (resumen estructural -> nodo) para hash-consing.
+
+    Una misma instancia puede internar varios programas: los subárboles
+    iguales entre programas también se comparten. La tabla mantiene vivos
+    sus nodos; `clear()` la vacía.
+    """
+
+    def __init__(self) -> None:
+        self._table: Dict[bytes, ASTNode] = {}
+        # Resumen de cada representante, por id (la tabla los mantiene vivos)
+        self._digests: Dict[int, bytes] = {}
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def clear(self) -> None:
+        self._table.clear()
+        self._digests.clear()
+
+    def intern(self, program: Program) -> InternReport:
+        """Comparte los subárboles repetidos de `program` y devuelve cuánto se ha ahorrado."""
+        report = InternReport()
+        report.nodes_before, report.bytes_before = footprint(program)
+        visited: Dict[int, Tuple[ASTNode, bytes, bool]] = {}
+        self._visit(program, 0, visited)
+        report.nodes_after, report.bytes_after = footprint(program)
+        return report
+
+    def _visit(self, node: ASTNode, depth: int, visited: Dict[int, Tuple[ASTNode, bytes, bool]]
+               ) -> Tuple[ASTNode, bytes, bool]:
+        """
+        Interna los hijos de `node` y después el propio nodo.
+
+        `depth` es el número de funciones que lo contienen. Devuelve el
+        representante, su resumen y si puede compartirse (False si envuelve
+        a un literal de función anidado).
+        """
+        known = self._digests.get(id(node))
+        if known is not None:
+            return node, known, True
+        seen = visited.get(id(node))
+        if seen is not None:
+            return seen
+
+        node_is_function = type(node) is Function
+        inner_depth = depth + 1 if node_is_function else depth
+        shareable = True
+        digests: Dict[int, bytes] = {}
+        for name, value in fields(node):
+            rebuilt, value_shareable = self._rebuild(value, inner_depth, visited, digests)
+            shareable = shareable and value_shareable
+            if rebuilt is not value:
+                setattr(node, name, rebuilt)
+        digest = node_digest(node, lambda child: digests[id(child)])
+        annotation = vars(node).get("_static_type")
+        if annotation is not None:
+            # El tipo anotado se probó en el contexto del nodo: solo se comparte con otro anotado igual
+            digest = hashlib.blake2b(digest + annotation.name.encode(), digest_size=len(digest)).digest()
+
+        if node_is_function:
+            # El literal entero arrastra sus funciones anidadas, que no se comparten sueltas
+            shareable = depth == 0
+        result = (node, digest, shareable)
+        if shareable and type(node) is not Block and type(node) is not Program:
+            canonical = self._table.get(digest)
+            if canonical is None:
+                self._table[digest] = node
+                self._digests[id(node)] = digest
+            else:
+                result = (canonical, digest, True)
+        visited[id(node)] = result
+        return result
+
+    def _rebuild(self, value, depth: int, visited: Dict[int, Tuple[ASTNode, bytes, bool]],
+                 digests: Dict[int, bytes]):
+        """Sustituye los nodos de un campo (nodo, lista o tupla) por sus representantes."""
+        value_type = type(value)
+        if value_type is list or value_type is tuple:
+            items = []
+            shareable = True
+            for item in value:
+                rebuilt, item_shareable = self._rebuild(item, depth, visited, digests)
+                items.append(rebuilt)
+                shareable = shareable and item_shareable
+            if all(rebuilt is item for rebuilt, item in zip(items, value)):
+                return value, shareable
+            return (items if value_type is list else tuple(items)), shareable
+        if isinstance(value, ASTNode):
+            canonical, digest, shareable = self._visit(value, depth, visited)
+            digests[id(canonical)] = digest
+            return canonical, shareable
+        return value, True
+
+
+def intern_tree(program: Program) -> InternReport:
+    """Hash-consing de un programa con una tabla propia."""
+    return Interner().intern(program)
+
+
+def footprint(root: ASTNode) -> Tuple[int, int]:
+    """Número de nodos distintos alcanzables desde `root` y bytes aproximados que ocupan.
+
+    Cuenta cada nodo, su diccionario de atributos, su token y las listas y
+    tuplas de sus campos; los objetos compartidos se cuentan una sola vez.
+    """
+    seen: Set[int] = set()
+    nodes = 0
+    size = 0
+    stack: List[object] = [root]
+    while stack:
+        value = stack.pop()
+        value_type = type(value)
+        if value_type is str or value is None or id(value) in seen:
+            continue
+        seen.add(id(value))
+        if value_type is list or value_type is tuple:
+            size += sys.getsizeof(value)
+            stack.extend(value)
+        elif value_type is Token:
+            size += sys.getsizeof(value)
+        elif isinstance(value, ASTNode):
+            nodes += 1
+            attributes = vars(value)
+            size += sys.getsizeof(value) + sys.getsizeof(attributes)
+            stack.extend(attributes.values())
+    return nodes, size
@@ -26,13 +26,23 @@ class ReturnStatement(Statement):
     def __init__(self, token: Token, return_value: Optional[Expression] = None) -> None:
         super().__init__(token)
         self.return_value = return_value
-        print("class ReturnStatement", return_value, Token)
 
     def __str__(self) -> str:
         out = f'{self.token_literal()} {str(self.return_value)};'
         return out
 
 
+class YieldStatement(Statement):
+    """Declaración yield: entrega un valor desde una función generadora."""
+    
+    def __init__(self, token: Token, value: Optional[Expression] = None) -> None:
+        super().__init__(token)
+        self.value = value
+
+    def __str__(self) -> str:
+        return f'{self.token_literal()} {str(self.value)};'
+
+
 class ExpressionStatement(Statement):
     """Declaración de expresión."""
     
@@ -53,4 +63,31 @@ class Block(Statement):
 
     def __str__(self) -> str:
         out: List[str] = [str(statement) for statement in self.statements]
-        return ''.join(out)
\ No newline at end of file
+        return ''.join(out)
+
+
+class WhileStatement(Statement):
+    """Bucle while: repite el cuerpo mientras la condición sea verdadera."""
+    
+    def __init__(self, token: Token, condition: Optional[Expression] = None,
+                 body: Optional[Block] = None) -> None:
+        super().__init__(token)
+        self.condition = condition
+        self.body = body
+
+    def __str__(self) -> str:
+        return f'{self.token_literal()} ({str(self.condition)}) {str(self.body)}'
+
+
+class ForStatement(Statement):
+    """Bucle for ... in: liga `variable` a cada elemento del iterable."""
+    
+    def __init__(self, token: Token, variable: Optional[Identifier] = None,
+                 iterable: Optional[Expression] = None, body: Optional[Block] = None) -> None:
+        super().__init__(token)
+        self.variable = variable
+        self.iterable = iterable
+        self.body = body
+
+    def __str__(self) -> str:
+        return f'{self.token_literal()} ({str(self.variable)} in {str(self.iterable)}) {str(self.body)}'
@@ -0,0 +1,92 @@
+"""Hash estructural de nodos del AST."""
+
+import hashlib
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from .astNode import ASTNode
+
+# Tamaño del resumen en bytes (32 caracteres hexadecimales)
+DIGEST_SIZE = 16
+
+# Orden de inserción de los atributos de un nodo -> campos estructurales ordenados
+_FIELD_ORDER: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def structural_hash(node: ASTNode, memo: Optional[Dict[int, bytes]] = None) -> str:
+    """
+    Resumen hexadecimal estable del contenido de `node` y sus descendientes.
+
+    Solo cuentan el tipo de cada nodo y sus campos (nombres, operadores,
+    literales e hijos), no los tokens ni la identidad de los objetos: dos
+    árboles parseados del mismo fuente, o de fuentes que solo difieren en
+    espacios, dan el mismo hash en cualquier proceso.
+
+    El resumen de un nodo se calcula a partir del de sus hijos; `memo`
+    (id del nodo -> resumen) permite reutilizarlos entre llamadas sobre el
+    mismo árbol mientras este no cambie.
+    """
+    memo = memo if memo is not None else {}
+
+    def child(value: ASTNode) -> bytes:
+        cached = memo.get(id(value))
+        if cached is None:
+            cached = node_digest(value, child)
+            memo[id(value)] = cached
+        return cached
+
+    return child(node).hex()
+
+
+def node_digest(node: ASTNode, child: Callable[[ASTNode], bytes]) -> bytes:
+    """Resumen binario de `node` dado el de cada hijo (`child`)."""
+    digest = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    digest.update(f"({type(node).__name__}".encode())
+    for name, value in fields(node):
+        digest.update(f" {name}=".encode())
+        for chunk in _encode(value, child):
+            digest.update(chunk)
+    digest.update(b")")
+    return digest.digest()
+
+
+def fields(node: ASTNode) -> Iterator[tuple]:
+    """
+    Pares (nombre, valor) de los campos de `node`, en orden estable.
+
+    No incluye el token ni los atributos privados (`_nombre`), que los
+    análisis pueden usar para anotar nodos sin cambiar su estructura.
+    """
+    attributes = vars(node)
+    order = tuple(attributes)
+    names = _FIELD_ORDER.get(order)
+    if names is None:
+        names = tuple(sorted(name for name in order if name != "token" and not name.startswith("_")))
+        _FIELD_ORDER[order] = names
+    for name in names:
+        yield name, attributes[name]
+
+
+def _encode(value: Any, child: Callable[[ASTNode], bytes]) -> Iterator[bytes]:
+    # Se compara el tipo exacto primero: isinstance con la ABC de los nodos es lento
+    value_type = type(value)
+    if value_type is str:
+        data = value.encode("utf-8")
+        yield f"S{len(data)}:".encode()
+        yield data
+    elif value is None:
+        yield b"N"
+    elif value_type is bool:
+        yield b"T" if value else b"F"
+    elif value_type is int:
+        yield f"I{value};".encode()
+    elif value_type is list or value_type is tuple:
+        yield b"["
+        for item in value:
+            yield from _encode(item, child)
+            yield b","
+        yield b"]"
+    elif isinstance(value, ASTNode):
+        yield b"#"
+        yield child(value)
+    else:
+        raise TypeError(f"campo de AST no soportado: {type(value).__name__}")
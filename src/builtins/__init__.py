@@ -0,0 +1,31 @@
+"""Funciones nativas del lenguaje.
+
+`BUILTINS` se resuelve en `ExpressionEvaluator.eval_identifier_expression`
+cuando un identificador no está ligado en el entorno. Los builtins de E/S
+(`ASYNC_BUILTINS`) solo los liga `AsyncInterpreter` en el entorno global.
+"""
+
+from typing import Dict
+
+from src.config.object import Builtin
+from .aio import ASYNC_BUILTINS
+from .mappings import builtin_put, builtin_remove
+from .output import FlushPolicy, OutputSink, builtin_print
+from .sequences import (
+    builtin_filter, builtin_join, builtin_len, builtin_map, builtin_range, builtin_reduce, builtin_sum
+)
+
+BUILTINS: Dict[str, Builtin] = {
+    "filter": Builtin(builtin_filter, applies_functions=True),
+    "join": Builtin(builtin_join),
+    "len": Builtin(builtin_len),
+    "map": Builtin(builtin_map, applies_functions=True),
+    "print": Builtin(builtin_print, writes_output=True),
+    "put": Builtin(builtin_put),
+    "range": Builtin(builtin_range),
+    "reduce": Builtin(builtin_reduce, applies_functions=True),
+    "remove": Builtin(builtin_remove),
+    "sum": Builtin(builtin_sum),
+}
+
+__all__ = ["ASYNC_BUILTINS", "BUILTINS", "FlushPolicy", "OutputSink"]
@@ -0,0 +1,80 @@
+"""Builtins de E/S asíncronos: solo disponibles en `AsyncInterpreter`."""
+
+import asyncio
+from typing import Dict
+from urllib.parse import urlsplit
+
+from src.config.object import NULL, AsyncBuiltin, Integer, Object, String
+from .errors import IO_ERROR, WRONG_ARGUMENT_COUNT, WRONG_ARGUMENT_TYPE, new_error
+
+HTTP_TIMEOUT = 30.0
+
+
+async def builtin_sleep(*args: Object) -> Object:
+    """sleep(ms) suspende el script sin bloquear a los demás."""
+    if len(args) != 1:
+        return new_error(WRONG_ARGUMENT_COUNT, ["sleep", 1, len(args)])
+    milliseconds = args[0]
+    if not isinstance(milliseconds, Integer) or milliseconds.value < 0:
+        return new_error(WRONG_ARGUMENT_TYPE, ["sleep", "INTEGER >= 0", milliseconds.type().name])
+    await asyncio.sleep(milliseconds.value / 1000)
+    return NULL
+
+
+def _read_text(path: str) -> str:
+    with open(path, encoding="utf-8") as source:
+        return source.read()
+
+
+async def builtin_read_file(*args: Object) -> Object:
+    """read_file(ruta) devuelve el contenido del fichero; la lectura va en un hilo aparte."""
+    if len(args) != 1:
+        return new_error(WRONG_ARGUMENT_COUNT, ["read_file", 1, len(args)])
+    path = args[0]
+    if not isinstance(path, String):
+        return new_error(WRONG_ARGUMENT_TYPE, ["read_file", "STRING", path.type().name])
+    try:
+        return String(await asyncio.to_thread(_read_text, path.value))
+    except (OSError, UnicodeDecodeError) as error:
+        return new_error(IO_ERROR, ["read_file", error])
+
+
+async def builtin_http_get(*args: Object) -> Object:
+    """http_get(url) hace un GET HTTP/1.0 y devuelve el cuerpo (solo `http://`)."""
+    if len(args) != 1:
+        return new_error(WRONG_ARGUMENT_COUNT, ["http_get", 1, len(args)])
+    url = args[0]
+    if not isinstance(url, String):
+        return new_error(WRONG_ARGUMENT_TYPE, ["http_get", "STRING", url.type().name])
+    parts = urlsplit(url.value)
+    if parts.scheme != "http" or not parts.hostname:
+        return new_error(WRONG_ARGUMENT_TYPE, ["http_get", "URL http://", url.value])
+    path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+    request = f"GET {path} HTTP/1.0\r\nHost: {parts.netloc}\r\nConnection: close\r\n\r\n"
+    try:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(parts.hostname, parts.port or 80), HTTP_TIMEOUT)
+        try:
+            writer.write(request.encode("ascii"))
+            await writer.drain()
+            response = await asyncio.wait_for(reader.read(), HTTP_TIMEOUT)
+        finally:
+            writer.close()
+    except (OSError, asyncio.TimeoutError) as error:
+        return new_error(IO_ERROR, ["http_get", str(error) or "tiempo de espera agotado"])
+
+    head, _, body = response.partition(b"\r\n\r\n")
+    status_line = head.split(b"\r\n", 1)[0].decode("latin-1")
+    status = status_line.split(" ", 2)
+    if len(status) < 2 or not status[1].isdigit():
+        return new_error(IO_ERROR, ["http_get", f"respuesta no válida: {status_line!r}"])
+    if int(status[1]) >= 400:
+        return new_error(IO_ERROR, ["http_get", status_line])
+    return String(body.decode("utf-8", errors="replace"))
+
+
+ASYNC_BUILTINS: Dict[str, AsyncBuiltin] = {
+    "http_get": AsyncBuiltin(builtin_http_get),
+    "read_file": AsyncBuiltin(builtin_read_file),
+    "sleep": AsyncBuiltin(builtin_sleep),
+}
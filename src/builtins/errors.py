@@ -0,0 +1,18 @@
+"""Mensajes de error de los builtins.
+
+Este paquete solo depende de `src.config`: el intérprete lo importa al
+cargarse, así que importar `src.interpreter` desde aquí crearía un ciclo.
+"""
+
+from typing import Any, List
+from src.config.object import Error
+
+WRONG_ARGUMENT_COUNT = 'Número incorrecto de argumentos para {}: se esperaban {}, se recibieron {}'
+WRONG_ARGUMENT_TYPE = 'Argumento no válido para {}: se esperaba {}, se recibió {}'
+NOT_ITERABLE = 'No es iterable: {}'
+UNHASHABLE_KEY = 'Clave no hashable: {}'
+IO_ERROR = 'Error de E/S en {}: {}'
+
+
+def new_error(message: str, args: List[Any]) -> Error:
+    return Error(message.format(*args))
@@ -0,0 +1,28 @@
+"""Builtins de mapas (Hash): actualizaciones persistentes."""
+
+from src.config.object import Hash, Object, is_hashable
+from .errors import UNHASHABLE_KEY, WRONG_ARGUMENT_COUNT, WRONG_ARGUMENT_TYPE, new_error
+
+
+def builtin_put(*args: Object) -> Object:
+    """put(mapa, clave, valor) -> mapa nuevo con la clave ligada; el original no cambia."""
+    if len(args) != 3:
+        return new_error(WRONG_ARGUMENT_COUNT, ["put", 3, len(args)])
+    mapping, key, value = args
+    if not isinstance(mapping, Hash):
+        return new_error(WRONG_ARGUMENT_TYPE, ["put", "HASH", mapping.type().name])
+    if not is_hashable(key):
+        return new_error(UNHASHABLE_KEY, [key.type().name])
+    return mapping.set(key, value)
+
+
+def builtin_remove(*args: Object) -> Object:
+    """remove(mapa, clave) -> mapa nuevo sin la clave; el original no cambia."""
+    if len(args) != 2:
+        return new_error(WRONG_ARGUMENT_COUNT, ["remove", 2, len(args)])
+    mapping, key = args
+    if not isinstance(mapping, Hash):
+        return new_error(WRONG_ARGUMENT_TYPE, ["remove", "HASH", mapping.type().name])
+    if not is_hashable(key):
+        return new_error(UNHASHABLE_KEY, [key.type().name])
+    return mapping.delete(key)
@@ -0,0 +1,128 @@
+"""Canal de salida del intérprete y builtin `print`."""
+
+import io
+import os
+import sys
+import threading
+from enum import Enum, auto
+from typing import Callable, List, Optional, TextIO, Union
+
+from src.config.object import NULL, Object
+
+
+class FlushPolicy(Enum):
+    """Cuándo se entrega al destino el texto acumulado en el búfer."""
+    # Al superar `buffer_size` caracteres (y al terminar el programa)
+    BUFFERED = auto()
+    # Al final de cada línea: útil para salida interactiva
+    LINE = auto()
+    # Solo al llamar a `flush` (el intérprete lo hace al terminar cada programa)
+    END = auto()
+
+
+# stdout (None), ruta de fichero, objeto tipo fichero (p. ej. io.StringIO) o callback
+OutputTarget = Union[None, str, "os.PathLike[str]", TextIO, Callable[[str], object], "OutputSink"]
+
+
+class OutputSink:
+    """
+    Destino de la salida del programa, propiedad de cada `Interpreter`.
+
+    Acumula los textos escritos y los entrega al destino en una sola
+    escritura por vaciado, según `flush_policy`:
+    - `target=None`: `sys.stdout`, resuelto en cada vaciado (respeta redirecciones).
+    - ruta (`str` / `PathLike`): se abre el fichero en modo append; `close` lo cierra.
+    - objeto con `write` (fichero, `io.StringIO`): se escribe en él.
+    - callable: se invoca con cada bloque de texto vaciado.
+    """
+
+    DEFAULT_BUFFER_SIZE = 64 * 1024
+
+    def __init__(self, target: OutputTarget = None, buffer_size: int = DEFAULT_BUFFER_SIZE,
+                 flush_policy: FlushPolicy = FlushPolicy.BUFFERED) -> None:
+        if buffer_size <= 0:
+            raise ValueError("buffer_size debe ser positivo")
+        self.buffer_size = buffer_size
+        self.flush_policy = flush_policy
+        self.writes = 0
+        self.flushes = 0
+        self._owned_file: Optional[TextIO] = None
+        self._write_target: Optional[Callable[[str], object]] = None
+        if isinstance(target, (str, os.PathLike)):
+            self._owned_file = open(target, "a", encoding="utf-8")
+            self._write_target = self._owned_file.write
+        elif hasattr(target, "write"):
+            self._write_target = target.write
+        elif callable(target):
+            self._write_target = target
+        elif target is not None:
+            raise TypeError(f"Destino de salida no soportado: {target!r}")
+        self._parts: List[str] = []
+        self._pending = 0
+        # Varios contextos de ejecución (hilos) pueden escribir en el mismo sink
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_target(cls, target: OutputTarget, buffer_size: int = DEFAULT_BUFFER_SIZE,
+                    flush_policy: FlushPolicy = FlushPolicy.BUFFERED) -> "OutputSink":
+        """Usa `target` si ya es un `OutputSink`; si no, crea uno nuevo sobre él."""
+        if isinstance(target, OutputSink):
+            return target
+        return cls(target, buffer_size, flush_policy)
+
+    @classmethod
+    def capture(cls) -> "OutputSink":
+        """Sink sobre un `io.StringIO` nuevo; el texto se lee con `getvalue()`."""
+        return cls(io.StringIO(), flush_policy=FlushPolicy.END)
+
+    def write(self, text: str) -> None:
+        with self._lock:
+            self.writes += 1
+            self._parts.append(text)
+            self._pending += len(text)
+            if self.flush_policy is FlushPolicy.LINE:
+                if "\n" in text:
+                    self.flush()
+            elif self.flush_policy is FlushPolicy.BUFFERED and self._pending >= self.buffer_size:
+                self.flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            if not self._parts:
+                return
+            text = "".join(self._parts)
+            self._parts.clear()
+            self._pending = 0
+            self.flushes += 1
+            if self._write_target is not None:
+                self._write_target(text)
+            else:
+                sys.stdout.write(text)
+
+    def getvalue(self) -> str:
+        """Todo lo escrito hasta ahora si el destino es un `io.StringIO`."""
+        self.flush()
+        owner = getattr(self._write_target, "__self__", None)
+        if not isinstance(owner, io.StringIO):
+            raise TypeError("getvalue solo está disponible para destinos io.StringIO")
+        return owner.getvalue()
+
+    def close(self) -> None:
+        """Vacía el búfer y cierra el fichero si lo abrió el propio sink."""
+        self.flush()
+        if self._owned_file is not None:
+            self._owned_file.close()
+            self._owned_file = None
+
+
+def builtin_print(output: Optional[OutputSink], *args: Object) -> Object:
+    """print(a, b, ...) escribe los valores separados por espacios y un salto de línea.
+
+    Sin sink (un evaluador usado fuera de `Interpreter`) escribe en stdout.
+    """
+    text = " ".join(argument.inspect() for argument in args) + "\n"
+    if output is None:
+        sys.stdout.write(text)
+    else:
+        output.write(text)
+    return NULL
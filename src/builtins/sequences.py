@@ -0,0 +1,183 @@
+"""Builtins de secuencias."""
+
+from typing import Callable, Iterator, List, Optional
+
+from src.config.object import Array, Boolean, Hash, Integer, LazyIterator, Null, Object, Range, String
+from .errors import NOT_ITERABLE, WRONG_ARGUMENT_COUNT, WRONG_ARGUMENT_TYPE, new_error
+
+# apply(fn, args) del evaluador: llama a una función del lenguaje o a otro builtin
+Apply = Callable[[Object, List[Object]], Object]
+
+
+def builtin_range(*args: Object) -> Object:
+    """range(stop) | range(start, stop) | range(start, stop, step) -> Range perezoso."""
+    if not 1 <= len(args) <= 3:
+        return new_error(WRONG_ARGUMENT_COUNT, ["range", "1-3", len(args)])
+    for argument in args:
+        if not isinstance(argument, Integer):
+            return new_error(WRONG_ARGUMENT_TYPE, ["range", "INTEGER", argument.type().name])
+
+    values = [argument.value for argument in args]
+    if len(values) == 1:
+        return Range(0, values[0])
+    if len(values) == 3 and values[2] == 0:
+        return new_error(WRONG_ARGUMENT_TYPE, ["range", "paso distinto de 0", "0"])
+    return Range(*values)
+
+
+def builtin_len(*args: Object) -> Object:
+    """len(x) para cadenas, arreglos, mapas y rangos; O(1) en todos los casos."""
+    if len(args) != 1:
+        return new_error(WRONG_ARGUMENT_COUNT, ["len", 1, len(args)])
+    value = args[0]
+    if isinstance(value, String):
+        return Integer(value.length)
+    if isinstance(value, (Array, Hash, Range)):
+        return Integer(len(value))
+    return new_error(WRONG_ARGUMENT_TYPE, ["len", "STRING, ARRAY, HASH o RANGE", value.type().name])
+
+
+def builtin_sum(*args: Object) -> Object:
+    """sum(xs) suma los enteros de un arreglo o rango sin pasar por el evaluador."""
+    if len(args) != 1:
+        return new_error(WRONG_ARGUMENT_COUNT, ["sum", 1, len(args)])
+    value = args[0]
+    if isinstance(value, Array) and value.is_typed:
+        return Integer(sum(value.ints))
+    if isinstance(value, Range):
+        # Serie aritmética: no hace falta recorrer el rango
+        count = len(value)
+        return Integer(count * value.start + value.step * count * (count - 1) // 2)
+    items = _iterate(value)
+    if items is None:
+        return new_error(NOT_ITERABLE, [value.type().name])
+    total = 0
+    for item in items:
+        if item.abrupt:
+            return item
+        if not isinstance(item, Integer):
+            return new_error(WRONG_ARGUMENT_TYPE, ["sum", "INTEGER", item.type().name])
+        total += item.value
+    return Integer(total)
+
+
+def builtin_map(apply: Apply, *args: Object) -> Object:
+    """map(fn, xs) -> fn aplicada a cada elemento.
+
+    Sobre un arreglo devuelve otro arreglo; sobre rangos, iteradores y demás
+    secuencias devuelve un iterador perezoso que llama a fn bajo demanda.
+    """
+    if len(args) != 2:
+        return new_error(WRONG_ARGUMENT_COUNT, ["map", 2, len(args)])
+    function, collection = args
+    items = _iterate(collection)
+    if items is None:
+        return new_error(NOT_ITERABLE, [collection.type().name])
+    mapped = _lazy_map(apply, function, items)
+    if not isinstance(collection, Array):
+        return LazyIterator(mapped, 'map')
+    results: List[Object] = []
+    for result in mapped:
+        if result.abrupt:
+            return result
+        results.append(result)
+    return Array(results)
+
+
+def builtin_filter(apply: Apply, *args: Object) -> Object:
+    """filter(fn, xs) -> elementos para los que fn es verdadera (perezoso salvo sobre arreglos)."""
+    if len(args) != 2:
+        return new_error(WRONG_ARGUMENT_COUNT, ["filter", 2, len(args)])
+    function, collection = args
+    items = _iterate(collection)
+    if items is None:
+        return new_error(NOT_ITERABLE, [collection.type().name])
+    kept = _lazy_filter(apply, function, items)
+    if not isinstance(collection, Array):
+        return LazyIterator(kept, 'filter')
+    results: List[Object] = []
+    for item in kept:
+        if item.abrupt:
+            return item
+        results.append(item)
+    return Array(results)
+
+
+def builtin_reduce(apply: Apply, *args: Object) -> Object:
+    """reduce(fn, xs, inicial) -> fn(...fn(fn(inicial, x0), x1)..., xn)."""
+    if len(args) != 3:
+        return new_error(WRONG_ARGUMENT_COUNT, ["reduce", 3, len(args)])
+    function, collection, accumulator = args
+    items = _iterate(collection)
+    if items is None:
+        return new_error(NOT_ITERABLE, [collection.type().name])
+    for item in items:
+        if item.abrupt:
+            return item
+        accumulator = apply(function, [accumulator, item])
+        if accumulator.abrupt:
+            return accumulator
+    return accumulator
+
+
+def builtin_join(*args: Object) -> Object:
+    """join(xs) | join(xs, separador) concatena cadenas en una sola copia."""
+    if not 1 <= len(args) <= 2:
+        return new_error(WRONG_ARGUMENT_COUNT, ["join", "1-2", len(args)])
+    separator = args[1] if len(args) == 2 else String('')
+    if not isinstance(separator, String):
+        return new_error(WRONG_ARGUMENT_TYPE, ["join", "STRING", separator.type().name])
+    items = _iterate(args[0])
+    if items is None:
+        return new_error(NOT_ITERABLE, [args[0].type().name])
+    parts: List[str] = []
+    for item in items:
+        if item.abrupt:
+            return item
+        if not isinstance(item, String):
+            return new_error(WRONG_ARGUMENT_TYPE, ["join", "STRING", item.type().name])
+        parts.append(item.value)
+    return String(separator.value.join(parts))
+
+
+def _lazy_map(apply: Apply, function: Object, items: Iterator[Object]) -> Iterator[Object]:
+    """Aplica `function` elemento a elemento; un Error se entrega y termina la secuencia."""
+    for item in items:
+        result = item if item.abrupt else apply(function, [item])
+        yield result
+        if result.abrupt:
+            return
+
+
+def _lazy_filter(apply: Apply, function: Object, items: Iterator[Object]) -> Iterator[Object]:
+    """Entrega los elementos que cumplen `function`; un Error se entrega y termina la secuencia."""
+    for item in items:
+        if item.abrupt:
+            yield item
+            return
+        keep = apply(function, [item])
+        if keep.abrupt:
+            yield keep
+            return
+        if _is_truthy(keep):
+            yield item
+
+
+def _iterate(value: Object) -> Optional[Iterator[Object]]:
+    """Elementos de un valor iterable del lenguaje, o None si no lo es."""
+    if isinstance(value, (Array, Range, LazyIterator)):
+        return iter(value)
+    if isinstance(value, Hash):
+        return value.keys()
+    if isinstance(value, String):
+        return (String(character) for character in value.value)
+    return None
+
+
+def _is_truthy(value: Object) -> bool:
+    """Mismas reglas que `RuntimePrimitives.is_truthy`: solo null y false son falsos."""
+    if isinstance(value, Null):
+        return False
+    if isinstance(value, Boolean):
+        return value.value is True
+    return True
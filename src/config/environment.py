@@ -1,11 +1,22 @@
-from typing import Optional
+from typing import Dict, Optional
 
 from src.config.object import Object
 
+
+class Cell:
+    """Celda mutable compartida entre un entorno y las clausuras que capturan una de sus variables."""
+    __slots__ = ("value",)
+
+    def __init__(self, value: Optional[Object] = None):
+        self.value = value
+
+
 class Environment:
     def __init__(self, outer: Optional['Environment'] = None):
         self.store = {}
         self.outer = outer
+        # Celdas creadas para variables capturadas por clausuras (None = ninguna)
+        self.cells: Optional[Dict[str, Cell]] = None
 
     def get(self, name: str) -> Optional[Object]:
         """Get the value associated with the name in the current environment or outer environments."""
@@ -19,6 +30,82 @@ class Environment:
     def set(self, name: str, value: Object) -> Object:
         """Set the value for the name in the current environment."""
         self.store[name] = value
-        print(f"Set {name} to {value}")
+        if self.cells is not None:
+            cell = self.cells.get(name)
+            if cell is not None:
+                cell.value = value
         return value
 
+    def cell(self, name: str) -> Cell:
+        """Get (or create) the cell that mirrors `name` in this environment."""
+        if self.cells is None:
+            self.cells = {}
+        cell = self.cells.get(name)
+        if cell is None:
+            cell = Cell(self.store.get(name))
+            self.cells[name] = cell
+        return cell
+
+
+class ClosureEnvironment(Environment):
+    """
+    Entorno plano de una clausura: solo las celdas de las variables libres que
+    pertenecían al marco donde se definió, más el entorno exterior de ese marco.
+    El marco definidor no queda referenciado y puede liberarse al terminar la llamada.
+    """
+    def __init__(self, cells: Dict[str, Cell], outer: Optional[Environment] = None):
+        super().__init__(outer=outer)
+        self.cells = cells
+
+    def get(self, name: str) -> Optional[Object]:
+        cell = self.cells.get(name)
+        if cell is not None and cell.value is not None:
+            return cell.value
+        if self.outer:
+            return self.outer.get(name)
+        return None
+
+
+class FrozenEnvironment(Environment):
+    """
+    Entorno global evaluado una sola vez (por ejemplo, un preludio de
+    funciones) y congelado con `freeze`: a partir de ahí es de solo lectura
+    y puede compartirse entre ejecuciones e hilos.
+
+    Cada ejecución parte de `child()`, una capa vacía encima que recibe sus
+    escrituras; crearla cuesta lo mismo sea cual sea el tamaño del preludio.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.frozen = False
+        # Programa evaluado para construirla (lo fija `Interpreter.snapshot`)
+        self.source = None
+
+    def set(self, name: str, value: Object) -> Object:
+        if self.frozen:
+            raise TypeError("un entorno congelado es de solo lectura")
+        return super().set(name, value)
+
+    def freeze(self) -> "FrozenEnvironment":
+        self.frozen = True
+        return self
+
+    def child(self) -> "OverlayEnvironment":
+        """Entorno global de una ejecución: lee de la instantánea, escribe en su propia capa."""
+        if not self.frozen:
+            raise ValueError("el entorno debe congelarse antes de usarlo como instantánea")
+        return OverlayEnvironment(self)
+
+
+class OverlayEnvironment(Environment):
+    """
+    Capa global de una ejecución sobre un `FrozenEnvironment`.
+
+    Se comporta como un entorno global más (las clausuras definidas en ella
+    la capturan entera, como en un `Environment()` sin exterior); los `let`
+    que redefinen nombres del preludio solo los ocultan en esta ejecución.
+    """
+
+    def __init__(self, snapshot: FrozenEnvironment) -> None:
+        super().__init__(outer=snapshot)
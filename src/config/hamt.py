@@ -0,0 +1,218 @@
+"""
+Hash array mapped trie (HAMT) persistente.
+
+Cada nodo interno indexa 5 bits del hash de la clave con un mapa de bits de
+32 posiciones y guarda solo las entradas presentes, en orden. Actualizar o
+borrar copia únicamente los nodos del camino hasta la clave (como mucho
+13 niveles para hashes de 64 bits); el resto de la estructura se comparte
+entre la versión anterior y la nueva.
+"""
+
+from typing import Any, Hashable, Iterator, Optional, Tuple
+
+_BITS = 5
+_MASK = (1 << _BITS) - 1
+_HASH_BITS = 64
+_HASH_MASK = (1 << _HASH_BITS) - 1
+
+
+def _hash(key: Hashable) -> int:
+    return hash(key) & _HASH_MASK
+
+
+class _Leaf:
+    __slots__ = ("hash", "key", "value")
+
+    def __init__(self, key_hash: int, key: Hashable, value: Any):
+        self.hash = key_hash
+        self.key = key
+        self.value = value
+
+
+class _CollisionNode:
+    """Claves distintas con el mismo hash completo: se guardan en una tupla."""
+    __slots__ = ("hash", "leaves")
+
+    def __init__(self, key_hash: int, leaves: Tuple[_Leaf, ...]):
+        self.hash = key_hash
+        self.leaves = leaves
+
+    def find(self, shift: int, key_hash: int, key: Hashable) -> Optional[_Leaf]:
+        if key_hash != self.hash:
+            return None
+        for leaf in self.leaves:
+            if leaf.key == key:
+                return leaf
+        return None
+
+    def assoc(self, shift: int, leaf: _Leaf) -> Tuple[Any, bool]:
+        if leaf.hash != self.hash:
+            # Otro hash con el mismo prefijo: se separa bajo un nodo de mapa de bits
+            return _BitmapNode(1 << ((self.hash >> shift) & _MASK), (self,)).assoc(shift, leaf)
+        for position, current in enumerate(self.leaves):
+            if current.key == leaf.key:
+                leaves = self.leaves[:position] + (leaf,) + self.leaves[position + 1:]
+                return _CollisionNode(self.hash, leaves), False
+        return _CollisionNode(self.hash, self.leaves + (leaf,)), True
+
+    def without(self, shift: int, key_hash: int, key: Hashable) -> Any:
+        if key_hash != self.hash:
+            return self
+        for position, current in enumerate(self.leaves):
+            if current.key == key:
+                leaves = self.leaves[:position] + self.leaves[position + 1:]
+                return leaves[0] if len(leaves) == 1 else _CollisionNode(self.hash, leaves)
+        return self
+
+    def leaves_iter(self) -> Iterator[_Leaf]:
+        return iter(self.leaves)
+
+
+class _BitmapNode:
+    __slots__ = ("bitmap", "entries")
+
+    def __init__(self, bitmap: int, entries: Tuple[Any, ...]):
+        self.bitmap = bitmap
+        self.entries = entries
+
+    def find(self, shift: int, key_hash: int, key: Hashable) -> Optional[_Leaf]:
+        node: Any = self
+        while True:
+            bit = 1 << ((key_hash >> shift) & _MASK)
+            if not node.bitmap & bit:
+                return None
+            entry = node.entries[(node.bitmap & (bit - 1)).bit_count()]
+            if type(entry) is _Leaf:
+                return entry if entry.key == key else None
+            if type(entry) is _CollisionNode:
+                return entry.find(shift, key_hash, key)
+            node = entry
+            shift += _BITS
+
+    def assoc(self, shift: int, leaf: _Leaf) -> Tuple["_BitmapNode", bool]:
+        """Devuelve (nodo nuevo, True si la clave no existía)."""
+        bit = 1 << ((leaf.hash >> shift) & _MASK)
+        position = (self.bitmap & (bit - 1)).bit_count()
+        entries = self.entries
+        if not self.bitmap & bit:
+            return _BitmapNode(self.bitmap | bit, entries[:position] + (leaf,) + entries[position:]), True
+
+        entry = entries[position]
+        if type(entry) is _Leaf:
+            if entry.key == leaf.key:
+                if entry.value is leaf.value:
+                    return self, False
+                replacement: Any = leaf
+                added = False
+            else:
+                replacement = _merge(shift + _BITS, entry, leaf)
+                added = True
+        else:
+            replacement, added = entry.assoc(shift + _BITS, leaf)
+            if replacement is entry:
+                return self, False
+        return _BitmapNode(self.bitmap, entries[:position] + (replacement,) + entries[position + 1:]), added
+
+    def without(self, shift: int, key_hash: int, key: Hashable) -> Any:
+        """Devuelve el nodo sin la clave; None si queda vacío, o una hoja si queda una sola."""
+        bit = 1 << ((key_hash >> shift) & _MASK)
+        if not self.bitmap & bit:
+            return self
+        position = (self.bitmap & (bit - 1)).bit_count()
+        entry = self.entries[position]
+        if type(entry) is _Leaf:
+            if entry.key != key:
+                return self
+            replacement = None
+        else:
+            replacement = entry.without(shift + _BITS, key_hash, key)
+            if replacement is entry:
+                return self
+
+        if replacement is None:
+            bitmap = self.bitmap & ~bit
+            entries = self.entries[:position] + self.entries[position + 1:]
+            if not entries:
+                return None
+            # Un nodo con una única hoja se sustituye por la hoja (forma canónica)
+            if len(entries) == 1 and type(entries[0]) is _Leaf and shift > 0:
+                return entries[0]
+            return _BitmapNode(bitmap, entries)
+        if type(replacement) is _Leaf and len(self.entries) == 1 and shift > 0:
+            return replacement
+        return _BitmapNode(self.bitmap, self.entries[:position] + (replacement,) + self.entries[position + 1:])
+
+    def leaves_iter(self) -> Iterator[_Leaf]:
+        stack = [iter(self.entries)]
+        while stack:
+            entry = next(stack[-1], None)
+            if entry is None:
+                stack.pop()
+            elif type(entry) is _Leaf:
+                yield entry
+            else:
+                stack.append(entry.leaves_iter() if type(entry) is _CollisionNode else iter(entry.entries))
+
+
+def _merge(shift: int, first: _Leaf, second: _Leaf) -> Any:
+    """Crea el subárbol mínimo que separa dos hojas con claves distintas."""
+    if first.hash == second.hash or shift >= _HASH_BITS:
+        return _CollisionNode(first.hash, (first, second))
+    first_index = (first.hash >> shift) & _MASK
+    second_index = (second.hash >> shift) & _MASK
+    if first_index == second_index:
+        return _BitmapNode(1 << first_index, (_merge(shift + _BITS, first, second),))
+    entries = (first, second) if first_index < second_index else (second, first)
+    return _BitmapNode((1 << first_index) | (1 << second_index), entries)
+
+
+_EMPTY_NODE = _BitmapNode(0, ())
+
+
+class Hamt:
+    """Mapa inmutable; `set` y `delete` devuelven un mapa nuevo que comparte estructura."""
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, items: Any = ()):
+        self._root = _EMPTY_NODE
+        self._size = 0
+        for key, value in items:
+            self._root, added = self._root.assoc(0, _Leaf(_hash(key), key, value))
+            self._size += added
+
+    @classmethod
+    def _from(cls, root: _BitmapNode, size: int) -> "Hamt":
+        hamt = cls.__new__(cls)
+        hamt._root = root
+        hamt._size = size
+        return hamt
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        leaf = self._root.find(0, _hash(key), key)
+        return default if leaf is None else leaf.value
+
+    def set(self, key: Hashable, value: Any) -> "Hamt":
+        root, added = self._root.assoc(0, _Leaf(_hash(key), key, value))
+        if root is self._root:
+            return self
+        return Hamt._from(root, self._size + added)
+
+    def delete(self, key: Hashable) -> "Hamt":
+        root = self._root.without(0, _hash(key), key)
+        if root is self._root:
+            return self
+        if root is None:
+            return Hamt._from(_EMPTY_NODE, 0)
+        return Hamt._from(root, self._size - 1)
+
+    def items(self) -> Iterator[Tuple[Hashable, Any]]:
+        return ((leaf.key, leaf.value) for leaf in self._root.leaves_iter())
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self._root.find(0, _hash(key), key) is not None
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return (leaf.key for leaf in self._root.leaves_iter())
+
+    def __len__(self) -> int:
+        return self._size
@@ -1,18 +1,28 @@
+from array import array
 from enum import Enum, auto
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from src.config.hamt import Hamt
 
 class ObjectType(Enum):
+    ARRAY = auto()
     BOOLEAN = auto()
     BUILTIN = auto()
     ERROR = auto()
     FUNCTION = auto()
+    HASH = auto()
     NULL= auto()
+    RANGE= auto()
     RETURN= auto()
     STRING= auto()
     INTEGER= auto()
+    ITERATOR= auto()
 
 class Object(ABC):
+    # Completa de forma abrupta la secuencia de sentencias (Return, Error)
+    abrupt: bool = False
+
     @abstractmethod
     def type(self) -> ObjectType:
         pass
@@ -49,8 +59,9 @@ class Null(Object):
         return "null"
     
 class Return(Object):
+    abrupt = True
+
     def __init__(self, value: Object):
-        print(value)
         self.value = value
 
     def type(self) -> ObjectType:
@@ -60,6 +71,8 @@ class Return(Object):
         return self.value.inspect()
 
 class Error(Object):
+    abrupt = True
+
     def __init__(self, message: str):
         self.message = message
 
@@ -92,17 +105,272 @@ class Function(Object):
         return ObjectType.FUNCTION
 
     def inspect(self) -> str:
-        return f'fn({", ".join(self.parameters)}) {self.body}'
+        return f'fn({", ".join(parameter.value for parameter in self.parameters)}) {self.body}'
+
+class Range(Object):
+    """Rango perezoso de enteros [start, stop) con paso `step`; no materializa sus elementos."""
+    def __init__(self, start: int, stop: int, step: int = 1):
+        self.start = start
+        self.stop = stop
+        self.step = step
+
+    def type(self) -> ObjectType:
+        return ObjectType.RANGE
+
+    def inspect(self) -> str:
+        if self.step == 1:
+            return f'range({self.start}, {self.stop})'
+        return f'range({self.start}, {self.stop}, {self.step})'
+
+    def __iter__(self) -> Iterator[Integer]:
+        for value in range(self.start, self.stop, self.step):
+            yield Integer(value)
+
+    def __len__(self) -> int:
+        return len(range(self.start, self.stop, self.step))
+
+class LazyIterator(Object):
+    """
+    Secuencia perezosa de un solo uso: resultados de `map`/`filter` sobre
+    entradas perezosas y llamadas a funciones generadoras (`yield`).
+
+    Envuelve un iterador Python que produce objetos del lenguaje bajo
+    demanda; recorrerlo lo consume. Si la producción falla, el último
+    elemento entregado es el `Error` y la secuencia termina.
+    """
+    def __init__(self, items: Iterator[Object], description: str = 'iterator'):
+        self._items = items
+        self.description = description
+
+    def __iter__(self) -> Iterator[Object]:
+        return self._items
+
+    def type(self) -> ObjectType:
+        return ObjectType.ITERATOR
+
+    def inspect(self) -> str:
+        return f'<{self.description}>'
+
+class Array(Object):
+    """
+    Arreglo del lenguaje con dos representaciones.
+
+    Si todos los elementos son `Integer` que caben en 64 bits se guardan
+    desempaquetados en un `array('q')` contiguo (`ints`), lo que permite
+    operar sobre todo el arreglo de una vez. En otro caso se guardan los
+    objetos tal cual en una lista (`items`). Exactamente una de las dos
+    representaciones es distinta de None.
+    """
+
+    def __init__(self, elements: Sequence[Object]):
+        self.ints: Optional[array] = None
+        self.items: Optional[List[Object]] = None
+        if all(type(element) is Integer for element in elements):
+            try:
+                self.ints = array('q', [element.value for element in elements])
+                return
+            except OverflowError:
+                pass
+        self.items = list(elements)
+
+    @classmethod
+    def from_ints(cls, values: Iterable[int]) -> 'Array':
+        """Construye un arreglo tipado; si algún valor no cabe en 64 bits se empaqueta."""
+        values = values if isinstance(values, (list, array)) else list(values)
+        try:
+            typed = array('q', values)
+        except OverflowError:
+            return cls([Integer(value) for value in values])
+        node = cls.__new__(cls)
+        node.ints = typed
+        node.items = None
+        return node
+
+    @property
+    def is_typed(self) -> bool:
+        return self.ints is not None
+
+    def get(self, index: int) -> Object:
+        """Elemento en `index` (admite índices negativos); lanza IndexError fuera de rango."""
+        if self.ints is not None:
+            return Integer(self.ints[index])
+        return self.items[index]
+
+    def __len__(self) -> int:
+        return len(self.ints) if self.ints is not None else len(self.items)
+
+    def __iter__(self) -> Iterator[Object]:
+        if self.ints is not None:
+            return (Integer(value) for value in self.ints)
+        return iter(self.items)
+
+    def type(self) -> ObjectType:
+        return ObjectType.ARRAY
+
+    def inspect(self) -> str:
+        if self.ints is not None:
+            return f'[{", ".join(map(str, self.ints))}]'
+        return f'[{", ".join(element.inspect() for element in self.items)}]'
+
+class Hash(Object):
+    """
+    Mapa del lenguaje sobre un HAMT persistente.
+
+    `set` y `delete` no modifican el mapa: devuelven uno nuevo que comparte
+    con el original todo salvo el camino a la clave, así que los mapas
+    conservan semántica de valor sin copiarse en cada inserción. Las claves
+    deben ser hashables (ver `is_hashable`); el HAMT guarda, por cada clave,
+    el par (objeto clave, objeto valor) para poder inspeccionarlo.
+    """
+
+    def __init__(self, pairs: Optional[Hamt] = None):
+        self.pairs = pairs if pairs is not None else Hamt()
+
+    @classmethod
+    def from_pairs(cls, pairs: Iterable[Tuple[Object, Object]]) -> 'Hash':
+        return cls(Hamt((hash_key(key), (key, value)) for key, value in pairs))
+
+    def get(self, key: Object) -> Optional[Object]:
+        entry = self.pairs.get(hash_key(key))
+        return None if entry is None else entry[1]
+
+    def set(self, key: Object, value: Object) -> 'Hash':
+        return Hash(self.pairs.set(hash_key(key), (key, value)))
+
+    def delete(self, key: Object) -> 'Hash':
+        pairs = self.pairs.delete(hash_key(key))
+        return self if pairs is self.pairs else Hash(pairs)
+
+    def keys(self) -> Iterator[Object]:
+        return (key for _, (key, _value) in self.pairs.items())
+
+    def __len__(self) -> int:
+        return len(self.pairs)
+
+    def type(self) -> ObjectType:
+        return ObjectType.HASH
+
+    def inspect(self) -> str:
+        pairs = (f'{key.inspect()}: {value.inspect()}' for _, (key, value) in self.pairs.items())
+        return f'{{{", ".join(pairs)}}}'
 
 class String(Object):
+    """
+    Cadena del lenguaje con representación perezosa tipo rope.
+
+    `concat` no copia: crea un nodo que referencia ambas mitades y conoce la
+    longitud total, así que construir una cadena por concatenaciones
+    repetidas es lineal. La cadena se aplana (una sola vez, con `join`)
+    cuando se lee `value`, es decir, al inspeccionarla o usarla como texto.
+    `length` es O(1) y `equals` compara por trozos sin aplanar.
+    """
+
+    # Por debajo de este tamaño copiar es más barato que crear un nodo
+    FLAT_CONCAT_LIMIT = 64
+
     def __init__(self, value: str):
-        self.value = value
+        self._flat: Optional[str] = value
+        self._left: Optional['String'] = None
+        self._right: Optional['String'] = None
+        self._length = len(value)
+
+    @classmethod
+    def concat(cls, left: 'String', right: 'String') -> 'String':
+        """Concatena sin copiar los datos (salvo cadenas pequeñas ya planas)."""
+        if right._length == 0:
+            return left
+        if left._length == 0:
+            return right
+        length = left._length + right._length
+        if length <= cls.FLAT_CONCAT_LIMIT and left._flat is not None and right._flat is not None:
+            return cls(left._flat + right._flat)
+        node = cls.__new__(cls)
+        node._flat = None
+        node._left = left
+        node._right = right
+        node._length = length
+        return node
+
+    @property
+    def value(self) -> str:
+        if self._flat is None:
+            self._flat = ''.join(self.chunks())
+            self._left = None
+            self._right = None
+        return self._flat
+
+    @value.setter
+    def value(self, value: str) -> None:
+        self._flat = value
+        self._left = None
+        self._right = None
+        self._length = len(value)
+
+    @property
+    def length(self) -> int:
+        return self._length
+
+    @property
+    def is_flat(self) -> bool:
+        return self._flat is not None
+
+    def chunks(self) -> Iterator[str]:
+        """Recorre las hojas de izquierda a derecha (iterativo: los ropes pueden ser muy profundos)."""
+        stack: List['String'] = [self]
+        while stack:
+            node = stack.pop()
+            if node._flat is not None:
+                if node._flat:
+                    yield node._flat
+            else:
+                stack.append(node._right)
+                stack.append(node._left)
+
+    def equals(self, other: 'String') -> bool:
+        """Igualdad de contenido sin aplanar: longitud O(1) y luego trozo a trozo."""
+        if self is other:
+            return True
+        if self._length != other._length:
+            return False
+        if self._flat is not None and other._flat is not None:
+            return self._flat == other._flat
+        return _chunks_equal(self.chunks(), other.chunks())
 
     def type(self) -> ObjectType:
         return ObjectType.STRING
 
     def inspect(self) -> str:
         return self.value
+
+
+# Tipos que pueden usarse como clave de un Hash
+_HASHABLE_TYPES = (Integer, Boolean, String)
+
+
+def is_hashable(obj: Object) -> bool:
+    return isinstance(obj, _HASHABLE_TYPES)
+
+
+def hash_key(obj: Object) -> Hashable:
+    """Clave de hash por contenido; precondición: `is_hashable(obj)`."""
+    return (obj.type(), obj.value)
+
+
+def _chunks_equal(left: Iterator[str], right: Iterator[str]) -> bool:
+    """Compara dos secuencias de trozos de igual longitud total."""
+    left_chunk, right_chunk = '', ''
+    while True:
+        if not left_chunk:
+            left_chunk = next(left, '')
+        if not right_chunk:
+            right_chunk = next(right, '')
+        if not left_chunk or not right_chunk:
+            return not left_chunk and not right_chunk
+        size = min(len(left_chunk), len(right_chunk))
+        if left_chunk[:size] != right_chunk[:size]:
+            return False
+        left_chunk = left_chunk[size:]
+        right_chunk = right_chunk[size:]
     
 class BuiltinFunction:
     def __init__(self, fn):
@@ -112,8 +380,17 @@ class BuiltinFunction:
         return self.fn(*args)
     
 class Builtin(Object):
-    def __init__(self, fn):
+    """
+    Función nativa. Se invoca directamente desde `eval_call_expression`,
+    sin crear entorno. Si `applies_functions` es True (map, filter, reduce)
+    recibe como primer argumento un `apply(fn, args)` del evaluador para
+    poder llamar a funciones del lenguaje; si `writes_output` es True
+    (print) recibe el `OutputSink` del intérprete.
+    """
+    def __init__(self, fn, applies_functions: bool = False, writes_output: bool = False):
         self.fn = fn
+        self.applies_functions = applies_functions
+        self.writes_output = writes_output
 
     def type(self) -> ObjectType:
         return ObjectType.BUILTIN
@@ -122,4 +399,58 @@ class Builtin(Object):
         return "builtin function"
 
     def __call__(self, *args):
-        return self.fn(*args)
\ No newline at end of file
+        return self.fn(*args)
+
+
+class AsyncBuiltin(Object):
+    """
+    Función nativa asíncrona (E/S): `fn` es una corrutina. Solo puede
+    llamarse desde `AsyncInterpreter`, que la espera y cede el bucle de
+    eventos mientras tanto; el evaluador síncrono la rechaza con un `Error`.
+    """
+    def __init__(self, fn):
+        self.fn = fn
+
+    def type(self) -> ObjectType:
+        return ObjectType.BUILTIN
+
+    def inspect(self) -> str:
+        return "async builtin function"
+
+    def __call__(self, *args):
+        return self.fn(*args)
+
+
+# Instancias únicas compartidas por el intérprete y los builtins
+NULL = Null()
+TRUE = Boolean(True)
+FALSE = Boolean(False)
+
+
+def to_object(value: Any) -> Object:
+    """
+    Convierte un valor Python en un objeto del lenguaje.
+
+    Los `Object` se devuelven tal cual; `bool`, `int`, `str` y `None` pasan
+    a `Boolean`, `Integer`, `String` y `null`; listas y tuplas a `Array` y
+    diccionarios a `Hash` (convirtiendo también sus elementos).
+    """
+    if isinstance(value, Object):
+        return value
+    if value is None:
+        return NULL
+    if isinstance(value, bool):
+        return TRUE if value else FALSE
+    if isinstance(value, int):
+        return Integer(value)
+    if isinstance(value, str):
+        return String(value)
+    if isinstance(value, (list, tuple)):
+        return Array([to_object(item) for item in value])
+    if isinstance(value, dict):
+        pairs = [(to_object(key), to_object(item)) for key, item in value.items()]
+        for key, _ in pairs:
+            if not is_hashable(key):
+                raise TypeError(f"clave no hashable: {key.inspect()}")
+        return Hash.from_pairs(pairs)
+    raise TypeError(f"no se puede convertir {type(value).__name__} en un objeto del lenguaje")
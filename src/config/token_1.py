@@ -66,6 +66,7 @@ class TokenType(Enum):
     MULTIPLICATION = auto()
     NEGATION = auto()
     ELSE = auto()
+    YIELD = auto()
 
 
 
@@ -1,3 +1,6 @@
 from .interpreter import Interpreter
+from .async_interpreter import AsyncInterpreter
+from .prepared import PreparedProgram, to_object
+from .result_cache import ResultCache, ResultCacheStats
 
-__all__ = ["Interpreter"]
+__all__ = ["AsyncInterpreter", "Interpreter", "PreparedProgram", "ResultCache", "ResultCacheStats", "to_object"]
@@ -0,0 +1,292 @@
+"""Evaluación asíncrona: el programa puede suspenderse en llamadas, bucles y E/S."""
+
+import asyncio
+from typing import List, Optional, Tuple
+import weakref
+
+import src.astNode as ast
+from src.config.environment import Environment
+from src.config.object import (
+    Array, AsyncBuiltin, Builtin, Hash, LazyIterator, Object, Return, is_hashable
+)
+from .dispatcher import Dispatcher
+from .errors import UNHASHABLE_KEY, YIELD_OUTSIDE_GENERATOR, new_error
+from .runtime import FunctionsOperations, IndexOperations, RuntimePrimitives
+
+
+class SuspendAnalyzer:
+    """Decide qué nodos pueden suspenderse: los que contienen llamadas o bucles propios.
+
+    Las funciones anidadas no cuentan: su cuerpo solo se ejecuta al llamarlas.
+    """
+
+    def __init__(self) -> None:
+        self._cache: "weakref.WeakKeyDictionary[ast.ASTNode, bool]" = weakref.WeakKeyDictionary()
+
+    def may_suspend(self, node: Optional[ast.ASTNode]) -> bool:
+        if node is None:
+            return False
+        cached = self._cache.get(node)
+        if cached is None:
+            cached = self._scan(node)
+            self._cache[node] = cached
+        return cached
+
+    def _scan(self, node: ast.ASTNode) -> bool:
+        node_type = type(node)
+        if node_type in (ast.Call, ast.WhileStatement, ast.ForStatement):
+            return True
+        if node_type in (ast.Block, ast.Program):
+            return any(self.may_suspend(statement) for statement in node.statements)
+        if node_type is ast.ExpressionStatement:
+            return self.may_suspend(node.expression)
+        if node_type is ast.LetStatement:
+            return self.may_suspend(node.value)
+        if node_type is ast.ReturnStatement:
+            return self.may_suspend(node.return_value)
+        if node_type is ast.Prefix:
+            return self.may_suspend(node.right)
+        if node_type is ast.Infix:
+            return self.may_suspend(node.left) or self.may_suspend(node.right)
+        if node_type is ast.If:
+            return (self.may_suspend(node.condition) or self.may_suspend(node.consequence)
+                    or self.may_suspend(node.alternative))
+        if node_type is ast.ArrayLiteral:
+            return any(self.may_suspend(element) for element in node.elements)
+        if node_type is ast.HashLiteral:
+            return any(self.may_suspend(key) or self.may_suspend(value) for key, value in node.pairs)
+        if node_type is ast.Index:
+            return self.may_suspend(node.left) or self.may_suspend(node.index)
+        # Literales, identificadores, funciones y yield (solo válido en generadores)
+        return False
+
+
+class AsyncEvaluator:
+    """
+    Evalúa un programa como corrutina sobre un contexto de ejecución.
+
+    Igual que `GeneratorRunner`, solo los nodos que pueden suspenderse se
+    recorren aquí; el resto se evalúa con el dispatcher síncrono del
+    contexto. Las llamadas a `AsyncBuiltin` se esperan, y cada
+    `yield_interval` pasos (llamadas e iteraciones) se cede el bucle de
+    eventos para que un cálculo largo no acapare a los demás scripts.
+
+    Los cuerpos generadores y las funciones que reciben builtins de orden
+    superior (`map`, `filter`...) se ejecutan de forma síncrona.
+    """
+
+    DEFAULT_YIELD_INTERVAL = 1000
+
+    def __init__(self, context: Dispatcher, analyzer: SuspendAnalyzer,
+                 yield_interval: int = DEFAULT_YIELD_INTERVAL) -> None:
+        if yield_interval <= 0:
+            raise ValueError("yield_interval debe ser positivo")
+        self.context = context
+        self.analyzer = analyzer
+        self.yield_interval = yield_interval
+        self._countdown = yield_interval
+
+    async def evaluate(self, node: ast.ASTNode, environment: Environment) -> Optional[Object]:
+        if not self.analyzer.may_suspend(node):
+            return self.context.evaluate(node, environment)
+
+        node_type = type(node)
+        if node_type is ast.Program:
+            return await self._program(node, environment)
+        if node_type is ast.Block:
+            return await self._block(node, environment)
+        if node_type is ast.ExpressionStatement:
+            return await self.evaluate(node.expression, environment)
+        if node_type is ast.LetStatement:
+            value = await self.evaluate(node.value, environment)
+            if value is not None and value.abrupt:
+                return value
+            environment.set(node.name.value, value)
+            return value
+        if node_type is ast.ReturnStatement:
+            register = self.context.statements.return_register
+            register.value = await self.evaluate(node.return_value, environment)
+            return register
+        if node_type is ast.YieldStatement:
+            return new_error(YIELD_OUTSIDE_GENERATOR, [])
+        if node_type is ast.If:
+            return await self._if(node, environment)
+        if node_type is ast.WhileStatement:
+            return await self._while(node, environment)
+        if node_type is ast.ForStatement:
+            return await self._for(node, environment)
+        if node_type is ast.Call:
+            return await self._call_expression(node, environment)
+        if node_type is ast.Prefix:
+            right = await self.evaluate(node.right, environment)
+            assert right is not None
+            return self._charged(self.context.expressions.apply_prefix(node.operator, right))
+        if node_type is ast.Infix:
+            left = await self.evaluate(node.left, environment)
+            right = await self.evaluate(node.right, environment)
+            assert left is not None and right is not None
+            return self._charged(self.context.expressions.apply_infix(node.operator, left, right))
+        if node_type is ast.ArrayLiteral:
+            return await self._array_literal(node, environment)
+        if node_type is ast.HashLiteral:
+            return await self._hash_literal(node, environment)
+        if node_type is ast.Index:
+            left = await self.evaluate(node.left, environment)
+            if left is None or left.abrupt:
+                return left
+            index = await self.evaluate(node.index, environment)
+            if index is None or index.abrupt:
+                return index
+            return IndexOperations.index(left, index)
+        return self.context.evaluate(node, environment)
+
+    async def call_function(self, function_object: Object, arguments: List[Object]) -> Object:
+        """Aplica una función esperando las de E/S y los cuerpos que pueden suspenderse."""
+        if isinstance(function_object, Builtin):
+            # Los builtins síncronos cuentan su paso en el propio evaluador
+            return self.context.expressions.call_function(function_object, arguments)
+        await self._step()
+        if isinstance(function_object, AsyncBuiltin):
+            return self._charged(await function_object(*arguments))
+
+        expressions = self.context.expressions
+        memo = expressions.memo
+        memo_key = None
+        if memo is not None:
+            memo_key = memo.key_for(function_object, arguments)
+            if memo_key is not None:
+                cached = memo.get(memo_key)
+                if cached is not None:
+                    return cached
+
+        apply_result = FunctionsOperations.apply_function(function_object, arguments, expressions.frames)
+        if isinstance(apply_result, Object):  # Error
+            return apply_result
+        block_node, extended_environment = apply_result
+        memory = expressions.memory
+        if memory is not None:
+            memory.acquire_frame()
+        if expressions.generators.is_generator(block_node):
+            return LazyIterator(expressions.generators.run(block_node, extended_environment), 'generator')
+        result = await self.evaluate(block_node, extended_environment)
+        assert result is not None
+        if expressions.frames is not None:
+            expressions.frames.release(extended_environment, block_node)
+        if memory is not None:
+            memory.release_frame()
+        value = FunctionsOperations.unwrap_return_value(result)
+        if memo_key is not None:
+            memo.put(memo_key, value)
+        return value
+
+    async def _step(self) -> None:
+        """Consume un paso del presupuesto y cede el bucle de eventos cada `yield_interval`."""
+        budget = self.context.statements.budget
+        if budget is not None:
+            budget.tick()
+        self._countdown -= 1
+        if self._countdown <= 0:
+            self._countdown = self.yield_interval
+            await asyncio.sleep(0)
+
+    def _charged(self, value: Object) -> Object:
+        memory = self.context.expressions.memory
+        if memory is not None:
+            memory.charge_value(value)
+        return value
+
+    async def _program(self, node: ast.Program, environment: Environment) -> Optional[Object]:
+        result: Optional[Object] = None
+        for statement in node.statements:
+            result = await self.evaluate(statement, environment)
+            if result is not None and result.abrupt:
+                if isinstance(result, Return):
+                    return result.value
+                return result
+        return result
+
+    async def _block(self, node: ast.Block, environment: Environment) -> Optional[Object]:
+        result: Optional[Object] = None
+        for statement in node.statements:
+            result = await self.evaluate(statement, environment)
+            if result is not None and result.abrupt:
+                return result
+        return result
+
+    async def _if(self, node: ast.If, environment: Environment) -> Optional[Object]:
+        condition = await self.evaluate(node.condition, environment)
+        assert condition is not None
+        if condition.abrupt:
+            return condition
+        if RuntimePrimitives.is_truthy(condition):
+            return await self.evaluate(node.consequence, environment)
+        if node.alternative is not None:
+            return await self.evaluate(node.alternative, environment)
+        return RuntimePrimitives.NULL
+
+    async def _while(self, node: ast.WhileStatement, environment: Environment) -> Object:
+        while True:
+            await self._step()
+            condition = await self.evaluate(node.condition, environment)
+            if condition is not None and condition.abrupt:
+                return condition
+            if not RuntimePrimitives.is_truthy(condition):
+                return RuntimePrimitives.NULL
+            result = await self.evaluate(node.body, environment)
+            if result is not None and result.abrupt:
+                return result
+
+    async def _for(self, node: ast.ForStatement, environment: Environment) -> Object:
+        iterable = await self.evaluate(node.iterable, environment)
+        if iterable is not None and iterable.abrupt:
+            return iterable
+        items = self.context.statements.iteration_items(iterable)
+        if isinstance(items, Object):  # Error
+            return items
+        name = node.variable.value
+        for item in items:
+            if item.abrupt:
+                return item
+            await self._step()
+            environment.set(name, item)
+            result = await self.evaluate(node.body, environment)
+            if result is not None and result.abrupt:
+                return result
+        return RuntimePrimitives.NULL
+
+    async def _call_expression(self, node: ast.Call, environment: Environment) -> Object:
+        function_object = await self.evaluate(node.function, environment)
+        assert function_object is not None
+        # Como en el evaluador síncrono: ni el callee ni los argumentos cortan la llamada
+        arguments: List[Object] = []
+        for argument_node in node.arguments:
+            argument = await self.evaluate(argument_node, environment)
+            assert argument is not None
+            arguments.append(argument)
+        return await self.call_function(function_object, arguments)
+
+    async def _array_literal(self, node: ast.ArrayLiteral, environment: Environment) -> Object:
+        elements: List[Object] = []
+        for element in node.elements:
+            value = await self.evaluate(element, environment)
+            assert value is not None
+            if value.abrupt:
+                return value
+            elements.append(value)
+        return Array(elements)
+
+    async def _hash_literal(self, node: ast.HashLiteral, environment: Environment) -> Object:
+        pairs: List[Tuple[Object, Object]] = []
+        for key_node, value_node in node.pairs:
+            key = await self.evaluate(key_node, environment)
+            assert key is not None
+            if key.abrupt:
+                return key
+            if not is_hashable(key):
+                return new_error(UNHASHABLE_KEY, [key.type().name])
+            value = await self.evaluate(value_node, environment)
+            assert value is not None
+            if value.abrupt:
+                return value
+            pairs.append((key, value))
+        return Hash.from_pairs(pairs)
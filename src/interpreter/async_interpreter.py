@@ -0,0 +1,57 @@
+"""Intérprete para servicios asyncio: miles de scripts concurrentes en un solo hilo."""
+
+import asyncio
+from typing import Any, Optional
+
+import src.astNode as ast
+from src.builtins import ASYNC_BUILTINS
+from src.builtins.output import OutputTarget
+from src.config.environment import Environment, FrozenEnvironment
+from src.config.object import Object
+from .async_eval import AsyncEvaluator, SuspendAnalyzer
+from .errors import DEADLINE_EXCEEDED, RECURSION_LIMIT, new_error
+from .interpreter import Interpreter
+from .limits import LimitExceeded
+
+
+class AsyncInterpreter(Interpreter):
+    """
+    `Interpreter` cuyos programas se ejecutan como corrutinas con `interpret_async`.
+
+    Los scripts pueden llamar a los builtins de E/S (`sleep`, `read_file`,
+    `http_get`), que se esperan sin bloquear el bucle de eventos, y ceden
+    el control cada `yield_interval` pasos. Cada ejecución tiene su propio
+    contexto, así que pueden solaparse tantas como tareas haya. `timeout`
+    se aplica también al tiempo pasado esperando E/S.
+
+    `interpret` (heredado) sigue ejecutando de forma síncrona los programas
+    que no usan E/S.
+    """
+
+    def __init__(self, *args: Any, yield_interval: int = AsyncEvaluator.DEFAULT_YIELD_INTERVAL,
+                 **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.yield_interval = yield_interval
+        self._suspends = SuspendAnalyzer()
+
+    async def interpret_async(self, program: ast.Program, fuel: Optional[int] = None,
+                              timeout: Optional[float] = None, memory_limit: Optional[int] = None,
+                              output: OutputTarget = None,
+                              prelude: Optional[FrozenEnvironment] = None) -> Optional[Object]:
+        context, run_output, memory = self._start_run(fuel, timeout, memory_limit, output)
+        environment = prelude.child() if prelude is not None else Environment()
+        for name, builtin in ASYNC_BUILTINS.items():
+            environment.set(name, builtin)
+        evaluator = AsyncEvaluator(context, self._suspends, self.yield_interval)
+        result: Optional[Object] = None
+        try:
+            result = await asyncio.wait_for(evaluator.evaluate(program, environment), timeout)
+            return result
+        except asyncio.TimeoutError:
+            return new_error(DEADLINE_EXCEEDED, [timeout])
+        except LimitExceeded as exceeded:
+            return exceeded.error
+        except RecursionError:
+            return new_error(RECURSION_LIMIT, [])
+        finally:
+            self._finish_run(context, run_output, output, memory, result)
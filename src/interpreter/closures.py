@@ -0,0 +1,155 @@
+"""Conversión de clausuras: cada función captura solo sus variables libres."""
+
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Set
+import weakref
+
+import src.astNode as ast
+from src.config.environment import Cell, ClosureEnvironment, Environment, OverlayEnvironment
+
+
+@dataclass(frozen=True)
+class ScopeInfo:
+    """Resultado del análisis de variables de un literal de función.
+
+    Attributes:
+        free: Nombres leídos por el cuerpo (o por funciones anidadas) que no
+            están ligados localmente en el momento de la lectura.
+        declared: Parámetros y nombres ligados con `let` en el propio cuerpo.
+    """
+    free: FrozenSet[str]
+    declared: FrozenSet[str]
+
+
+class ClosureConverter:
+    """Analiza literales `ast.Function` y construye sus entornos de captura.
+
+    El análisis se cachea por nodo. Además recuerda, para cada literal
+    anidado, el `ScopeInfo` de la función que lo contiene: así, al crear la
+    clausura, se sabe qué variables libres pertenecen al marco actual
+    (incluidas las que se ligarán después, como en la recursión local).
+    """
+
+    def __init__(self) -> None:
+        self._scopes: "weakref.WeakKeyDictionary[ast.Function, ScopeInfo]" = weakref.WeakKeyDictionary()
+        self._parents: "weakref.WeakKeyDictionary[ast.Function, ScopeInfo]" = weakref.WeakKeyDictionary()
+
+    def analyze(self, node: ast.Function) -> ScopeInfo:
+        """Calcula (o recupera de la caché) las variables libres del literal."""
+        cached = self._scopes.get(node)
+        if cached is not None:
+            return cached
+
+        parameters = {parameter.value for parameter in node.parameters or []}
+        declared: Set[str] = set(parameters)
+        self._collect_declared(node.body, declared)
+
+        free: Set[str] = set()
+        nested: List[ast.Function] = []
+        self._collect_free(node.body, set(parameters), declared, free, nested)
+
+        info = ScopeInfo(free=frozenset(free - parameters), declared=frozenset(declared))
+        for literal in nested:
+            self._parents[literal] = info
+        self._scopes[node] = info
+        return info
+
+    def capture(self, node: ast.Function, environment: Environment) -> Environment:
+        """Devuelve el entorno que debe guardar la clausura creada en `environment`.
+
+        En el entorno global (o en la capa global de una ejecución sobre una
+        instantánea) no hay nada que liberar y se devuelve tal cual.
+        Dentro de un marco de llamada se crean celdas solo para las variables
+        libres propias de ese marco; el resto se resuelve por el entorno exterior.
+        """
+        info = self.analyze(node)
+        if environment.outer is None or type(environment) is OverlayEnvironment:
+            return environment
+
+        parent = self._parents.get(node)
+        owned = parent.declared if parent is not None else frozenset()
+        cells: Dict[str, Cell] = {}
+        for name in info.free:
+            if name in owned or name in environment.store:
+                cells[name] = environment.cell(name)
+        return ClosureEnvironment(cells, environment.outer)
+
+    def _collect_declared(self, node: Optional[ast.ASTNode], declared: Set[str]) -> None:
+        """Nombres ligados con `let` en el cuerpo, sin entrar en funciones anidadas."""
+        node_type = type(node)
+        if node_type is ast.Block:
+            for statement in node.statements:
+                self._collect_declared(statement, declared)
+        elif node_type is ast.LetStatement:
+            if node.name is not None:
+                declared.add(node.name.value)
+        elif node_type is ast.ExpressionStatement:
+            self._collect_declared(node.expression, declared)
+        elif node_type is ast.If:
+            self._collect_declared(node.consequence, declared)
+            self._collect_declared(node.alternative, declared)
+        elif node_type is ast.WhileStatement:
+            self._collect_declared(node.body, declared)
+        elif node_type is ast.ForStatement:
+            if node.variable is not None:
+                declared.add(node.variable.value)
+            self._collect_declared(node.body, declared)
+
+    def _collect_free(self, node: Optional[ast.ASTNode], bound: Set[str], declared: Set[str],
+                      free: Set[str], nested: List[ast.Function]) -> None:
+        """Recorre el cuerpo en orden acumulando lecturas de nombres aún no ligados."""
+        node_type = type(node)
+        if node_type is ast.Identifier:
+            if node.value not in bound:
+                free.add(node.value)
+        elif node_type is ast.Block:
+            for statement in node.statements:
+                self._collect_free(statement, bound, declared, free, nested)
+        elif node_type is ast.LetStatement:
+            self._collect_free(node.value, bound, declared, free, nested)
+            if node.name is not None:
+                bound.add(node.name.value)
+        elif node_type is ast.ReturnStatement:
+            self._collect_free(node.return_value, bound, declared, free, nested)
+        elif node_type is ast.YieldStatement:
+            self._collect_free(node.value, bound, declared, free, nested)
+        elif node_type is ast.ExpressionStatement:
+            self._collect_free(node.expression, bound, declared, free, nested)
+        elif node_type is ast.Prefix:
+            self._collect_free(node.right, bound, declared, free, nested)
+        elif node_type is ast.Infix:
+            self._collect_free(node.left, bound, declared, free, nested)
+            self._collect_free(node.right, bound, declared, free, nested)
+        elif node_type is ast.If:
+            self._collect_free(node.condition, bound, declared, free, nested)
+            # Los `let` de una rama solo ligan dentro de ella
+            self._collect_free(node.consequence, set(bound), declared, free, nested)
+            self._collect_free(node.alternative, set(bound), declared, free, nested)
+        elif node_type is ast.WhileStatement:
+            self._collect_free(node.condition, bound, declared, free, nested)
+            self._collect_free(node.body, set(bound), declared, free, nested)
+        elif node_type is ast.ForStatement:
+            self._collect_free(node.iterable, bound, declared, free, nested)
+            body_bound = set(bound)
+            if node.variable is not None:
+                body_bound.add(node.variable.value)
+            self._collect_free(node.body, body_bound, declared, free, nested)
+        elif node_type is ast.Call:
+            self._collect_free(node.function, bound, declared, free, nested)
+            for argument in node.arguments or []:
+                self._collect_free(argument, bound, declared, free, nested)
+        elif node_type is ast.ArrayLiteral:
+            for element in node.elements:
+                self._collect_free(element, bound, declared, free, nested)
+        elif node_type is ast.HashLiteral:
+            for key, value in node.pairs:
+                self._collect_free(key, bound, declared, free, nested)
+                self._collect_free(value, bound, declared, free, nested)
+        elif node_type is ast.Index:
+            self._collect_free(node.left, bound, declared, free, nested)
+            self._collect_free(node.index, bound, declared, free, nested)
+        elif node_type is ast.Function:
+            nested.append(node)
+            # Las funciones anidadas se llaman más tarde: sus lecturas de nombres
+            # declarados aquí se resuelven en este marco, no fuera de él
+            free.update(self.analyze(node).free - declared)
@@ -0,0 +1,455 @@
+"""
+Evaluación por columnas: un programa sobre muchas filas de entrada a la vez.
+
+Cada nodo del AST se visita una vez por lote, no una vez por fila: los
+operandos son columnas (listas Python) y los operadores se aplican con
+`map` sobre ellas. Las columnas de enteros, booleanos y cadenas guardan
+los valores Python sin envolver; las demás (y las que contienen errores)
+guardan objetos del lenguaje y se operan fila a fila con las mismas
+funciones que el evaluador (`apply_infix`, `apply_prefix`, ...), así que
+el resultado de cada fila es el mismo que daría `Interpreter.interpret`.
+
+Se vectorizan literales, identificadores, `ast.Prefix`, `ast.Infix`,
+`ast.Index`, `if` (las filas se reparten entre las ramas), `let`,
+`return` y llamadas a funciones del lenguaje (su cuerpo se evalúa sobre las
+filas de la llamada) o a builtins sin efectos. Cualquier otra construcción
+lanza `Unvectorizable` y el llamador repite el lote fila a fila.
+"""
+
+from itertools import compress
+import operator
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Tuple, Union
+
+import src.astNode as ast
+from src.builtins import BUILTINS
+from src.config.environment import Environment
+from src.config.object import (
+    FALSE, NULL, TRUE, Boolean, Builtin, Error, Function, Integer, Object, String, to_object
+)
+from .errors import DIVISION_BY_ZERO, UNKNOWN_INFIX_OPERATOR, new_error
+from .eval_expressions import ExpressionEvaluator
+from .generators import YieldAnalyzer
+from .runtime import IndexOperations, RuntimePrimitives
+
+# Tipos de columna: valores Python sin envolver u objetos del lenguaje
+INT, BOOL, STR, OBJ = "int", "bool", "str", "obj"
+
+_RAW_KINDS = {int: INT, bool: BOOL, str: STR}
+_BOXED_KINDS = {Integer: INT, Boolean: BOOL, String: STR}
+
+_INTEGER_ARITHMETIC = {'+': operator.add, '-': operator.sub, '*': operator.mul}
+_COMPARISONS = {
+    '<': operator.lt, '<=': operator.le, '>': operator.gt,
+    '>=': operator.ge, '==': operator.eq, '!=': operator.ne,
+}
+
+
+class Unvectorizable(Exception):
+    """El programa (o este lote) no puede evaluarse por columnas."""
+
+
+class Column:
+    """Valores de una expresión para las filas activas, en orden."""
+    __slots__ = ("kind", "values")
+
+    def __init__(self, kind: str, values: List[Any]) -> None:
+        self.kind = kind
+        self.values = values
+
+    @classmethod
+    def constant(cls, value: Object, size: int) -> "Column":
+        kind, raw = _unbox(value)
+        return cls(kind, [raw] * size)
+
+    @classmethod
+    def from_values(cls, values: Sequence[Any]) -> "Column":
+        """Columna a partir de valores Python u objetos del lenguaje (p. ej. `array.tolist()`)."""
+        values = list(values)
+        kinds = set(map(type, values))
+        if len(kinds) == 1 and kinds <= {int, bool, str}:
+            return cls(_RAW_KINDS[kinds.pop()], values)
+        return cls.from_objects([to_object(value) for value in values])
+
+    @classmethod
+    def from_objects(cls, values: List[Object]) -> "Column":
+        """Columna de objetos; si todos son enteros, booleanos o cadenas se guardan sin envolver."""
+        kinds = set(map(type, values))
+        if len(kinds) == 1:
+            kind = _BOXED_KINDS.get(kinds.pop())
+            if kind is not None:
+                return cls(kind, [value.value for value in values])
+        return cls(OBJ, values)
+
+    def take(self, positions: Sequence[int]) -> "Column":
+        values = self.values
+        return Column(self.kind, [values[position] for position in positions])
+
+    def boxed(self) -> List[Object]:
+        kind = self.kind
+        if kind == INT:
+            return [Integer(value) for value in self.values]
+        if kind == BOOL:
+            return [TRUE if value else FALSE for value in self.values]
+        if kind == STR:
+            return [String(value) for value in self.values]
+        return self.values
+
+    def truthy(self) -> List[bool]:
+        if self.kind == BOOL:
+            return self.values
+        if self.kind == OBJ:
+            is_truthy = RuntimePrimitives.is_truthy
+            return [is_truthy(value) for value in self.values]
+        # Enteros y cadenas son siempre verdaderos
+        return [True] * len(self.values)
+
+    def errors(self) -> List[bool]:
+        if self.kind != OBJ:
+            return [False] * len(self.values)
+        return [type(value) is Error for value in self.values]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+def _unbox(value: Object) -> Tuple[str, Any]:
+    value_type = type(value)
+    if value_type is Integer:
+        return INT, value.value
+    if value_type is Boolean:
+        return BOOL, value.value
+    if value_type is String:
+        return STR, value.value
+    return OBJ, value
+
+
+def _box(value: Any) -> Object:
+    value_type = type(value)
+    if value_type is bool:
+        return TRUE if value else FALSE
+    if value_type is int:
+        return Integer(value)
+    return String(value)
+
+
+class _Closure:
+    """Literal de función ligado con `let` en el nivel superior del programa."""
+    __slots__ = ("node",)
+
+    def __init__(self, node: ast.Function) -> None:
+        self.node = node
+
+
+Callee = Union[_Closure, Function, Builtin]
+Binding = Union[Column, Callee]
+
+
+class Frame:
+    """
+    Variables visibles para un subconjunto de filas.
+
+    `rows` son los índices absolutos (en el lote) de las filas activas. Un
+    marco hijo de `narrow` ve las variables del padre restringidas a sus
+    filas; la restricción se hace al leer cada nombre, no al crear el marco.
+    """
+    __slots__ = ("rows", "names", "parent", "positions", "environment", "_taken")
+
+    def __init__(self, rows: List[int], parent: Optional["Frame"] = None,
+                 positions: Optional[List[int]] = None, environment: Optional[Environment] = None) -> None:
+        self.rows = rows
+        self.names: Dict[str, Binding] = {}
+        self.parent = parent
+        self.positions = positions
+        self.environment = environment
+        self._taken: Dict[str, Binding] = {}
+
+    def narrow(self, positions: List[int]) -> "Frame":
+        rows = self.rows
+        return Frame([rows[position] for position in positions], self, positions)
+
+    def lookup(self, name: str) -> Optional[Binding]:
+        binding = self.names.get(name)
+        if binding is not None:
+            return binding
+        binding = self._taken.get(name)
+        if binding is not None:
+            return binding
+        if self.parent is not None:
+            binding = self.parent.lookup(name)
+            if type(binding) is Column:
+                binding = binding.take(self.positions)
+        elif self.environment is not None:
+            binding = self._global(name)
+        if binding is not None:
+            self._taken[name] = binding
+        return binding
+
+    def _global(self, name: str) -> Optional[Binding]:
+        value = self.environment.get(name)
+        if value is None:
+            value = BUILTINS.get(name)
+        if value is None:
+            return None
+        if isinstance(value, (Function, Builtin)):
+            return value
+        return Column.constant(value, len(self.rows))
+
+
+class ColumnarEvaluator:
+    """
+    Evalúa un `ast.Program` sobre columnas de entrada.
+
+    `run` devuelve el resultado de cada fila como lo devolvería
+    `Interpreter.interpret` con esas entradas, o lanza `Unvectorizable`.
+    No aplica fuel, tiempo ni cuota de memoria: con límites hay que
+    ejecutar fila a fila.
+    """
+
+    MAX_CALL_DEPTH = 200
+
+    def __init__(self) -> None:
+        self.yields = YieldAnalyzer()
+        self._depth = 0
+
+    def run(self, program: ast.Program, columns: Mapping[str, Column], size: int,
+            environment: Environment) -> List[Object]:
+        root = Frame(list(range(size)), environment=environment)
+        for name, column in columns.items():
+            root.names[name] = column
+        self._depth = 0
+        column, _ = self._block(program.statements, root, root)
+        return column.boxed()
+
+    # Sentencias: devuelven la columna resultado y las posiciones que terminaron con `return`
+
+    def _block(self, statements: Sequence[ast.Statement], frame: Frame, root: Frame) -> Tuple[Column, Set[int]]:
+        """
+        Evalúa las sentencias para todas las filas del marco.
+
+        Una fila termina en la primera sentencia que le da un `Error` o un
+        `return`; su valor queda fijado ahí. Las sentencias siguientes se
+        siguen evaluando para todas las filas (sin efectos, no cambia nada)
+        para no tener que restringir el marco a mitad de bloque.
+        """
+        if not statements:
+            raise Unvectorizable("bloque vacío")
+        size = len(frame.rows)
+        done = [False] * size
+        finals: List[Any] = [None] * size
+        final_kinds: Set[str] = set()
+        returned: Set[int] = set()
+        last = len(statements) - 1
+        result: Optional[Column] = None
+        for index, statement in enumerate(statements):
+            statement_type = type(statement)
+            if statement_type is ast.LetStatement and type(statement.value) is ast.Function:
+                if frame is not root or index == last:
+                    raise Unvectorizable("función definida fuera del nivel superior")
+                root.names[statement.name.value] = _Closure(statement.value)
+                continue
+            if statement_type is ast.LetStatement:
+                column, stopped = self._statement_value(statement.value, frame, root)
+            elif statement_type is ast.ExpressionStatement:
+                column, stopped = self._statement_value(statement.expression, frame, root)
+            elif statement_type is ast.ReturnStatement:
+                column, stopped = self._expression(statement.return_value, frame, root), set(range(size))
+            else:
+                raise Unvectorizable(statement_type.__name__)
+
+            if index == last or len(stopped) == size:
+                result = column
+                returned.update(position for position in stopped if not done[position])
+                break
+            if stopped or column.kind == OBJ:
+                errors = column.errors()
+                for position in range(size):
+                    if not done[position] and (errors[position] or position in stopped):
+                        done[position] = True
+                        finals[position] = column.values[position]
+                        final_kinds.add(column.kind)
+                        if position in stopped:
+                            returned.add(position)
+            if statement_type is ast.LetStatement:
+                frame.names[statement.name.value] = column
+            if all(done):
+                break
+        return self._merge(done, finals, final_kinds, result), returned
+
+    @staticmethod
+    def _merge(done: List[bool], finals: List[Any], final_kinds: Set[str], result: Optional[Column]) -> Column:
+        """Columna del bloque: el valor fijado en las filas terminadas antes y `result` en el resto."""
+        if not final_kinds:
+            if result is None:
+                raise Unvectorizable("bloque sin valor")
+            return result
+        if result is None:
+            if not all(done):
+                raise Unvectorizable("bloque sin valor")
+            result = Column(OBJ, [None] * len(done))
+            kinds = final_kinds
+        else:
+            kinds = final_kinds | {result.kind}
+        if len(kinds) == 1:
+            values = list(result.values)
+            for position in compress(range(len(done)), done):
+                values[position] = finals[position]
+            return Column(kinds.pop(), values)
+        # Tipos distintos: todo como objetos del lenguaje (cada valor terminado conserva el suyo)
+        values = result.boxed() if result.kind != OBJ else list(result.values)
+        for position in compress(range(len(done)), done):
+            values[position] = finals[position]
+        return Column.from_objects([value if type(value) not in _RAW_KINDS else _box(value) for value in values])
+
+    def _statement_value(self, node: ast.Expression, frame: Frame, root: Frame) -> Tuple[Column, Set[int]]:
+        """Valor de una expresión en posición de sentencia, donde un `if` puede hacer `return`."""
+        if type(node) is ast.If:
+            return self._if(node, frame, root)
+        return self._expression(node, frame, root), set()
+
+    # Expresiones
+
+    def _expression(self, node: ast.Expression, frame: Frame, root: Frame) -> Column:
+        node_type = type(node)
+        size = len(frame.rows)
+        if node_type is ast.Identifier:
+            binding = frame.lookup(node.value)
+            if type(binding) is not Column:
+                raise Unvectorizable(f"identificador {node.value}")
+            return binding
+        if node_type is ast.Integer:
+            return Column(INT, [node.value] * size)
+        if node_type is ast.Boolean:
+            return Column(BOOL, [bool(node.value)] * size)
+        if node_type is ast.StringLiteral:
+            return Column(STR, [node.value] * size)
+        if node_type is ast.Infix:
+            left = self._expression(node.left, frame, root)
+            right = self._expression(node.right, frame, root)
+            return self._infix(node.operator, left, right)
+        if node_type is ast.Prefix:
+            return self._prefix(node.operator, self._expression(node.right, frame, root))
+        if node_type is ast.If:
+            column, returned = self._if(node, frame, root)
+            if returned:
+                raise Unvectorizable("return dentro de una expresión")
+            return column
+        if node_type is ast.Call:
+            return self._call(node, frame, root)
+        if node_type is ast.Index:
+            left = self._expression(node.left, frame, root)
+            index = self._expression(node.index, frame, root)
+            return Column(OBJ, [_index(container, key) for container, key in zip(left.boxed(), index.boxed())])
+        raise Unvectorizable(node_type.__name__)
+
+    @staticmethod
+    def _infix(operator_: str, left: Column, right: Column) -> Column:
+        if left.kind == INT and right.kind == INT:
+            arithmetic = _INTEGER_ARITHMETIC.get(operator_)
+            if arithmetic is not None:
+                return Column(INT, list(map(arithmetic, left.values, right.values)))
+            comparison = _COMPARISONS.get(operator_)
+            if comparison is not None:
+                return Column(BOOL, list(map(comparison, left.values, right.values)))
+            if operator_ == '/':
+                if 0 not in right.values:
+                    return Column(INT, list(map(operator.floordiv, left.values, right.values)))
+                # Cada fila con divisor cero da su propio error
+                return Column(OBJ, [Integer(dividend // divisor) if divisor else new_error(DIVISION_BY_ZERO, [])
+                                    for dividend, divisor in zip(left.values, right.values)])
+            error = new_error(UNKNOWN_INFIX_OPERATOR, ["INTEGER", operator_, "INTEGER"])
+            return Column(OBJ, [error] * len(left))
+        if left.kind == STR and right.kind == STR:
+            if operator_ == '+':
+                return Column(STR, list(map(operator.add, left.values, right.values)))
+            if operator_ in ('==', '!='):
+                return Column(BOOL, list(map(_COMPARISONS[operator_], left.values, right.values)))
+        apply_infix = ExpressionEvaluator.apply_infix
+        return Column(OBJ, [apply_infix(operator_, left_value, right_value)
+                            for left_value, right_value in zip(left.boxed(), right.boxed())])
+
+    @staticmethod
+    def _prefix(operator_: str, right: Column) -> Column:
+        if operator_ == '-' and right.kind == INT:
+            return Column(INT, list(map(operator.neg, right.values)))
+        if operator_ == '!' and right.kind != OBJ:
+            return Column(BOOL, [not truthy for truthy in right.truthy()])
+        apply_prefix = ExpressionEvaluator.apply_prefix
+        return Column(OBJ, [apply_prefix(operator_, value) for value in right.boxed()])
+
+    def _if(self, node: ast.If, frame: Frame, root: Frame) -> Tuple[Column, Set[int]]:
+        """Reparte las filas según la condición y evalúa cada rama solo con las suyas."""
+        truthy = self._expression(node.condition, frame, root).truthy()
+        consequence = [position for position, value in enumerate(truthy) if value]
+        alternative = [position for position, value in enumerate(truthy) if not value]
+        branches: List[Tuple[List[int], Column, Set[int]]] = []
+        for positions, block in ((consequence, node.consequence), (alternative, node.alternative)):
+            if not positions:
+                continue
+            if block is None:
+                branches.append((positions, Column(OBJ, [NULL] * len(positions)), set()))
+                continue
+            statements = block.statements
+            if (any(type(statement) is ast.LetStatement for statement in statements)
+                    and type(statements[-1]) is not ast.ReturnStatement):
+                # Un `let` en una rama sigue ligado después del `if`: no se puede aislar
+                raise Unvectorizable("let en una rama sin return")
+            column, returned = self._block(statements, frame.narrow(positions), root)
+            branches.append((positions, column, returned))
+
+        if len(branches) == 1 and len(branches[0][0]) == len(truthy):
+            return branches[0][1], branches[0][2]
+        kinds = {column.kind for _, column, _ in branches}
+        kind = kinds.pop() if len(kinds) == 1 else OBJ
+        values: List[Any] = [None] * len(truthy)
+        returned: Set[int] = set()
+        for positions, column, branch_returned in branches:
+            branch_values = column.values if kind != OBJ else column.boxed()
+            for position, value in zip(positions, branch_values):
+                values[position] = value
+            returned.update(positions[position] for position in branch_returned)
+        return Column(kind, values), returned
+
+    def _call(self, node: ast.Call, frame: Frame, root: Frame) -> Column:
+        if type(node.function) is not ast.Identifier:
+            raise Unvectorizable("llamada a una expresión")
+        callee = frame.lookup(node.function.value)
+        arguments = [self._expression(argument, frame, root) for argument in node.arguments]
+        size = len(frame.rows)
+        if type(callee) is Builtin:
+            if callee.applies_functions or callee.writes_output:
+                raise Unvectorizable(f"builtin {node.function.value}")
+            # Builtin sin efectos: se aplica fila a fila
+            rows = zip(*(argument.boxed() for argument in arguments)) if arguments else ([()] * size)
+            return Column.from_objects([callee(*values) for values in rows])
+        if type(callee) is _Closure:
+            function_node = callee.node
+            parameters, body = function_node.parameters, function_node.body
+            scope = Frame(frame.rows, root, frame.rows)
+        elif type(callee) is Function:
+            parameters, body = callee.parameters, callee.body
+            scope = Frame(frame.rows, environment=callee.env)
+        else:
+            raise Unvectorizable("llamada a algo que no es una función")
+        if len(parameters) != len(arguments) or self.yields.contains_yield(body):
+            raise Unvectorizable("aridad distinta o función generadora")
+        if size == 0:
+            return Column(OBJ, [])
+        self._depth += 1
+        if self._depth > self.MAX_CALL_DEPTH:
+            raise Unvectorizable("recursión demasiado profunda")
+        try:
+            for parameter, argument in zip(parameters, arguments):
+                scope.names[parameter.value] = argument
+            column, _ = self._block(body.statements, scope, root)
+        finally:
+            self._depth -= 1
+        return column
+
+
+def _index(container: Object, key: Object) -> Object:
+    """Como `eval_index_expression`: un operando con error se propaga tal cual."""
+    if type(container) is Error:
+        return container
+    if type(key) is Error:
+        return key
+    return IndexOperations.index(container, key)
@@ -1,16 +1,65 @@
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 import src.astNode as ast
 from src.config.environment import Environment
 from src.config.object import Object
 from .interfaces import IEvaluator
 from src.interpreter.eval_expressions import ExpressionEvaluator
 from src.interpreter.eval_statements import StatementEvaluator
+from src.interpreter.memo import MemoTable
+from src.interpreter.frames import FramePool
+from src.interpreter.limits import ExecutionBudget, MemoryQuota
+
+if TYPE_CHECKING:
+    from src.builtins.output import OutputSink
 
 class Dispatcher(IEvaluator):
-    """Punto único de evaluación que coordina statements y expressions."""
-    def __init__(self):
+    """
+    Punto único de evaluación que coordina statements y expressions.
+
+    Un dispatcher es también un contexto de ejecución: sus evaluadores
+    guardan el estado de la ejecución en curso (registro de return, pool de
+    marcos, límites, salida). Para ejecutar en paralelo, cada ejecución usa
+    su propio contexto creado con `new_context`.
+    """
+    def __init__(self, memo: Optional[MemoTable] = None, closure_conversion: bool = True,
+                 frame_pool: bool = True, output: Optional["OutputSink"] = None):
+        self.closure_conversion = closure_conversion
+        self.frame_pool = frame_pool
         self.expressions = ExpressionEvaluator(self)
         self.statements = StatementEvaluator(self)
+        self.expressions.memo = memo
+        self.expressions.output = output
+        if not closure_conversion:
+            self.expressions.closures = None
+        if frame_pool:
+            self.expressions.frames = FramePool(closure_conversion=closure_conversion)
+
+    def new_context(self) -> "Dispatcher":
+        """
+        Crea un contexto de ejecución independiente con la misma configuración.
+
+        Solo se comparte lo que es seguro entre hilos: la tabla de
+        memoización (protegida con un cerrojo), el sink de salida y las
+        cachés de análisis del AST, que dependen únicamente del nodo
+        analizado. Lo demás es propio del contexto nuevo.
+        """
+        context = Dispatcher(memo=self.expressions.memo, closure_conversion=self.closure_conversion,
+                             frame_pool=self.frame_pool, output=self.expressions.output)
+        if self.expressions.closures is not None:
+            context.expressions.closures = self.expressions.closures
+        context.expressions.generators.analyzer = self.expressions.generators.analyzer
+        if self.expressions.frames is not None:
+            context.expressions.frames.escapes = self.expressions.frames.escapes
+        return context
+
+    def set_budget(self, budget: Optional[ExecutionBudget]) -> None:
+        """Instala (o retira, con None) el límite de pasos/tiempo en ambos evaluadores."""
+        self.expressions.budget = budget
+        self.statements.budget = budget
+
+    def set_memory(self, memory: Optional[MemoryQuota]) -> None:
+        """Instala (o retira, con None) la contabilidad de memoria de la ejecución."""
+        self.expressions.memory = memory
 
     def evaluate(self, node: ast.ASTNode, env: Environment) -> Optional[Object]:
         # Prioridad: statements primero (program, block, let, return, expr stmt)
@@ -1,4 +1,5 @@
 from typing import Any, List
+from src.builtins.errors import NOT_ITERABLE, UNHASHABLE_KEY  # Compartidos con los builtins
 from src.config.object import Error
 
 # Mensajes centralizados
@@ -8,6 +9,16 @@ UNKNOWN_PREFIX_OPERATOR = 'Operador desconocido: {}{}'
 UNKNOWN_INFIX_OPERATOR = 'Operador desconocido: {} {} {}'
 UNKNOWN_IDENTIFIER = 'Identificador no encontrado: {}'
 DIVISION_BY_ZERO = "División por cero"
+INDEX_OUT_OF_RANGE = 'Índice fuera de rango: {}'
+INDEX_NOT_SUPPORTED = 'Operador de índice no soportado: {}[{}]'
+LENGTH_MISMATCH = 'Longitudes distintas: {} {} {}'
+YIELD_OUTSIDE_GENERATOR = 'yield fuera de una función generadora'
+FUEL_EXHAUSTED = 'Presupuesto de pasos agotado: {} pasos'
+DEADLINE_EXCEEDED = 'Tiempo límite excedido: {} s'
+MEMORY_QUOTA_EXCEEDED = 'Cuota de memoria excedida: {} bytes'
+RECURSION_LIMIT = 'Profundidad de recursión excedida'
+ASYNC_BUILTIN_IN_SYNC_CONTEXT = 'Las funciones de E/S solo pueden llamarse con AsyncInterpreter'
+WRONG_ARITY = 'Número incorrecto de argumentos: se esperaban {}, se recibieron {}'
 
 
 def new_error(message: str, args: List[Any]) -> Error:
@@ -1,17 +1,27 @@
 from __future__ import annotations
-from typing import Optional, List, cast, Type
+from typing import Optional, List, Tuple, cast, Type, TYPE_CHECKING
 from unittest import case
 import src.astNode as ast
 from src.config.environment import Environment
-from src.config.object import Object, Error, Return, Function, String, Integer
-from .runtime import RuntimePrimitives, InfixOperations, PrefixOperations, FunctionsOperations
+from src.config.object import (
+    Object, ObjectType, Error, Return, Function, String, Integer, Builtin, Array, Hash, LazyIterator, is_hashable
+)
+from .runtime import RuntimePrimitives, InfixOperations, PrefixOperations, FunctionsOperations, IndexOperations
 from .errors import (
-    TYPE_MISMATCH, UNKNOWN_INFIX_OPERATOR, UNKNOWN_IDENTIFIER, new_error
+    TYPE_MISMATCH, UNKNOWN_INFIX_OPERATOR, UNKNOWN_IDENTIFIER, UNHASHABLE_KEY, new_error
 )
 from .interfaces import IEvaluator
+from .memo import MemoTable
+from .closures import ClosureConverter
+from .frames import FramePool
+from .generators import GeneratorRunner
+from .limits import ExecutionBudget, MemoryQuota
 
 import importlib
 
+if TYPE_CHECKING:
+    from src.builtins.output import OutputSink
+
 try:
     builtins_module = importlib.import_module("src.builtins")
     BUILTINS = getattr(builtins_module, "BUILTINS", {})
@@ -20,8 +30,24 @@ except ModuleNotFoundError:
 
 class ExpressionEvaluator:
     """Evalúa expresiones (no programa/sentencias)."""
+
+    # Tabla de memoización de funciones puras (None = desactivada)
+    memo: Optional[MemoTable] = None
+    # Pool de marcos de llamada (None = un Environment nuevo por llamada)
+    frames: Optional[FramePool] = None
+    # Canal de salida para `print` (None = escribir directamente en stdout)
+    output: Optional["OutputSink"] = None
+    # Límite de pasos/tiempo de la ejecución en curso (None = sin límites)
+    budget: Optional[ExecutionBudget] = None
+    # Contabilidad/cuota de memoria de la ejecución en curso (None = desactivada)
+    memory: Optional[MemoryQuota] = None
+
     def __init__(self, dispatcher: IEvaluator):
         self.dispatcher = dispatcher  # acceso a evaluación genérica
+        # Conversión de clausuras (None = capturar el entorno completo)
+        self.closures: Optional[ClosureConverter] = ClosureConverter()
+        # Ejecuta los cuerpos con `yield` como secuencias perezosas
+        self.generators = GeneratorRunner(dispatcher)
 
     def evaluate(self, node: ast.ASTNode, environment: Environment) -> Optional[Object]:
         node_type: Type = type(node)
@@ -29,23 +55,46 @@ class ExpressionEvaluator:
         match node_type:
             case ast.Integer:
                 integer_node = cast(ast.Integer, node)
-                return Integer(integer_node.value)
+                integer = Integer(integer_node.value)
+                if self.memory is not None:
+                    self.memory.charge_value(integer)
+                return integer
             case ast.StringLiteral:
                 string_node = cast(ast.StringLiteral, node)
-                return String(string_node.value)
+                string = String(string_node.value)
+                if self.memory is not None:
+                    self.memory.charge_value(string)
+                return string
+            case ast.Boolean:
+                boolean_node = cast(ast.Boolean, node)
+                return RuntimePrimitives.to_boolean_object(bool(boolean_node.value))
             case ast.Identifier:
                 return self.eval_identifier_expression(node, environment)
             case ast.Prefix:
-                return self.eval_prefix_expression(node, environment)
+                result = self.eval_prefix_expression(node, environment)
+                if self.memory is not None:
+                    self.memory.charge_value(result)
+                return result
             case ast.Infix:
-                return self.eval_infix_expression(node, environment)
+                result = self.eval_infix_expression(node, environment)
+                if self.memory is not None:
+                    self.memory.charge_value(result)
+                return result
             case ast.If:
                 return self.eval_binary_expression(node, environment)
             case ast.Function:
-                function_node = cast(ast.Function, node)                
+                function_node = cast(ast.Function, node)
+                if self.closures is not None:
+                    environment = self.closures.capture(function_node, environment)
                 return Function(function_node.parameters, function_node.body, environment)
             case ast.Call:
                 return self.eval_call_expression(node, environment)
+            case ast.ArrayLiteral:
+                return self.eval_array_literal(node, environment)
+            case ast.Index:
+                return self.eval_index_expression(node, environment)
+            case ast.HashLiteral:
+                return self.eval_hash_literal(node, environment)
             case ast.Block:
                 return self.dispatcher.statements.evaluate(node, environment)
             case _:
@@ -62,38 +111,104 @@ class ExpressionEvaluator:
         prefix_node = cast(ast.Prefix, node)
         right_value = self.dispatcher.evaluate(prefix_node.right, environment)
         assert right_value is not None
-        if prefix_node.operator == '!':
+        if prefix_node.right._static_type is ObjectType.INTEGER and prefix_node.operator == '-':
+            # Operando entero probado por la inferencia de tipos: sin sondear su tipo
+            return Integer(-right_value.value)
+        return self.apply_prefix(prefix_node.operator, right_value)
+
+    @staticmethod
+    def apply_prefix(operator: str, right_value: Object) -> Object:
+        """Aplica un operador prefijo a un operando ya evaluado."""
+        if operator == '!':
             return PrefixOperations.bang(right_value)
-        if prefix_node.operator == '-':
+        if operator == '-':
             return PrefixOperations.minus(right_value)
-        return new_error(UNKNOWN_INFIX_OPERATOR, [prefix_node.operator, right_value.type().name])
+        return new_error(UNKNOWN_INFIX_OPERATOR, [operator, right_value.type().name])
 
     def eval_infix_expression(self, node: ast.Infix, environment: Environment) -> Optional[Object]:
         infix_node = cast(ast.Infix, node)
         left_value = self.dispatcher.evaluate(infix_node.left, environment)
         right_value = self.dispatcher.evaluate(infix_node.right, environment)
         assert left_value is not None and right_value is not None
+        # Operandos de un tipo probado por la inferencia de tipos: sin sondear sus tipos
+        static_type = infix_node.left._static_type
+        if static_type is not None and static_type is infix_node.right._static_type:
+            if static_type is ObjectType.INTEGER:
+                return InfixOperations.integer_infix(infix_node.operator, left_value, right_value)
+            if static_type is ObjectType.STRING:
+                return InfixOperations.string_infix(infix_node.operator, left_value, right_value)
+        return self.apply_infix(infix_node.operator, left_value, right_value)
 
+    @staticmethod
+    def apply_infix(operator: str, left_value: Object, right_value: Object) -> Object:
+        """Aplica un operador infijo a dos operandos ya evaluados."""
         if left_value.type().name == "INTEGER" and right_value.type().name == "INTEGER":
-            return InfixOperations.integer_infix(infix_node.operator, left_value, right_value)
-        
+            return InfixOperations.integer_infix(operator, left_value, right_value)
+
         if left_value.type().name == "STRING" and right_value.type().name == "STRING":
-            return InfixOperations.string_infix(infix_node.operator, left_value, right_value)
+            return InfixOperations.string_infix(operator, left_value, right_value)
+
+        if left_value.type().name == "ARRAY" or right_value.type().name == "ARRAY":
+            return InfixOperations.array_infix(operator, left_value, right_value)
 
-        if infix_node.operator == '==':
+        if operator == '==':
             return RuntimePrimitives.to_boolean_object(left_value is right_value)
-        if infix_node.operator == '!=':
+        if operator == '!=':
             return RuntimePrimitives.to_boolean_object(left_value is not right_value)
         if left_value.type() != right_value.type():
-            return new_error(TYPE_MISMATCH, [left_value.type().name, infix_node.operator, right_value.type().name])
+            return new_error(TYPE_MISMATCH, [left_value.type().name, operator, right_value.type().name])
 
-        return new_error(UNKNOWN_INFIX_OPERATOR, [left_value.type().name, infix_node.operator, right_value.type().name])
+        return new_error(UNKNOWN_INFIX_OPERATOR, [left_value.type().name, operator, right_value.type().name])
+
+    def eval_array_literal(self, node: ast.ArrayLiteral, environment: Environment) -> Optional[Object]:
+        array_node = cast(ast.ArrayLiteral, node)
+        elements: List[Object] = []
+        for element in array_node.elements:
+            value = self.dispatcher.evaluate(element, environment)
+            assert value is not None
+            if value.abrupt:
+                return value
+            elements.append(value)
+        return Array(elements)
+
+    def eval_hash_literal(self, node: ast.HashLiteral, environment: Environment) -> Optional[Object]:
+        hash_node = cast(ast.HashLiteral, node)
+        pairs: List[Tuple[Object, Object]] = []
+        for key_node, value_node in hash_node.pairs:
+            key = self.dispatcher.evaluate(key_node, environment)
+            assert key is not None
+            if key.abrupt:
+                return key
+            if not is_hashable(key):
+                return new_error(UNHASHABLE_KEY, [key.type().name])
+            value = self.dispatcher.evaluate(value_node, environment)
+            assert value is not None
+            if value.abrupt:
+                return value
+            pairs.append((key, value))
+        return Hash.from_pairs(pairs)
+
+    def eval_index_expression(self, node: ast.Index, environment: Environment) -> Optional[Object]:
+        index_node = cast(ast.Index, node)
+        left_value = self.dispatcher.evaluate(index_node.left, environment)
+        assert left_value is not None
+        if left_value.abrupt:
+            return left_value
+        index_value = self.dispatcher.evaluate(index_node.index, environment)
+        assert index_value is not None
+        if index_value.abrupt:
+            return index_value
+        return IndexOperations.index(left_value, index_value)
 
     def eval_binary_expression(self, node: ast.If, environment: Environment) -> Optional[Object]:
         if_node = cast(ast.If, node)
         condition_value = self.dispatcher.evaluate(if_node.condition, environment)
         assert condition_value is not None
-        if RuntimePrimitives.is_truthy(condition_value):
+        if if_node.condition._static_type is ObjectType.BOOLEAN:
+            truthy = condition_value is RuntimePrimitives.TRUE
+        else:
+            truthy = RuntimePrimitives.is_truthy(condition_value)
+        if truthy:
             return self.dispatcher.evaluate(if_node.consequence, environment)
         if if_node.alternative is not None:
             return self.dispatcher.evaluate(if_node.alternative, environment)
@@ -103,11 +218,51 @@ class ExpressionEvaluator:
         call_node = cast(ast.Call, node)
         function_object = self.dispatcher.evaluate(call_node.function, environment)
         arguments = [self.dispatcher.evaluate(argument, environment) for argument in call_node.arguments]
-        assert function_object is not None and all(argument is not None for argument in arguments)                
-        apply_result = FunctionsOperations.apply_function(function_object, cast(List[Object], arguments))  # type: ignore
+        assert function_object is not None and all(argument is not None for argument in arguments)
+        return self.call_function(function_object, cast(List[Object], arguments))
+
+    def call_function(self, function_object: Object, arguments: List[Object]) -> Object:
+        """Aplica una función ya evaluada; también lo usan los builtins de orden superior."""
+        budget = self.budget
+        if budget is not None:
+            budget.tick()
+        # Los builtins se invocan directamente, sin extender entorno
+        if isinstance(function_object, Builtin):
+            if function_object.applies_functions:
+                result = function_object(self.call_function, *arguments)
+            elif function_object.writes_output:
+                result = function_object(self.output, *arguments)
+            else:
+                result = function_object(*arguments)
+            if self.memory is not None:
+                self.memory.charge_value(result)
+            return result
+
+        memo_key = None
+        if self.memo is not None:
+            memo_key = self.memo.key_for(function_object, arguments)
+            if memo_key is not None:
+                cached = self.memo.get(memo_key)
+                if cached is not None:
+                    return cached
+
+        apply_result = FunctionsOperations.apply_function(function_object, arguments, self.frames)  # type: ignore
         if isinstance(apply_result, Object):  # Error
             return apply_result
         block_node, extended_environment = apply_result
+        memory = self.memory
+        if memory is not None:
+            memory.acquire_frame()
+        if self.generators.is_generator(block_node):
+            # El marco queda suspendido dentro del generador: no vuelve al pool
+            return LazyIterator(self.generators.run(block_node, extended_environment), 'generator')
         result = self.dispatcher.evaluate(block_node, extended_environment)
         assert result is not None
-        return FunctionsOperations.unwrap_return_value(result)
+        if self.frames is not None:
+            self.frames.release(extended_environment, block_node)
+        if memory is not None:
+            memory.release_frame()
+        value = FunctionsOperations.unwrap_return_value(result)
+        if memo_key is not None:
+            self.memo.put(memo_key, value)
+        return value
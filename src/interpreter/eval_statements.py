@@ -1,16 +1,33 @@
 from __future__ import annotations
-from typing import Optional, cast, Type
+from typing import Iterator, Optional, Union, cast, Type
 import src.astNode as ast
 from src.config.environment import Environment
-from src.config.object import Object, Error, Return
+from src.config.object import Object, ObjectType, Error, Return, Range, String, Array, Hash, LazyIterator
+from .errors import NOT_ITERABLE, YIELD_OUTSIDE_GENERATOR, new_error
 from .interfaces import IEvaluator
+from .limits import ExecutionBudget
+from .runtime import RuntimePrimitives
 
 class StatementEvaluator:
-    """Evalúa sentencias, bloques y programa."""
+    """Evalúa sentencias, bloques y programa.
+
+    Señalización de control: `return` no crea un `Return` nuevo; escribe el
+    valor en un registro preasignado (`return_register`) y lo devuelve. Ese
+    registro y los `Error` tienen `abrupt = True`, de modo que los bucles de
+    bloque y programa solo leen un atributo por sentencia. El registro se
+    consume de inmediato (en la llamada o el programa que lo recibe), por lo
+    que basta uno por evaluador.
+
+    Todo el estado es de la ejecución en curso: cada contexto de ejecución
+    (ver `Dispatcher.new_context`) tiene su propio evaluador, de modo que
+    varios hilos pueden ejecutar a la vez el mismo `Program`.
+    """
     def __init__(self, dispatcher: IEvaluator):
         self.dispatcher = dispatcher
+        self.return_register = Return(None)
 
-    return_statement_node: cast = None
+    # Límite de pasos/tiempo: cada iteración de bucle consume un paso
+    budget: Optional[ExecutionBudget] = None
 
     def evaluate(self, node: ast.ASTNode, environment: Environment) -> Optional[Object]:
         node_type: Type = type(node)
@@ -25,24 +42,94 @@ class StatementEvaluator:
                 return self.dispatcher.evaluate(expression_statement_node.expression, environment)
 
             case ast.ReturnStatement:
-                self.return_statement_node = cast(ast.ReturnStatement, node)
-                return_value = self.dispatcher.evaluate(self.return_statement_node.return_value, environment)
-                return Return(return_value)
+                return_node = cast(ast.ReturnStatement, node)
+                return_value = self.dispatcher.evaluate(return_node.return_value, environment)
+                register = self.return_register
+                register.value = return_value
+                return register
+
+            case ast.WhileStatement:
+                return self.eval_while_statement(cast(ast.WhileStatement, node), environment)
+
+            case ast.ForStatement:
+                return self.eval_for_statement(cast(ast.ForStatement, node), environment)
+
+            case ast.YieldStatement:
+                # Los cuerpos generadores los ejecuta GeneratorRunner; aquí el yield está fuera de lugar
+                return new_error(YIELD_OUTSIDE_GENERATOR, [])
 
             case ast.LetStatement:
-                self.return_statement_node = cast(ast.LetStatement, node)
-                value = self.dispatcher.evaluate(self.return_statement_node.value, environment)
-                environment.set(self.return_statement_node.name.value, value)
+                let_node = cast(ast.LetStatement, node)
+                value = self.dispatcher.evaluate(let_node.value, environment)
+                if value is not None and value.abrupt:
+                    return value
+                environment.set(let_node.name.value, value)
                 return value
 
+    def eval_while_statement(self, node: ast.WhileStatement, environment: Environment) -> Object:
+        """Evalúa un while como bucle Python plano: sin marcos ni recursión por iteración."""
+        evaluate = self.dispatcher.evaluate
+        is_truthy = RuntimePrimitives.is_truthy
+        condition_node = node.condition
+        # Condición booleana probada por la inferencia de tipos: basta compararla con TRUE
+        boolean = condition_node._static_type is ObjectType.BOOLEAN
+        true = RuntimePrimitives.TRUE
+        body = node.body
+        budget = self.budget
+        while True:
+            if budget is not None:
+                budget.tick()
+            condition = evaluate(condition_node, environment)
+            if condition is not None and condition.abrupt:
+                return condition
+            if not (condition is true if boolean else is_truthy(condition)):
+                return RuntimePrimitives.NULL
+            result = self.eval_block_expression(body, environment)
+            if result is not None and result.abrupt:
+                return result
+
+    def eval_for_statement(self, node: ast.ForStatement, environment: Environment) -> Object:
+        """Evalúa for (x in iterable) ligando `x` en el entorno actual en cada iteración."""
+        iterable = self.dispatcher.evaluate(node.iterable, environment)
+        if iterable is not None and iterable.abrupt:
+            return iterable
+        items = self.iteration_items(iterable)
+        if isinstance(items, Object):  # Error
+            return items
+
+        name = node.variable.value
+        body = node.body
+        budget = self.budget
+        for item in items:
+            if item.abrupt:
+                return item
+            if budget is not None:
+                budget.tick()
+            environment.set(name, item)
+            result = self.eval_block_expression(body, environment)
+            if result is not None and result.abrupt:
+                return result
+        return RuntimePrimitives.NULL
+
+    @staticmethod
+    def iteration_items(iterable: Optional[Object]) -> Union[Iterator[Object], Error]:
+        """Elementos que recorre un `for`, o un Error si el valor no es iterable."""
+        if isinstance(iterable, (Range, Array, LazyIterator)):
+            return iter(iterable)
+        if isinstance(iterable, Hash):
+            return iterable.keys()
+        if isinstance(iterable, String):
+            return (String(character) for character in iterable.value)
+        return new_error(NOT_ITERABLE, [iterable.type().name if iterable is not None else "NULL"])
+
     def eval_program_expression(self, node: ast.Program, environment: Environment) -> Optional[Object]:
         program_node = cast(ast.Program, node)
         result: Optional[Object] = None
         for statement in program_node.statements:
             result = self.dispatcher.evaluate(statement, environment)
-            if isinstance(result, Return):
-                return cast(Return, result).value
-            if isinstance(result, Error):
+            if result is not None and result.abrupt:
+                if isinstance(result, Return):
+                    return cast(Return, result).value
                 return result
         return result
 
@@ -51,6 +138,6 @@ class StatementEvaluator:
         result: Optional[Object] = None
         for statement in block_node.statements:
             result = self.dispatcher.evaluate(statement, environment)
-            if result is not None and (result.type().name in ("RETURN", "ERROR")):
+            if result is not None and result.abrupt:
                 return result
-        return result        
+        return result
@@ -0,0 +1,121 @@
+"""Pool de marcos (`Environment`) para llamadas a funciones."""
+
+from dataclasses import dataclass
+from typing import List, Optional
+import weakref
+
+import src.astNode as ast
+from src.config.environment import Environment
+
+
+@dataclass
+class FramePoolStats:
+    """Contadores del pool de marcos."""
+    allocated: int = 0
+    reused: int = 0
+    released: int = 0
+    escaped: int = 0
+
+
+class EscapeAnalyzer:
+    """Decide si los marcos de una función pueden sobrevivir a la llamada.
+
+    El único modo en que un marco escapa es que una función anidada lo
+    capture como entorno. Con la conversión de clausuras activa las
+    funciones anidadas capturan celdas y no el marco, así que nunca escapa.
+    """
+
+    def __init__(self, closure_conversion: bool = True) -> None:
+        self.closure_conversion = closure_conversion
+        self._cache: "weakref.WeakKeyDictionary[ast.Block, bool]" = weakref.WeakKeyDictionary()
+
+    def may_escape(self, body: ast.Block) -> bool:
+        if self.closure_conversion:
+            return False
+        cached = self._cache.get(body)
+        if cached is None:
+            cached = self._contains_function_literal(body)
+            self._cache[body] = cached
+        return cached
+
+    def _contains_function_literal(self, node: Optional[ast.ASTNode]) -> bool:
+        node_type = type(node)
+        if node_type is ast.Function:
+            return True
+        if node_type in (ast.Block, ast.Program):
+            return any(self._contains_function_literal(statement) for statement in node.statements)
+        if node_type is ast.LetStatement:
+            return self._contains_function_literal(node.value)
+        if node_type is ast.ReturnStatement:
+            return self._contains_function_literal(node.return_value)
+        if node_type is ast.YieldStatement:
+            return self._contains_function_literal(node.value)
+        if node_type is ast.ExpressionStatement:
+            return self._contains_function_literal(node.expression)
+        if node_type is ast.Prefix:
+            return self._contains_function_literal(node.right)
+        if node_type is ast.Infix:
+            return self._contains_function_literal(node.left) or self._contains_function_literal(node.right)
+        if node_type is ast.If:
+            return (self._contains_function_literal(node.condition)
+                    or self._contains_function_literal(node.consequence)
+                    or self._contains_function_literal(node.alternative))
+        if node_type is ast.WhileStatement:
+            return self._contains_function_literal(node.condition) or self._contains_function_literal(node.body)
+        if node_type is ast.ForStatement:
+            return self._contains_function_literal(node.iterable) or self._contains_function_literal(node.body)
+        if node_type is ast.Call:
+            return (self._contains_function_literal(node.function)
+                    or any(self._contains_function_literal(argument) for argument in node.arguments or []))
+        if node_type is ast.ArrayLiteral:
+            return any(self._contains_function_literal(element) for element in node.elements)
+        if node_type is ast.HashLiteral:
+            return any(self._contains_function_literal(key) or self._contains_function_literal(value)
+                       for key, value in node.pairs)
+        if node_type is ast.Index:
+            return self._contains_function_literal(node.left) or self._contains_function_literal(node.index)
+        if node_type in (ast.Identifier, ast.Integer, ast.StringLiteral, ast.Boolean) or node is None:
+            return False
+        # Nodo desconocido: suponer lo peor
+        return True
+
+
+class FramePool:
+    """Recicla los `Environment` de llamadas cuyos marcos no escapan.
+
+    `acquire` entrega un marco limpio (reutilizado si hay alguno libre) y
+    `release` lo vacía y lo devuelve al pool al terminar la llamada.
+    """
+
+    DEFAULT_SIZE = 256
+
+    def __init__(self, max_size: int = DEFAULT_SIZE, closure_conversion: bool = True) -> None:
+        self.max_size = max_size
+        self.escapes = EscapeAnalyzer(closure_conversion)
+        self.stats = FramePoolStats()
+        self._free: List[Environment] = []
+
+    def acquire(self, outer: Optional[Environment]) -> Environment:
+        if self._free:
+            frame = self._free.pop()
+            frame.outer = outer
+            self.stats.reused += 1
+            return frame
+        self.stats.allocated += 1
+        return Environment(outer=outer)
+
+    def release(self, frame: Environment, body: ast.Block) -> None:
+        """Devuelve el marco al pool salvo que el cuerpo pueda hacerlo escapar."""
+        if self.escapes.may_escape(body):
+            self.stats.escaped += 1
+            return
+        self.stats.released += 1
+        if len(self._free) >= self.max_size:
+            return
+        frame.store.clear()
+        frame.cells = None
+        frame.outer = None
+        self._free.append(frame)
+
+    def __len__(self) -> int:
+        return len(self._free)
@@ -0,0 +1,147 @@
+"""Funciones generadoras: cuerpos con `yield` ejecutados como generadores Python."""
+
+from typing import Generator, Iterator, Optional
+import weakref
+
+import src.astNode as ast
+from src.config.environment import Environment
+from src.config.object import Object, Return
+from .interfaces import IEvaluator
+from .runtime import RuntimePrimitives
+
+# Cada paso produce objetos y, al terminar, indica si el cuerpo acabó (return/error)
+Steps = Generator[Object, None, bool]
+
+
+class YieldAnalyzer:
+    """Decide qué nodos contienen un `yield` propio (sin entrar en funciones anidadas)."""
+
+    def __init__(self) -> None:
+        self._cache: "weakref.WeakKeyDictionary[ast.ASTNode, bool]" = weakref.WeakKeyDictionary()
+
+    def contains_yield(self, node: Optional[ast.ASTNode]) -> bool:
+        if node is None:
+            return False
+        cached = self._cache.get(node)
+        if cached is None:
+            cached = self._scan(node)
+            self._cache[node] = cached
+        return cached
+
+    def _scan(self, node: ast.ASTNode) -> bool:
+        node_type = type(node)
+        if node_type is ast.YieldStatement:
+            return True
+        if node_type is ast.Block:
+            return any(self.contains_yield(statement) for statement in node.statements)
+        if node_type is ast.ExpressionStatement:
+            return self.contains_yield(node.expression)
+        if node_type is ast.If:
+            return self.contains_yield(node.consequence) or self.contains_yield(node.alternative)
+        if node_type in (ast.WhileStatement, ast.ForStatement):
+            return self.contains_yield(node.body)
+        # `yield` es una sentencia: no puede aparecer dentro de otras expresiones
+        return False
+
+
+class GeneratorRunner:
+    """
+    Ejecuta el cuerpo de una función generadora de forma suspendible.
+
+    Solo las construcciones que contienen un `yield` (bloques, `if` usados
+    como sentencia, `while` y `for`) se recorren aquí como generadores
+    Python; el resto de sentencias y todas las expresiones se evalúan con
+    el dispatcher normal. Así el marco de la función queda suspendido en
+    el `yield` y la secuencia se produce bajo demanda, en memoria constante.
+    """
+
+    def __init__(self, dispatcher: IEvaluator) -> None:
+        self.dispatcher = dispatcher
+        self.analyzer = YieldAnalyzer()
+
+    def is_generator(self, body: Optional[ast.Block]) -> bool:
+        return self.analyzer.contains_yield(body)
+
+    def run(self, body: ast.Block, environment: Environment) -> Iterator[Object]:
+        """Iterador de los valores entregados; `return` termina la secuencia."""
+        yield from self._steps(body, environment)
+
+    def _steps(self, node: ast.ASTNode, environment: Environment) -> Steps:
+        if not self.analyzer.contains_yield(node):
+            result = self.dispatcher.evaluate(node, environment)
+            if result is not None and result.abrupt:
+                if not isinstance(result, Return):
+                    yield result
+                return True
+            return False
+
+        node_type = type(node)
+        if node_type is ast.YieldStatement:
+            value = self.dispatcher.evaluate(node.value, environment)
+            assert value is not None
+            yield value
+            return value.abrupt
+        if node_type is ast.Block:
+            for statement in node.statements:
+                if (yield from self._steps(statement, environment)):
+                    return True
+            return False
+        if node_type is ast.ExpressionStatement:
+            return (yield from self._steps(node.expression, environment))
+        if node_type is ast.If:
+            return (yield from self._if_steps(node, environment))
+        if node_type is ast.WhileStatement:
+            return (yield from self._while_steps(node, environment))
+        if node_type is ast.ForStatement:
+            return (yield from self._for_steps(node, environment))
+        return False
+
+    def _if_steps(self, node: ast.If, environment: Environment) -> Steps:
+        condition = self.dispatcher.evaluate(node.condition, environment)
+        assert condition is not None
+        if condition.abrupt:
+            yield condition
+            return True
+        if RuntimePrimitives.is_truthy(condition):
+            return (yield from self._steps(node.consequence, environment))
+        if node.alternative is not None:
+            return (yield from self._steps(node.alternative, environment))
+        return False
+
+    def _while_steps(self, node: ast.WhileStatement, environment: Environment) -> Steps:
+        budget = self.dispatcher.statements.budget
+        while True:
+            if budget is not None:
+                budget.tick()
+            condition = self.dispatcher.evaluate(node.condition, environment)
+            assert condition is not None
+            if condition.abrupt:
+                yield condition
+                return True
+            if not RuntimePrimitives.is_truthy(condition):
+                return False
+            if (yield from self._steps(node.body, environment)):
+                return True
+
+    def _for_steps(self, node: ast.ForStatement, environment: Environment) -> Steps:
+        iterable = self.dispatcher.evaluate(node.iterable, environment)
+        assert iterable is not None
+        if iterable.abrupt:
+            yield iterable
+            return True
+        items = self.dispatcher.statements.iteration_items(iterable)
+        if isinstance(items, Object):  # Error
+            yield items
+            return True
+        name = node.variable.value
+        budget = self.dispatcher.statements.budget
+        for item in items:
+            if item.abrupt:
+                yield item
+                return True
+            if budget is not None:
+                budget.tick()
+            environment.set(name, item)
+            if (yield from self._steps(node.body, environment)):
+                return True
+        return False
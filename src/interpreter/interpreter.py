@@ -1,17 +1,205 @@
-from typing import Optional
+import threading
+import weakref
+from typing import List, Mapping, Optional, Tuple
 import src.astNode as ast
-from src.config.environment import Environment
-from src.config.object import Object
+from src.builtins.output import FlushPolicy, OutputSink, OutputTarget
+from src.config.environment import Environment, FrozenEnvironment
+from src.config.object import Error, LazyIterator, Object
 from .dispatcher import Dispatcher
+from .memo import MemoPolicy, MemoStats, MemoTable
+from .frames import FramePoolStats
+from .errors import RECURSION_LIMIT, new_error
+from .limits import ExecutionBudget, LimitExceeded, MemoryQuota, MemoryReport
+from .result_cache import ResultCache
 
 class Interpreter:
     """
     Punto de entrada externo conservando la API original:
     - interpret(program: ast.Program) -> Optional[Object]
+
+    `memoize` activa (opt-in) la memoización de funciones puras:
+    False/None la desactiva, True usa el tamaño por defecto, un entero fija
+    el tamaño de la caché LRU y una `MemoTable` permite compartirla.
+
+    `closure_conversion` (activo por defecto) hace que las clausuras capturen
+    solo sus variables libres en lugar de toda la cadena de entornos.
+
+    `frame_pool` (activo por defecto) recicla los marcos de llamada que no
+    escapan en lugar de crear un `Environment` nuevo por llamada.
+
+    `output` es el destino de `print`: None (stdout), una ruta de fichero,
+    un objeto con `write` (fichero, `io.StringIO`), un callback o un
+    `OutputSink` ya construido. `output_buffer_size` y `flush_policy`
+    controlan cuándo se vacía el búfer; siempre se vacía al terminar
+    cada `interpret`. `interpret(output=...)` usa otro destino solo para
+    esa ejecución.
+
+    `interpret` acepta además `fuel` (máximo de pasos: llamadas a funciones
+    e iteraciones de bucle) y `timeout` (segundos); al agotarse cualquiera
+    de los dos devuelve un `Error` en lugar del resultado.
+
+    `memory_limit` (bytes, por ejecución) aborta con un `Error` los programas
+    que asignan demasiados `String`, `Integer` o marcos `Environment`. Con
+    un límite, o con `track_memory=True`, tras cada ejecución queda en
+    `memory_report` el uso asignado y pico por tipo de objeto. El informe es
+    por hilo: cada hilo ve el de su última ejecución, aunque otros hilos
+    ejecuten a la vez con el mismo intérprete (las corrutinas de
+    `AsyncInterpreter` en un mismo hilo ven el de la última en terminar).
+
+    `result_cache` (una `ResultCache`, opcional) reutiliza el resultado de
+    ejecuciones anteriores del mismo programa con las mismas entradas,
+    preludio, `fuel` y `memory_limit`. Un acierto no evalúa nada (ni
+    actualiza `memory_report`); los programas que usan E/S o `print` y las
+    ejecuciones cortadas por un límite nunca se guardan.
     """
-    def __init__(self):
-        self._dispatcher = Dispatcher()
+    def __init__(self, memoize: MemoPolicy = False, closure_conversion: bool = True,
+                 frame_pool: bool = True, output: OutputTarget = None,
+                 output_buffer_size: int = OutputSink.DEFAULT_BUFFER_SIZE,
+                 flush_policy: FlushPolicy = FlushPolicy.BUFFERED, track_memory: bool = False,
+                 result_cache: Optional[ResultCache] = None):
+        self.track_memory = track_memory
+        self.result_cache = result_cache
+        # Informe de memoria de la última ejecución de cada hilo
+        self._memory_reports = threading.local()
+        self._memo = MemoTable.from_policy(memoize)
+        self.output = OutputSink.from_target(output, output_buffer_size, flush_policy)
+        # Plantilla con la configuración y las cachés compartidas; no evalúa
+        self._dispatcher = Dispatcher(memo=self._memo, closure_conversion=closure_conversion,
+                                      frame_pool=frame_pool, output=self.output)
+        # Contextos de ejecución libres para reutilizar y todos los creados (para estadísticas)
+        self._idle_contexts: List[Dispatcher] = []
+        self._contexts: "weakref.WeakSet[Dispatcher]" = weakref.WeakSet()
+        self._contexts_lock = threading.Lock()
+
+    @property
+    def memory_report(self) -> Optional[MemoryReport]:
+        """Uso de memoria de la última ejecución de este hilo (None si no se contabilizó)."""
+        return getattr(self._memory_reports, "report", None)
+
+    @property
+    def memo_stats(self) -> Optional[MemoStats]:
+        """Estadísticas de la caché de memoización (None si está desactivada)."""
+        return self._memo.stats if self._memo is not None else None
+
+    @property
+    def frame_stats(self) -> Optional[FramePoolStats]:
+        """Estadísticas de los pools de marcos de todos los contextos (None si está desactivado)."""
+        if not self._dispatcher.frame_pool:
+            return None
+        total = FramePoolStats()
+        with self._contexts_lock:
+            pools = [context.expressions.frames for context in self._contexts]
+        for pool in pools:
+            total.allocated += pool.stats.allocated
+            total.reused += pool.stats.reused
+            total.released += pool.stats.released
+            total.escaped += pool.stats.escaped
+        return total
+
+    def snapshot(self, prelude: ast.Program) -> FrozenEnvironment:
+        """
+        Evalúa `prelude` en un entorno nuevo y lo congela.
+
+        El resultado es de solo lectura y puede compartirse entre ejecuciones,
+        hilos e intérpretes. Lanza ValueError si el preludio produce un error.
+        """
+        environment = FrozenEnvironment()
+        environment.source = prelude
+        context, run_output, memory = self._start_run(None, None, None, None)
+        result: Optional[Object] = None
+        try:
+            result = context.evaluate(prelude, environment)
+        finally:
+            self._finish_run(context, run_output, None, memory, result)
+        if isinstance(result, Error):
+            raise ValueError(f"el preludio falló: {result.message}")
+        return environment.freeze()
+
+    def interpret(self, program: ast.Program, fuel: Optional[int] = None,
+                  timeout: Optional[float] = None, memory_limit: Optional[int] = None,
+                  output: OutputTarget = None, prelude: Optional[FrozenEnvironment] = None) -> Optional[Object]:
+        """
+        Ejecuta `program` en un contexto de ejecución propio.
+
+        Es seguro llamarlo desde varios hilos a la vez con el mismo
+        `Program`: cada llamada toma un contexto libre (o crea uno) y solo
+        comparte con las demás la memoización, las cachés de análisis y,
+        salvo que se pase `output`, el sink de salida.
+
+        Con `prelude` (de `snapshot`) los nombres del preludio ya están
+        definidos; los `let` del programa quedan en la capa de esta ejecución.
+        """
+        environment = prelude.child() if prelude is not None else Environment()
+        return self._run(program, environment, fuel, timeout, memory_limit, output, prelude)
+
+    def _run(self, program: ast.Program, environment: Environment, fuel: Optional[int],
+             timeout: Optional[float], memory_limit: Optional[int], output: OutputTarget,
+             prelude: Optional[FrozenEnvironment] = None,
+             bindings: Mapping[str, Object] = {}) -> Optional[Object]:
+        """
+        Evalúa `program` en `environment` con los límites dados, en un contexto propio.
+
+        `prelude` y `bindings` (las entradas ya ligadas en `environment`)
+        solo se usan para la clave de `result_cache`.
+        """
+        cache = self.result_cache
+        key = cache.key(program, prelude, bindings, fuel, memory_limit) if cache is not None else None
+        if key is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+        context, run_output, memory = self._start_run(fuel, timeout, memory_limit, output)
+        result: Optional[Object] = None
+        try:
+            result = context.evaluate(program, environment)
+            if key is not None and result is not None:
+                cache.put(key, result)
+            return result
+        except LimitExceeded as exceeded:
+            return exceeded.error
+        except RecursionError:
+            return new_error(RECURSION_LIMIT, [])
+        finally:
+            self._finish_run(context, run_output, output, memory, result)
+
+    def _start_run(self, fuel: Optional[int], timeout: Optional[float], memory_limit: Optional[int],
+                   output: OutputTarget) -> Tuple[Dispatcher, OutputSink, Optional[MemoryQuota]]:
+        """Toma un contexto e instala en él los límites y la salida de la ejecución."""
+        context = self._acquire_context()
+        run_output = self.output
+        if output is not None:
+            run_output = OutputSink.from_target(output)
+            context.expressions.output = run_output
+        if fuel is not None or timeout is not None:
+            context.set_budget(ExecutionBudget(fuel=fuel, timeout=timeout))
+        memory = None
+        if memory_limit is not None or self.track_memory:
+            memory = MemoryQuota(memory_limit)
+            context.set_memory(memory)
+        return context, run_output, memory
+
+    def _finish_run(self, context: Dispatcher, run_output: OutputSink, output: OutputTarget,
+                    memory: Optional[MemoryQuota], result: Optional[Object]) -> None:
+        context.set_budget(None)
+        if memory is not None:
+            context.set_memory(None)
+            self._memory_reports.report = memory.report()
+        context.expressions.output = self.output
+        # La salida de `print` va en búfer: se entrega al terminar cada programa
+        if run_output is not self.output and not isinstance(output, OutputSink):
+            # El sink lo creó esta ejecución: se cierra con el fichero que haya abierto
+            run_output.close()
+        else:
+            run_output.flush()
+        # Un generador devuelto sigue usando el contexto: no se recicla
+        if not isinstance(result, LazyIterator):
+            self._idle_contexts.append(context)
 
-    def interpret(self, program: ast.Program) -> Optional[Object]:
-        env = Environment()
-        return self._dispatcher.evaluate(program, env)
+    def _acquire_context(self) -> Dispatcher:
+        try:
+            return self._idle_contexts.pop()
+        except IndexError:
+            context = self._dispatcher.new_context()
+            with self._contexts_lock:
+                self._contexts.add(context)
+            return context
@@ -0,0 +1,178 @@
+"""Límites de ejecución: presupuesto de pasos ("fuel"), tiempo máximo y memoria."""
+
+from dataclasses import dataclass, field
+import sys
+import time
+from typing import Dict, Optional
+
+from src.config.object import Error, Integer, Object, String
+from .errors import DEADLINE_EXCEEDED, FUEL_EXHAUSTED, MEMORY_QUOTA_EXCEEDED, new_error
+
+
+class LimitExceeded(Exception):
+    """Se lanza al agotar un límite; `Interpreter.interpret` la convierte en `error`.
+
+    Se usa una excepción (y no un `Error` propagado) para abandonar de
+    inmediato recursiones profundas y bucles sin depender de que cada
+    construcción intermedia compruebe `abrupt`.
+    """
+
+    def __init__(self, error: Error) -> None:
+        super().__init__(error.message)
+        self.error = error
+
+
+class ExecutionBudget:
+    """
+    Cuenta pasos (llamadas a funciones e iteraciones de bucle) de una ejecución.
+
+    `tick` solo decrementa un contador; cada `check_interval` pasos (o antes,
+    si queda menos fuel) pasa por `_checkpoint`, que contabiliza el bloque
+    consumido y consulta el reloj. Así el coste por paso es una resta y una
+    comparación, y el fuel se agota exactamente en el paso `fuel + 1`.
+    """
+    __slots__ = ("fuel", "timeout", "check_interval", "used", "_deadline", "_chunk", "_countdown")
+
+    DEFAULT_CHECK_INTERVAL = 1024
+
+    def __init__(self, fuel: Optional[int] = None, timeout: Optional[float] = None,
+                 check_interval: int = DEFAULT_CHECK_INTERVAL) -> None:
+        if fuel is not None and fuel < 0:
+            raise ValueError("fuel no puede ser negativo")
+        if timeout is not None and timeout < 0:
+            raise ValueError("timeout no puede ser negativo")
+        if check_interval <= 0:
+            raise ValueError("check_interval debe ser positivo")
+        self.fuel = fuel
+        self.timeout = timeout
+        self.check_interval = check_interval
+        self.used = 0
+        self._deadline = time.monotonic() + timeout if timeout is not None else None
+        self._chunk = 0
+        self._countdown = 0
+        self._next_chunk()
+
+    def tick(self) -> None:
+        """Consume un paso."""
+        self._countdown -= 1
+        if self._countdown < 0:
+            self._checkpoint()
+
+    @property
+    def steps(self) -> int:
+        """Pasos consumidos hasta ahora."""
+        return self.used + self._chunk - self._countdown
+
+    def _checkpoint(self) -> None:
+        self.used += self._chunk
+        if self.fuel is not None and self.used >= self.fuel:
+            self._countdown = 0
+            self._chunk = 0
+            raise LimitExceeded(new_error(FUEL_EXHAUSTED, [self.fuel]))
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            self._countdown = 0
+            self._chunk = 0
+            raise LimitExceeded(new_error(DEADLINE_EXCEEDED, [self.timeout]))
+        self._next_chunk()
+        # El paso que disparó el control también cuenta
+        self._countdown -= 1
+
+    def _next_chunk(self) -> None:
+        chunk = self.check_interval
+        if self.fuel is not None:
+            chunk = min(chunk, self.fuel - self.used)
+        self._chunk = chunk
+        self._countdown = chunk
+
+
+@dataclass
+class MemoryUsage:
+    """Contadores de un tipo de objeto: cuántos se crearon, bytes asignados y pico vivo."""
+    count: int = 0
+    allocated: int = 0
+    live: int = 0
+    peak: int = 0
+
+
+@dataclass
+class MemoryReport:
+    """Resumen de memoria de una ejecución, por tipo de objeto."""
+    by_type: Dict[str, MemoryUsage] = field(default_factory=dict)
+    peak: int = 0
+    limit: Optional[int] = None
+
+
+class MemoryQuota:
+    """
+    Contabilidad aproximada de memoria de una ejecución, con cuota opcional.
+
+    Se cargan los `Integer` y `String` que crea el evaluador (literales,
+    operadores y resultados de builtins) y los marcos `Environment` de cada
+    llamada. Los marcos se descuentan al volver la llamada; los valores se
+    suponen vivos hasta el final de la ejecución, porque el evaluador no ve
+    cuándo se liberan: la estimación es, por tanto, una cota superior.
+
+    Una cadena rope nueva solo cuesta su nodo (comparte los datos de sus
+    mitades), pero ninguna cadena puede superar por sí sola la cuota: si se
+    aplanara no cabría.
+    """
+
+    # Cabecera aproximada de un objeto del intérprete (CPython, 64 bits)
+    OBJECT_BYTES = 56
+    # Marco de llamada: objeto más un diccionario pequeño de variables
+    ENVIRONMENT_BYTES = OBJECT_BYTES + 184
+
+    def __init__(self, limit: Optional[int] = None) -> None:
+        if limit is not None and limit < 0:
+            raise ValueError("el límite de memoria no puede ser negativo")
+        self.limit = limit
+        self.current = 0
+        self.peak = 0
+        self.usage: Dict[str, MemoryUsage] = {
+            name: MemoryUsage() for name in ("Integer", "String", "Environment")
+        }
+
+    def charge_value(self, value: Optional[Object]) -> None:
+        """Carga un valor recién creado si es de un tipo contabilizado."""
+        value_type = type(value)
+        if value_type is Integer:
+            self._charge("Integer", self.OBJECT_BYTES + sys.getsizeof(value.value))
+        elif value_type is String:
+            if self.limit is not None and value.length > self.limit:
+                self._exceeded()
+            if value.is_flat:
+                self._charge("String", self.OBJECT_BYTES + sys.getsizeof(value.value))
+            else:
+                self._charge("String", self.OBJECT_BYTES)
+
+    def acquire_frame(self) -> None:
+        self._charge("Environment", self.ENVIRONMENT_BYTES)
+
+    def release_frame(self) -> None:
+        usage = self.usage["Environment"]
+        usage.live -= self.ENVIRONMENT_BYTES
+        self.current -= self.ENVIRONMENT_BYTES
+
+    def report(self) -> MemoryReport:
+        return MemoryReport(
+            by_type={name: MemoryUsage(usage.count, usage.allocated, usage.live, usage.peak)
+                     for name, usage in self.usage.items()},
+            peak=self.peak,
+            limit=self.limit,
+        )
+
+    def _charge(self, kind: str, size: int) -> None:
+        usage = self.usage[kind]
+        usage.count += 1
+        usage.allocated += size
+        usage.live += size
+        if usage.live > usage.peak:
+            usage.peak = usage.live
+        self.current += size
+        if self.current > self.peak:
+            self.peak = self.current
+            if self.limit is not None and self.current > self.limit:
+                self._exceeded()
+
+    def _exceeded(self) -> None:
+        raise LimitExceeded(new_error(MEMORY_QUOTA_EXCEEDED, [self.limit]))
@@ -0,0 +1,146 @@
+"""Memoización de llamadas a funciones puras con caché LRU acotada."""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import threading
+from typing import Dict, Hashable, List, Optional, Tuple, Union
+
+from src.config.object import Boolean, Function, Integer, Object, String
+from .purity import PurityAnalyzer
+
+# Tipos de argumento (y de resultado) que pueden formar parte de una clave
+_KEYABLE_TYPES = (Integer, String, Boolean)
+
+MemoKey = Tuple[Hashable, ...]
+MemoPolicy = Union[bool, int, "MemoTable", None]
+
+
+@dataclass
+class MemoStats:
+    """Contadores de uso de la tabla de memoización."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    uncacheable: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class MemoTable:
+    """Tabla LRU de resultados indexada por (función, dependencias, argumentos).
+
+    Solo se memorizan llamadas a funciones que el `PurityAnalyzer` demuestra
+    puras y cuyos argumentos son `Integer`, `String` o `Boolean`. La clave
+    incluye las funciones libres a las que se resolvieron los callees, de modo
+    que volver a ligar un nombre con `let` no devuelve resultados obsoletos.
+    """
+
+    DEFAULT_SIZE = 1024
+
+    def __init__(self, max_size: int = DEFAULT_SIZE, analyzer: Optional[PurityAnalyzer] = None) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size debe ser positivo")
+        self.max_size = max_size
+        self.analyzer = analyzer if analyzer is not None else PurityAnalyzer()
+        self.stats = MemoStats()
+        self._entries: "OrderedDict[MemoKey, Object]" = OrderedDict()
+        # La tabla se comparte entre contextos de ejecución de distintos hilos
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_policy(cls, policy: MemoPolicy) -> Optional["MemoTable"]:
+        """Construye la tabla a partir de la política `memoize=` del intérprete.
+
+        - False / None: sin memoización.
+        - True: tabla con el tamaño por defecto.
+        - int: tabla con ese número máximo de entradas.
+        - MemoTable: se usa tal cual (permite compartirla).
+        """
+        if policy is None or policy is False:
+            return None
+        if isinstance(policy, MemoTable):
+            return policy
+        if policy is True:
+            return cls()
+        if isinstance(policy, int):
+            return cls(max_size=policy)
+        raise TypeError(f"Política de memoización no soportada: {policy!r}")
+
+    def key_for(self, fn: Object, args: List[Object]) -> Optional[MemoKey]:
+        """Devuelve la clave de la llamada o None si no es memorizable."""
+        if not isinstance(fn, Function):
+            return None
+
+        arguments_key = []
+        for argument in args:
+            if not isinstance(argument, _KEYABLE_TYPES):
+                self._count_uncacheable()
+                return None
+            arguments_key.append((type(argument), argument.value))
+
+        dependencies = self._resolve_pure_dependencies(fn, {})
+        if dependencies is None:
+            self._count_uncacheable()
+            return None
+        return (fn, tuple(dependencies), tuple(arguments_key))
+
+    def get(self, key: MemoKey) -> Optional[Object]:
+        """Busca un resultado y lo marca como usado recientemente."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return value
+
+    def put(self, key: MemoKey, value: Object) -> None:
+        """Guarda un resultado; solo se memorizan valores primitivos."""
+        if not isinstance(value, _KEYABLE_TYPES):
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _count_uncacheable(self) -> None:
+        with self._lock:
+            self.stats.uncacheable += 1
+
+    def _resolve_pure_dependencies(self, fn: Function, visited: Dict[int, Function]) -> Optional[List[Function]]:
+        """Verifica transitivamente que `fn` y sus callees sean puros.
+
+        Devuelve las funciones alcanzadas (sin contar `fn`) o None si alguna
+        no es pura o un callee no resuelve a una `Function`.
+        """
+        visited[id(fn)] = fn
+        info = self.analyzer.analyze(fn.parameters, fn.body)
+        if not info.pure:
+            return None
+
+        dependencies: List[Function] = []
+        for name in sorted(info.callees):
+            callee = fn.env.get(name) if fn.env is not None else None
+            if not isinstance(callee, Function):
+                return None
+            if id(callee) in visited:
+                continue
+            dependencies.append(callee)
+            nested = self._resolve_pure_dependencies(callee, visited)
+            if nested is None:
+                return None
+            dependencies.extend(nested)
+        return dependencies
@@ -0,0 +1,103 @@
+"""Programas preparados: se parsean una vez y se ejecutan muchas con entradas distintas."""
+
+from typing import Any, FrozenSet, List, Mapping, Optional, Sequence, Tuple
+
+import src.astNode as ast
+from src.builtins.output import OutputTarget
+from src.config.environment import Environment, FrozenEnvironment
+from src.config.object import Object, to_object
+from .columnar import Column, ColumnarEvaluator, Unvectorizable
+from .interpreter import Interpreter
+
+
+class PreparedProgram:
+    """
+    Un `ast.Program` ya parseado con sus nombres de entrada declarados.
+
+    `run(bindings)` liga cada entrada en un entorno global nuevo (o en una
+    capa sobre la instantánea `prelude`) y evalúa el programa: no se vuelve
+    a tokenizar ni a parsear, y las cachés de análisis del intérprete
+    (clausuras, generadores, memoización) se reutilizan entre ejecuciones.
+
+    Las ejecuciones son independientes: los `let` de una no los ve la
+    siguiente. Como `Interpreter.interpret`, `run` puede llamarse desde
+    varios hilos a la vez.
+
+    `run_batch(columns)` evalúa muchas filas de una vez por columnas (ver
+    `columnar`) y recurre a `run` fila a fila si el programa no lo admite.
+    """
+
+    def __init__(self, program: ast.Program, inputs: Sequence[str] = (),
+                 interpreter: Optional[Interpreter] = None,
+                 prelude: Optional[FrozenEnvironment] = None) -> None:
+        names: Tuple[str, ...] = tuple(inputs)
+        for name in names:
+            if not name.isidentifier():
+                raise ValueError(f"nombre de entrada no válido: {name!r}")
+        if len(set(names)) != len(names):
+            raise ValueError("nombres de entrada repetidos")
+        self.program = program
+        self.inputs = names
+        self.interpreter = interpreter if interpreter is not None else Interpreter()
+        self.prelude = prelude
+        self._names: FrozenSet[str] = frozenset(names)
+
+    def run(self, bindings: Optional[Mapping[str, Any]] = None, fuel: Optional[int] = None,
+            timeout: Optional[float] = None, memory_limit: Optional[int] = None,
+            output: OutputTarget = None) -> Optional[Object]:
+        """
+        Ejecuta el programa con `bindings` (nombre de entrada -> valor).
+
+        Deben darse exactamente las entradas declaradas; los valores Python
+        se convierten con `to_object`. Los límites y la salida funcionan
+        como en `Interpreter.interpret`.
+        """
+        bindings = bindings if bindings is not None else {}
+        if bindings.keys() != self._names:
+            raise ValueError(self._mismatch(bindings))
+        environment = self.prelude.child() if self.prelude is not None else Environment()
+        values = {name: to_object(value) for name, value in bindings.items()}
+        environment.store.update(values)
+        return self.interpreter._run(self.program, environment, fuel, timeout, memory_limit, output,
+                                     self.prelude, values)
+
+    def run_batch(self, columns: Mapping[str, Sequence[Any]], fuel: Optional[int] = None,
+                  timeout: Optional[float] = None, memory_limit: Optional[int] = None,
+                  output: OutputTarget = None) -> List[Optional[Object]]:
+        """
+        Ejecuta el programa para cada fila de `columns` (nombre de entrada -> valores).
+
+        Las columnas pueden ser listas, tuplas o arreglos de NumPy (se leen
+        con `tolist()`) y deben tener la misma longitud. Devuelve un
+        resultado por fila, el mismo que daría `run` con los valores de esa
+        fila. Con `fuel`, `timeout` o `memory_limit`, o si el programa usa
+        algo que no se evalúa por columnas, se ejecuta fila a fila.
+        """
+        if columns.keys() != self._names:
+            raise ValueError(self._mismatch(columns))
+        lists = {name: values.tolist() if hasattr(values, "tolist") else list(values)
+                 for name, values in columns.items()}
+        sizes = {len(values) for values in lists.values()}
+        if len(sizes) > 1:
+            raise ValueError("las columnas tienen longitudes distintas")
+        size = sizes.pop() if sizes else 1
+        if fuel is None and timeout is None and memory_limit is None:
+            environment = self.prelude.child() if self.prelude is not None else Environment()
+            try:
+                return ColumnarEvaluator().run(
+                    self.program, {name: Column.from_values(values) for name, values in lists.items()},
+                    size, environment)
+            except Unvectorizable:
+                pass
+        rows = [dict(zip(lists, values)) for values in zip(*lists.values())] if lists else [{}] * size
+        return [self.run(row, fuel, timeout, memory_limit, output) for row in rows]
+
+    def _mismatch(self, bindings: Mapping[str, Any]) -> str:
+        missing = sorted(self._names - bindings.keys())
+        unexpected = sorted(bindings.keys() - self._names)
+        parts = []
+        if missing:
+            parts.append(f"faltan entradas: {', '.join(missing)}")
+        if unexpected:
+            parts.append(f"entradas no declaradas: {', '.join(unexpected)}")
+        return "; ".join(parts)
@@ -0,0 +1,159 @@
+"""Análisis de pureza para funciones definidas en el lenguaje.
+
+Una función se considera pura cuando su resultado depende únicamente de
+sus argumentos: no lee variables libres (que podrían volver a ligarse) y
+solo llama a otras funciones libres que, a su vez, sean puras. Como `let`
+siempre liga en el entorno local, un cuerpo nunca puede mutar una variable
+libre; basta con vigilar las lecturas.
+"""
+
+from dataclasses import dataclass
+from typing import FrozenSet, List, Optional, Set
+import weakref
+
+import src.astNode as ast
+
+
+@dataclass(frozen=True)
+class PurityInfo:
+    """Resultado del análisis estático de un cuerpo de función.
+
+    Attributes:
+        pure: True si el cuerpo no depende de estado externo salvo llamadas
+            a las funciones listadas en `callees`.
+        callees: Identificadores libres usados en posición de llamada; deben
+            resolverse en tiempo de ejecución a funciones puras.
+    """
+    pure: bool
+    callees: FrozenSet[str] = frozenset()
+
+
+IMPURE = PurityInfo(pure=False)
+
+
+class PurityAnalyzer:
+    """Analiza cuerpos `ast.Block` y cachea el veredicto por nodo."""
+
+    def __init__(self) -> None:
+        self._cache: "weakref.WeakKeyDictionary[ast.Block, PurityInfo]" = weakref.WeakKeyDictionary()
+
+    def analyze_function(self, node: ast.Function) -> PurityInfo:
+        """Analiza un literal de función completo."""
+        return self.analyze(node.parameters, node.body)
+
+    def analyze(self, parameters: List[ast.Identifier], body: Optional[ast.Block]) -> PurityInfo:
+        """Analiza el cuerpo de una función dados sus parámetros."""
+        if body is None:
+            return IMPURE
+        cached = self._cache.get(body)
+        if cached is not None:
+            return cached
+
+        parameter_names = {parameter.value for parameter in parameters}
+        declared: Set[str] = set(parameter_names)
+        self._collect_let_names(body, declared)
+        callees: Set[str] = set()
+        if self._is_pure(body, set(parameter_names), declared, callees):
+            info = PurityInfo(pure=True, callees=frozenset(callees))
+        else:
+            info = IMPURE
+
+        self._cache[body] = info
+        return info
+
+    def _collect_let_names(self, node: Optional[ast.ASTNode], names: Set[str]) -> None:
+        """Recolecta los nombres ligados con `let` dentro del cuerpo (sin entrar en funciones anidadas)."""
+        if isinstance(node, ast.Block):
+            for statement in node.statements:
+                self._collect_let_names(statement, names)
+        elif isinstance(node, ast.LetStatement):
+            if node.name is not None:
+                names.add(node.name.value)
+        elif isinstance(node, ast.ExpressionStatement):
+            self._collect_let_names(node.expression, names)
+        elif isinstance(node, ast.If):
+            self._collect_let_names(node.consequence, names)
+            self._collect_let_names(node.alternative, names)
+        elif isinstance(node, ast.WhileStatement):
+            self._collect_let_names(node.body, names)
+        elif isinstance(node, ast.ForStatement):
+            if node.variable is not None:
+                names.add(node.variable.value)
+            self._collect_let_names(node.body, names)
+
+    def _is_pure(self, node: Optional[ast.ASTNode], bound: Set[str], declared: Set[str],
+                 callees: Set[str]) -> bool:
+        """
+        Recorre el nodo en orden verificando que solo contenga construcciones puras.
+
+        `bound` son los nombres locales ya ligados seguro en este punto (se
+        amplía con cada `let`; las ramas y los bucles trabajan sobre una
+        copia): leer cualquier otro nombre puede leer una variable libre.
+        `declared` son todos los nombres locales del cuerpo.
+        """
+        if node is None:
+            return True
+
+        node_type = type(node)
+        if node_type in (ast.Integer, ast.StringLiteral, ast.Boolean):
+            return True
+        if node_type is ast.Identifier:
+            return node.value in bound
+        if node_type is ast.Prefix:
+            return self._is_pure(node.right, bound, declared, callees)
+        if node_type is ast.Infix:
+            return (self._is_pure(node.left, bound, declared, callees)
+                    and self._is_pure(node.right, bound, declared, callees))
+        if node_type is ast.If:
+            return (self._is_pure(node.condition, bound, declared, callees)
+                    and self._is_pure(node.consequence, set(bound), declared, callees)
+                    and self._is_pure(node.alternative, set(bound), declared, callees))
+        if node_type is ast.Call:
+            return self._is_pure_call(node, bound, declared, callees)
+        if node_type is ast.ArrayLiteral:
+            return all(self._is_pure(element, bound, declared, callees) for element in node.elements)
+        if node_type is ast.HashLiteral:
+            return all(self._is_pure(key, bound, declared, callees) and self._is_pure(value, bound, declared, callees)
+                       for key, value in node.pairs)
+        if node_type is ast.Index:
+            return (self._is_pure(node.left, bound, declared, callees)
+                    and self._is_pure(node.index, bound, declared, callees))
+        if node_type in (ast.Block, ast.Program):
+            return all(self._is_pure(statement, bound, declared, callees) for statement in node.statements)
+        if node_type is ast.LetStatement:
+            if not self._is_pure(node.value, bound, declared, callees):
+                return False
+            if node.name is not None:
+                bound.add(node.name.value)
+            return True
+        if node_type is ast.ReturnStatement:
+            return self._is_pure(node.return_value, bound, declared, callees)
+        if node_type is ast.ExpressionStatement:
+            return self._is_pure(node.expression, bound, declared, callees)
+        if node_type is ast.WhileStatement:
+            return (self._is_pure(node.condition, bound, declared, callees)
+                    and self._is_pure(node.body, set(bound), declared, callees))
+        if node_type is ast.ForStatement:
+            body_bound = set(bound)
+            if node.variable is not None:
+                body_bound.add(node.variable.value)
+            return (self._is_pure(node.iterable, bound, declared, callees)
+                    and self._is_pure(node.body, body_bound, declared, callees))
+
+        # Funciones anidadas, generadores (yield) y nodos desconocidos: conservadoramente impuros
+        return False
+
+    def _is_pure_call(self, node: ast.Call, bound: Set[str], declared: Set[str], callees: Set[str]) -> bool:
+        """
+        Una llamada es pura si su callee es un identificador libre y sus argumentos son puros.
+
+        Un callee ligado localmente en cualquier punto del cuerpo no es libre:
+        según el camino, la llamada podría ir a la función local.
+        """
+        callee = node.function
+        if type(callee) is not ast.Identifier or callee.value in declared:
+            return False
+        if not all(self._is_pure(argument, bound, declared, callees) for argument in node.arguments or []):
+            return False
+        callees.add(callee.value)
+        return True
@@ -0,0 +1,275 @@
+"""
+Caché de resultados de ejecuciones completas.
+
+La clave combina el hash estructural del programa (y del preludio), las
+entradas ligadas y los límites que cambian el resultado (`fuel`,
+`memory_limit`). Un programa que nombra un builtin no determinista o con
+efectos (E/S asíncrona, `print`) no se cachea nunca.
+
+Hay dos niveles: un LRU en memoria acotado en bytes y, opcionalmente, una
+base SQLite en disco que sobrevive al proceso y puede compartirse entre
+procesos (cada uno con su propia `ResultCache`). Los valores se guardan
+en una codificación JSON propia que reconstruye `null`, `true` y `false`
+como las instancias únicas del intérprete.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, FrozenSet, Mapping, Optional, Tuple
+import weakref
+
+import src.astNode as ast
+from src.astNode.structural import DIGEST_SIZE, fields, structural_hash
+from src.builtins import ASYNC_BUILTINS, BUILTINS
+from src.config.environment import FrozenEnvironment
+from src.config.object import (
+    FALSE, NULL, TRUE, Array, Boolean, Error, Hash, Integer, Null, Object, Range, String
+)
+
+# Builtins cuyo resultado o efecto no depende solo de sus argumentos
+NONDETERMINISTIC_BUILTINS: FrozenSet[str] = frozenset(ASYNC_BUILTINS) | frozenset(
+    name for name, builtin in BUILTINS.items() if builtin.writes_output)
+
+
+@dataclass
+class ResultCacheStats:
+    """Contadores de la caché; `disk_hits` es la parte de `hits` servida desde SQLite."""
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    uncacheable: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class Uncacheable(Exception):
+    """Un valor que no puede formar parte de una clave ni guardarse."""
+
+
+def encode_value(value: Object) -> Any:
+    """Forma JSON canónica de un valor de datos; lanza Uncacheable para funciones, iteradores, etc."""
+    value_type = type(value)
+    if value_type is Integer:
+        return ["I", value.value]
+    if value_type is String:
+        return ["S", value.value]
+    if value_type is Boolean:
+        return ["B", value.value]
+    if value_type is Null:
+        return ["N"]
+    if value_type is Error:
+        return ["E", value.message]
+    if value_type is Range:
+        return ["R", value.start, value.stop, value.step]
+    if value_type is Array:
+        if value.ints is not None:
+            return ["A", list(value.ints)]
+        return ["A", [encode_value(element) for element in value.items]]
+    if value_type is Hash:
+        # Orden canónico: el del HAMT depende del hash de las claves, que varía entre procesos
+        pairs = [[encode_value(key), encode_value(item)] for _, (key, item) in value.pairs.items()]
+        pairs.sort(key=lambda pair: json.dumps(pair[0]))
+        return ["H", pairs]
+    raise Uncacheable(value_type.__name__)
+
+
+def decode_value(data: Any) -> Object:
+    tag = data[0]
+    if tag == "I":
+        return Integer(data[1])
+    if tag == "S":
+        return String(data[1])
+    if tag == "B":
+        return TRUE if data[1] else FALSE
+    if tag == "N":
+        return NULL
+    if tag == "E":
+        return Error(data[1])
+    if tag == "R":
+        return Range(data[1], data[2], data[3])
+    if tag == "A":
+        elements = data[1]
+        if all(type(element) is int for element in elements):
+            return Array.from_ints(elements)
+        return Array([decode_value(element) for element in elements])
+    if tag == "H":
+        return Hash.from_pairs((decode_value(key), decode_value(item)) for key, item in data[1])
+    raise ValueError(f"valor codificado desconocido: {tag!r}")
+
+
+class ResultCache:
+    """
+    Caché LRU de resultados con un segundo nivel opcional en SQLite.
+
+    `max_bytes` acota el nivel en memoria (tamaño de los valores
+    codificados); `path` activa el nivel en disco, acotado por
+    `disk_max_bytes` (sin límite si es None). Al superar un límite se
+    descartan primero las entradas usadas hace más tiempo. Es segura entre
+    hilos; un proceso hijo debe abrir su propia instancia.
+    """
+
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, path: Optional[str] = None,
+                 disk_max_bytes: Optional[int] = None) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes debe ser positivo")
+        if disk_max_bytes is not None and disk_max_bytes <= 0:
+            raise ValueError("disk_max_bytes debe ser positivo")
+        self.max_bytes = max_bytes
+        self.disk_max_bytes = disk_max_bytes
+        self.stats = ResultCacheStats()
+        self.size_bytes = 0
+        self._entries: "OrderedDict[str, Tuple[Object, int]]" = OrderedDict()
+        self._programs: "weakref.WeakKeyDictionary[ast.Program, Tuple[str, bool]]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._disk_bytes = 0
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._db.execute("CREATE TABLE IF NOT EXISTS results "
+                             "(key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, used REAL NOT NULL)")
+            self._db.execute("CREATE INDEX IF NOT EXISTS results_used ON results (used)")
+            self._disk_bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+    def key(self, program: ast.Program, prelude: Optional[FrozenEnvironment] = None,
+            bindings: Mapping[str, Object] = {}, fuel: Optional[int] = None,
+            memory_limit: Optional[int] = None) -> Optional[str]:
+        """
+        Clave de la ejecución, o None (y se cuenta en `uncacheable`) si no debe cachearse.
+
+        Un preludio solo es cacheable si se creó con `Interpreter.snapshot`,
+        que recuerda el programa del que sale.
+        """
+        try:
+            parts = [self._program_hash(program)]
+            if prelude is not None:
+                if prelude.source is None:
+                    raise Uncacheable("preludio sin programa de origen")
+                parts.append(self._program_hash(prelude.source))
+            encoded = {name: encode_value(value) for name, value in bindings.items()}
+        except Uncacheable:
+            with self._lock:
+                self.stats.uncacheable += 1
+            return None
+        payload = json.dumps([parts, sorted(encoded.items()), fuel, memory_limit], separators=(",", ":"))
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=DIGEST_SIZE).hexdigest()
+
+    def get(self, key: str) -> Optional[Object]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return entry[0]
+            if self._db is not None:
+                row = self._db.execute("SELECT value, size FROM results WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    self._db.execute("UPDATE results SET used = ? WHERE key = ?", (time.time(), key))
+                    value = decode_value(json.loads(row[0]))
+                    self._remember(key, value, row[1])
+                    self.stats.hits += 1
+                    self.stats.disk_hits += 1
+                    return value
+            self.stats.misses += 1
+            return None
+
+    def put(self, key: str, value: Object) -> None:
+        """Guarda el resultado; los valores que no son datos (funciones, iteradores) se ignoran."""
+        try:
+            text = json.dumps(encode_value(value), separators=(",", ":"))
+        except Uncacheable:
+            with self._lock:
+                self.stats.uncacheable += 1
+            return
+        size = len(text)
+        with self._lock:
+            self.stats.stores += 1
+            self._remember(key, value, size)
+            if self._db is not None:
+                self._store(key, text, size)
+
+    def clear(self) -> None:
+        """Vacía ambos niveles (las estadísticas se conservan)."""
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+            if self._db is not None:
+                self._db.execute("DELETE FROM results")
+                self._disk_bytes = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _program_hash(self, program: ast.Program) -> str:
+        """Hash estructural del programa; lanza Uncacheable si nombra builtins no deterministas."""
+        info = self._programs.get(program)
+        if info is None:
+            info = (structural_hash(program), _is_deterministic(program))
+            self._programs[program] = info
+        if not info[1]:
+            raise Uncacheable("builtin no determinista")
+        return info[0]
+
+    def _remember(self, key: str, value: Object, size: int) -> None:
+        if size > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.size_bytes -= previous[1]
+        self._entries[key] = (value, size)
+        self.size_bytes += size
+        while self.size_bytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.size_bytes -= evicted
+            self.stats.evictions += 1
+
+    def _store(self, key: str, text: str, size: int) -> None:
+        assert self._db is not None
+        previous = self._db.execute("SELECT size FROM results WHERE key = ?", (key,)).fetchone()
+        self._db.execute("INSERT OR REPLACE INTO results (key, value, size, used) VALUES (?, ?, ?, ?)",
+                         (key, text, size, time.time()))
+        self._disk_bytes += size - (previous[0] if previous is not None else 0)
+        if self.disk_max_bytes is None or self._disk_bytes <= self.disk_max_bytes:
+            return
+        excess = self._disk_bytes - self.disk_max_bytes
+        evicted = []
+        for old_key, old_size in self._db.execute("SELECT key, size FROM results ORDER BY used"):
+            if excess <= 0:
+                break
+            evicted.append((old_key,))
+            excess -= old_size
+            self._disk_bytes -= old_size
+        self._db.executemany("DELETE FROM results WHERE key = ?", evicted)
+        self.stats.evictions += len(evicted)
+
+
+def _is_deterministic(program: ast.Program) -> bool:
+    """False si algún identificador del programa nombra un builtin no determinista."""
+    stack: list = [program]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.Identifier):
+            if node.value in NONDETERMINISTIC_BUILTINS:
+                return False
+        elif isinstance(node, ast.ASTNode):
+            stack.extend(value for _, value in fields(node))
+        elif isinstance(node, (list, tuple)):
+            stack.extend(node)
+    return True
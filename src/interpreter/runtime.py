@@ -1,21 +1,35 @@
-from typing import List, Tuple, Union, Optional, cast
+import operator
+from array import array
+from itertools import repeat
+from typing import List, Tuple, Union, Optional, cast, TYPE_CHECKING
 from src.astNode import (
     Block, Expression, Statement
 )   
 from src.config.environment import Environment
+from src.config import object as objects
 from src.config.object import (
-    Boolean, Null, Object, Integer, Return, Function, String, ObjectType
+    Array, AsyncBuiltin, Boolean, Hash, Null, Object, Integer, Return, Function, String, ObjectType, is_hashable
 )
 
+if TYPE_CHECKING:
+    from .frames import FramePool
+
 ApplyResult = Union[
     Tuple[Block, Environment], 
     Object                     
 ]
 
 from .errors import (
+    ASYNC_BUILTIN_IN_SYNC_CONTEXT,
+    NOT_A_FUNCTION,
     UNKNOWN_INFIX_OPERATOR,
     UNKNOWN_PREFIX_OPERATOR,
     DIVISION_BY_ZERO,
+    INDEX_NOT_SUPPORTED,
+    INDEX_OUT_OF_RANGE,
+    LENGTH_MISMATCH,
+    UNHASHABLE_KEY,
+    WRONG_ARITY,
     new_error
 )
 
@@ -27,9 +41,9 @@ class RuntimePrimitives:
     """
     
     # Singleton instances for primitive values
-    TRUE = Boolean(True)
-    FALSE = Boolean(False)
-    NULL = Null()
+    TRUE = objects.TRUE
+    FALSE = objects.FALSE
+    NULL = objects.NULL
     
     def __new__(cls, *args, **kwargs):
         """Prevent instantiation of this utility class."""
@@ -92,10 +106,27 @@ class InfixOperations:
         '!=': lambda l, r: l != r,
     }
     
+    # Operan sobre objetos String: '+' construye un rope sin copiar
     _STRING_OPERATORS = {
-        '+': lambda l, r: l + r,
-        '==': lambda l, r: l == r,
-        '!=': lambda l, r: l != r,
+        '+': lambda l, r: String.concat(l, r),
+        '==': lambda l, r: RuntimePrimitives.to_boolean_object(l.equals(r)),
+        '!=': lambda l, r: RuntimePrimitives.to_boolean_object(not l.equals(r)),
+    }
+
+    # Operadores elemento a elemento sobre arreglos de enteros
+    _ARRAY_ARITHMETIC = {
+        '+': operator.add,
+        '-': operator.sub,
+        '*': operator.mul,
+        '/': operator.floordiv,
+    }
+    _ARRAY_COMPARISON = {
+        '<': operator.lt,
+        '<=': operator.le,
+        '>': operator.gt,
+        '>=': operator.ge,
+        '==': operator.eq,
+        '!=': operator.ne,
     }
 
     @staticmethod
@@ -143,8 +174,8 @@ class InfixOperations:
         Returns:
             Object: Result of the operation or error object
         """
-        left_value = cast(String, left).value
-        right_value = cast(String, right).value
+        left_string = cast(String, left)
+        right_string = cast(String, right)
 
         # Get the operation function
         operation = InfixOperations._STRING_OPERATORS.get(operator)
@@ -152,13 +183,84 @@ class InfixOperations:
             return new_error(UNKNOWN_INFIX_OPERATOR, 
                            [left.type().name, operator, right.type().name])
         
-        result = operation(left_value, right_value)
+        return operation(left_string, right_string)
+
+    @staticmethod
+    def array_infix(operator: str, left: Object, right: Object) -> Object:
+        """Evaluate elementwise operations on integer arrays.
         
-        # Return appropriate object type based on operation
-        if operator in ['==', '!=']:
-            return RuntimePrimitives.to_boolean_object(result)
+        Both operands may be arrays of equal length, or one of them may be an
+        Integer that is broadcast over the other. The loop runs over the
+        unboxed `array('q')` storage, never through the evaluator.
         
-        return String(result)
+        Args:
+            operator: The infix operator as a string
+            left: Left operand (Array or Integer)
+            right: Right operand (Array or Integer)
+            
+        Returns:
+            Object: Array of Integer (arithmetic) or Boolean (comparisons), or error object
+        """
+        left_values = InfixOperations._unboxed_operand(left)
+        right_values = InfixOperations._unboxed_operand(right)
+        if left_values is None or right_values is None:
+            return new_error(UNKNOWN_INFIX_OPERATOR,
+                           [left.type().name, operator, right.type().name])
+
+        if isinstance(left_values, array) and isinstance(right_values, array):
+            if len(left_values) != len(right_values):
+                return new_error(LENGTH_MISMATCH, [len(left_values), operator, len(right_values)])
+            pairs = (left_values, right_values)
+        elif isinstance(left_values, array):
+            pairs = (left_values, repeat(right_values, len(left_values)))
+        else:
+            pairs = (repeat(left_values, len(right_values)), right_values)
+
+        arithmetic = InfixOperations._ARRAY_ARITHMETIC.get(operator)
+        if arithmetic is not None:
+            if operator == '/' and (right_values == 0 if isinstance(right_values, int) else 0 in right_values):
+                return new_error(DIVISION_BY_ZERO, [])
+            return Array.from_ints(list(map(arithmetic, *pairs)))
+
+        comparison = InfixOperations._ARRAY_COMPARISON.get(operator)
+        if comparison is not None:
+            to_boolean = RuntimePrimitives.to_boolean_object
+            return Array([to_boolean(result) for result in map(comparison, *pairs)])
+
+        return new_error(UNKNOWN_INFIX_OPERATOR,
+                       [left.type().name, operator, right.type().name])
+
+    @staticmethod
+    def _unboxed_operand(operand: Object) -> Union[array, int, None]:
+        """Return the raw storage of a typed Array, the int of an Integer, or None."""
+        if isinstance(operand, Array):
+            return operand.ints
+        if isinstance(operand, Integer):
+            return operand.value
+        return None
+
+
+class IndexOperations:
+    """Acceso por índice a valores indexables."""
+
+    @staticmethod
+    def index(left: Object, index: Object) -> Object:
+        """
+        Devuelve `left[index]`.
+        - Arreglos: índice entero (admite negativos como Python); fuera de rango es un Error.
+        - Mapas: cualquier clave hashable; una clave ausente devuelve NULL.
+        """
+        if isinstance(left, Hash):
+            if not is_hashable(index):
+                return new_error(UNHASHABLE_KEY, [index.type().name])
+            value = left.get(index)
+            return value if value is not None else RuntimePrimitives.NULL
+        if not isinstance(left, Array) or not isinstance(index, Integer):
+            return new_error(INDEX_NOT_SUPPORTED, [left.type().name, index.type().name])
+        try:
+            return left.get(index.value)
+        except IndexError:
+            return new_error(INDEX_OUT_OF_RANGE, [index.value])
 
 class PrefixOperations:
     """Handles prefix (unary) operators for the language.
@@ -219,12 +321,14 @@ class FunctionsOperations:
     """Aplicación de funciones y manejo de entornos."""
 
     @staticmethod
-    def extend_function_environment(fn: Function, args: List[Object]) -> Environment:
+    def extend_function_environment(fn: Function, args: List[Object],
+                                    pool: Optional["FramePool"] = None) -> Environment:
         """
         Crea un entorno hijo de la clausura de `fn` y liga parámetros -> argumentos.
+        Si se recibe un `FramePool`, el marco se toma del pool en lugar de asignarlo.
         Precondición: len(args) == len(fn.parameters)
         """
-        env = Environment(outer=fn.env)
+        env = pool.acquire(fn.env) if pool is not None else Environment(outer=fn.env)
         for param, arg in zip(fn.parameters, args):
             env.set(param.value, arg)
         return env
@@ -237,19 +341,21 @@ class FunctionsOperations:
         """
         if isinstance(obj, Return):
             value: Optional[Object] = cast(Return, obj).value
-            return value if value is not None else Runtime.NULL
+            return value if value is not None else RuntimePrimitives.NULL
         return obj
 
     @staticmethod
-    def apply_function(fn: Object, args: List[Object]) -> ApplyResult:
+    def apply_function(fn: Object, args: List[Object], pool: Optional["FramePool"] = None) -> ApplyResult:
         """
         Prepara la ejecución de una Function definida en el lenguaje:
         - Verifica tipo (Function) y aridad.
-        - Extiende entorno con ligaduras param->arg.
+        - Extiende entorno con ligaduras param->arg (marco tomado de `pool` si existe).
         - Devuelve (bloque_cuerpo, env_extendido) para que el evaluador lo ejecute.
         En caso de error, retorna un Error (Object).
         """
         if not isinstance(fn, Function):
+            if isinstance(fn, AsyncBuiltin):
+                return new_error(ASYNC_BUILTIN_IN_SYNC_CONTEXT, [])
             return new_error(NOT_A_FUNCTION, [fn.type().name])
 
         expected = len(fn.parameters)
@@ -257,6 +363,6 @@ class FunctionsOperations:
         if expected != received:
             return new_error(WRONG_ARITY, [expected, received])
 
-        extended_env = Functions.extend_function_environment(fn, args)
+        extended_env = FunctionsOperations.extend_function_environment(fn, args, pool)
         # Importante: NO evaluamos aquí para evitar acoplamientos/ciclos.
         return fn.body, extended_env
\ No newline at end of file
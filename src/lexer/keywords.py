@@ -6,6 +6,7 @@ KEYWORDS = {
     "let": TokenType.LET,
     "function": TokenType.FUNCTION,
     "return": TokenType.RETURN,
+    "yield": TokenType.YIELD,
     "if": TokenType.CONDITIONAL,
     "while": TokenType.LOOP,
     "for": TokenType.LOOP,
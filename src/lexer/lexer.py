@@ -29,7 +29,10 @@ class Lexer:
         ")": TokenType.RPAREN,
         "{": TokenType.LBRACE,
         "}": TokenType.RBRACE,
+        "[": TokenType.LBRACKET,
+        "]": TokenType.RBRACKET,
         ",": TokenType.COMMA,
+        ":": TokenType.COLON,
         ";": TokenType.SEMICOLON,
         '"': TokenType.QUOTE,
         "<": TokenType.LT,
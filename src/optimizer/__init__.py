@@ -0,0 +1,19 @@
+"""
+Pasadas de optimización sobre el AST.
+
+Cada pasada recibe un `ast.Program` ya parseado, lo transforma sin cambiar
+su resultado ni su salida y devuelve un informe de lo que ha hecho. La
+única diferencia visible es el texto de las funciones: las pasadas
+reescriben los literales de función, así que `print` o `inspect()` de un
+valor función muestran el cuerpo ya optimizado.
+"""
+
+from .dead_code import DeadCodeEliminator, DeadCodeReport, eliminate_dead_code
+from .inlining import InlineReport, Inliner, inline_functions
+from .type_inference import TypeDiagnostic, TypeInference, TypeReport, infer_types
+
+__all__ = [
+    "DeadCodeEliminator", "DeadCodeReport", "eliminate_dead_code",
+    "InlineReport", "Inliner", "inline_functions",
+    "TypeDiagnostic", "TypeInference", "TypeReport", "infer_types",
+]
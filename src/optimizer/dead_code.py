@@ -0,0 +1,244 @@
+"""
+Eliminación de código muerto sobre `ast.Program`.
+
+Se quitan tres clases de sentencias:
+
+- las que siguen a un `return` (o a un `if` cuyas dos ramas retornan),
+  que `eval_block_expression` nunca alcanza;
+- los `let` dentro de funciones cuyo nombre no se lee en ninguna parte de
+  la función (ni en sus funciones anidadas) y cuyo valor no tiene efectos;
+- las expresiones sin efectos usadas como sentencia.
+
+Una expresión "sin efectos" no puede producir un error ni escribir nada:
+literales, literales de función, identificadores que seguro están ligados
+a un valor normal (`let` anteriores del mismo camino y builtins que
+ningún nombre local oculta; no los parámetros, que pueden recibir un Error), `!x` y arreglos o hashes de
+literales. La última sentencia de un bloque nunca se
+quita porque es su valor, y los `let` globales tampoco: definen el entorno
+que leen otros programas (preludios, `PreparedProgram`).
+
+Los nodos modificados se copian en lugar de mutarse, de modo que la
+pasada es segura sobre árboles con subárboles compartidos (`Interner`);
+solo la lista de sentencias del `Program` se sustituye en su sitio.
+"""
+
+from dataclasses import dataclass
+from typing import FrozenSet, List, Optional, Set
+
+import src.astNode as ast
+from src.astNode.structural import fields
+from src.builtins import BUILTINS
+from .tree import ATOMS, count_nodes, replace
+
+# Literales cuya evaluación no puede fallar ni tener efectos
+_PURE_LEAVES = (ast.Integer, ast.StringLiteral, ast.Boolean, ast.Function)
+# Literales válidos como clave de un hash
+_HASHABLE_LITERALS = (ast.Integer, ast.StringLiteral, ast.Boolean)
+
+
+@dataclass
+class DeadCodeReport:
+    """Sentencias eliminadas por motivo y nodos del AST que desaparecen con ellas."""
+    unreachable: int = 0
+    unused_lets: int = 0
+    unused_expressions: int = 0
+    nodes_removed: int = 0
+
+    @property
+    def statements_removed(self) -> int:
+        return self.unreachable + self.unused_lets + self.unused_expressions
+
+
+class DeadCodeEliminator:
+    """Pasada de eliminación de código muerto; acumula lo eliminado en `report`."""
+
+    def __init__(self) -> None:
+        self.report = DeadCodeReport()
+        # Nombres ligados en las funciones que se están recorriendo: ocultan a los builtins
+        self._shadowed: FrozenSet[str] = frozenset()
+
+    def run(self, program: ast.Program) -> DeadCodeReport:
+        statements = self._statements(program.statements, None, set(BUILTINS))
+        if statements is not program.statements:
+            program.statements = statements
+        return self.report
+
+    def _statements(self, statements: List[ast.Statement], reads: Optional[FrozenSet[str]],
+                    bound: Set[str]) -> List[ast.Statement]:
+        """
+        Optimiza una secuencia de sentencias.
+
+        `reads` son los nombres leídos en la función que la contiene (None
+        fuera de funciones) y `bound`, los nombres ligados seguro en este
+        punto; se amplía con los `let` que se van recorriendo.
+        """
+        result: List[ast.Statement] = []
+        changed = False
+        last = len(statements) - 1
+        for position, original in enumerate(statements):
+            statement = self._node(original, reads, bound)
+            changed = changed or statement is not original
+            if position < last and self._remove_if_dead(statement, reads, bound):
+                changed = True
+                continue
+            result.append(statement)
+            if type(statement) is ast.LetStatement and statement.name is not None:
+                bound.add(statement.name.value)
+            if position < last and _always_returns(statement):
+                unreachable = statements[position + 1:]
+                self.report.unreachable += len(unreachable)
+                self.report.nodes_removed += sum(count_nodes(node) for node in unreachable)
+                changed = True
+                break
+        return result if changed else statements
+
+    def _remove_if_dead(self, statement: ast.Statement, reads: Optional[FrozenSet[str]],
+                        bound: Set[str]) -> bool:
+        statement_type = type(statement)
+        if statement_type is ast.LetStatement:
+            if (reads is None or statement.name is None or statement.name.value in reads
+                    or not _is_pure(statement.value, bound)):
+                return False
+            self.report.unused_lets += 1
+        elif statement_type is ast.ExpressionStatement:
+            if not _is_pure(statement.expression, bound):
+                return False
+            self.report.unused_expressions += 1
+        else:
+            return False
+        self.report.nodes_removed += count_nodes(statement)
+        return True
+
+    def _node(self, node, reads: Optional[FrozenSet[str]], bound: Set[str]):
+        """Devuelve `node` optimizado: el mismo objeto si no cambia, una copia si cambia."""
+        node_type = type(node)
+        if node_type in ATOMS:
+            return node
+        if node_type is ast.Function:
+            return self._function(node)
+        if node_type is ast.Block:
+            statements = self._statements(node.statements, reads, set(bound))
+            return node if statements is node.statements else replace(node, statements=statements)
+        if node_type is ast.ForStatement and node.variable is not None:
+            # La variable del bucle está ligada dentro del cuerpo
+            body = self._node(node.body, reads, bound | {node.variable.value})
+            iterable = self._node(node.iterable, reads, bound)
+            if body is node.body and iterable is node.iterable:
+                return node
+            return replace(node, body=body, iterable=iterable)
+        changes = {}
+        for name, value in fields(node):
+            rebuilt = self._field(value, reads, bound)
+            if rebuilt is not value:
+                changes[name] = rebuilt
+        return replace(node, **changes) if changes else node
+
+    def _field(self, value, reads: Optional[FrozenSet[str]], bound: Set[str]):
+        value_type = type(value)
+        if value_type is list or value_type is tuple:
+            items = [self._field(item, reads, bound) for item in value]
+            if all(item is original for item, original in zip(items, value)):
+                return value
+            return items if value_type is list else tuple(items)
+        return self._node(value, reads, bound)
+
+    def _function(self, node: ast.Function):
+        """Optimiza el cuerpo hasta un punto fijo: quitar un `let` puede dejar otro sin lectores."""
+        if node.body is None:
+            return node
+        outer = self._shadowed
+        self._shadowed = outer | _binders(node)
+        try:
+            # Un builtin solo está ligado seguro si ni esta función ni las que la
+            # contienen usan su nombre (un parámetro `len` puede valer un Error)
+            builtins = set(BUILTINS) - self._shadowed
+            body = node.body
+            while True:
+                removed = self.report.unused_lets
+                body = self._node(body, frozenset(_reads(body)), set(builtins))
+                if self.report.unused_lets == removed:
+                    break
+        finally:
+            self._shadowed = outer
+        return node if body is node.body else replace(node, body=body)
+
+
+def eliminate_dead_code(program: ast.Program) -> DeadCodeReport:
+    """Elimina el código muerto de `program` (en su sitio) y devuelve el informe."""
+    return DeadCodeEliminator().run(program)
+
+
+def _always_returns(statement: Optional[ast.ASTNode]) -> bool:
+    """True si ejecutar la sentencia termina siempre la función (o el programa) con `return`."""
+    statement_type = type(statement)
+    if statement_type is ast.ReturnStatement:
+        return True
+    if statement_type is ast.Block:
+        return any(_always_returns(inner) for inner in statement.statements)
+    if statement_type is ast.ExpressionStatement and type(statement.expression) is ast.If:
+        branch = statement.expression
+        return (branch.alternative is not None and _always_returns(branch.consequence)
+                and _always_returns(branch.alternative))
+    return False
+
+
+def _is_pure(node: Optional[ast.ASTNode], bound: Set[str]) -> bool:
+    """True si evaluar la expresión no puede fallar ni tener efectos."""
+    node_type = type(node)
+    if node_type in _PURE_LEAVES:
+        return True
+    if node_type is ast.Identifier:
+        return node.value in bound
+    if node_type is ast.Prefix:
+        if node.operator == "!":
+            return _is_pure(node.right, bound)
+        return node.operator == "-" and type(node.right) is ast.Integer
+    if node_type is ast.ArrayLiteral:
+        return all(_is_pure(element, bound) for element in node.elements)
+    if node_type is ast.HashLiteral:
+        return all(type(key) in _HASHABLE_LITERALS and _is_pure(value, bound) for key, value in node.pairs)
+    return False
+
+
+def _binders(node: ast.Function) -> Set[str]:
+    """Parámetros y nombres ligados con `let` o `for` en la función (sin sus funciones anidadas)."""
+    names = {parameter.value for parameter in node.parameters}
+    stack = [node.body]
+    while stack:
+        value = stack.pop()
+        value_type = type(value)
+        if value_type is list or value_type is tuple:
+            stack.extend(value)
+        elif value_type is ast.LetStatement:
+            if value.name is not None:
+                names.add(value.name.value)
+            stack.append(value.value)
+        elif value_type is ast.ForStatement:
+            if value.variable is not None:
+                names.add(value.variable.value)
+            stack.extend((value.iterable, value.body))
+        elif value_type is not ast.Function and value_type not in ATOMS:
+            stack.extend(field for _, field in fields(value))
+    return names
+
+
+def _reads(node) -> Set[str]:
+    """Nombres leídos dentro de `node`, incluidas sus funciones anidadas."""
+    names: Set[str] = set()
+    stack = [node]
+    while stack:
+        value = stack.pop()
+        value_type = type(value)
+        if value_type is list or value_type is tuple:
+            stack.extend(value)
+        elif value_type is ast.Identifier:
+            names.add(value.value)
+        elif value_type is ast.LetStatement:
+            stack.append(value.value)
+        elif value_type is ast.Function:
+            stack.append(value.body)
+        elif value_type is ast.ForStatement:
+            stack.extend((value.iterable, value.body))
+        elif value_type not in ATOMS:
+            stack.extend(field for _, field in fields(value))
+    return names
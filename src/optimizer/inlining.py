@@ -0,0 +1,349 @@
+"""
+Inlining de funciones pequeñas ligadas con `let`.
+
+Una llamada `f(a, b)` a una función `let f = function(x, y) { expr }` se
+sustituye por `expr` con cada parámetro reemplazado por su argumento. Así
+se ahorra todo lo que cuesta `eval_call_expression`: evaluar el callee,
+construir la lista de argumentos, el marco `Environment` y deshacer el
+`Return`.
+
+Solo se hace cuando el resultado es equivalente:
+
+- `f` se liga una sola vez en todo el programa (ningún otro `let`,
+  parámetro ni variable de `for` usa el nombre), con un `let` que es
+  sentencia directa del programa o del cuerpo de una función, y la llamada
+  aparece después de él en ese mismo cuerpo;
+- el cuerpo es una única expresión (o `return expresión`) sin literales de
+  función ni sentencias que liguen nombres o retornen, con a lo sumo
+  `max_body_nodes` nodos, y no nombra a `f` (no es recursiva);
+- higiene: el cuerpo no introduce binders, de modo que los argumentos no
+  pueden quedar capturados; a cambio, ningún nombre libre del cuerpo puede
+  estar ligado en una función entre la definición y la llamada, porque allí
+  se resolvería a otra variable;
+- los argumentos identificador o literal pueden duplicarse o descartarse.
+  Se admite además un único argumento compuesto si su parámetro aparece
+  exactamente una vez y el cuerpo solo tiene operadores, identificadores y
+  literales: así se evalúa una vez y sin reordenar efectos.
+
+Las funciones que se definen después pueden usar las ya inlineadas, de
+modo que las cadenas de funciones pequeñas se aplanan en una pasada. La
+definición se conserva (puede haber otras llamadas o lectores). Las
+llamadas inlineadas ya no consumen fuel ni profundidad de recursión.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+import src.astNode as ast
+from src.astNode.structural import fields
+from .tree import ATOMS, count_nodes, replace
+
+# Argumentos que se pueden duplicar o descartar sin cambiar el resultado
+_SIMPLE_ARGUMENTS = (ast.Identifier, ast.Integer, ast.StringLiteral, ast.Boolean)
+# Nodos que evalúan siempre todos sus hijos, sin efectos ni cortocircuitos
+_STRAIGHT_NODES = (ast.Infix, ast.Prefix, ast.Identifier, ast.Integer, ast.StringLiteral, ast.Boolean)
+# Expresiones admitidas en un cuerpo inlineable (If se comprueba aparte)
+_INLINABLE_NODES = _STRAIGHT_NODES + (ast.Call, ast.Index, ast.ArrayLiteral, ast.HashLiteral)
+
+
+@dataclass
+class InlineReport:
+    """Funciones candidatas y llamadas inlineadas por función."""
+    candidates: int = 0
+    sites: Dict[str, int] = field(default_factory=dict)
+    # Llamadas a candidatas que no se pudieron inlinear (aridad, higiene, argumentos)
+    skipped: int = 0
+
+    @property
+    def inlined(self) -> int:
+        return sum(self.sites.values())
+
+
+@dataclass(frozen=True)
+class _Candidate:
+    name: str
+    parameters: Tuple[str, ...]
+    body: ast.Expression
+    # Apariciones de cada parámetro en el cuerpo
+    uses: Tuple[int, ...]
+    free: FrozenSet[str]
+    # Índice en la pila de ámbitos del cuerpo que contiene el `let`
+    depth: int
+    straight: bool
+
+
+class Inliner:
+    """Pasada de inlining; acumula las llamadas sustituidas en `report`."""
+
+    DEFAULT_MAX_BODY_NODES = 16
+
+    def __init__(self, max_body_nodes: int = DEFAULT_MAX_BODY_NODES) -> None:
+        if max_body_nodes <= 0:
+            raise ValueError("max_body_nodes debe ser positivo")
+        self.max_body_nodes = max_body_nodes
+        self.report = InlineReport()
+        self._bindings: Dict[str, int] = {}
+        # Nombres ligados en el programa y en cada función que rodea al nodo actual
+        self._scopes: List[Set[str]] = []
+        self._active: Dict[str, _Candidate] = {}
+
+    def run(self, program: ast.Program) -> InlineReport:
+        self._bindings = _binding_counts(program)
+        self._scopes = [_declared(program.statements)]
+        statements = self._statements(program.statements, register=True)
+        if statements is not program.statements:
+            program.statements = statements
+        return self.report
+
+    def _statements(self, statements: List[ast.Statement], register: bool) -> List[ast.Statement]:
+        """Reescribe las sentencias; con `register`, sus `let` de funciones pasan a ser candidatas."""
+        result: List[ast.Statement] = []
+        changed = False
+        registered: List[str] = []
+        for original in statements:
+            statement = self._node(original)
+            changed = changed or statement is not original
+            result.append(statement)
+            if register:
+                candidate = self._candidate(statement)
+                if candidate is not None:
+                    self._active[candidate.name] = candidate
+                    registered.append(candidate.name)
+                    self.report.candidates += 1
+        for name in registered:
+            del self._active[name]
+        return result if changed else statements
+
+    def _node(self, node):
+        node_type = type(node)
+        if node_type in ATOMS:
+            return node
+        if node_type is ast.Function:
+            return self._function(node)
+        if node_type is ast.Block:
+            statements = self._statements(node.statements, register=False)
+            return node if statements is node.statements else replace(node, statements=statements)
+        changes = {}
+        for name, value in fields(node):
+            rebuilt = self._field(value)
+            if rebuilt is not value:
+                changes[name] = rebuilt
+        rebuilt_node = replace(node, **changes) if changes else node
+        if node_type is ast.Call:
+            return self._inline(rebuilt_node)
+        return rebuilt_node
+
+    def _field(self, value):
+        value_type = type(value)
+        if value_type is list or value_type is tuple:
+            items = [self._field(item) for item in value]
+            if all(item is original for item, original in zip(items, value)):
+                return value
+            return items if value_type is list else tuple(items)
+        return self._node(value)
+
+    def _function(self, node: ast.Function):
+        if node.body is None:
+            return node
+        scope = _declared(node.body.statements)
+        scope.update(parameter.value for parameter in node.parameters)
+        self._scopes.append(scope)
+        try:
+            statements = self._statements(node.body.statements, register=True)
+        finally:
+            self._scopes.pop()
+        if statements is node.body.statements:
+            return node
+        return replace(node, body=replace(node.body, statements=statements))
+
+    def _candidate(self, statement: ast.Statement) -> Optional[_Candidate]:
+        """La función ligada por `statement` si cumple las condiciones para inlinearla."""
+        if type(statement) is not ast.LetStatement or type(statement.value) is not ast.Function:
+            return None
+        name = statement.name.value
+        function = statement.value
+        if self._bindings.get(name) != 1 or function.body is None or len(function.body.statements) != 1:
+            return None
+        parameters = tuple(parameter.value for parameter in function.parameters)
+        if len(set(parameters)) != len(parameters):
+            return None
+        only = function.body.statements[0]
+        if type(only) is ast.ExpressionStatement:
+            body = only.expression
+        elif type(only) is ast.ReturnStatement:
+            body = only.return_value
+        else:
+            return None
+        if body is None or not _inlinable(body) or count_nodes(body) > self.max_body_nodes:
+            return None
+        names = _identifier_counts(body)
+        if name in names:
+            return None
+        return _Candidate(
+            name=name,
+            parameters=parameters,
+            body=body,
+            uses=tuple(names.get(parameter, 0) for parameter in parameters),
+            free=frozenset(names.keys() - set(parameters)),
+            depth=len(self._scopes) - 1,
+            straight=_straight(body),
+        )
+
+    def _inline(self, call: ast.Call):
+        callee = call.function
+        if type(callee) is not ast.Identifier:
+            return call
+        candidate = self._active.get(callee.value)
+        if candidate is None:
+            return call
+        arguments = call.arguments or []
+        if not self._can_inline(candidate, arguments):
+            self.report.skipped += 1
+            return call
+        mapping = dict(zip(candidate.parameters, arguments))
+        self.report.sites[candidate.name] = self.report.sites.get(candidate.name, 0) + 1
+        return _substitute(candidate.body, mapping)
+
+    def _can_inline(self, candidate: _Candidate, arguments: List[ast.Expression]) -> bool:
+        if len(arguments) != len(candidate.parameters):
+            # Se deja la llamada para que falle igual que antes (WRONG_ARITY)
+            return False
+        for scope in self._scopes[candidate.depth + 1:]:
+            if not candidate.free.isdisjoint(scope):
+                return False
+        compound = [position for position, argument in enumerate(arguments)
+                    if type(argument) not in _SIMPLE_ARGUMENTS]
+        if not compound:
+            return True
+        return len(compound) == 1 and candidate.straight and candidate.uses[compound[0]] == 1
+
+
+def inline_functions(program: ast.Program, max_body_nodes: int = Inliner.DEFAULT_MAX_BODY_NODES) -> InlineReport:
+    """Inlinea las funciones pequeñas de `program` (en su sitio) y devuelve el informe."""
+    return Inliner(max_body_nodes).run(program)
+
+
+def _inlinable(node: Optional[ast.ASTNode]) -> bool:
+    """True si la expresión puede evaluarse en el entorno del llamador sin cambiar de significado."""
+    node_type = type(node)
+    if node_type is ast.If:
+        return (_inlinable(node.condition) and _inlinable_block(node.consequence)
+                and (node.alternative is None or _inlinable_block(node.alternative)))
+    if node_type not in _INLINABLE_NODES:
+        return False
+    if node_type is ast.Prefix:
+        return _inlinable(node.right)
+    if node_type is ast.Infix:
+        return _inlinable(node.left) and _inlinable(node.right)
+    if node_type is ast.Call:
+        return _inlinable(node.function) and all(_inlinable(argument) for argument in node.arguments or [])
+    if node_type is ast.Index:
+        return _inlinable(node.left) and _inlinable(node.index)
+    if node_type is ast.ArrayLiteral:
+        return all(_inlinable(element) for element in node.elements)
+    if node_type is ast.HashLiteral:
+        return all(_inlinable(key) and _inlinable(value) for key, value in node.pairs)
+    return True
+
+
+def _inlinable_block(block: Optional[ast.Block]) -> bool:
+    """Un bloque sin `let`, `return` ni bucles: solo expresiones."""
+    return block is not None and all(
+        type(statement) is ast.ExpressionStatement and _inlinable(statement.expression)
+        for statement in block.statements)
+
+
+def _straight(node: ast.ASTNode) -> bool:
+    """True si el nodo solo tiene operadores, identificadores y literales."""
+    node_type = type(node)
+    if node_type not in _STRAIGHT_NODES:
+        return False
+    if node_type is ast.Prefix:
+        return _straight(node.right)
+    if node_type is ast.Infix:
+        return _straight(node.left) and _straight(node.right)
+    return True
+
+
+def _substitute(node, mapping: Dict[str, ast.Expression]):
+    """Copia de `node` con cada identificador de `mapping` sustituido (sin binders: no hay captura)."""
+    node_type = type(node)
+    if node_type is ast.Identifier:
+        return mapping.get(node.value, node)
+    if node_type in ATOMS:
+        return node
+    if node_type is list or node_type is tuple:
+        items = [_substitute(item, mapping) for item in node]
+        if all(item is original for item, original in zip(items, node)):
+            return node
+        return items if node_type is list else tuple(items)
+    changes = {}
+    for name, value in fields(node):
+        rebuilt = _substitute(value, mapping)
+        if rebuilt is not value:
+            changes[name] = rebuilt
+    return replace(node, **changes) if changes else node
+
+
+def _identifier_counts(node) -> Dict[str, int]:
+    """Apariciones de cada identificador dentro de `node`."""
+    counts: Dict[str, int] = {}
+    stack = [node]
+    while stack:
+        value = stack.pop()
+        value_type = type(value)
+        if value_type is list or value_type is tuple:
+            stack.extend(value)
+        elif value_type is ast.Identifier:
+            counts[value.value] = counts.get(value.value, 0) + 1
+        elif value_type not in ATOMS:
+            stack.extend(field for _, field in fields(value))
+    return counts
+
+
+def _declared(statements: List[ast.Statement]) -> Set[str]:
+    """Nombres que liga un cuerpo (`let` y variables de `for`), sin entrar en funciones anidadas."""
+    names: Set[str] = set()
+    stack: list = list(statements)
+    while stack:
+        value = stack.pop()
+        value_type = type(value)
+        if value_type is list or value_type is tuple:
+            stack.extend(value)
+        elif value_type is ast.LetStatement:
+            if value.name is not None:
+                names.add(value.name.value)
+            stack.append(value.value)
+        elif value_type is ast.ForStatement:
+            if value.variable is not None:
+                names.add(value.variable.value)
+            stack.extend((value.iterable, value.body))
+        elif value_type is not ast.Function and value_type not in ATOMS:
+            stack.extend(field for _, field in fields(value))
+    return names
+
+
+def _binding_counts(program: ast.Program) -> Dict[str, int]:
+    """Cuántas veces se liga cada nombre en todo el programa (let, parámetros y for)."""
+    counts: Dict[str, int] = {}
+    stack: list = [program]
+    while stack:
+        value = stack.pop()
+        value_type = type(value)
+        names: Tuple[Optional[ast.Identifier], ...] = ()
+        if value_type is list or value_type is tuple:
+            stack.extend(value)
+            continue
+        if value_type is ast.LetStatement:
+            names = (value.name,)
+        elif value_type is ast.ForStatement:
+            names = (value.variable,)
+        elif value_type is ast.Function:
+            names = tuple(value.parameters)
+        if value_type in ATOMS:
+            continue
+        for identifier in names:
+            if identifier is not None:
+                counts[identifier.value] = counts.get(identifier.value, 0) + 1
+        stack.extend(field for _, field in fields(value))
+    return counts
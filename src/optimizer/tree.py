@@ -0,0 +1,42 @@
+"""Utilidades compartidas por las pasadas para recorrer y reescribir el AST."""
+
+import copy
+
+import src.astNode as ast
+from src.astNode.structural import fields
+
+# Campos y nodos sin sentencias ni subexpresiones dentro
+ATOMS = frozenset({str, int, bool, type(None), ast.Identifier, ast.Integer, ast.StringLiteral, ast.Boolean})
+
+
+def count_nodes(node) -> int:
+    """Número de nodos del subárbol (los compartidos cuentan cada vez que aparecen)."""
+    total = 0
+    stack = [node]
+    while stack:
+        value = stack.pop()
+        value_type = type(value)
+        if value_type is list or value_type is tuple:
+            stack.extend(value)
+        elif isinstance(value, ast.ASTNode):
+            total += 1
+            stack.extend(field for _, field in fields(value))
+    return total
+
+
+def replace(node: ast.ASTNode, **changes) -> ast.ASTNode:
+    """
+    Copia de `node` con los campos indicados cambiados.
+
+    Las pasadas no mutan nodos: un subárbol puede estar compartido
+    (`Interner`) o reutilizado en varios sitios del mismo árbol. Si cambia
+    algún campo, la copia pierde las anotaciones privadas (`_nombre`), que
+    se calcularon para los hijos originales.
+    """
+    clone = copy.copy(node)
+    if changes:
+        for name in [name for name in vars(clone) if name.startswith("_")]:
+            delattr(clone, name)
+    for name, value in changes.items():
+        setattr(clone, name, value)
+    return clone
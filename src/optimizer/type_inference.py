@@ -0,0 +1,577 @@
+"""
+Inferencia de tipos estática e insensible al flujo sobre `ast.Program`.
+
+Cada variable (un nombre ligado en una función o en el programa) recibe la
+unión de los tipos de todo lo que se le asigna: sus `let`, los argumentos
+de las llamadas y los elementos de un `for`. Con esos tipos se calcula el
+de cada expresión, y se repite hasta un punto fijo: los parámetros dependen
+de las llamadas y el resultado de una función de su cuerpo (recursión
+incluida).
+
+El tipo de una expresión es el conjunto de `ObjectType` que puede dar, con
+`ERROR` si puede evaluarse a un `Error`, o None si no se sabe nada. La
+inferencia es conservadora:
+
+- un identificador solo tiene tipo si seguro está ligado donde se lee
+  (parámetros, `let` anteriores del mismo camino, la propia función dentro
+  de `let f = function...`); si no, la lectura podría caer en otro entorno;
+- solo se infieren los parámetros de funciones ligadas una única vez con
+  `let` y usadas únicamente como función llamada (no escapan como valor);
+- índices y resultados de builtins no tienen tipo conocido.
+
+Las expresiones con un único tipo INTEGER, STRING, BOOLEAN o FUNCTION, sin
+posible error, se anotan en `_static_type`; el evaluador lo consulta para
+no sondear los tipos de operandos y condiciones. Los nodos anotados se
+copian, como en las demás pasadas, de modo que otro programa que comparta
+subárboles (`Interner`) no ve anotaciones que no le corresponden.
+
+La misma pasada recoge los errores seguros (operandos con los que
+`apply_infix` da `TYPE_MISMATCH`, operadores desconocidos, llamadas a algo
+que no es una función, aridades incorrectas, identificadores que no existen)
+con el mensaje que daría el intérprete al evaluarlos. Si una sentencia
+global acaba con seguridad en error antes de cualquier `return` global, el
+programa está condenado (`TypeReport.doomed`) y puede rechazarse sin
+ejecutarlo.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+import src.astNode as ast
+from src.astNode.structural import fields
+from src.builtins import ASYNC_BUILTINS, BUILTINS
+from src.config.object import Error, ObjectType
+from src.interpreter.errors import (
+    DIVISION_BY_ZERO, NOT_A_FUNCTION, TYPE_MISMATCH, UNHASHABLE_KEY, UNKNOWN_IDENTIFIER,
+    UNKNOWN_INFIX_OPERATOR, UNKNOWN_PREFIX_OPERATOR, WRONG_ARITY, new_error,
+)
+from .tree import ATOMS, replace
+
+# Tipos posibles de una expresión; None = cualquiera (incluido un error)
+Inferred = Optional[FrozenSet[ObjectType]]
+# Variable: (id del ámbito, nombre); un ámbito es un literal de función o el programa
+Variable = Tuple[int, str]
+
+_EMPTY: FrozenSet[ObjectType] = frozenset()
+_INTEGER = frozenset({ObjectType.INTEGER})
+_STRING = frozenset({ObjectType.STRING})
+_BOOLEAN = frozenset({ObjectType.BOOLEAN})
+_FUNCTION = frozenset({ObjectType.FUNCTION})
+_BUILTIN = frozenset({ObjectType.BUILTIN})
+_ARRAY = frozenset({ObjectType.ARRAY})
+_HASH = frozenset({ObjectType.HASH})
+_NULL = frozenset({ObjectType.NULL})
+_ERROR = frozenset({ObjectType.ERROR})
+
+# Tipos que se anotan en los nodos
+_ANNOTATED = frozenset({ObjectType.INTEGER, ObjectType.STRING, ObjectType.BOOLEAN, ObjectType.FUNCTION})
+_CALLABLE = frozenset({ObjectType.FUNCTION, ObjectType.BUILTIN})
+_HASHABLE = frozenset({ObjectType.INTEGER, ObjectType.STRING, ObjectType.BOOLEAN})
+
+_INTEGER_ARITHMETIC = frozenset({'+', '-', '*', '/'})
+_INTEGER_COMPARISONS = frozenset({'<', '<=', '>', '>=', '==', '!='})
+
+
+@dataclass
+class TypeDiagnostic:
+    """Error seguro: evaluar `node` da siempre un `Error` con `message`."""
+    message: str
+    node: ast.ASTNode
+
+
+@dataclass
+class TypeReport:
+    """Nodos anotados, vueltas hasta el punto fijo, errores seguros y si el programa está condenado."""
+    annotated: int = 0
+    iterations: int = 0
+    errors: List[TypeDiagnostic] = field(default_factory=list)
+    doomed: bool = False
+
+
+@dataclass
+class _Frame:
+    """Lo acumulado al recorrer el cuerpo de una función (o el programa)."""
+    returns: Inferred = _EMPTY
+    returned: int = 0
+    failed: bool = False
+
+
+class TypeInference:
+    """
+    Pasada de inferencia de tipos; deja el resultado en `report`.
+
+    `external` son los nombres que el programa recibe de fuera (preludio,
+    entradas de `PreparedProgram`): su tipo es desconocido y ocultan a los
+    builtins. Con `library=True` el programa es un preludio: otros programas
+    pueden llamar a sus funciones globales, así que sus parámetros no se
+    infieren.
+    """
+
+    def __init__(self, external: Iterable[str] = (), library: bool = False) -> None:
+        self.external = frozenset(external)
+        self.library = library
+        self.report = TypeReport()
+        self._variables: Dict[Variable, Inferred] = {}
+        # Tipo del resultado de cada literal de función, por id
+        self._returns: Dict[int, Inferred] = {}
+        # Nombres ligados en cada ámbito, por id
+        self._declared: Dict[int, Set[str]] = {}
+        # Funciones que solo se llaman por su nombre: nombre -> (variable, literal)
+        self._known: Dict[str, Tuple[Variable, ast.Function]] = {}
+        # Resultados del último recorrido: tipo por id de nodo y errores por id de nodo
+        self._types: Dict[int, Inferred] = {}
+        self._errors: Dict[int, TypeDiagnostic] = {}
+        self._frame = _Frame()
+
+    def run(self, program: ast.Program) -> TypeReport:
+        self._prepare(program)
+        while True:
+            self.report.iterations += 1
+            state = (dict(self._variables), dict(self._returns))
+            outcomes = self._walk(program)
+            if state == (self._variables, self._returns):
+                break
+        self.report.errors = list(self._errors.values())
+        for inferred, returned in outcomes:
+            if returned:
+                break
+            if inferred == _ERROR:
+                self.report.doomed = True
+                break
+
+        rebuilt: Dict[int, ast.ASTNode] = {}
+        statements = [self._annotate(statement, rebuilt) for statement in program.statements]
+        if any(new is not old for new, old in zip(statements, program.statements)):
+            program.statements = statements
+        return self.report
+
+    def _prepare(self, program: ast.Program) -> None:
+        """Ámbitos, nombres ligados en cada uno y funciones cuyos parámetros pueden inferirse."""
+        binders: Counter = Counter()
+        reads: Counter = Counter()
+        callees: Counter = Counter()
+        occurrences: Counter = Counter()
+        functions: Dict[int, ast.Function] = {}
+        let_functions: Dict[str, Tuple[Variable, ast.Function]] = {}
+
+        def collect(value, scope: int) -> None:
+            value_type = type(value)
+            if value_type is list or value_type is tuple:
+                for item in value:
+                    collect(item, scope)
+            elif value_type is ast.Identifier:
+                reads[value.value] += 1
+            elif value_type is ast.Function:
+                occurrences[id(value)] += 1
+                functions[id(value)] = value
+                declared = self._declared.setdefault(id(value), set())
+                for parameter in value.parameters:
+                    declared.add(parameter.value)
+                    binders[parameter.value] += 1
+                collect(value.body, id(value))
+            elif value_type is ast.LetStatement:
+                if value.name is not None:
+                    self._declared[scope].add(value.name.value)
+                    binders[value.name.value] += 1
+                    if type(value.value) is ast.Function:
+                        let_functions[value.name.value] = ((scope, value.name.value), value.value)
+                collect(value.value, scope)
+            elif value_type is ast.ForStatement:
+                if value.variable is not None:
+                    self._declared[scope].add(value.variable.value)
+                    binders[value.variable.value] += 1
+                collect(value.iterable, scope)
+                collect(value.body, scope)
+            elif value_type is ast.Call:
+                if type(value.function) is ast.Identifier:
+                    callees[value.function.value] += 1
+                collect(value.function, scope)
+                collect(value.arguments, scope)
+            elif value_type not in ATOMS:
+                for _, child in fields(value):
+                    collect(child, scope)
+
+        self._declared[id(program)] = set()
+        collect(program.statements, id(program))
+
+        for name, (variable, function) in let_functions.items():
+            if (binders[name] == 1 and reads[name] == callees[name] and occurrences[id(function)] == 1
+                    and name not in self.external and not (self.library and variable[0] == id(program))):
+                self._known[name] = (variable, function)
+        inferable = {id(function) for _, function in self._known.values()}
+        for key, function in functions.items():
+            if key not in inferable:
+                for parameter in function.parameters:
+                    self._variables[(key, parameter.value)] = None
+
+    def _walk(self, program: ast.Program) -> List[Tuple[Inferred, bool]]:
+        """Recorre el programa con los tipos actuales; devuelve (tipo, ¿ejecuta un return?) por sentencia global."""
+        self._types = {}
+        self._errors = {}
+        self._frame = _Frame()
+        scopes = (id(program),)
+        bound: Set[Variable] = set()
+        outcomes = []
+        for statement in program.statements:
+            returned = self._frame.returned
+            inferred = self._statement(statement, scopes, bound)
+            outcomes.append((inferred, self._frame.returned != returned))
+        return outcomes
+
+    def _statements(self, statements: List[ast.Statement], scopes: Tuple[int, ...],
+                    bound: Set[Variable]) -> Inferred:
+        """Tipo del valor de una secuencia de sentencias; `bound` se amplía con sus `let`."""
+        value: Inferred = None
+        failed = False
+        for statement in statements:
+            value = self._statement(statement, scopes, bound)
+            if value is None or ObjectType.ERROR in value:
+                # Un Error interrumpe el bloque y sale de la función como resultado
+                failed = True
+                self._frame.failed = True
+        return _join(value, _ERROR) if failed else value
+
+    def _statement(self, node: ast.Statement, scopes: Tuple[int, ...], bound: Set[Variable]) -> Inferred:
+        node_type = type(node)
+        if node_type is ast.ExpressionStatement:
+            return self._expression(node.expression, scopes, bound, abrupt=True)
+        if node_type is ast.LetStatement:
+            if node.name is None:
+                return self._expression(node.value, scopes, bound, abrupt=True)
+            variable = self._resolve(node.name.value, scopes)
+            if type(node.value) is ast.Function:
+                # La función no puede llamarse antes de que el `let` la ligue
+                inferred = self._expression(node.value, scopes, bound | {variable})
+            else:
+                inferred = self._expression(node.value, scopes, bound, abrupt=True)
+            # Un `let` cuyo valor es un Error no liga nada
+            self._assign(variable, inferred - _ERROR if inferred is not None else None)
+            bound.add(variable)
+            return inferred
+        if node_type is ast.ReturnStatement:
+            inferred = self._expression(node.return_value, scopes, bound)
+            self._frame.returns = _join(self._frame.returns, inferred)
+            self._frame.returned += 1
+            return _EMPTY
+        if node_type is ast.WhileStatement:
+            condition = self._expression(node.condition, scopes, bound)
+            body = self._statements(node.body.statements, scopes, set(bound))
+            # Un Error en la condición o en el cuerpo es el resultado del while
+            if any(inferred is None or ObjectType.ERROR in inferred for inferred in (condition, body)):
+                return _NULL | _ERROR
+            return _NULL
+        if node_type is ast.ForStatement:
+            self._expression(node.iterable, scopes, bound)
+            inner = set(bound)
+            if node.variable is not None:
+                variable = self._resolve(node.variable.value, scopes)
+                self._assign(variable, _INTEGER if self._is_range(node.iterable, scopes) else None)
+                inner.add(variable)
+            self._statements(node.body.statements, scopes, inner)
+            return _NULL | _ERROR
+        if node_type is ast.Block:
+            return self._statements(node.statements, scopes, set(bound))
+        if node_type is ast.YieldStatement:
+            self._expression(node.value, scopes, bound)
+        return None
+
+    def _expression(self, node: Optional[ast.Expression], scopes: Tuple[int, ...], bound: Set[Variable],
+                    abrupt: bool = False) -> Inferred:
+        """
+        Tipo de `node`; se acumula en `_types` (un nodo compartido recibe la unión).
+
+        `abrupt` indica que quien usa el valor propaga los abruptos (sentencia
+        de expresión, valor de `let`): un `return` dentro de un `if` sale de
+        la función en vez de llegar como valor.
+        """
+        inferred = self._infer(node, scopes, bound, abrupt)
+        key = id(node)
+        self._types[key] = _join(self._types[key], inferred) if key in self._types else inferred
+        return inferred
+
+    def _infer(self, node: Optional[ast.Expression], scopes: Tuple[int, ...], bound: Set[Variable],
+               abrupt: bool) -> Inferred:
+        node_type = type(node)
+        if node_type is ast.Integer:
+            return _INTEGER
+        if node_type is ast.StringLiteral:
+            return _STRING
+        if node_type is ast.Boolean:
+            return _BOOLEAN
+        if node_type is ast.Identifier:
+            return self._identifier(node, scopes, bound)
+        if node_type is ast.Prefix:
+            return self._prefix(node, scopes, bound)
+        if node_type is ast.Infix:
+            return self._infix(node, scopes, bound)
+        if node_type is ast.If:
+            return self._if(node, scopes, bound, abrupt)
+        if node_type is ast.Function:
+            return self._function(node, scopes, bound)
+        if node_type is ast.Call:
+            return self._call(node, scopes, bound)
+        if node_type is ast.ArrayLiteral:
+            elements = [self._expression(element, scopes, bound) for element in node.elements]
+            if any(element is None or ObjectType.ERROR in element for element in elements):
+                return _ARRAY | _ERROR
+            return _ARRAY
+        if node_type is ast.HashLiteral:
+            return self._hash(node, scopes, bound)
+        if node_type is ast.Index:
+            self._expression(node.left, scopes, bound)
+            self._expression(node.index, scopes, bound)
+        return None
+
+    def _identifier(self, node: ast.Identifier, scopes: Tuple[int, ...], bound: Set[Variable]) -> Inferred:
+        name = node.value
+        variable = self._resolve(name, scopes)
+        if variable is None:
+            if name in self.external or name in ASYNC_BUILTINS:
+                return None
+            if name in BUILTINS:
+                return _BUILTIN
+            self._error(node, new_error(UNKNOWN_IDENTIFIER, [name]))
+            return _ERROR
+        if variable in bound:
+            return self._variables.get(variable, _EMPTY)
+        return None
+
+    def _prefix(self, node: ast.Prefix, scopes: Tuple[int, ...], bound: Set[Variable]) -> Inferred:
+        operand = self._expression(node.right, scopes, bound)
+        if node.operator == '!':
+            return _BOOLEAN
+        if node.operator != '-' or operand is None:
+            return None
+        result = operand & _INTEGER
+        wrong = operand - _INTEGER - _ERROR
+        if wrong and not result:
+            self._error(node, new_error(UNKNOWN_PREFIX_OPERATOR, ['-', _first(wrong).name]))
+        return result | _ERROR if wrong or ObjectType.ERROR in operand else result
+
+    def _infix(self, node: ast.Infix, scopes: Tuple[int, ...], bound: Set[Variable]) -> Inferred:
+        left = self._expression(node.left, scopes, bound)
+        right = self._expression(node.right, scopes, bound)
+        if left is None or right is None:
+            return None
+        result: Set[ObjectType] = set()
+        message = None
+        valid = False
+        for left_type in _ordered(left):
+            for right_type in _ordered(right):
+                outcome = _infix_outcome(node.operator, left_type, right_type, node.right)
+                if outcome is None:
+                    return None
+                inferred, error = outcome
+                result |= inferred
+                if left_type is not ObjectType.ERROR and right_type is not ObjectType.ERROR:
+                    if error is None:
+                        valid = True
+                    elif message is None:
+                        message = error
+        if message is not None and not valid:
+            self._error(node, Error(message))
+        return frozenset(result)
+
+    def _if(self, node: ast.If, scopes: Tuple[int, ...], bound: Set[Variable], abrupt: bool) -> Inferred:
+        self._expression(node.condition, scopes, bound)
+        returned = self._frame.returned
+        inferred = self._statements(node.consequence.statements, scopes, set(bound))
+        if node.alternative is not None:
+            inferred = _join(inferred, self._statements(node.alternative.statements, scopes, set(bound)))
+        else:
+            inferred = _join(inferred, _NULL)
+        if not abrupt and self._frame.returned != returned:
+            # El `return` de una rama llegaría como valor a la expresión que usa el `if`
+            return None
+        return inferred
+
+    def _function(self, node: ast.Function, scopes: Tuple[int, ...], bound: Set[Variable]) -> Inferred:
+        outer, self._frame = self._frame, _Frame()
+        key = id(node)
+        inner = bound | {(key, parameter.value) for parameter in node.parameters}
+        result: Inferred = None
+        if node.body is not None:
+            value = self._statements(node.body.statements, scopes + (key,), inner)
+            if not _contains_yield(node.body):
+                result = _join(value, self._frame.returns)
+                if self._frame.failed:
+                    result = _join(result, _ERROR)
+        self._frame = outer
+        self._returns[key] = _join(self._returns.get(key, _EMPTY), result)
+        return _FUNCTION
+
+    def _call(self, node: ast.Call, scopes: Tuple[int, ...], bound: Set[Variable]) -> Inferred:
+        callee = self._expression(node.function, scopes, bound)
+        arguments = [self._expression(argument, scopes, bound) for argument in node.arguments]
+        if type(node.function) is ast.Identifier:
+            known = self._known.get(node.function.value)
+            if known is not None and self._resolve(node.function.value, scopes) == known[0]:
+                variable, function = known
+                if len(function.parameters) == len(arguments):
+                    for parameter, argument in zip(function.parameters, arguments):
+                        self._assign((id(function), parameter.value), argument)
+                    if variable in bound:
+                        return self._returns.get(id(function), _EMPTY)
+                elif variable in bound:
+                    self._error(node, new_error(WRONG_ARITY, [len(function.parameters), len(arguments)]))
+                    return _ERROR
+                return None
+        if callee is None:
+            return None
+        wrong = callee - _ERROR
+        if wrong and not wrong & _CALLABLE:
+            self._error(node, new_error(NOT_A_FUNCTION, [_first(wrong).name]))
+            return _ERROR
+        if callee == _ERROR or not callee:
+            return callee
+        return None
+
+    def _hash(self, node: ast.HashLiteral, scopes: Tuple[int, ...], bound: Set[Variable]) -> Inferred:
+        failed = False
+        definite = False
+        for key, value in node.pairs:
+            key_type = self._expression(key, scopes, bound)
+            value_type = self._expression(value, scopes, bound)
+            if key_type and not key_type & _HASHABLE:
+                wrong = key_type - _ERROR
+                if wrong:
+                    self._error(node, new_error(UNHASHABLE_KEY, [_first(wrong).name]))
+                definite = True
+            failed = (failed or key_type is None or not key_type <= _HASHABLE
+                      or value_type is None or ObjectType.ERROR in value_type)
+        if definite:
+            return _ERROR
+        return _HASH | _ERROR if failed else _HASH
+
+    def _resolve(self, name: str, scopes: Tuple[int, ...]) -> Optional[Variable]:
+        """Variable a la que se refiere `name`: la del ámbito más interno que lo liga."""
+        for scope in reversed(scopes):
+            if name in self._declared[scope]:
+                return scope, name
+        return None
+
+    def _assign(self, variable: Variable, inferred: Inferred) -> None:
+        self._variables[variable] = (_join(self._variables[variable], inferred)
+                                     if variable in self._variables else inferred)
+
+    def _is_range(self, iterable: Optional[ast.Expression], scopes: Tuple[int, ...]) -> bool:
+        """True si el iterable es una llamada al builtin `range` (sus elementos son enteros)."""
+        return (type(iterable) is ast.Call and type(iterable.function) is ast.Identifier
+                and iterable.function.value == "range" and "range" not in self.external
+                and self._resolve("range", scopes) is None)
+
+    def _error(self, node: ast.ASTNode, error: Error) -> None:
+        if id(node) not in self._errors:
+            self._errors[id(node)] = TypeDiagnostic(error.message, node)
+
+    def _annotate(self, node, rebuilt: Dict[int, ast.ASTNode]):
+        """Copia anotada de `node` (el mismo objeto si no cambia nada en su subárbol)."""
+        node_type = type(node)
+        if node_type is list or node_type is tuple:
+            items = [self._annotate(item, rebuilt) for item in node]
+            if all(item is original for item, original in zip(items, node)):
+                return node
+            return items if node_type is list else tuple(items)
+        if not isinstance(node, ast.ASTNode):
+            return node
+        done = rebuilt.get(id(node))
+        if done is not None:
+            return done
+
+        changes = {}
+        for name, value in fields(node):
+            annotated = self._annotate(value, rebuilt)
+            if annotated is not value:
+                changes[name] = annotated
+        wanted = _annotation(self._types.get(id(node)))
+        if wanted is not None and wanted is getattr(node_type, "_static_type", None):
+            # Los literales ya llevan su tipo en la clase
+            wanted = None
+        if wanted is not None:
+            self.report.annotated += 1
+        result = node
+        if changes or wanted is not vars(node).get("_static_type"):
+            result = replace(node, **changes)
+            if wanted is None:
+                vars(result).pop("_static_type", None)
+            else:
+                result._static_type = wanted
+        rebuilt[id(node)] = result
+        return result
+
+
+def infer_types(program: ast.Program, external: Iterable[str] = (), library: bool = False) -> TypeReport:
+    """Anota `program` (en su sitio) con los tipos probados y devuelve el informe."""
+    return TypeInference(external, library).run(program)
+
+
+def _join(left: Inferred, right: Inferred) -> Inferred:
+    if left is None or right is None:
+        return None
+    return left | right
+
+
+def _first(types: FrozenSet[ObjectType]) -> ObjectType:
+    return _ordered(types)[0]
+
+
+def _ordered(types: FrozenSet[ObjectType]) -> List[ObjectType]:
+    """Orden estable de un conjunto de tipos (los mensajes no dependen del hash)."""
+    return sorted(types, key=lambda object_type: object_type.value)
+
+
+def _annotation(inferred: Inferred) -> Optional[ObjectType]:
+    if inferred is None or len(inferred) != 1:
+        return None
+    (object_type,) = inferred
+    return object_type if object_type in _ANNOTATED else None
+
+
+def _infix_outcome(operator: str, left: ObjectType, right: ObjectType,
+                   right_node: Optional[ast.Expression]) -> Optional[Tuple[FrozenSet[ObjectType], Optional[str]]]:
+    """
+    Tipos del resultado de `apply_infix` con operandos de tipo `left` y
+    `right`, y el mensaje si el resultado es seguro un error; None si no se
+    sabe (operaciones con arreglos).
+    """
+    if left is ObjectType.INTEGER and right is ObjectType.INTEGER:
+        if operator in _INTEGER_COMPARISONS:
+            return _BOOLEAN, None
+        if operator == '/' and type(right_node) is ast.Integer:
+            if right_node.value == 0:
+                return _ERROR, DIVISION_BY_ZERO
+            return _INTEGER, None
+        if operator == '/':
+            return _INTEGER | _ERROR, None
+        if operator in _INTEGER_ARITHMETIC:
+            return _INTEGER, None
+        return _ERROR, UNKNOWN_INFIX_OPERATOR.format(left.name, operator, right.name)
+    if left is ObjectType.STRING and right is ObjectType.STRING:
+        if operator == '+':
+            return _STRING, None
+        if operator in ('==', '!='):
+            return _BOOLEAN, None
+        return _ERROR, UNKNOWN_INFIX_OPERATOR.format(left.name, operator, right.name)
+    if left is ObjectType.ARRAY or right is ObjectType.ARRAY:
+        return None
+    if operator in ('==', '!='):
+        return _BOOLEAN, None
+    if left is not right:
+        return _ERROR, TYPE_MISMATCH.format(left.name, operator, right.name)
+    return _ERROR, UNKNOWN_INFIX_OPERATOR.format(left.name, operator, right.name)
+
+
+def _contains_yield(node) -> bool:
+    """True si el cuerpo tiene un `yield` fuera de funciones anidadas (la llamada da un generador)."""
+    stack = [node]
+    while stack:
+        value = stack.pop()
+        value_type = type(value)
+        if value_type is ast.YieldStatement:
+            return True
+        if value_type is list or value_type is tuple:
+            stack.extend(value)
+        elif value_type is not ast.Function and value_type not in ATOMS:
+            stack.extend(child for _, child in fields(value))
+    return False
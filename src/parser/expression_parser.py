@@ -4,7 +4,7 @@ from typing import Optional, List, Callable, Dict
 from src.astNode import (
     Expression, Prefix, Infix,
     Integer, Boolean, Identifier, Call,
-    StringLiteral, Function, Block
+    StringLiteral, Function, Block, If, ArrayLiteral, Index, HashLiteral
 )
 from src.config.token_1 import Token, TokenType
 from .precedence import Precedence, PRECEDENCES
@@ -24,7 +24,10 @@ class ExpressionParser:
             TokenType.TRUE: self._parse_boolean,
             TokenType.FALSE: self._parse_boolean,
             TokenType.LPAREN: self._parse_grouped_expression,
-            TokenType.FUNCTION: self._parse_function_literal
+            TokenType.FUNCTION: self._parse_function_literal,
+            TokenType.CONDITIONAL: self._parse_if_expression,
+            TokenType.LBRACKET: self._parse_array_literal,
+            TokenType.LBRACE: self._parse_hash_literal
         }
         
         self._infix_parse_fns: Dict[TokenType, Callable[[Expression], Optional[Expression]]] = {
@@ -36,7 +39,10 @@ class ExpressionParser:
             TokenType.NOT_EQUAL: self._parse_infix_expression,
             TokenType.LT: self._parse_infix_expression,
             TokenType.GT: self._parse_infix_expression,
-            TokenType.LPAREN: self._parse_call_expression
+            TokenType.LTE: self._parse_infix_expression,
+            TokenType.GTE: self._parse_infix_expression,
+            TokenType.LPAREN: self._parse_call_expression,
+            TokenType.LBRACKET: self._parse_index_expression
         }
     
     def parse_expression(self, precedence: Precedence) -> Optional[Expression]:
@@ -117,6 +123,38 @@ class ExpressionParser:
         
         return expression
     
+    def _parse_if_expression(self) -> Optional[If]:
+        """Parsea expresiones condicionales: if (condición) { ... } else { ... }."""
+        assert self.core._current_token is not None
+        
+        expression = If(token=self.core._current_token)
+        
+        if not self.core._expected_tokens(TokenType.LPAREN):
+            return None
+        
+        self.core._next_token()
+        expression.condition = self.parse_expression(Precedence.LOWEST)
+        
+        if not self.core._expected_tokens(TokenType.RPAREN):
+            return None
+        
+        if not self.core._expected_tokens(TokenType.LBRACE):
+            return None
+        
+        expression.consequence = self.core.statement_parser.parse_block_statement()
+        
+        # 'else' no es palabra reservada en el lexer: llega como identificador
+        assert self.core._peek_token is not None
+        if self.core._peek_token.type == TokenType.IDENT and self.core._peek_token.literal == 'else':
+            self.core._next_token()
+            
+            if not self.core._expected_tokens(TokenType.LBRACE):
+                return None
+            
+            expression.alternative = self.core.statement_parser.parse_block_statement()
+        
+        return expression
+    
     def _parse_grouped_expression(self) -> Optional[Expression]:
         """Parsea expresiones agrupadas entre paréntesis."""
         self.core._next_token()
@@ -138,10 +176,66 @@ class ExpressionParser:
     
     def _parse_call_arguments(self) -> Optional[List[Expression]]:
         """Parsea argumentos de llamadas a funciones."""
+        return self._parse_expression_list(TokenType.RPAREN)
+    
+    def _parse_array_literal(self) -> Optional[ArrayLiteral]:
+        """Parsea literales de arreglo: [a, b, c]."""
+        assert self.core._current_token is not None
+        
+        literal = ArrayLiteral(token=self.core._current_token)
+        elements = self._parse_expression_list(TokenType.RBRACKET)
+        if elements is None:
+            return None
+        literal.elements = elements
+        
+        return literal
+    
+    def _parse_hash_literal(self) -> Optional[HashLiteral]:
+        """Parsea literales de mapa: {clave: valor, ...}."""
+        assert self.core._current_token is not None
+        
+        literal = HashLiteral(token=self.core._current_token)
+        
+        assert self.core._peek_token is not None
+        while self.core._peek_token.type != TokenType.RBRACE:
+            self.core._next_token()
+            key = self.parse_expression(Precedence.LOWEST)
+            
+            if not self.core._expected_tokens(TokenType.COLON):
+                return None
+            
+            self.core._next_token()
+            value = self.parse_expression(Precedence.LOWEST)
+            if key is not None and value is not None:
+                literal.pairs.append((key, value))
+            
+            if self.core._peek_token.type != TokenType.RBRACE and not self.core._expected_tokens(TokenType.COMMA):
+                return None
+        
+        if not self.core._expected_tokens(TokenType.RBRACE):
+            return None
+        
+        return literal
+    
+    def _parse_index_expression(self, left: Expression) -> Optional[Index]:
+        """Parsea accesos por índice: xs[i]."""
+        assert self.core._current_token is not None
+        
+        expression = Index(token=self.core._current_token, left=left)
+        self.core._next_token()
+        expression.index = self.parse_expression(Precedence.LOWEST)
+        
+        if not self.core._expected_tokens(TokenType.RBRACKET):
+            return None
+        
+        return expression
+    
+    def _parse_expression_list(self, end: TokenType) -> Optional[List[Expression]]:
+        """Parsea expresiones separadas por comas hasta el token `end`."""
         args: List[Expression] = []
         
         assert self.core._peek_token is not None
-        if self.core._peek_token.type == TokenType.RPAREN:
+        if self.core._peek_token.type == end:
             self.core._next_token()
             return args
         
@@ -157,7 +251,7 @@ class ExpressionParser:
             if argument:
                 args.append(argument)
         
-        if not self.core._expected_tokens(TokenType.RPAREN):
+        if not self.core._expected_tokens(end):
             return None
         
         return args
@@ -56,6 +56,10 @@ class ModularParser:
             return self.statement_parser.parse_let_statement()
         elif self._current_token.type == TokenType.RETURN:
             return self.statement_parser.parse_return_statement()
+        elif self._current_token.type == TokenType.YIELD:
+            return self.statement_parser.parse_yield_statement()
+        elif self._current_token.type == TokenType.LOOP:
+            return self.statement_parser.parse_loop_statement()
         else:
             return self.statement_parser.parse_expression_statement()
     
@@ -14,6 +14,7 @@ class Precedence(IntEnum):
     PRODUCT = 5
     PREFIX = 6
     CALL = 7
+    INDEX = 8
 
 
 PRECEDENCES: Dict[TokenType, Precedence] = {
@@ -27,5 +28,6 @@ PRECEDENCES: Dict[TokenType, Precedence] = {
     TokenType.MINUS: Precedence.SUM,
     TokenType.DIVISION: Precedence.PRODUCT,
     TokenType.MULTIPLICATION: Precedence.PRODUCT,
-    TokenType.LPAREN: Precedence.CALL
+    TokenType.LPAREN: Precedence.CALL,
+    TokenType.LBRACKET: Precedence.INDEX
 }
\ No newline at end of file
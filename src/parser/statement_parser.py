@@ -3,7 +3,8 @@
 from typing import Optional, List
 from src.astNode import (
     Statement, LetStatement, ReturnStatement, 
-    ExpressionStatement, Identifier, Block
+    ExpressionStatement, Identifier, Block,
+    WhileStatement, ForStatement, YieldStatement
 )
 from src.config.token_1 import Token, TokenType
 from .precedence import Precedence
@@ -51,6 +52,20 @@ class StatementParser:
         
         return statement
     
+    def parse_yield_statement(self) -> YieldStatement:
+        """Analiza declaraciones yield (solo válidas dentro de funciones generadoras)."""
+        assert self.core._current_token is not None
+        
+        statement = YieldStatement(token=self.core._current_token)
+        self.core._next_token()
+        
+        statement.value = self.core.expression_parser.parse_expression(Precedence.LOWEST)
+        
+        if self.core._peek_token.type == TokenType.SEMICOLON:
+            self.core._next_token()
+        
+        return statement
+    
     def parse_expression_statement(self) -> Optional[ExpressionStatement]:
         """Analiza declaraciones de expresión."""
         assert self.core._current_token is not None
@@ -80,6 +95,66 @@ class StatementParser:
         
         return block_statement
     
+    def parse_loop_statement(self) -> Optional[Statement]:
+        """Analiza bucles: el lexer mapea 'while' y 'for' al mismo TokenType.LOOP."""
+        assert self.core._current_token is not None
+        
+        if self.core._current_token.literal == 'for':
+            return self.parse_for_statement()
+        return self.parse_while_statement()
+    
+    def parse_while_statement(self) -> Optional[WhileStatement]:
+        """Analiza bucles while (condición) { ... }."""
+        assert self.core._current_token is not None
+        
+        statement = WhileStatement(token=self.core._current_token)
+        
+        if not self.core._expected_tokens(TokenType.LPAREN):
+            return None
+        
+        self.core._next_token()
+        statement.condition = self.core.expression_parser.parse_expression(Precedence.LOWEST)
+        
+        if not self.core._expected_tokens(TokenType.RPAREN):
+            return None
+        
+        if not self.core._expected_tokens(TokenType.LBRACE):
+            return None
+        
+        statement.body = self.parse_block_statement()
+        
+        return statement
+    
+    def parse_for_statement(self) -> Optional[ForStatement]:
+        """Analiza bucles for (variable in iterable) { ... }."""
+        assert self.core._current_token is not None
+        
+        statement = ForStatement(token=self.core._current_token)
+        
+        if not self.core._expected_tokens(TokenType.LPAREN):
+            return None
+        
+        if not self.core._expected_tokens(TokenType.IDENT):
+            return None
+        
+        statement.variable = Identifier(token=self.core._current_token, value=self.core._current_token.literal)
+        
+        if not self.core._expected_tokens(TokenType.IN):
+            return None
+        
+        self.core._next_token()
+        statement.iterable = self.core.expression_parser.parse_expression(Precedence.LOWEST)
+        
+        if not self.core._expected_tokens(TokenType.RPAREN):
+            return None
+        
+        if not self.core._expected_tokens(TokenType.LBRACE):
+            return None
+        
+        statement.body = self.parse_block_statement()
+        
+        return statement
+    
     def _parse_identifier_for_let(self) -> Optional[Identifier]:
         """Auxiliar para parsear identificadores en declaraciones let."""
         assert self.core._current_token is not None
@@ -0,0 +1,8 @@
+"""
+Ejecución de muchos scripts: pool de procesos por lotes y su CLI
+(`python -m src.runner`). El servidor fork está en `src.runner.forkserver`.
+"""
+
+from .batch import BatchRunner, Job, JobLimits, JobResult, execute, load_jobs, parse_source
+
+__all__ = ["BatchRunner", "Job", "JobLimits", "JobResult", "execute", "load_jobs", "parse_source"]
@@ -0,0 +1,49 @@
+"""
+CLI del ejecutor por lotes.
+
+    python -m src.runner trabajos/            # cada *.lpp es un trabajo
+    python -m src.runner trabajos.jsonl -w 8 --timeout 2 --ast
+
+Escribe un resultado JSON por línea en stdout (en orden de llegada salvo
+`--ordered`) y un resumen en stderr.
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import List, Optional
+
+from .batch import BatchRunner, load_jobs
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.runner", description="Ejecuta scripts en paralelo.")
+    parser.add_argument("jobs", help="directorio con scripts *.lpp o fichero JSONL de trabajos")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="procesos del pool (por defecto, uno por CPU)")
+    parser.add_argument("--timeout", type=float, default=None, help="segundos máximos por trabajo")
+    parser.add_argument("--fuel", type=int, default=None, help="pasos máximos por trabajo")
+    parser.add_argument("--memory-limit", type=int, default=None, help="bytes máximos por trabajo")
+    parser.add_argument("--ast", action="store_true", help="parsear en el proceso padre y enviar el AST")
+    parser.add_argument("--ordered", action="store_true", help="emitir los resultados en el orden de entrada")
+    parser.add_argument("--check-types", action="store_true",
+                        help="rechazar sin ejecutarlos los trabajos con un error de tipos seguro")
+    args = parser.parse_args(argv)
+
+    runner = BatchRunner(workers=args.workers, timeout=args.timeout, fuel=args.fuel,
+                         memory_limit=args.memory_limit, ship_ast=args.ast, check_types=args.check_types)
+    start = time.perf_counter()
+    total = failed = 0
+    with runner:
+        for result in runner.run(load_jobs(args.jobs), ordered=args.ordered):
+            total += 1
+            failed += not result.ok
+            sys.stdout.write(json.dumps(result.to_dict(), ensure_ascii=False) + "\n")
+    seconds = time.perf_counter() - start
+    rate = total / seconds if seconds else 0.0
+    sys.stderr.write(f"{total} trabajos ({failed} con error) en {seconds:.2f}s, {rate:.1f} trabajos/s\n")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+"""
+Ejecución por lotes de scripts independientes en un pool de procesos.
+
+Cada worker importa el lexer, el parser y el intérprete una sola vez y
+mantiene un `Interpreter` caliente; los trabajos llegan como código fuente
+o como AST ya parseado (serializado con pickle) y los resultados vuelven
+en cuanto terminan, con el valor final en forma `inspect()`.
+"""
+
+from dataclasses import asdict, dataclass, field
+import io
+import json
+import multiprocessing
+import os
+import pickle
+import time
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+import src.astNode as ast
+from src.builtins import OutputSink
+from src.config.environment import FrozenEnvironment
+from src.config.object import Error
+from src.interpreter.interpreter import Interpreter
+from src.lexer.lexer import Lexer
+from src.optimizer import infer_types
+from src.parser.parser_core import Parser
+
+SCRIPT_SUFFIX = ".lpp"
+
+
+@dataclass(frozen=True)
+class Job:
+    """Un script a ejecutar: `source` o bien `program` (AST serializado con pickle)."""
+    id: str
+    source: Optional[str] = None
+    program: Optional[bytes] = None
+
+
+@dataclass(frozen=True)
+class JobResult:
+    """Resultado de un trabajo: `result` si terminó bien, `error` si no."""
+    id: str
+    ok: bool
+    result: Optional[str] = None
+    error: Optional[str] = None
+    output: str = ""
+    seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class JobLimits:
+    """
+    Límites aplicados a cada trabajo (ver `Interpreter.interpret`).
+
+    Con `check_types` el trabajo pasa antes por la inferencia de tipos: se
+    ejecuta anotado y, si un error de tipos es seguro, se rechaza sin
+    ejecutarlo.
+    """
+    timeout: Optional[float] = None
+    fuel: Optional[int] = None
+    memory_limit: Optional[int] = None
+    check_types: bool = False
+
+
+def parse_source(source: str) -> ast.Program:
+    """Parsea un script; lanza SyntaxError con los errores del parser."""
+    parser = Parser(Lexer(source))
+    program = parser.parse_program()
+    if parser.errors:
+        raise SyntaxError("; ".join(parser.errors))
+    return program
+
+
+def execute(interpreter: Interpreter, job: Job, limits: JobLimits = JobLimits(),
+            prelude: Optional[FrozenEnvironment] = None) -> JobResult:
+    """
+    Ejecuta un trabajo con `interpreter`; nunca lanza, los fallos van en el resultado.
+
+    `prelude` es una instantánea de `Interpreter.snapshot`: el trabajo ve
+    sus definiciones sin volver a evaluarlas.
+    """
+    start = time.perf_counter()
+    output = io.StringIO()
+    try:
+        if job.program is not None:
+            program = pickle.loads(job.program)
+        else:
+            program = parse_source(job.source or "")
+        if limits.check_types:
+            report = infer_types(program, external=prelude.store if prelude is not None else ())
+            if report.doomed:
+                return JobResult(job.id, False, error="; ".join(error.message for error in report.errors),
+                                 seconds=time.perf_counter() - start)
+        value = interpreter.interpret(program, fuel=limits.fuel, timeout=limits.timeout,
+                                      memory_limit=limits.memory_limit, output=output, prelude=prelude)
+        if isinstance(value, Error):
+            return JobResult(job.id, False, error=value.message, output=output.getvalue(),
+                             seconds=time.perf_counter() - start)
+        # Formatear el resultado también puede fallar: queda dentro del manejo de errores
+        result = value.inspect() if value is not None else None
+        return JobResult(job.id, True, result=result, output=output.getvalue(),
+                         seconds=time.perf_counter() - start)
+    except SyntaxError as error:
+        return JobResult(job.id, False, error=str(error), seconds=time.perf_counter() - start)
+    except Exception as error:  # Fallo interno: se informa sin tumbar el lote
+        return JobResult(job.id, False, error=f"{type(error).__name__}: {error}",
+                         output=output.getvalue(), seconds=time.perf_counter() - start)
+
+
+def load_jobs(path: str) -> Iterator[Job]:
+    """
+    Trabajos de un directorio (cada `*.lpp` es un script, con su nombre como id)
+    o de un fichero JSONL con objetos `{"id": ..., "source": ...}` por línea.
+    """
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            if name.endswith(SCRIPT_SUFFIX):
+                with open(os.path.join(path, name), encoding="utf-8") as script:
+                    yield Job(name, source=script.read())
+        return
+    with open(path, encoding="utf-8") as lines:
+        for number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            yield Job(str(record.get("id", number)), source=record["source"])
+
+
+# Estado de cada proceso worker (lo crea `_init_worker` una vez por proceso)
+_worker_interpreter: Optional[Interpreter] = None
+_worker_limits = JobLimits()
+
+
+def _init_worker(limits: JobLimits) -> None:
+    global _worker_interpreter, _worker_limits
+    _worker_interpreter = Interpreter(output=OutputSink.capture())
+    _worker_limits = limits
+    # Calentar: primera ejecución con builtins y contexto de ejecución ya creados
+    _worker_interpreter.interpret(parse_source("len(range(1));"))
+
+
+def _run_in_worker(job: Job) -> JobResult:
+    assert _worker_interpreter is not None
+    return execute(_worker_interpreter, job, _worker_limits)
+
+
+@dataclass
+class BatchRunner:
+    """
+    Pool de procesos calientes que ejecuta trabajos y devuelve los resultados en flujo.
+
+    `workers` (por defecto, uno por CPU) fija el tamaño del pool. Con
+    `ship_ast=True` el proceso padre parsea cada script y envía el AST
+    serializado; un script con errores de sintaxis se envía como fuente y
+    el worker informa del error. `timeout`, `fuel` y `memory_limit` se
+    aplican a cada trabajo dentro del worker, que sigue vivo para el
+    siguiente: el tiempo límite es cooperativo (se comprueba en llamadas e
+    iteraciones de bucle, ver `ExecutionBudget`). `check_types` rechaza sin
+    ejecutarlos los trabajos con un error de tipos seguro (ver `JobLimits`).
+    """
+    workers: Optional[int] = None
+    timeout: Optional[float] = None
+    fuel: Optional[int] = None
+    memory_limit: Optional[int] = None
+    ship_ast: bool = False
+    check_types: bool = False
+    chunksize: int = 8
+    _pool: Any = field(default=None, init=False, repr=False)
+
+    def __enter__(self) -> "BatchRunner":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def start(self) -> None:
+        if self._pool is None:
+            limits = JobLimits(self.timeout, self.fuel, self.memory_limit, self.check_types)
+            self._pool = multiprocessing.Pool(self.workers, initializer=_init_worker, initargs=(limits,))
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def run(self, jobs: Iterable[Job], ordered: bool = False) -> Iterator[JobResult]:
+        """Ejecuta `jobs` en el pool; sin `ordered`, cada resultado llega en cuanto termina."""
+        self.start()
+        prepared = (self._prepare(job) for job in jobs)
+        if ordered:
+            return self._pool.imap(_run_in_worker, prepared, self.chunksize)
+        return self._pool.imap_unordered(_run_in_worker, prepared, self.chunksize)
+
+    def _prepare(self, job: Job) -> Job:
+        if not self.ship_ast or job.program is not None or job.source is None:
+            return job
+        try:
+            program = pickle.dumps(parse_source(job.source), protocol=pickle.HIGHEST_PROTOCOL)
+        except (SyntaxError, RecursionError):
+            return job
+        return Job(job.id, program=program)
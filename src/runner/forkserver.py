@@ -0,0 +1,192 @@
+"""
+Servidor fork: un proceso padre precargado que crea un hijo por trabajo.
+
+El padre importa todo el intérprete, evalúa los scripts de preludio en
+una instantánea (`Interpreter.snapshot`), calienta el `Interpreter` y
+congela su heap con `gc.freeze()`. Después
+mantiene `spare` hijos creados de antemano con `fork`: cada uno hereda
+todo ya cargado (compartido copy-on-write), hace una ejecución de
+calentamiento fuera del camino crítico (así las páginas que copia ya están
+copiadas) y espera en `accept` sobre el socket Unix compartido. Atiende un
+único trabajo y termina; el padre lo repone. El arranque de un trabajo no
+paga ni importaciones, ni parseo del preludio, ni el propio `fork`.
+
+Protocolo: el cliente envía una línea JSON `{"id": ..., "source": ...}` y
+recibe una línea JSON con los campos de `JobResult`.
+
+    python -m src.runner.forkserver /tmp/lpp.sock --prelude comun.lpp --timeout 2
+"""
+
+import argparse
+import gc
+import json
+import os
+import signal
+import socket
+import sys
+import time
+from typing import List, Optional, Sequence, Set
+
+import src.astNode as ast
+from src.builtins import OutputSink
+from src.config.environment import FrozenEnvironment
+from src.interpreter.interpreter import Interpreter
+from .batch import Job, JobLimits, JobResult, execute, parse_source
+
+WARMUP = Job("warmup", source="len(range(1));")
+
+
+class ForkServer:
+    """Atiende trabajos en `socket_path`, cada uno en un hijo de un solo uso creado con `fork`."""
+
+    BACKLOG = 128
+    DEFAULT_SPARE = 4
+
+    def __init__(self, socket_path: str, preludes: Sequence[str] = (), limits: JobLimits = JobLimits(),
+                 spare: int = DEFAULT_SPARE) -> None:
+        if spare <= 0:
+            raise ValueError("spare debe ser positivo")
+        self.socket_path = socket_path
+        self.limits = limits
+        self.spare = spare
+        self.interpreter = Interpreter(output=OutputSink.capture())
+        # Se evalúan una sola vez, en el padre: los hijos heredan las definiciones ya construidas
+        programs = [parse_source(source) for source in preludes]
+        self.prelude: FrozenEnvironment = self.interpreter.snapshot(
+            ast.Program([statement for program in programs for statement in program.statements]))
+        self._listener: Optional[socket.socket] = None
+        self._children: Set[int] = set()
+
+    def bind(self) -> None:
+        """Abre el socket, calienta el intérprete y congela el heap del padre."""
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(self.socket_path)
+        listener.listen(self.BACKLOG)
+        self._listener = listener
+        execute(self.interpreter, WARMUP, self.limits, self.prelude)
+        # Los objetos ya creados no vuelven a recorrerse en el GC: los hijos no tocan sus páginas
+        gc.collect()
+        gc.freeze()
+
+    def serve_forever(self, max_jobs: Optional[int] = None) -> None:
+        """Mantiene `spare` hijos en espera; con `max_jobs` deja de reponerlos tras ese número."""
+        if self._listener is None:
+            self.bind()
+        spawned = 0
+        try:
+            while max_jobs is None or spawned < max_jobs:
+                while len(self._children) < self.spare and (max_jobs is None or spawned < max_jobs):
+                    self._spawn()
+                    spawned += 1
+                pid, _ = os.wait()
+                self._children.discard(pid)
+            while self._children:
+                pid, _ = os.wait()
+                self._children.discard(pid)
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Termina los hijos en espera y cierra el socket."""
+        for pid in list(self._children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+                os.waitpid(pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+            self._children.discard(pid)
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+    def _spawn(self) -> None:
+        pid = os.fork()
+        if pid == 0:
+            self._run_child()
+        self._children.add(pid)
+
+    def _run_child(self) -> None:
+        """Cuerpo del hijo: nunca vuelve, termina con `os._exit`."""
+        status = 0
+        try:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            self._children.clear()
+            assert self._listener is not None
+            execute(self.interpreter, WARMUP, self.limits, self.prelude)
+            connection, _ = self._listener.accept()
+            self._listener.close()
+            with connection, connection.makefile("rwb") as stream:
+                request = json.loads(stream.readline())
+                job = Job(str(request.get("id", "")), source=request.get("source", ""))
+                result = execute(self.interpreter, job, self.limits, self.prelude)
+                stream.write(json.dumps(result.to_dict(), ensure_ascii=False).encode("utf-8") + b"\n")
+                stream.flush()
+        except BaseException:
+            status = 1
+        finally:
+            # Sin limpieza de intérprete: ni atexit ni vaciado de búferes heredados del padre
+            os._exit(status)
+
+
+class ForkServerClient:
+    """Cliente mínimo: una conexión por trabajo."""
+
+    def __init__(self, socket_path: str, connect_timeout: float = 5.0) -> None:
+        self.socket_path = socket_path
+        self.connect_timeout = connect_timeout
+
+    def run(self, source: str, job_id: str = "") -> JobResult:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.settimeout(self.connect_timeout)
+            connection.connect(self.socket_path)
+            connection.settimeout(None)
+            with connection.makefile("rwb") as stream:
+                stream.write(json.dumps({"id": job_id, "source": source}).encode("utf-8") + b"\n")
+                stream.flush()
+                line = stream.readline()
+        if not line:
+            return JobResult(job_id, False, error="el proceso hijo terminó sin responder")
+        return JobResult(**json.loads(line))
+
+    def wait_ready(self, timeout: float = 10.0) -> None:
+        """Espera a que el servidor escuche en el socket."""
+        deadline = time.monotonic() + timeout
+        while not os.path.exists(self.socket_path):
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"el servidor no escucha en {self.socket_path}")
+            time.sleep(0.01)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.runner.forkserver",
+                                     description="Servidor fork de scripts sobre un socket Unix.")
+    parser.add_argument("socket", help="ruta del socket Unix")
+    parser.add_argument("--prelude", action="append", default=[], help="script que se ejecuta antes de cada trabajo")
+    parser.add_argument("--timeout", type=float, default=None, help="segundos máximos por trabajo")
+    parser.add_argument("--fuel", type=int, default=None, help="pasos máximos por trabajo")
+    parser.add_argument("--memory-limit", type=int, default=None, help="bytes máximos por trabajo")
+    parser.add_argument("--spare", type=int, default=ForkServer.DEFAULT_SPARE, help="hijos creados de antemano")
+    args = parser.parse_args(argv)
+
+    preludes = []
+    for path in args.prelude:
+        with open(path, encoding="utf-8") as prelude:
+            preludes.append(prelude.read())
+    server = ForkServer(args.socket, preludes, JobLimits(args.timeout, args.fuel, args.memory_limit), args.spare)
+    server.bind()
+    # SIGTERM termina de forma ordenada: se cierran los hijos en espera y el socket
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    sys.stderr.write(f"Escuchando en {args.socket}\n")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+"""Tests para AsyncInterpreter y los builtins de E/S."""
+
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+
+import src.astNode as ast
+from src.builtins import OutputSink
+from src.config.object import Error
+from src.interpreter import AsyncInterpreter, Interpreter
+from src.interpreter.async_eval import SuspendAnalyzer
+from src.lexer.lexer import Lexer
+from src.parser.parser_core import Parser
+
+
+def parse(source: str) -> ast.Program:
+    parser = Parser(Lexer(source))
+    program = parser.parse_program()
+    assert not parser.errors, parser.errors
+    return program
+
+
+class TestSuspendAnalyzer(unittest.TestCase):
+    """Test suite para SuspendAnalyzer."""
+
+    def test_calls_and_loops_may_suspend_but_nested_functions_do_not(self):
+        """Test solo las llamadas y bucles propios pueden suspender un nodo."""
+        analyzer = SuspendAnalyzer()
+        statements = parse('1 + 2; f(1) + 2; while (x) { 1; }; let g = function() { f(1) };').statements
+
+        self.assertEqual([analyzer.may_suspend(statement) for statement in statements],
+                         [False, True, True, False])
+
+
+class TestAsyncInterpreter(unittest.IsolatedAsyncioTestCase):
+    """Test suite para la ejecución asíncrona de scripts."""
+
+    def setUp(self):
+        self.interpreter = AsyncInterpreter(output=OutputSink.capture(), yield_interval=100)
+
+    async def test_results_match_synchronous_interpreter(self):
+        """Test un programa sin E/S da el mismo resultado que con Interpreter."""
+        program = parse('''
+            let fib = function(n) { if (n < 2) { return n; } fib(n - 1) + fib(n - 2) };
+            let xs = [fib(5), fib(6)];
+            let total = 0;
+            for (x in xs) { let total = total + x; }
+            {'total': total}['total'] + len(map(function(x) { x }, xs));
+        ''')
+
+        result = await self.interpreter.interpret_async(program)
+
+        expected = Interpreter(output=OutputSink.capture()).interpret(program)
+        self.assertEqual(result.inspect(), expected.inspect())
+
+    async def test_calls_match_synchronous_interpreter(self):
+        """Test las llamadas dan los mismos errores y usan la misma memoización que con Interpreter."""
+        sources = [
+            "[x()]; 't';",
+            "let f = function(a) { a }; f(nope);",
+            "5(1);",
+            "let square = function(x) { x * x }; square(3) + square(3) + square(4);",
+        ]
+        for source in sources:
+            with self.subTest(source=source):
+                program = parse(source)
+                asynchronous = AsyncInterpreter(output=OutputSink.capture(), memoize=True)
+                synchronous = Interpreter(output=OutputSink.capture(), memoize=True)
+
+                result = await asynchronous.interpret_async(program)
+                expected = synchronous.interpret(program)
+
+                self.assertEqual(result.inspect(), expected.inspect())
+                self.assertEqual(asynchronous.memo_stats, synchronous.memo_stats)
+
+    async def test_sleeping_scripts_run_concurrently(self):
+        """Test cien scripts que duermen 50 ms terminan en mucho menos que 5 s."""
+        program = parse('sleep(50); 1;')
+        start = time.perf_counter()
+
+        results = await asyncio.gather(*(self.interpreter.interpret_async(program) for _ in range(100)))
+
+        self.assertTrue(all(result.value == 1 for result in results))
+        self.assertLess(time.perf_counter() - start, 2.5)
+
+    async def test_long_computation_yields_to_other_scripts(self):
+        """Test un bucle largo cede el control: un script que duerme 1 ms termina antes."""
+        finished = []
+
+        async def run(name, source):
+            await self.interpreter.interpret_async(parse(source))
+            finished.append(name)
+
+        await asyncio.gather(run("bucle", 'let i = 0; while (i < 20000) { let i = i + 1; }'),
+                             run("sleep", 'sleep(1);'))
+
+        self.assertEqual(finished, ["sleep", "bucle"])
+
+    async def test_timeout_covers_time_spent_waiting(self):
+        """Test el tiempo límite corta también una espera de E/S."""
+        result = await self.interpreter.interpret_async(parse('sleep(5000);'), timeout=0.05)
+
+        self.assertIsInstance(result, Error)
+        self.assertIn("Tiempo", result.message)
+
+    async def test_read_file(self):
+        """Test read_file devuelve el contenido y un Error si el fichero no existe."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "datos.txt")
+            with open(path, "w", encoding="utf-8") as data:
+                data.write("hola")
+
+            content = await self.interpreter.interpret_async(parse(f"read_file('{path}');"))
+            missing = await self.interpreter.interpret_async(parse(f"read_file('{path}.no');"))
+
+        self.assertEqual(content.value, "hola")
+        self.assertIsInstance(missing, Error)
+
+    async def test_http_get_against_local_server(self):
+        """Test http_get lee el cuerpo de un servidor local y falla con estados de error."""
+        async def handle(reader, writer):
+            request = await reader.readuntil(b"\r\n\r\n")
+            status = b"404 Not Found" if b"/falta" in request else b"200 OK"
+            writer.write(b"HTTP/1.0 " + status + b"\r\nContent-Type: text/plain\r\n\r\ncuerpo")
+            await writer.drain()
+            writer.close()
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            body = await self.interpreter.interpret_async(parse(f"http_get('http://127.0.0.1:{port}/ok');"))
+            missing = await self.interpreter.interpret_async(parse(f"http_get('http://127.0.0.1:{port}/falta');"))
+
+        self.assertEqual(body.value, "cuerpo")
+        self.assertIsInstance(missing, Error)
+        self.assertIn("404", missing.message)
+
+    async def test_io_builtin_in_synchronous_callback_is_an_error(self):
+        """Test una función de E/S llamada desde un callback síncrono (map) da un Error."""
+        result = await self.interpreter.interpret_async(parse('map(function(x) { sleep(x) }, [1]);'))
+
+        self.assertIsInstance(result, Error)
+        self.assertIn("AsyncInterpreter", result.message)
+
+
+if __name__ == "__main__":
+    unittest.main()
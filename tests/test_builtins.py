@@ -0,0 +1,257 @@
+"""Tests para las funciones nativas (src.builtins)."""
+
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from typing import List
+
+from src.builtins import BUILTINS, FlushPolicy, OutputSink
+from src.interpreter.interpreter import Interpreter
+from src.lexer import Lexer
+from src.parser.parser_core import Parser
+from src.config.object import (
+    Array, Builtin, Error, Hash, Integer, LazyIterator, NULL, Object, Range, String, TRUE, FALSE
+)
+
+
+class TestRangeBuiltin(unittest.TestCase):
+    """Test suite para el builtin range."""
+
+    def setUp(self):
+        self.range = BUILTINS["range"]
+
+    def test_range_single_argument(self):
+        """Test range(n) empieza en 0."""
+        result = self.range(Integer(3))
+
+        self.assertIsInstance(result, Range)
+        self.assertEqual([item.value for item in result], [0, 1, 2])
+
+    def test_range_with_step(self):
+        """Test range(a, b, paso)."""
+        result = self.range(Integer(10), Integer(0), Integer(-3))
+
+        self.assertEqual([item.value for item in result], [10, 7, 4, 1])
+        self.assertEqual(len(result), 4)
+        self.assertEqual(result.inspect(), "range(10, 0, -3)")
+
+    def test_range_is_lazy(self):
+        """Test un rango enorme no materializa sus elementos."""
+        result = self.range(Integer(0), Integer(10 ** 12))
+
+        self.assertEqual(len(result), 10 ** 12)
+        self.assertEqual(next(iter(result)).value, 0)
+
+    def test_range_rejects_non_integers(self):
+        """Test range con argumentos no enteros devuelve Error."""
+        self.assertIsInstance(self.range(String("a")), Error)
+        self.assertIsInstance(self.range(), Error)
+        self.assertIsInstance(self.range(Integer(0), Integer(5), Integer(0)), Error)
+
+
+if __name__ == '__main__':
+    unittest.main()
+
+
+class TestMappingBuiltins(unittest.TestCase):
+    """Test suite para los builtins put y remove."""
+
+    def setUp(self):
+        self.mapping = Hash.from_pairs([(String("a"), Integer(1))])
+
+    def test_put_returns_new_hash(self):
+        """Test put no modifica el mapa original."""
+        result = BUILTINS["put"](self.mapping, String("b"), Integer(2))
+
+        self.assertEqual(len(result), 2)
+        self.assertEqual(len(self.mapping), 1)
+
+    def test_remove_returns_new_hash(self):
+        """Test remove no modifica el mapa original."""
+        result = BUILTINS["remove"](self.mapping, String("a"))
+
+        self.assertEqual(len(result), 0)
+        self.assertEqual(len(self.mapping), 1)
+
+    def test_invalid_arguments(self):
+        """Test argumentos inválidos devuelven Error."""
+        self.assertIsInstance(BUILTINS["put"](Integer(1), String("a"), Integer(1)), Error)
+        self.assertIsInstance(BUILTINS["put"](self.mapping, self.mapping, Integer(1)), Error)
+        self.assertIsInstance(BUILTINS["remove"](self.mapping), Error)
+
+
+def apply(function: Object, arguments: List[Object]) -> Object:
+    """Sustituto del evaluador: solo sabe llamar builtins."""
+    assert isinstance(function, Builtin)
+    return function(*arguments)
+
+
+def is_odd(value: Object) -> Object:
+    return TRUE if value.value % 2 else FALSE
+
+
+class TestSequenceBuiltins(unittest.TestCase):
+    """Test suite para len, sum, map, filter, reduce y join."""
+
+    def test_len(self):
+        """Test len sobre cada tipo soportado."""
+        length = BUILTINS["len"]
+
+        self.assertEqual(length(String("hola")).value, 4)
+        self.assertEqual(length(Array.from_ints([1, 2])).value, 2)
+        self.assertEqual(length(Range(0, 10)).value, 10)
+        self.assertIsInstance(length(Integer(1)), Error)
+
+    def test_sum_of_typed_array_and_range(self):
+        """Test sum nativo sobre arreglos tipados y rangos (sin recorrerlos)."""
+        total = BUILTINS["sum"]
+
+        self.assertEqual(total(Array.from_ints(range(1000))).value, 499500)
+        self.assertEqual(total(Range(10, 0, -3)).value, 22)
+        self.assertEqual(total(Range(0, 10 ** 12)).value, (10 ** 12 - 1) * 10 ** 12 // 2)
+
+    def test_sum_rejects_non_integers(self):
+        """Test sum con elementos no enteros devuelve Error."""
+        self.assertIsInstance(BUILTINS["sum"](Array([String("a")])), Error)
+
+    def test_map_filter_reduce(self):
+        """Test las funciones de orden superior llaman a través de apply."""
+        numbers = Array.from_ints([1, 2, 3, 4])
+
+        mapped = BUILTINS["map"](apply, Builtin(lambda value: Integer(value.value * 10)), numbers)
+        filtered = BUILTINS["filter"](apply, Builtin(is_odd), numbers)
+        reduced = BUILTINS["reduce"](apply, Builtin(lambda acc, value: Integer(acc.value + value.value)),
+                                     numbers, Integer(100))
+
+        self.assertEqual(list(mapped.ints), [10, 20, 30, 40])
+        self.assertEqual(list(filtered.ints), [1, 3])
+        self.assertEqual(reduced.value, 110)
+
+    def test_map_and_filter_are_lazy_over_ranges(self):
+        """Test sobre un rango map y filter devuelven iteradores que llaman bajo demanda."""
+        calls: List[int] = []
+
+        def double(value: Object) -> Object:
+            calls.append(value.value)
+            return Integer(value.value * 2)
+
+        mapped = BUILTINS["map"](apply, Builtin(double), Range(0, 10 ** 12))
+        odd = BUILTINS["filter"](apply, Builtin(is_odd), Range(0, 10))
+
+        self.assertIsInstance(mapped, LazyIterator)
+        self.assertEqual(calls, [])
+        iterator = iter(mapped)
+        self.assertEqual([next(iterator).value for _ in range(3)], [0, 2, 4])
+        self.assertEqual(calls, [0, 1, 2])
+        self.assertEqual(BUILTINS["sum"](odd).value, 25)
+
+    def test_map_propagates_errors(self):
+        """Test un Error del callback detiene map."""
+        error = Error("falla")
+
+        result = BUILTINS["map"](apply, Builtin(lambda value: error), Array.from_ints([1, 2]))
+
+        self.assertIs(result, error)
+
+    def test_join(self):
+        """Test join con y sin separador."""
+        words = Array([String("a"), String("b")])
+
+        self.assertEqual(BUILTINS["join"](words).value, "ab")
+        self.assertEqual(BUILTINS["join"](words, String(", ")).value, "a, b")
+        self.assertIsInstance(BUILTINS["join"](Array.from_ints([1])), Error)
+
+    def test_higher_order_builtins_are_marked(self):
+        """Test solo map, filter y reduce reciben apply."""
+        marked = {name for name, builtin in BUILTINS.items() if builtin.applies_functions}
+
+        self.assertEqual(marked, {"map", "filter", "reduce"})
+
+
+class TestOutputSink(unittest.TestCase):
+    """Test suite para OutputSink y el builtin print."""
+
+    def test_print_writes_to_sink(self):
+        """Test print escribe en el sink recibido y devuelve NULL."""
+        sink = OutputSink.capture()
+
+        result = BUILTINS["print"](sink, Integer(1), String("dos"))
+
+        self.assertIs(result, NULL)
+        self.assertEqual(sink.getvalue(), "1 dos\n")
+
+    def test_buffered_policy_flushes_when_full(self):
+        """Test con BUFFERED se escribe en bloques al superar buffer_size."""
+        chunks: List[str] = []
+        sink = OutputSink(chunks.append, buffer_size=10)
+
+        for _ in range(5):
+            sink.write("abcd")
+        pending = list(chunks)
+        sink.flush()
+
+        self.assertEqual(pending, ["abcdabcdabcd"])
+        self.assertEqual(chunks, ["abcdabcdabcd", "abcdabcd"])
+        self.assertEqual((sink.writes, sink.flushes), (5, 2))
+
+    def test_line_policy_flushes_each_line(self):
+        """Test con LINE se vacía al escribir un salto de línea."""
+        chunks: List[str] = []
+        sink = OutputSink(chunks.append, flush_policy=FlushPolicy.LINE)
+
+        sink.write("a")
+        sink.write("b\n")
+
+        self.assertEqual(chunks, ["ab\n"])
+
+    def test_end_policy_waits_for_flush(self):
+        """Test con END nada se escribe hasta flush."""
+        target = io.StringIO()
+        sink = OutputSink(target, buffer_size=1, flush_policy=FlushPolicy.END)
+
+        sink.write("hola\n")
+
+        self.assertEqual(target.getvalue(), "")
+        sink.flush()
+        self.assertEqual(target.getvalue(), "hola\n")
+
+    def test_stdout_target_is_resolved_on_flush(self):
+        """Test sin destino se escribe en el sys.stdout vigente al vaciar."""
+        sink = OutputSink()
+        output = io.StringIO()
+
+        sink.write("x\n")
+        with redirect_stdout(output):
+            sink.flush()
+
+        self.assertEqual(output.getvalue(), "x\n")
+
+    def test_file_target(self):
+        """Test una ruta abre el fichero en modo append."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "salida.txt")
+            sink = OutputSink(path)
+
+            sink.write("linea\n")
+            sink.close()
+
+            with open(path, encoding="utf-8") as handle:
+                self.assertEqual(handle.read(), "linea\n")
+
+    def test_invalid_target(self):
+        """Test destinos no soportados y tamaños inválidos."""
+        with self.assertRaises(TypeError):
+            OutputSink(42)
+        with self.assertRaises(ValueError):
+            OutputSink(buffer_size=0)
+
+    def test_interpreter_captures_print(self):
+        """Test el intérprete escribe print en su propio sink."""
+        sink = OutputSink.capture()
+        program = Parser(Lexer("print('a', 1); print([2]);")).parse_program()
+
+        Interpreter(output=sink).interpret(program)
+
+        self.assertEqual(sink.getvalue(), "a 1\n[2]\n")
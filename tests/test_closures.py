@@ -0,0 +1,146 @@
+"""Tests para la conversión de clausuras."""
+
+import unittest
+
+import src.astNode as ast
+from src.lexer.lexer import Lexer
+from src.parser.parser_core import Parser
+from src.config.environment import ClosureEnvironment, Environment
+from src.config.object import Function, Integer
+from src.interpreter.closures import ClosureConverter
+from src.interpreter.interpreter import Interpreter
+
+
+def parse(source: str) -> ast.Program:
+    parser = Parser(Lexer(source))
+    program = parser.parse_program()
+    assert not parser.errors, parser.errors
+    return program
+
+
+class TestClosureConverter(unittest.TestCase):
+    """Test suite para ClosureConverter."""
+
+    def setUp(self):
+        self.converter = ClosureConverter()
+
+    def _function(self, source: str) -> ast.Function:
+        return parse(source).statements[0].value
+
+    def test_free_variables_exclude_parameters_and_locals(self):
+        """Test las variables libres excluyen parámetros y lets."""
+        node = self._function('let f = function(x) { let y = x + a; return y + b; };')
+
+        info = self.converter.analyze(node)
+
+        self.assertEqual(info.free, frozenset({'a', 'b'}))
+        self.assertEqual(info.declared, frozenset({'x', 'y'}))
+
+    def test_read_before_let_is_free(self):
+        """Test leer un nombre antes de ligarlo lo hace libre."""
+        node = self._function('let f = function() { let x = x + 1; return x; };')
+
+        info = self.converter.analyze(node)
+
+        self.assertIn('x', info.free)
+
+    def test_nested_function_free_variables_propagate(self):
+        """Test las libres de funciones anidadas suben salvo las declaradas."""
+        node = self._function('let f = function(x) { return function(y) { return x + y + z; }; };')
+
+        info = self.converter.analyze(node)
+
+        self.assertEqual(info.free, frozenset({'z'}))
+
+    def test_capture_in_global_environment_keeps_it(self):
+        """Test en el entorno global no se crea entorno de captura."""
+        environment = Environment()
+        node = self._function('let f = function(x) { return x + a; };')
+
+        self.assertIs(self.converter.capture(node, environment), environment)
+
+    def test_capture_in_frame_only_keeps_free_cells(self):
+        """Test dentro de un marco solo se capturan las variables libres."""
+        outer = self._function('let f = function(a, big) { return function(x) { return x + a; }; };')
+        self.converter.analyze(outer)
+        inner = outer.body.statements[0].return_value
+        globals_env = Environment()
+        frame = Environment(outer=globals_env)
+        frame.set('a', Integer(1))
+        frame.set('big', Integer(2))
+
+        captured = self.converter.capture(inner, frame)
+
+        self.assertIsInstance(captured, ClosureEnvironment)
+        self.assertEqual(set(captured.cells), {'a'})
+        self.assertIs(captured.outer, globals_env)
+        self.assertEqual(captured.get('a').value, 1)
+
+
+class TestInterpreterClosures(unittest.TestCase):
+    """Tests de integración de clausuras convertidas."""
+
+    def _run(self, source: str, **options):
+        return Interpreter(**options).interpret(parse(source))
+
+    def test_closure_reads_captured_parameter(self):
+        """Test la clausura lee el parámetro capturado."""
+        source = '''
+            let make = function(base) { let unused = base * 1000; return function(x) { return x + base; }; };
+            let add5 = make(5);
+            add5(3);
+        '''
+
+        self.assertEqual(self._run(source).value, 8)
+
+    def test_local_binding_defined_after_closure(self):
+        """Test una clausura ve un let local definido después de crearla."""
+        source = '''
+            let f = function() {
+                let g = function() { return h(); };
+                let h = function() { return 7; };
+                return g();
+            };
+            f();
+        '''
+
+        self.assertEqual(self._run(source).value, 7)
+
+    def test_rebinding_is_visible_through_cell(self):
+        """Test volver a ligar una variable capturada se refleja en la clausura."""
+        source = '''
+            let f = function() {
+                let n = 1;
+                let get = function() { return n; };
+                let n = 2;
+                return get();
+            };
+            f();
+        '''
+
+        self.assertEqual(self._run(source).value, 2)
+
+    def test_nested_closures_reach_outer_captures(self):
+        """Test clausuras anidadas resuelven variables de varios niveles."""
+        source = '''
+            let adder = function(a) { return function(b) { return function(c) { return a + b + c; }; }; };
+            adder(1)(2)(3);
+        '''
+
+        self.assertEqual(self._run(source).value, 6)
+        self.assertEqual(self._run(source, closure_conversion=False).value, 6)
+
+    def test_closure_does_not_retain_defining_frame(self):
+        """Test la clausura no referencia el marco que la definió."""
+        source = 'let make = function(a, big) { return function(x) { return x + a; }; }; make(1, 2);'
+
+        closure = self._run(source)
+
+        self.assertIsInstance(closure, Function)
+        self.assertIsInstance(closure.env, ClosureEnvironment)
+        self.assertEqual(set(closure.env.cells), {'a'})
+        self.assertIsNone(closure.env.get('big'))
+
+
+if __name__ == '__main__':
+    unittest.main()
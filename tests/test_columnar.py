@@ -0,0 +1,105 @@
+"""Tests para la evaluación por columnas (PreparedProgram.run_batch y ColumnarEvaluator)."""
+
+import unittest
+
+import src.astNode as ast
+from src.builtins import OutputSink
+from src.config.environment import Environment
+from src.config.object import Error
+from src.interpreter import Interpreter, PreparedProgram
+from src.interpreter.columnar import Column, ColumnarEvaluator, Unvectorizable
+from src.lexer.lexer import Lexer
+from src.parser.parser_core import Parser
+
+
+def parse(source: str) -> ast.Program:
+    parser = Parser(Lexer(source))
+    program = parser.parse_program()
+    assert not parser.errors, parser.errors
+    return program
+
+
+class FakeArray:
+    """Imita un arreglo de NumPy: solo se usa `tolist()`."""
+
+    def __init__(self, values):
+        self.values = values
+
+    def tolist(self):
+        return list(self.values)
+
+
+A = [5, -3, 7, 0, 2, 9, 4, -1]
+B = [2, 0, -3, 4, 0, 1, 4, 3]
+
+
+class TestRunBatch(unittest.TestCase):
+    """Test suite para PreparedProgram.run_batch."""
+
+    def setUp(self):
+        self.interpreter = Interpreter(output=OutputSink.capture())
+        self.prelude = self.interpreter.snapshot(parse('let doble = function(x) { x * 2 };'))
+
+    def assertSameAsRowByRow(self, source, a=A, b=B):
+        prepared = PreparedProgram(parse(source), ["a", "b"], self.interpreter, self.prelude)
+
+        batch = prepared.run_batch({"a": a, "b": b})
+
+        expected = [prepared.run({"a": x, "b": y}) for x, y in zip(a, b)]
+        self.assertEqual([(type(value), value.inspect()) for value in batch],
+                         [(type(value), value.inspect()) for value in expected], source)
+
+    def test_results_match_row_by_row(self):
+        """Test infijos, prefijos, if, let, return y llamadas dan lo mismo que fila a fila."""
+        for source in (
+            'a + b * 3 - -a;',
+            'if (a > b) { \'mayor\' } else { a - b };',
+            '!(a == b) == (a != b);',
+            'let c = a / b; c + 1;',
+            'if (b == 0) { let z = 5; return z; } a / b;',
+            'let fib = function(n) { if (n < 2) { return n; } fib(n - 1) + fib(n - 2) }; fib(a + 2);',
+            'let g = function(x, y) { let q = x / y; q * 2 }; g(a, b) + doble(b);',
+            'len(\'abc\') + a;',
+        ):
+            self.assertSameAsRowByRow(source)
+
+    def test_mixed_type_columns(self):
+        """Test columnas con valores de varios tipos se operan como objetos del lenguaje."""
+        a = ['x', 1, True, None, 'y', 2]
+        b = ['x', 2, True, 'z', 1, 'w']
+
+        for source in ('a + b;', 'a == b;', 'if (a) { b } else { a };', '!a;'):
+            self.assertSameAsRowByRow(source, a, b)
+
+    def test_division_by_zero_is_reported_per_row(self):
+        """Test solo las filas con divisor cero dan error; las demás dividen con suelo."""
+        prepared = PreparedProgram(parse('a / b;'), ["a", "b"], self.interpreter)
+
+        results = prepared.run_batch({"a": FakeArray([7, -7, 1]), "b": FakeArray([2, 2, 0])})
+
+        self.assertEqual([result.inspect() for result in results[:2]], ["3", "-4"])
+        self.assertIsInstance(results[2], Error)
+
+    def test_unvectorizable_programs_fall_back_row_by_row(self):
+        """Test literales de arreglo y builtins con efectos se ejecutan fila a fila."""
+        with self.assertRaises(Unvectorizable):
+            ColumnarEvaluator().run(parse('[a][0];'), {"a": Column.from_values([1, 2])}, 2, Environment())
+        prepared = PreparedProgram(parse('print(a); [a, a][1];'), ["a"], self.interpreter)
+
+        results = prepared.run_batch({"a": [1, 2]})
+
+        self.assertEqual([result.inspect() for result in results], ["1", "2"])
+        self.assertEqual(self.interpreter.output.getvalue(), "1\n2\n")
+
+    def test_columns_must_match_inputs_and_length(self):
+        """Test nombres de columna no declarados o longitudes distintas lanzan ValueError."""
+        prepared = PreparedProgram(parse('a + b;'), ["a", "b"], self.interpreter)
+
+        with self.assertRaises(ValueError):
+            prepared.run_batch({"a": [1]})
+        with self.assertRaises(ValueError):
+            prepared.run_batch({"a": [1, 2], "b": [1]})
+
+
+if __name__ == "__main__":
+    unittest.main()
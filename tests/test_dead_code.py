@@ -0,0 +1,148 @@
+"""Tests para la pasada de eliminación de código muerto."""
+
+import unittest
+
+import src.astNode as ast
+from src.builtins import OutputSink
+from src.interpreter import Interpreter
+from src.lexer.lexer import Lexer
+from src.optimizer import eliminate_dead_code
+from src.parser.parser_core import Parser
+
+
+def parse(source: str) -> ast.Program:
+    parser = Parser(Lexer(source))
+    program = parser.parse_program()
+    assert not parser.errors, parser.errors
+    return program
+
+
+def run(program: ast.Program):
+    output = OutputSink.capture()
+    result = Interpreter(output=output).interpret(program)
+    return result.inspect() if result is not None else None, output.getvalue()
+
+
+class TestDeadCodeEliminator(unittest.TestCase):
+    """Test suite para eliminate_dead_code."""
+
+    def test_statements_after_return_are_removed(self):
+        """Test lo que sigue a un return, o a un if cuyas dos ramas retornan, desaparece."""
+        source = '''
+            let f = function(n) { return n; print('nunca'); n + 1 };
+            let g = function(n) { if (n > 0) { return 1; } else { return 2; } print('nunca'); };
+            [f(1), g(1), g(-1)];
+        '''
+        program = parse(source)
+        expected = run(parse(source))
+
+        report = eliminate_dead_code(program)
+
+        self.assertEqual(report.unreachable, 3)
+        self.assertEqual(len(program.statements[0].value.body.statements), 1)
+        self.assertEqual(run(program), expected)
+
+    def test_unused_pure_lets_are_removed_until_fixpoint(self):
+        """Test un let sin lectores se quita y, con él, los que solo él leía."""
+        program = parse('''
+            let f = function(a) {
+                let t = 'a';
+                let u = [t, 'x', true];
+                let usada = a * 2;
+                usada
+            };
+            f(21);
+        ''')
+
+        report = eliminate_dead_code(program)
+
+        body = program.statements[0].value.body.statements
+        self.assertEqual(report.unused_lets, 2)
+        self.assertEqual([statement.name.value for statement in body[:-1]], ['usada'])
+        self.assertGreater(report.nodes_removed, report.statements_removed)
+        self.assertEqual(run(program), ('42', ''))
+
+    def test_lets_that_may_fail_or_are_read_are_kept(self):
+        """Test se conservan los let cuyo valor puede fallar y los leídos por funciones anidadas."""
+        source = '''
+            let f = function(a) {
+                let falla = desconocido;
+                let suma = a + 1;
+                let capturada = 7;
+                let g = function() { capturada };
+                g()
+            };
+            f(1);
+        '''
+        program = parse(source)
+        expected = run(parse(source))
+
+        report = eliminate_dead_code(program)
+
+        self.assertEqual(report.unused_lets, 0)
+        self.assertEqual(run(program), expected)
+
+    def test_parameter_reads_are_kept(self):
+        """Test leer un parámetro no se quita: puede valer un Error que corta el bloque."""
+        source = '''
+            let f = function(a) { if (2) { return (!(0 * b)); } ((-false) + c) };
+            let g = function(a, b) { let c = b; return 's'; };
+            (if (f(f('s'))) { g(c, (-true)) });
+            true;
+        '''
+        program = parse(source)
+        expected = run(parse(source))
+
+        report = eliminate_dead_code(program)
+
+        self.assertEqual(report.unused_lets, 0)
+        self.assertEqual(expected, ('Error: Operador desconocido: -BOOLEAN', ''))
+        self.assertEqual(run(program), expected)
+
+    def test_parameters_shadowing_builtins_are_kept(self):
+        """Test un parámetro con nombre de builtin no se lee como el builtin, ni en funciones anidadas."""
+        sources = [
+            'let f = function(len) { len; 5 }; f(nope);',
+            'let f = function(print) { let t = print; 5 }; f(nope);',
+            'let f = function(len) { let g = function() { len; 5 }; g() }; f(nope);',
+        ]
+        for source in sources:
+            with self.subTest(source=source):
+                program = parse(source)
+                expected = run(parse(source))
+
+                report = eliminate_dead_code(program)
+
+                self.assertEqual(report.statements_removed, 0)
+                self.assertEqual(expected, ('Error: Identificador no encontrado: nope', ''))
+                self.assertEqual(run(program), expected)
+
+    def test_globals_and_final_values_are_kept(self):
+        """Test los let globales y la última sentencia de un bloque no se quitan."""
+        program = parse("let global = 1; 5; 'ignorado'; let h = function() { let ultimo = 3 }; h();")
+
+        report = eliminate_dead_code(program)
+
+        self.assertEqual(report.unused_expressions, 2)
+        self.assertEqual(report.unused_lets, 0)
+        self.assertEqual(run(program), ('3', ''))
+
+    def test_shared_subtrees_are_not_mutated(self):
+        """Test la pasada copia los nodos que cambia: un árbol internado sigue intacto en otro programa."""
+        interner = ast.Interner()
+        source = 'let f = function(a) { if (a) { let x = 1; return a; 3 } 0 }; f(true);'
+        first = parse(source)
+        second = parse(source)
+        interner.intern(first)
+        interner.intern(second)
+        text = str(second)
+
+        eliminate_dead_code(first)
+
+        self.assertEqual(str(second), text)
+        self.assertNotEqual(str(first), text)
+        self.assertEqual(run(first), run(second))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,7 @@ import src.astNode as ast
 from src.config.environment import Environment
 from src.config.object import Object, Integer
 from src.interpreter.dispatcher import Dispatcher
+from src.interpreter.memo import MemoTable
 
 
 class TestDispatcher(unittest.TestCase):
@@ -168,5 +169,27 @@ class TestDispatcher(unittest.TestCase):
         self.assertEqual(self.mock_expressions.evaluate.call_count, 1)
 
 
+class TestDispatcherContexts(unittest.TestCase):
+    """Tests for Dispatcher.new_context."""
+
+    def test_new_context_shares_analyses_but_not_run_state(self):
+        """Test que un contexto nuevo comparte memo y cachés de análisis, no el estado de ejecución."""
+        # Arrange
+        memo = MemoTable()
+        dispatcher = Dispatcher(memo=memo)
+
+        # Act
+        context = dispatcher.new_context()
+
+        # Assert
+        self.assertIs(context.expressions.memo, memo)
+        self.assertIs(context.expressions.closures, dispatcher.expressions.closures)
+        self.assertIs(context.expressions.generators.analyzer, dispatcher.expressions.generators.analyzer)
+        self.assertIs(context.expressions.frames.escapes, dispatcher.expressions.frames.escapes)
+        self.assertIsNot(context.expressions, dispatcher.expressions)
+        self.assertIsNot(context.statements.return_register, dispatcher.statements.return_register)
+        self.assertIsNot(context.expressions.frames, dispatcher.expressions.frames)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
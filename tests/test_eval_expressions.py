@@ -8,7 +8,7 @@ from typing import Optional, List
 import src.astNode as ast
 from src.config.environment import Environment
 from src.config.object import (
-    Object, Integer, Boolean, String, Function, Error, Return
+    Object, Integer, Boolean, String, Function, Error, Return, Builtin
 )
 from src.interpreter.eval_expressions import ExpressionEvaluator
 from src.interpreter.interfaces import IEvaluator
@@ -352,7 +352,7 @@ class TestExpressionEvaluator(unittest.TestCase):
         
         # Assert
         mock_functions_ops.apply_function.assert_called_once_with(
-            function_obj, [arg1_obj, arg2_obj]
+            function_obj, [arg1_obj, arg2_obj], self.evaluator.frames
         )
         mock_functions_ops.unwrap_return_value.assert_called_once()
         self.assertEqual(result, final_result)
@@ -380,6 +380,32 @@ class TestExpressionEvaluator(unittest.TestCase):
         # Assert
         self.assertEqual(result, error_obj)
 
+    def test_call_builtin_does_not_extend_environment(self):
+        """Test los builtins se llaman directamente, sin apply_function."""
+        # Arrange
+        builtin = Builtin(lambda value: Integer(value.value + 1))
+
+        # Act
+        with patch('src.interpreter.eval_expressions.FunctionsOperations') as mock_functions_ops:
+            result = self.evaluator.call_function(builtin, [Integer(1)])
+
+        # Assert
+        mock_functions_ops.apply_function.assert_not_called()
+        self.assertEqual(result.value, 2)
+
+    def test_call_higher_order_builtin_receives_apply(self):
+        """Test los builtins de orden superior reciben call_function como apply."""
+        # Arrange
+        received = []
+        builtin = Builtin(lambda apply, value: received.append(apply) or value, applies_functions=True)
+
+        # Act
+        result = self.evaluator.call_function(builtin, [Integer(5)])
+
+        # Assert
+        self.assertEqual(received, [self.evaluator.call_function])
+        self.assertEqual(result.value, 5)
+
     def test_evaluate_block_expression(self):
         """Test evaluación de expresión de bloque."""
         # Arrange
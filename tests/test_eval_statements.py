@@ -8,7 +8,7 @@ from typing import Optional, List
 import src.astNode as ast
 from src.config.environment import Environment
 from src.config.object import (
-    Object, Integer, Boolean, String, Error, Return
+    Object, Integer, Boolean, String, Error, Return, Range, LazyIterator
 )
 from src.interpreter.eval_statements import StatementEvaluator
 from src.interpreter.interfaces import IEvaluator
@@ -328,32 +328,69 @@ class TestStatementEvaluator(unittest.TestCase):
         self.mock_dispatcher.evaluate.assert_called_once_with(expression, self.environment)
         self.assertEqual(result, expected_result)
 
-    def test_return_statement_node_attribute_updated(self):
-        """Test que return_statement_node se actualiza correctamente."""
+    def test_return_statement_reuses_register(self):
+        """Test return no asigna un Return nuevo en cada ejecución."""
         # Arrange
-        return_value = Mock()
-        return_statement = ast.ReturnStatement(token=Mock(), return_value=return_value)
-        self.mock_dispatcher.evaluate.return_value = Integer(42)
+        return_statement = ast.ReturnStatement(token=Mock(), return_value=Mock())
+        self.mock_dispatcher.evaluate.side_effect = [Integer(1), Integer(2)]
         
         # Act
-        self.evaluator.evaluate(return_statement, self.environment)
+        first = self.evaluator.evaluate(return_statement, self.environment)
+        first_value = first.value
+        second = self.evaluator.evaluate(return_statement, self.environment)
         
         # Assert
-        self.assertEqual(self.evaluator.return_statement_node, return_statement)
+        self.assertIs(first, second)
+        self.assertIs(second, self.evaluator.return_register)
+        self.assertEqual(first_value.value, 1)
+        self.assertEqual(second.value.value, 2)
 
-    def test_let_statement_node_attribute_updated(self):
-        """Test que return_statement_node se actualiza correctamente para let."""
+    def test_let_statement_propagates_error_without_binding(self):
+        """Test let no liga un Error y lo propaga."""
         # Arrange
-        name = ast.Identifier(token=Mock(), value="y")
-        value_expr = Mock()
-        let_statement = ast.LetStatement(token=Mock(), name=name, value=value_expr)
-        self.mock_dispatcher.evaluate.return_value = Integer(42)
+        name = ast.Identifier(token=Mock(), value="x")
+        let_statement = ast.LetStatement(token=Mock(), name=name, value=Mock())
+        error_obj = Error("boom")
+        self.mock_dispatcher.evaluate.return_value = error_obj
+        
+        # Act
+        result = self.evaluator.evaluate(let_statement, self.environment)
+        
+        # Assert
+        self.assertIs(result, error_obj)
+        self.assertIsNone(self.environment.get("x"))
+
+    def test_block_stops_on_abrupt_completion_only(self):
+        """Test el bloque solo se detiene ante resultados abruptos."""
+        # Arrange
+        statements = [Mock(), Mock(), Mock()]
+        block_node = ast.Block(token=Mock(), statements=statements)
+        error_obj = Error("boom")
+        self.mock_dispatcher.evaluate.side_effect = [Integer(1), error_obj, Integer(3)]
         
         # Act
-        self.evaluator.evaluate(let_statement, self.environment)
+        result = self.evaluator.eval_block_expression(block_node, self.environment)
         
         # Assert
-        self.assertEqual(self.evaluator.return_statement_node, let_statement)
+        self.assertIs(result, error_obj)
+        self.assertEqual(self.mock_dispatcher.evaluate.call_count, 2)
+
+    def test_return_register_is_per_evaluator(self):
+        """Test cada evaluador (contexto de ejecución) tiene su propio registro de return."""
+        # Arrange
+        other = StatementEvaluator(Mock(spec=IEvaluator))
+        other.dispatcher.evaluate.return_value = Integer(2)
+        return_statement = ast.ReturnStatement(token=Mock(), return_value=Mock())
+        self.mock_dispatcher.evaluate.return_value = Integer(1)
+
+        # Act
+        first = self.evaluator.evaluate(return_statement, self.environment)
+        second = other.evaluate(return_statement, self.environment)
+
+        # Assert
+        self.assertIsNot(first, second)
+        self.assertEqual(first.value.value, 1)
+        self.assertEqual(second.value.value, 2)
 
     def test_integration_program_with_mixed_statements(self):
         """Test de integración con programa que tiene diferentes tipos de declaraciones."""
@@ -397,5 +434,106 @@ class TestStatementEvaluator(unittest.TestCase):
         self.assertEqual(result.value, 2)  # Comparar valor
 
 
+    def test_while_statement_loops_until_condition_is_false(self):
+        """Test while evalúa el cuerpo mientras la condición sea verdadera."""
+        # Arrange
+        condition = Mock()
+        body_stmt = Mock()
+        body = ast.Block(token=Mock(), statements=[body_stmt])
+        while_node = ast.WhileStatement(token=Mock(), condition=condition, body=body)
+        self.mock_dispatcher.evaluate.side_effect = [
+            Boolean(True), Integer(1),
+            Boolean(True), Integer(2),
+            Boolean(False)
+        ]
+        
+        # Act
+        result = self.evaluator.evaluate(while_node, self.environment)
+        
+        # Assert
+        self.assertEqual(self.mock_dispatcher.evaluate.call_count, 5)
+        self.assertEqual(result.type().name, "NULL")
+
+    def test_while_statement_propagates_return(self):
+        """Test un return dentro del while termina el bucle."""
+        # Arrange
+        body = ast.Block(token=Mock(), statements=[Mock()])
+        while_node = ast.WhileStatement(token=Mock(), condition=Mock(), body=body)
+        return_obj = Return(Integer(7))
+        self.mock_dispatcher.evaluate.side_effect = [Boolean(True), return_obj]
+        
+        # Act
+        result = self.evaluator.evaluate(while_node, self.environment)
+        
+        # Assert
+        self.assertIs(result, return_obj)
+
+    def test_for_statement_binds_variable_per_item(self):
+        """Test for liga la variable en cada elemento de un rango perezoso."""
+        # Arrange
+        variable = ast.Identifier(token=Mock(), value="i")
+        body = ast.Block(token=Mock(), statements=[Mock()])
+        for_node = ast.ForStatement(token=Mock(), variable=variable, iterable=Mock(), body=body)
+        seen = []
+
+        def side_effect(node, env):
+            if node is for_node.iterable:
+                return Range(0, 3)
+            seen.append(env.get("i").value)
+            return env.get("i")
+
+        self.mock_dispatcher.evaluate.side_effect = side_effect
+        
+        # Act
+        result = self.evaluator.evaluate(for_node, self.environment)
+        
+        # Assert
+        self.assertEqual(seen, [0, 1, 2])
+        self.assertEqual(result.type().name, "NULL")
+
+    def test_for_statement_over_non_iterable_is_error(self):
+        """Test for sobre un valor no iterable produce Error."""
+        # Arrange
+        variable = ast.Identifier(token=Mock(), value="i")
+        for_node = ast.ForStatement(token=Mock(), variable=variable, iterable=Mock(),
+                                    body=ast.Block(token=Mock(), statements=[]))
+        self.mock_dispatcher.evaluate.return_value = Integer(5)
+        
+        # Act
+        result = self.evaluator.evaluate(for_node, self.environment)
+        
+        # Assert
+        self.assertIsInstance(result, Error)
+    def test_for_statement_stops_on_error_item(self):
+        """Test for sobre un iterador perezoso se detiene en un elemento Error."""
+        # Arrange
+        variable = ast.Identifier(token=Mock(), value="i")
+        for_node = ast.ForStatement(token=Mock(), variable=variable, iterable=Mock(),
+                                    body=ast.Block(token=Mock(), statements=[Mock()]))
+        error = Error("falla")
+        self.mock_dispatcher.evaluate.side_effect = [
+            LazyIterator(iter([Integer(1), error, Integer(3)])),
+            Integer(1),
+        ]
+        
+        # Act
+        result = self.evaluator.evaluate(for_node, self.environment)
+        
+        # Assert
+        self.assertIs(result, error)
+        self.assertEqual(self.mock_dispatcher.evaluate.call_count, 2)
+
+    def test_yield_outside_generator_is_error(self):
+        """Test un yield evaluado fuera de una función generadora es un Error."""
+        # Arrange
+        yield_node = ast.YieldStatement(token=Mock(), value=Mock())
+        
+        # Act
+        result = self.evaluator.evaluate(yield_node, self.environment)
+        
+        # Assert
+        self.assertIsInstance(result, Error)
+        self.mock_dispatcher.evaluate.assert_not_called()
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
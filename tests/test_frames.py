@@ -0,0 +1,137 @@
+"""Tests para el pool de marcos de llamada."""
+
+import unittest
+from unittest.mock import Mock
+
+import src.astNode as ast
+from src.lexer.lexer import Lexer
+from src.parser.parser_core import Parser
+from src.config.environment import Environment
+from src.config.object import Integer
+from src.interpreter.frames import EscapeAnalyzer, FramePool
+from src.interpreter.interpreter import Interpreter
+
+
+def parse(source: str) -> ast.Program:
+    parser = Parser(Lexer(source))
+    program = parser.parse_program()
+    assert not parser.errors, parser.errors
+    return program
+
+
+FIB = '''
+let fib = function(n) {
+    if (n < 2) { return n; } else { return fib(n - 1) + fib(n - 2); }
+};
+fib(10);
+'''
+
+
+class TestEscapeAnalyzer(unittest.TestCase):
+    """Test suite para EscapeAnalyzer."""
+
+    def _body(self, source: str) -> ast.Block:
+        return parse(source).statements[0].value.body
+
+    def test_nothing_escapes_with_closure_conversion(self):
+        """Test con conversión de clausuras ningún marco escapa."""
+        body = self._body('let f = function(x) { return function() { return x; }; };')
+
+        self.assertFalse(EscapeAnalyzer(closure_conversion=True).may_escape(body))
+
+    def test_nested_literal_escapes_without_conversion(self):
+        """Test sin conversión, una función anidada hace escapar el marco."""
+        body = self._body('let f = function(x) { return function() { return x; }; };')
+
+        self.assertTrue(EscapeAnalyzer(closure_conversion=False).may_escape(body))
+
+    def test_plain_body_does_not_escape(self):
+        """Test un cuerpo sin funciones anidadas no escapa."""
+        body = self._body('let f = function(x) { let y = x + 1; return y * 2; };')
+
+        self.assertFalse(EscapeAnalyzer(closure_conversion=False).may_escape(body))
+
+
+class TestFramePool(unittest.TestCase):
+    """Test suite para FramePool."""
+
+    def test_released_frame_is_reused_clean(self):
+        """Test un marco liberado se reutiliza vacío y con el nuevo exterior."""
+        pool = FramePool()
+        first_outer = Environment()
+        second_outer = Environment()
+        frame = pool.acquire(first_outer)
+        frame.set('x', Integer(1))
+        frame.cell('x')
+
+        pool.release(frame, Mock())
+        reused = pool.acquire(second_outer)
+
+        self.assertIs(reused, frame)
+        self.assertEqual(reused.store, {})
+        self.assertIsNone(reused.cells)
+        self.assertIs(reused.outer, second_outer)
+        self.assertEqual(pool.stats.allocated, 1)
+        self.assertEqual(pool.stats.reused, 1)
+
+    def test_escaping_frame_is_not_recycled(self):
+        """Test un marco que puede escapar no vuelve al pool."""
+        pool = FramePool(closure_conversion=False)
+        body = parse('let f = function() { return function() { return 1; }; };').statements[0].value.body
+        frame = pool.acquire(Environment())
+
+        pool.release(frame, body)
+
+        self.assertEqual(len(pool), 0)
+        self.assertEqual(pool.stats.escaped, 1)
+
+    def test_pool_is_bounded(self):
+        """Test el pool no guarda más marcos que su tamaño máximo."""
+        pool = FramePool(max_size=1)
+        frames = [pool.acquire(None) for _ in range(3)]
+
+        for frame in frames:
+            pool.release(frame, Mock())
+
+        self.assertEqual(len(pool), 1)
+
+
+class TestInterpreterFramePool(unittest.TestCase):
+    """Tests de integración del pool de marcos."""
+
+    def test_recursion_allocates_at_most_depth_frames(self):
+        """Test la recursión asigna como mucho un marco por nivel de profundidad."""
+        interpreter = Interpreter()
+
+        result = interpreter.interpret(parse(FIB))
+
+        self.assertEqual(result.value, 55)
+        stats = interpreter.frame_stats
+        self.assertLessEqual(stats.allocated, 10)
+        self.assertGreater(stats.reused, 100)
+
+    def test_closures_survive_frame_recycling(self):
+        """Test las clausuras siguen siendo válidas tras reciclar su marco."""
+        source = '''
+            let make = function(a) { return function(b) { return a + b; }; };
+            let add1 = make(1);
+            let add2 = make(2);
+            add1(10) + add2(20);
+        '''
+
+        for closure_conversion in (True, False):
+            result = Interpreter(closure_conversion=closure_conversion).interpret(parse(source))
+            self.assertEqual(result.value, 33)
+
+    def test_pool_can_be_disabled(self):
+        """Test frame_pool=False desactiva el pool."""
+        interpreter = Interpreter(frame_pool=False)
+
+        result = interpreter.interpret(parse(FIB))
+
+        self.assertEqual(result.value, 55)
+        self.assertIsNone(interpreter.frame_stats)
+
+
+if __name__ == '__main__':
+    unittest.main()
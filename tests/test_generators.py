@@ -0,0 +1,102 @@
+"""Tests para las funciones generadoras (yield)."""
+
+import unittest
+
+import src.astNode as ast
+from src.builtins import OutputSink
+from src.config.object import Error, LazyIterator
+from src.interpreter.generators import YieldAnalyzer
+from src.interpreter.interpreter import Interpreter
+from src.lexer.lexer import Lexer
+from src.parser.parser_core import Parser
+
+
+def parse(source: str) -> ast.Program:
+    parser = Parser(Lexer(source))
+    program = parser.parse_program()
+    assert not parser.errors, parser.errors
+    return program
+
+
+def run(source: str):
+    return Interpreter(output=OutputSink.capture()).interpret(parse(source))
+
+
+class TestYieldAnalyzer(unittest.TestCase):
+    """Test suite para YieldAnalyzer."""
+
+    def test_detects_nested_yield_but_not_in_inner_functions(self):
+        """Test un yield dentro de bucles cuenta; uno en una función anidada no."""
+        outer = parse('let g = function() { while (true) { if (x) { yield 1; } } };').statements[0].value
+        inner = parse('let f = function() { let h = function() { yield 1; }; h; };').statements[0].value
+        analyzer = YieldAnalyzer()
+
+        self.assertTrue(analyzer.contains_yield(outer.body))
+        self.assertFalse(analyzer.contains_yield(inner.body))
+
+
+class TestGenerators(unittest.TestCase):
+    """Test suite para la ejecución perezosa de funciones generadoras."""
+
+    def test_calling_a_generator_returns_lazy_iterator(self):
+        """Test llamar a una función con yield no ejecuta su cuerpo."""
+        result = run('let g = function() { yield 1; }; g();')
+
+        self.assertIsInstance(result, LazyIterator)
+
+    def test_generator_yields_from_loops(self):
+        """Test los yield dentro de for y while producen la secuencia en orden."""
+        result = run('''
+            let g = function(n) {
+                for (i in range(n)) { yield i; }
+                let j = 0;
+                while (j < 2) { yield 100 + j; let j = j + 1; }
+            };
+            join(map(function(x) { 'v' }, g(3)), '') + '-' + join(map(function(x) { 'w' }, g(0)), '');
+        ''')
+
+        self.assertEqual(result.value, 'vvvvv-ww')
+
+    def test_return_ends_the_sequence(self):
+        """Test return termina la secuencia sin entregar su valor."""
+        result = run('let g = function() { yield 1; return 50; yield 2; }; sum(g());')
+
+        self.assertEqual(result.value, 1)
+
+    def test_generator_state_is_suspended_between_items(self):
+        """Test el marco conserva sus variables entre elementos."""
+        result = run('''
+            let counter = function() { let n = 0; while (true) { let n = n + 1; yield n; } };
+            let total = 0;
+            for (x in counter()) {
+                let total = total + x;
+                if (x == 4) { return total; }
+            }
+        ''')
+
+        self.assertEqual(result.value, 10)
+
+    def test_error_inside_generator_reaches_consumer(self):
+        """Test un error en el cuerpo se entrega como último elemento."""
+        result = run('let g = function() { yield 1; yield missing; yield 3; }; sum(g());')
+
+        self.assertIsInstance(result, Error)
+
+    def test_iterator_is_single_use(self):
+        """Test recorrer un iterador lo consume."""
+        result = run('let g = function() { yield 5; }; let it = g(); sum(it) + sum(it);')
+
+        self.assertEqual(result.value, 5)
+
+    def test_pipeline_over_huge_range_is_lazy(self):
+        """Test una cadena map/filter sobre un rango enorme solo evalúa lo consumido."""
+        result = run('''
+            let evens = filter(function(x) { x / 2 * 2 == x }, map(function(x) { x + 1 }, range(1000000000000)));
+            for (x in evens) { if (x > 6) { return x; } }
+        ''')
+
+        self.assertEqual(result.value, 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
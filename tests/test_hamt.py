@@ -0,0 +1,101 @@
+"""Tests para el HAMT persistente (src.config.hamt)."""
+
+import random
+import unittest
+
+from src.config.hamt import Hamt
+
+
+class CollidingKey:
+    """Clave con hash controlado para forzar colisiones."""
+
+    def __init__(self, name: str, key_hash: int):
+        self.name = name
+        self.key_hash = key_hash
+
+    def __hash__(self) -> int:
+        return self.key_hash
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, CollidingKey) and self.name == other.name
+
+
+class TestHamt(unittest.TestCase):
+    """Test suite para Hamt."""
+
+    def test_set_and_get(self):
+        """Test insertar y buscar claves."""
+        hamt = Hamt([("a", 1), ("b", 2)])
+
+        self.assertEqual(hamt.get("a"), 1)
+        self.assertEqual(hamt.get("b"), 2)
+        self.assertIsNone(hamt.get("c"))
+        self.assertEqual(len(hamt), 2)
+
+    def test_set_returns_new_map(self):
+        """Test set no modifica la versión anterior."""
+        original = Hamt([("a", 1)])
+
+        updated = original.set("b", 2).set("a", 10)
+
+        self.assertEqual(dict(original.items()), {"a": 1})
+        self.assertEqual(dict(updated.items()), {"a": 10, "b": 2})
+
+    def test_updates_share_structure(self):
+        """Test una actualización comparte los subárboles no tocados."""
+        original = Hamt((index, index) for index in range(10000))
+
+        updated = original.set(0, "cero")
+
+        shared = set(map(id, original._root.entries)) & set(map(id, updated._root.entries))
+        self.assertEqual(len(shared), len(original._root.entries) - 1)
+
+    def test_set_same_value_returns_same_map(self):
+        """Test volver a ligar el mismo valor no crea un mapa nuevo."""
+        value = object()
+        hamt = Hamt([("a", value)])
+
+        self.assertIs(hamt.set("a", value), hamt)
+
+    def test_delete(self):
+        """Test borrar claves existentes y ausentes."""
+        hamt = Hamt((index, index) for index in range(100))
+
+        smaller = hamt.delete(50)
+
+        self.assertNotIn(50, smaller)
+        self.assertIn(50, hamt)
+        self.assertEqual(len(smaller), 99)
+        self.assertIs(smaller.delete(50), smaller)
+
+    def test_full_hash_collisions(self):
+        """Test claves distintas con el mismo hash conviven y se borran."""
+        first, second, third = CollidingKey("x", 7), CollidingKey("y", 7), CollidingKey("z", 7 + (1 << 40))
+
+        hamt = Hamt().set(first, 1).set(second, 2).set(third, 3)
+
+        self.assertEqual((hamt.get(first), hamt.get(second), hamt.get(third)), (1, 2, 3))
+        hamt = hamt.delete(first)
+        self.assertIsNone(hamt.get(first))
+        self.assertEqual(hamt.get(second), 2)
+        self.assertEqual(len(hamt), 2)
+
+    def test_matches_dict_under_random_operations(self):
+        """Test una secuencia aleatoria de operaciones equivale a un dict."""
+        rng = random.Random(7)
+        hamt, expected = Hamt(), {}
+        for _ in range(5000):
+            key = rng.randrange(500)
+            if rng.random() < 0.6:
+                hamt = hamt.set(key, key * 2)
+                expected[key] = key * 2
+            else:
+                hamt = hamt.delete(key)
+                expected.pop(key, None)
+
+        self.assertEqual(len(hamt), len(expected))
+        self.assertEqual(dict(hamt.items()), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
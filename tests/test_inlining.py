@@ -0,0 +1,134 @@
+"""Tests para la pasada de inlining de funciones pequeñas."""
+
+import unittest
+
+import src.astNode as ast
+from src.builtins import OutputSink
+from src.interpreter import Interpreter
+from src.lexer.lexer import Lexer
+from src.optimizer import Inliner, inline_functions
+from src.parser.parser_core import Parser
+
+
+def parse(source: str) -> ast.Program:
+    parser = Parser(Lexer(source))
+    program = parser.parse_program()
+    assert not parser.errors, parser.errors
+    return program
+
+
+def run(program: ast.Program):
+    output = OutputSink.capture()
+    result = Interpreter(output=output).interpret(program)
+    return result.inspect() if result is not None else None, output.getvalue()
+
+
+def assert_equivalent(test: unittest.TestCase, source: str, **options):
+    """Inlinea `source` y comprueba que da lo mismo que sin inlinear; devuelve programa e informe."""
+    program = parse(source)
+    report = inline_functions(program, **options)
+    test.assertEqual(run(program), run(parse(source)))
+    return program, report
+
+
+class TestInliner(unittest.TestCase):
+    """Test suite para inline_functions."""
+
+    def test_small_functions_are_inlined(self):
+        """Test las llamadas a funciones de una expresión se sustituyen por su cuerpo."""
+        program, report = assert_equivalent(self, '''
+            let k = 10;
+            let cuadrado = function(x) { x * x };
+            let suma = function(a, b) { return a + b + k; };
+            let y = 3;
+            [cuadrado(y), suma(y, 4), cuadrado(4)];
+        ''')
+
+        self.assertEqual(report.sites, {'cuadrado': 2, 'suma': 1})
+        self.assertEqual(str(program.statements[-1]), '[(y * y), ((y + 4) + k), (4 * 4)]')
+
+    def test_chains_are_flattened_in_one_pass(self):
+        """Test una función pequeña que llama a otra ya inlineada se aplana en su definición."""
+        program, report = assert_equivalent(self, '''
+            let doble = function(x) { x * 2 };
+            let mas_uno = function(x) { doble(x) + 1 };
+            mas_uno(5);
+        ''')
+
+        self.assertEqual(report.inlined, 2)
+        self.assertEqual(str(program.statements[-1]), '((5 * 2) + 1)')
+
+    def test_shadowed_free_names_block_inlining(self):
+        """Test no se inlinea donde un nombre libre del cuerpo se resolvería a otra variable."""
+        program, report = assert_equivalent(self, '''
+            let k = 1;
+            let f = function(x) { x + k };
+            let g = function(k) { f(k) };
+            let h = function(y) { f(y) };
+            [g(5), h(5)];
+        ''')
+
+        self.assertEqual(report.sites, {'f': 1, 'g': 1, 'h': 1})
+        self.assertEqual(report.skipped, 1)
+        self.assertEqual(str(program.statements[2].value.body), 'f(k)')
+        self.assertEqual(str(program.statements[-1]), '[f(5), (5 + k)]')
+
+    def test_unsafe_candidates_and_arguments_are_kept(self):
+        """Test recursivas, religadas, multi-sentencia y argumentos compuestos dudosos no se tocan."""
+        source = '''
+            let fact = function(n) { if (n < 2) { 1 } else { n * fact(n - 1) } };
+            let g = function(x) { x + 1 };
+            let g = function(x) { x + 2 };
+            let larga = function(x) { let y = x; y };
+            let dos_veces = function(x) { x + x };
+            let elige = function(c, a) { if (c) { a } else { 0 } };
+            let ruido = function(v) { print(v); v };
+            [fact(5), g(1), larga(3), dos_veces(ruido(2)), elige(false, ruido(3)), dos_veces(1, 2)];
+        '''
+        _, report = assert_equivalent(self, source)
+
+        self.assertEqual(report.sites, {})
+        self.assertEqual(report.skipped, 3)
+
+    def test_single_compound_argument_used_once(self):
+        """Test un argumento compuesto se inlinea si se evalúa una sola vez y sin reordenar efectos."""
+        program, report = assert_equivalent(self, '''
+            let ruido = function(v) { print(v); v };
+            let incremento = function(x, y) { x + y };
+            incremento(ruido(1), 2);
+        ''')
+
+        self.assertEqual(report.sites, {'incremento': 1})
+        self.assertEqual(str(program.statements[-1]), '(ruido(1) + 2)')
+
+    def test_size_limit_and_definition_order(self):
+        """Test se respeta max_body_nodes y no se inlinea antes de la definición."""
+        source = '''
+            let antes = function() { tarde(1) };
+            let tarde = function(x) { x + x + x + x };
+            [antes(), tarde(2)];
+        '''
+        _, small = assert_equivalent(self, source, max_body_nodes=2)
+        _, large = assert_equivalent(self, source)
+
+        self.assertEqual(small.inlined, 0)
+        self.assertEqual(large.sites, {'tarde': 1, 'antes': 1})
+        with self.assertRaises(ValueError):
+            Inliner(max_body_nodes=0)
+
+    def test_functions_declared_inside_functions(self):
+        """Test las funciones locales se inlinean en su cuerpo y en las funciones anidadas posteriores."""
+        _, report = assert_equivalent(self, '''
+            let externa = function(a) {
+                let escala = function(x) { x * a };
+                let interna = function(b) { escala(b) + escala(2) };
+                interna(3) + escala(4)
+            };
+            externa(5);
+        ''')
+
+        self.assertEqual(report.sites['escala'], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
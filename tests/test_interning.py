@@ -0,0 +1,115 @@
+"""Tests para el hash-consing de subárboles del AST."""
+
+import unittest
+
+import src.astNode as ast
+from src.builtins import OutputSink
+from src.interpreter import Interpreter
+from src.lexer.lexer import Lexer
+from src.parser.parser_core import Parser
+
+
+def parse(source: str) -> ast.Program:
+    parser = Parser(Lexer(source))
+    program = parser.parse_program()
+    assert not parser.errors, parser.errors
+    return program
+
+
+def value_of(statement: ast.Statement) -> ast.Expression:
+    return statement.value if type(statement) is ast.LetStatement else statement.expression
+
+
+class TestInterner(unittest.TestCase):
+    """Test suite para Interner."""
+
+    def test_repeated_expressions_are_stored_once(self):
+        """Test subexpresiones iguales pasan a ser el mismo nodo y se informa del ahorro."""
+        program = parse('let a = x * 2 + 1; let b = x * 2 + 1; let c = (x * 2) - 7;')
+        text = str(program)
+
+        report = ast.intern_tree(program)
+
+        first, second, third = (value_of(statement) for statement in program.statements)
+        self.assertIs(first, second)
+        self.assertIs(first.left, third.left)
+        self.assertEqual(str(program), text)
+        self.assertGreater(report.shared, 0)
+        self.assertLess(report.nodes_after, report.nodes_before)
+        self.assertGreater(report.saved_bytes, 0)
+
+    def test_results_are_unchanged(self):
+        """Test el programa internado da el mismo resultado y la misma salida."""
+        source = '''
+            let cuadrado = function(n) { n * n };
+            let cubo = function(n) { n * n * n };
+            let otro = function(n) { n * n };
+            let f = function(a) { let g = function() { a * 2 }; g() };
+            let h = function(b) { let g = function() { a * 2 }; let a = b + 1; g() };
+            print(cuadrado(3) + otro(4) + cubo(2));
+            [f(5), h(5)];
+        '''
+        expected_output = OutputSink.capture()
+        expected = Interpreter(output=expected_output).interpret(parse(source))
+        program = parse(source)
+        ast.intern_tree(program)
+        output = OutputSink.capture()
+
+        result = Interpreter(output=output, memoize=True).interpret(program)
+
+        self.assertEqual(result.inspect(), expected.inspect())
+        self.assertEqual(output.getvalue(), expected_output.getvalue())
+
+    def test_top_level_functions_are_shared_whole(self):
+        """Test dos literales de función iguales fuera de otras funciones son el mismo nodo."""
+        program = parse('let f = function(n) { n + 1 }; let g = function(n) { n + 1 };')
+
+        ast.intern_tree(program)
+
+        self.assertIs(program.statements[0].value, program.statements[1].value)
+
+    def test_context_dependent_nodes_are_not_shared(self):
+        """Test los cuerpos con otros parámetros y las funciones anidadas siguen siendo propios."""
+        program = parse('''
+            let f = function(x) { x + y };
+            let g = function(y) { x + y };
+            let p = function(a) { let k = function() { a }; k };
+            let q = function(b) { let k = function() { a }; b };
+        ''')
+
+        ast.intern_tree(program)
+
+        f, g, p, q = (statement.value for statement in program.statements)
+        self.assertIsNot(f.body, g.body)
+        self.assertIs(f.body.statements[0], g.body.statements[0])
+        self.assertIsNot(p.body.statements[0].value, q.body.statements[0].value)
+        self.assertIs(p.body.statements[0].value.body.statements[0],
+                      q.body.statements[0].value.body.statements[0])
+
+    def test_interner_shares_across_programs(self):
+        """Test una misma tabla comparte subárboles entre programas y repetir la pasada no cambia nada."""
+        interner = ast.Interner()
+        first = parse('let r = [1, 2, 3];')
+        second = parse('[1, 2, 3];')
+
+        interner.intern(first)
+        interner.intern(second)
+        again = interner.intern(second)
+
+        self.assertIs(first.statements[0].value, second.statements[0].expression)
+        self.assertEqual(again.shared, 0)
+
+    def test_structural_hash_survives_interning(self):
+        """Test el hash estructural del programa no cambia y coincide entre nodos compartidos."""
+        program = parse('let a = len([1, 2]); let b = len([1, 2]);')
+        before = ast.structural_hash(program)
+
+        ast.intern_tree(program)
+
+        self.assertEqual(ast.structural_hash(program), before)
+        self.assertEqual(ast.structural_hash(program.statements[0].value),
+                         ast.structural_hash(parse('len([1, 2]);').statements[0].expression))
+
+
+if __name__ == '__main__':
+    unittest.main()
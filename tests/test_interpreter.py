@@ -0,0 +1,175 @@
+"""Tests para Interpreter: contextos de ejecución, uso desde varios hilos e instantáneas de preludio."""
+
+from concurrent.futures import ThreadPoolExecutor
+import io
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import src.astNode as ast
+from src.builtins import OutputSink
+from src.config.object import Error, LazyIterator
+from src.interpreter.interpreter import Interpreter
+from src.lexer.lexer import Lexer
+from src.parser.parser_core import Parser
+
+
+def parse(source: str) -> ast.Program:
+    parser = Parser(Lexer(source))
+    program = parser.parse_program()
+    assert not parser.errors, parser.errors
+    return program
+
+
+PROGRAM = parse('''
+    let fib = function(n) { if (n < 2) { return n; } return fib(n - 1) + fib(n - 2); };
+    let total = 0;
+    for (i in range(12)) { let total = total + fib(i); }
+    print(total);
+    total;
+''')
+
+
+class TestInterpreterContexts(unittest.TestCase):
+    """Test suite para la ejecución concurrente de un mismo Program."""
+
+    def test_concurrent_runs_share_program_and_interpreter(self):
+        """Test varios hilos ejecutan el mismo Program con el mismo Interpreter sin interferir."""
+        interpreter = Interpreter(memoize=True, output=OutputSink.capture())
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: interpreter.interpret(PROGRAM), range(32)))
+
+        self.assertTrue(all(result.value == 232 for result in results), [r.inspect() for r in results])
+        self.assertEqual(interpreter.output.getvalue(), "232\n" * 32)
+
+    def test_concurrent_limits_are_per_run(self):
+        """Test el fuel de una ejecución no afecta a las que corren a la vez."""
+        interpreter = Interpreter(output=OutputSink.capture())
+        endless = parse('while (true) { 1; }')
+
+        def run(index):
+            if index % 2:
+                return interpreter.interpret(endless, fuel=2000)
+            return interpreter.interpret(PROGRAM)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(run, range(16)))
+
+        for index, result in enumerate(results):
+            if index % 2:
+                self.assertIsInstance(result, Error)
+            else:
+                self.assertEqual(result.value, 232)
+
+    def test_output_can_be_redirected_per_run(self):
+        """Test interpret(output=...) escribe solo esa ejecución en el destino dado."""
+        interpreter = Interpreter(output=OutputSink.capture())
+        target = io.StringIO()
+
+        interpreter.interpret(PROGRAM, output=target)
+        interpreter.interpret(PROGRAM)
+
+        self.assertEqual(target.getvalue(), "232\n")
+        self.assertEqual(interpreter.output.getvalue(), "232\n")
+
+    def test_output_path_is_closed_after_each_run(self):
+        """Test interpret(output=<ruta>) no deja abierto el fichero tras cada ejecución."""
+        interpreter = Interpreter(output=OutputSink.capture())
+        handles = []
+
+        def tracked_open(*args, **kwargs):
+            handles.append(open(*args, **kwargs))
+            return handles[-1]
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "salida.txt")
+            with patch('src.builtins.output.open', tracked_open, create=True):
+                interpreter.interpret(PROGRAM, output=path)
+                interpreter.interpret(PROGRAM, output=path)
+
+            with open(path, encoding="utf-8") as handle:
+                self.assertEqual(handle.read(), "232\n" * 2)
+        self.assertEqual(len(handles), 2)
+        self.assertTrue(all(handle.closed for handle in handles))
+
+    def test_contexts_are_reused_between_runs(self):
+        """Test ejecuciones sucesivas reutilizan el contexto (y su pool de marcos)."""
+        interpreter = Interpreter(output=OutputSink.capture())
+
+        interpreter.interpret(PROGRAM)
+        allocated = interpreter.frame_stats.allocated
+        interpreter.interpret(PROGRAM)
+
+        self.assertEqual(interpreter.frame_stats.allocated, allocated)
+
+    def test_returned_generator_keeps_its_context(self):
+        """Test un generador devuelto sigue funcionando tras otras ejecuciones."""
+        interpreter = Interpreter(output=OutputSink.capture())
+        generator = interpreter.interpret(parse('let g = function() { yield 1; yield 2; }; g();'))
+
+        interpreter.interpret(PROGRAM)
+
+        self.assertIsInstance(generator, LazyIterator)
+        self.assertEqual([item.value for item in generator], [1, 2])
+
+
+class TestPreludeSnapshot(unittest.TestCase):
+    """Test suite para Interpreter.snapshot e interpret(prelude=...)."""
+
+    def setUp(self):
+        self.interpreter = Interpreter(output=OutputSink.capture())
+        self.prelude = self.interpreter.snapshot(parse('''
+            let doble = function(x) { x * 2 };
+            let fib = function(n) { if (n < 2) { return n; } return fib(n - 1) + fib(n - 2); };
+            let base = 10;
+        '''))
+
+    def test_runs_see_prelude_definitions(self):
+        """Test el programa usa las funciones del preludio sin volver a evaluarlo."""
+        result = self.interpreter.interpret(parse('doble(fib(10)) + base;'), prelude=self.prelude)
+
+        self.assertEqual(result.value, 120)
+
+    def test_run_bindings_do_not_leak_into_snapshot(self):
+        """Test los let de una ejecución (incluidos los que ocultan el preludio) no los ve la siguiente."""
+        shadowed = self.interpreter.interpret(parse('let base = 1; let nuevo = 2; base;'), prelude=self.prelude)
+        after = self.interpreter.interpret(parse('base;'), prelude=self.prelude)
+        missing = self.interpreter.interpret(parse('nuevo;'), prelude=self.prelude)
+
+        self.assertEqual(shadowed.value, 1)
+        self.assertEqual(after.value, 10)
+        self.assertIsInstance(missing, Error)
+
+    def test_run_functions_are_global_closures(self):
+        """Test las funciones recursivas y mutuamente recursivas del programa siguen funcionando."""
+        program = parse('''
+            let par = function(n) { if (n == 0) { return true; } return impar(n - 1); };
+            let impar = function(n) { if (n == 0) { return false; } return par(n - 1); };
+            par(base);
+        ''')
+
+        result = self.interpreter.interpret(program, prelude=self.prelude)
+
+        self.assertTrue(result.value)
+
+    def test_snapshot_is_read_only_and_rejects_failing_prelude(self):
+        """Test la instantánea no admite escrituras y un preludio con error lanza ValueError."""
+        with self.assertRaises(TypeError):
+            self.prelude.set("base", None)
+        with self.assertRaises(ValueError):
+            self.interpreter.snapshot(parse('let x = 1 + true;'))
+
+    def test_concurrent_runs_share_one_snapshot(self):
+        """Test varios hilos ejecutan sobre la misma instantánea sin interferir."""
+        program = parse('let base = base + 1; doble(base);')
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: self.interpreter.interpret(program, prelude=self.prelude), range(16)))
+
+        self.assertEqual([result.value for result in results], [22] * 16)
+
+
+if __name__ == "__main__":
+    unittest.main()
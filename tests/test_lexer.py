@@ -57,6 +57,20 @@ class LexerTest(TestCase):
 
         self.assertEqual(tokens, expected_tokens)
 
+    def test_brackets_and_colon(self) -> None:
+        source: str = '[1:]'
+        lexer: Lexer = Lexer(source)
+        tokens = self.collect_tokens(lexer, source)
+
+        expected_tokens: List[Token] = [
+            Token(TokenType.LBRACKET, '['),
+            Token(TokenType.INT, '1'),
+            Token(TokenType.COLON, ':'),
+            Token(TokenType.RBRACKET, ']'),
+        ]
+
+        self.assertEqual(tokens, expected_tokens)
+
     def test_eof(self) -> None:
         source: str = 'a'
         lexer: Lexer = Lexer(source)
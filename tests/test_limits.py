@@ -0,0 +1,230 @@
+"""Tests para los límites de ejecución (fuel, tiempo máximo y memoria)."""
+
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import src.astNode as ast
+from src.builtins import OutputSink
+from src.config.object import Error, Integer, String
+from src.interpreter.interpreter import Interpreter
+from src.interpreter.limits import ExecutionBudget, LimitExceeded, MemoryQuota
+from src.lexer.lexer import Lexer
+from src.parser.parser_core import Parser
+
+
+def parse(source: str) -> ast.Program:
+    parser = Parser(Lexer(source))
+    program = parser.parse_program()
+    assert not parser.errors, parser.errors
+    return program
+
+
+class TestExecutionBudget(unittest.TestCase):
+    """Test suite para ExecutionBudget."""
+
+    def test_fuel_is_exhausted_exactly_after_the_last_step(self):
+        """Test con fuel N se permiten N pasos y el N+1 falla, sea cual sea el intervalo."""
+        for check_interval in (1, 3, 1024):
+            budget = ExecutionBudget(fuel=10, check_interval=check_interval)
+
+            for _ in range(10):
+                budget.tick()
+            with self.assertRaises(LimitExceeded) as raised:
+                budget.tick()
+
+            self.assertEqual(budget.steps, 10)
+            self.assertIn("10", raised.exception.error.message)
+
+    def test_steps_counts_ticks_between_checkpoints(self):
+        """Test steps refleja los pasos consumidos aunque no haya pasado por un control."""
+        budget = ExecutionBudget(check_interval=4)
+
+        for _ in range(9):
+            budget.tick()
+
+        self.assertEqual(budget.steps, 9)
+
+    def test_expired_deadline_is_detected_at_the_next_checkpoint(self):
+        """Test con timeout 0 el límite salta en el primer control del reloj."""
+        budget = ExecutionBudget(timeout=0, check_interval=2)
+
+        budget.tick()
+        budget.tick()
+        with self.assertRaises(LimitExceeded):
+            budget.tick()
+
+
+class TestInterpretLimits(unittest.TestCase):
+    """Test suite para los límites en Interpreter.interpret."""
+
+    def setUp(self):
+        self.interpreter = Interpreter(output=OutputSink.capture())
+
+    def test_infinite_loop_returns_fuel_error(self):
+        """Test un while infinito termina con un Error al agotar el fuel."""
+        result = self.interpreter.interpret(parse('while (true) { 1; }'), fuel=5000)
+
+        self.assertIsInstance(result, Error)
+        self.assertIn("5000", result.message)
+
+    def test_infinite_loop_returns_deadline_error(self):
+        """Test un while infinito termina con un Error al vencer el tiempo."""
+        result = self.interpreter.interpret(parse('while (true) { 1; }'), timeout=0.05)
+
+        self.assertIsInstance(result, Error)
+        self.assertIn("Tiempo", result.message)
+
+    def test_runaway_recursion_returns_error(self):
+        """Test una recursión sin caso base devuelve un Error en lugar de lanzar."""
+        program = parse('let f = function(n) { f(n + 1) }; f(0);')
+
+        result = self.interpreter.interpret(program)
+
+        self.assertIsInstance(result, Error)
+
+    def test_program_within_limits_is_unaffected(self):
+        """Test un programa que cabe en el presupuesto da el mismo resultado que sin límites."""
+        program = parse('''
+            let fib = function(n) { if (n < 2) { return n; } fib(n - 1) + fib(n - 2) };
+            let total = 0;
+            for (i in range(5)) { let total = total + fib(i); }
+            total;
+        ''')
+
+        result = self.interpreter.interpret(program, fuel=10_000, timeout=10)
+
+        self.assertIsInstance(result, Integer)
+        self.assertEqual(result.value, 7)
+
+    def test_limits_apply_to_a_single_run(self):
+        """Test el presupuesto de una ejecución no afecta a la siguiente."""
+        program = parse('let i = 0; while (i < 100) { let i = i + 1; } i;')
+
+        limited = self.interpreter.interpret(program, fuel=10)
+        unlimited = self.interpreter.interpret(program)
+
+        self.assertIsInstance(limited, Error)
+        self.assertEqual(unlimited.value, 100)
+
+    def test_generator_loops_consume_fuel(self):
+        """Test los bucles dentro de un generador también cuentan pasos."""
+        program = parse('''
+            let g = function() { while (true) { yield 1; } };
+            sum(g());
+        ''')
+
+        result = self.interpreter.interpret(program, fuel=1000)
+
+        self.assertIsInstance(result, Error)
+
+
+class TestMemoryQuota(unittest.TestCase):
+    """Test suite para MemoryQuota."""
+
+    def test_frames_are_refunded_on_release(self):
+        """Test un marco liberado deja de contar pero el pico lo recuerda."""
+        quota = MemoryQuota()
+
+        quota.acquire_frame()
+        quota.acquire_frame()
+        quota.release_frame()
+        quota.release_frame()
+
+        environment = quota.report().by_type["Environment"]
+        self.assertEqual(quota.current, 0)
+        self.assertEqual(environment.count, 2)
+        self.assertEqual(environment.peak, 2 * MemoryQuota.ENVIRONMENT_BYTES)
+
+    def test_rope_longer_than_the_quota_is_rejected(self):
+        """Test una cadena rope cuesta su nodo, pero no puede ser más larga que la cuota."""
+        quota = MemoryQuota(limit=1000)
+        half = String("x" * 600)
+        quota.charge_value(half)
+
+        with self.assertRaises(LimitExceeded):
+            quota.charge_value(String.concat(half, half))
+
+    def test_untracked_values_are_ignored(self):
+        """Test solo se contabilizan Integer y String."""
+        quota = MemoryQuota(limit=0)
+
+        quota.charge_value(Error("x"))
+        quota.charge_value(None)
+
+        self.assertEqual(quota.current, 0)
+
+
+class TestInterpretMemory(unittest.TestCase):
+    """Test suite para la cuota de memoria en Interpreter.interpret."""
+
+    def test_string_doubling_exceeds_quota(self):
+        """Test duplicar una cadena en bucle aborta con un Error de cuota."""
+        interpreter = Interpreter(output=OutputSink.capture())
+        program = parse("let s = 'a'; while (true) { let s = s + s; }")
+
+        result = interpreter.interpret(program, memory_limit=1_000_000)
+
+        self.assertIsInstance(result, Error)
+        self.assertIn("memoria", result.message)
+
+    def test_deep_recursion_exceeds_quota(self):
+        """Test una cadena de marcos profunda agota la cuota antes que la pila."""
+        interpreter = Interpreter(output=OutputSink.capture())
+        program = parse('let f = function(n) { if (n == 0) { return 0; } f(n - 1) }; f(200);')
+
+        result = interpreter.interpret(program, memory_limit=20 * MemoryQuota.ENVIRONMENT_BYTES)
+
+        self.assertIsInstance(result, Error)
+        self.assertLess(interpreter.memory_report.by_type["Environment"].count, 20)
+
+    def test_report_records_peak_by_type(self):
+        """Test con track_memory se informa del uso por tipo tras la ejecución."""
+        interpreter = Interpreter(output=OutputSink.capture(), track_memory=True)
+        program = parse('''
+            let f = function(n) { if (n == 0) { return 0; } 1 + f(n - 1) };
+            f(10);
+            f(10);
+        ''')
+
+        result = interpreter.interpret(program)
+
+        report = interpreter.memory_report
+        environment = report.by_type["Environment"]
+        self.assertEqual(result.value, 10)
+        self.assertEqual(environment.count, 22)
+        self.assertEqual(environment.live, 0)
+        self.assertEqual(environment.peak, 11 * MemoryQuota.ENVIRONMENT_BYTES)
+        self.assertGreater(report.by_type["Integer"].allocated, 0)
+        self.assertGreaterEqual(report.peak, environment.peak)
+
+    def test_report_is_per_thread(self):
+        """Test dos hilos que ejecutan a la vez con el mismo intérprete ven cada uno su informe."""
+        interpreter = Interpreter(output=OutputSink.capture(), track_memory=True)
+        programs = [
+            parse('let f = function(n) { if (n == 0) { return 0; } 1 + f(n - 1) }; f(10);'),
+            parse('let f = function(n) { n }; f(1);'),
+        ]
+        both_done = threading.Barrier(len(programs))
+
+        def run(program):
+            interpreter.interpret(program)
+            both_done.wait()
+            return interpreter.memory_report.by_type["Environment"].count
+
+        with ThreadPoolExecutor(max_workers=len(programs)) as pool:
+            counts = list(pool.map(run, programs))
+
+        self.assertEqual(counts, [11, 1])
+
+    def test_no_report_without_tracking(self):
+        """Test sin límite ni track_memory no se contabiliza nada."""
+        interpreter = Interpreter(output=OutputSink.capture())
+
+        interpreter.interpret(parse('1 + 2;'))
+
+        self.assertIsNone(interpreter.memory_report)
+
+
+if __name__ == "__main__":
+    unittest.main()
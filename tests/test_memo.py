@@ -0,0 +1,220 @@
+"""Tests para la memoización de funciones puras."""
+
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import src.astNode as ast
+from src.lexer.lexer import Lexer
+from src.parser.parser_core import Parser
+from src.config.environment import Environment
+from src.config.object import Function, Integer, String
+from src.interpreter.interpreter import Interpreter
+from src.interpreter.memo import MemoTable
+from src.interpreter.purity import PurityAnalyzer
+
+
+def parse(source: str) -> ast.Program:
+    parser = Parser(Lexer(source))
+    program = parser.parse_program()
+    assert not parser.errors, parser.errors
+    return program
+
+
+class TestPurityAnalyzer(unittest.TestCase):
+    """Test suite para PurityAnalyzer."""
+
+    def setUp(self):
+        self.analyzer = PurityAnalyzer()
+
+    def _function(self, source: str) -> ast.Function:
+        statement = parse(source).statements[0]
+        return statement.value
+
+    def test_arithmetic_over_parameters_is_pure(self):
+        """Test función que solo usa sus parámetros."""
+        info = self.analyzer.analyze_function(self._function('let f = function(x, y) { return x * y + 1; };'))
+
+        self.assertTrue(info.pure)
+        self.assertEqual(info.callees, frozenset())
+
+    def test_free_variable_read_is_impure(self):
+        """Test función que lee una variable libre."""
+        info = self.analyzer.analyze_function(self._function('let f = function(x) { return x + k; };'))
+
+        self.assertFalse(info.pure)
+
+    def test_free_calls_are_recorded_as_callees(self):
+        """Test llamadas a funciones libres quedan como dependencias."""
+        info = self.analyzer.analyze_function(self._function('let f = function(x) { let y = g(x); return h(y); };'))
+
+        self.assertTrue(info.pure)
+        self.assertEqual(info.callees, frozenset({'g', 'h'}))
+
+    def test_nested_function_literal_is_impure(self):
+        """Test funciones anidadas se consideran impuras."""
+        info = self.analyzer.analyze_function(self._function('let f = function(x) { return function(y) { return y; }; };'))
+
+        self.assertFalse(info.pure)
+
+    def test_names_bound_later_or_in_a_branch_are_not_local(self):
+        """Test leer un nombre antes de su let o ligado solo en una rama lee la variable libre."""
+        later = self.analyzer.analyze_function(self._function('let f = function(n) { let r = x; let x = 5; r + n };'))
+        branch = self.analyzer.analyze_function(
+            self._function('let f = function(n) { if (n > 100) { let x = 0; } x + n };'))
+        bound = self.analyzer.analyze_function(self._function('let f = function(n) { let x = 5; let r = x; r + n };'))
+
+        self.assertFalse(later.pure)
+        self.assertFalse(branch.pure)
+        self.assertTrue(bound.pure)
+
+    def test_result_is_cached_per_body(self):
+        """Test el veredicto se cachea por cuerpo."""
+        function_node = self._function('let f = function(x) { return x; };')
+
+        first = self.analyzer.analyze_function(function_node)
+        second = self.analyzer.analyze_function(function_node)
+
+        self.assertIs(first, second)
+
+
+class TestMemoTable(unittest.TestCase):
+    """Test suite para MemoTable."""
+
+    def setUp(self):
+        self.environment = Environment()
+        program = parse('let f = function(x) { return x + 1; };')
+        self.function_node = program.statements[0].value
+        self.function = Function(self.function_node.parameters, self.function_node.body, self.environment)
+        self.environment.set('f', self.function)
+
+    def test_from_policy(self):
+        """Test construcción desde la política memoize=."""
+        self.assertIsNone(MemoTable.from_policy(False))
+        self.assertIsNone(MemoTable.from_policy(None))
+        self.assertEqual(MemoTable.from_policy(True).max_size, MemoTable.DEFAULT_SIZE)
+        self.assertEqual(MemoTable.from_policy(8).max_size, 8)
+        table = MemoTable()
+        self.assertIs(MemoTable.from_policy(table), table)
+
+    def test_key_distinguishes_argument_types(self):
+        """Test la clave distingue tipos de argumentos con igual valor Python."""
+        table = MemoTable()
+
+        integer_key = table.key_for(self.function, [Integer(1)])
+        string_key = table.key_for(self.function, [String("1")])
+
+        self.assertIsNotNone(integer_key)
+        self.assertNotEqual(integer_key, string_key)
+
+    def test_non_primitive_arguments_are_uncacheable(self):
+        """Test argumentos función no son memorizables."""
+        table = MemoTable()
+
+        key = table.key_for(self.function, [self.function])
+
+        self.assertIsNone(key)
+        self.assertEqual(table.stats.uncacheable, 1)
+
+    def test_uncacheable_count_is_exact_across_threads(self):
+        """Test el contador de no memorizables no pierde incrementos con varios hilos."""
+        table = MemoTable()
+
+        def lookups(_):
+            for _ in range(500):
+                table.key_for(self.function, [self.function])
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lookups, range(8)))
+
+        self.assertEqual(table.stats.uncacheable, 8 * 500)
+
+    def test_lru_eviction(self):
+        """Test se expulsa la entrada menos usada recientemente."""
+        table = MemoTable(max_size=2)
+        keys = [table.key_for(self.function, [Integer(n)]) for n in range(3)]
+
+        table.put(keys[0], Integer(1))
+        table.put(keys[1], Integer(2))
+        table.get(keys[0])
+        table.put(keys[2], Integer(3))
+
+        self.assertEqual(len(table), 2)
+        self.assertEqual(table.stats.evictions, 1)
+        self.assertIsNone(table.get(keys[1]))
+        self.assertEqual(table.get(keys[0]).value, 1)
+
+
+class TestInterpreterMemoize(unittest.TestCase):
+    """Tests de integración de la política memoize= del intérprete."""
+
+    SOURCE = '''
+        let square = function(x) { return x * x; };
+        let twice = function(a) { return square(a) + square(a); };
+        twice(3) + twice(3);
+    '''
+
+    def test_memoization_disabled_by_default(self):
+        """Test por defecto no hay memoización."""
+        interpreter = Interpreter()
+
+        result = interpreter.interpret(parse(self.SOURCE))
+
+        self.assertEqual(result.value, 36)
+        self.assertIsNone(interpreter.memo_stats)
+
+    def test_pure_calls_are_memoized(self):
+        """Test las llamadas repetidas a funciones puras se sirven de la caché."""
+        interpreter = Interpreter(memoize=True)
+
+        result = interpreter.interpret(parse(self.SOURCE))
+
+        self.assertEqual(result.value, 36)
+        self.assertEqual(interpreter.memo_stats.misses, 2)
+        self.assertEqual(interpreter.memo_stats.hits, 2)
+
+    def test_impure_function_is_not_memoized(self):
+        """Test funciones que leen variables libres no se memorizan."""
+        interpreter = Interpreter(memoize=True)
+        source = 'let k = 2; let f = function(x) { return x * k; }; f(1) + f(1);'
+
+        result = interpreter.interpret(parse(source))
+
+        self.assertEqual(result.value, 4)
+        self.assertEqual(interpreter.memo_stats.hits, 0)
+        self.assertEqual(interpreter.memo_stats.uncacheable, 2)
+
+    def test_rebinding_callee_invalidates_entries(self):
+        """Test volver a ligar un callee no devuelve resultados obsoletos."""
+        interpreter = Interpreter(memoize=True)
+        source = '''
+            let g = function(x) { return x + 1; };
+            let f = function(x) { return g(x); };
+            let first = f(1);
+            let g = function(x) { return x + 100; };
+            first + f(1);
+        '''
+
+        result = interpreter.interpret(parse(source))
+
+        self.assertEqual(result.value, 2 + 101)
+
+
+    def test_free_reads_shadowed_later_are_not_memoized(self):
+        """Test una lectura libre con el nombre de un let posterior o condicional no devuelve resultados obsoletos."""
+        bodies = [
+            'let r = x; let x = 5; r + n',
+            'if (n > 100) { let x = 0; } x + n',
+        ]
+        for body in bodies:
+            with self.subTest(body=body):
+                source = 'let x = 1; let f = function(n) { %s }; let a = f(1); let x = 100; f(1);' % body
+
+                plain = Interpreter().interpret(parse(source))
+                memoized = Interpreter(memoize=True).interpret(parse(source))
+
+                self.assertEqual(plain.value, 101)
+                self.assertEqual(memoized.value, 101)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,189 @@
+"""Tests para los objetos de runtime (src.config.object)."""
+
+import unittest
+
+from src.config.object import Array, Boolean, Error, Hash, Integer, String
+from src.interpreter.runtime import IndexOperations, InfixOperations, RuntimePrimitives
+
+
+class TestRopeString(unittest.TestCase):
+    """Test suite para la representación rope de String."""
+
+    def test_concat_of_large_strings_is_lazy(self):
+        """Test concatenar cadenas grandes no aplana."""
+        left = String("a" * 100)
+        right = String("b" * 100)
+
+        result = String.concat(left, right)
+
+        self.assertFalse(result.is_flat)
+        self.assertEqual(result.length, 200)
+
+    def test_small_concat_is_flat(self):
+        """Test concatenar cadenas pequeñas copia directamente."""
+        result = String.concat(String("ab"), String("cd"))
+
+        self.assertTrue(result.is_flat)
+        self.assertEqual(result.value, "abcd")
+
+    def test_value_flattens_once(self):
+        """Test leer value aplana y conserva el contenido."""
+        rope = String("x" * 70)
+        for _ in range(10):
+            rope = String.concat(rope, String("y" * 70))
+
+        value = rope.value
+
+        self.assertTrue(rope.is_flat)
+        self.assertEqual(value, "x" * 70 + "y" * 700)
+        self.assertIs(rope.value, value)
+
+    def test_deep_rope_flattens_without_recursion(self):
+        """Test un rope muy profundo se aplana iterativamente."""
+        rope = String("")
+        piece = String("z" * 65)
+        for _ in range(20000):
+            rope = String.concat(rope, piece)
+
+        self.assertEqual(rope.length, 65 * 20000)
+        self.assertEqual(rope.value, "z" * 65 * 20000)
+
+    def test_equals_without_flattening(self):
+        """Test la igualdad entre ropes con distinta forma no aplana."""
+        first = String.concat(String("a" * 65), String("b" * 65))
+        second = String.concat(String("a" * 30), String.concat(String("a" * 35), String("b" * 65)))
+        different = String.concat(String("a" * 65), String("c" * 65))
+
+        self.assertTrue(first.equals(second))
+        self.assertFalse(first.equals(different))
+        self.assertFalse(first.is_flat)
+        self.assertFalse(second.is_flat)
+
+    def test_equals_different_length_is_false(self):
+        """Test longitudes distintas no son iguales."""
+        self.assertFalse(String("abc").equals(String("abcd")))
+
+    def test_value_setter_resets_rope(self):
+        """Test asignar value reemplaza el contenido."""
+        rope = String.concat(String("a" * 65), String("b" * 65))
+
+        rope.value = "plain"
+
+        self.assertTrue(rope.is_flat)
+        self.assertEqual(rope.length, 5)
+
+    def test_string_infix_uses_ropes(self):
+        """Test el operador + del lenguaje produce ropes y == los compara."""
+        left = String("h" * 100)
+        right = String("w" * 100)
+
+        joined = InfixOperations.string_infix('+', left, right)
+        equal = InfixOperations.string_infix('==', joined, String("h" * 100 + "w" * 100))
+
+        self.assertFalse(joined.is_flat)
+        self.assertIs(equal, RuntimePrimitives.TRUE)
+
+
+class TestArray(unittest.TestCase):
+    """Test suite para Array y sus operaciones vectorizadas."""
+
+    def test_integer_array_is_typed(self):
+        """Test un arreglo de enteros usa almacenamiento array('q')."""
+        array = Array([Integer(1), Integer(2), Integer(3)])
+
+        self.assertTrue(array.is_typed)
+        self.assertEqual(list(array.ints), [1, 2, 3])
+        self.assertEqual(array.inspect(), "[1, 2, 3]")
+
+    def test_mixed_array_is_boxed(self):
+        """Test un arreglo heterogéneo guarda los objetos."""
+        array = Array([Integer(1), String("a")])
+
+        self.assertFalse(array.is_typed)
+        self.assertEqual(len(array), 2)
+        self.assertEqual(array.inspect(), "[1, a]")
+
+    def test_big_integers_fall_back_to_boxed(self):
+        """Test enteros fuera de 64 bits no rompen el arreglo."""
+        array = Array.from_ints([2 ** 70, 1])
+
+        self.assertFalse(array.is_typed)
+        self.assertEqual(array.get(0).value, 2 ** 70)
+
+    def test_elementwise_arithmetic(self):
+        """Test + y * entre arreglos y con escalares difundidos."""
+        left = Array.from_ints([1, 2, 3])
+        right = Array.from_ints([10, 20, 30])
+
+        added = InfixOperations.array_infix('+', left, right)
+        scaled = InfixOperations.array_infix('*', Integer(2), left)
+        divided = InfixOperations.array_infix('/', right, Integer(4))
+
+        self.assertEqual(list(added.ints), [11, 22, 33])
+        self.assertEqual(list(scaled.ints), [2, 4, 6])
+        self.assertEqual(list(divided.ints), [2, 5, 7])
+
+    def test_elementwise_comparison(self):
+        """Test las comparaciones producen un arreglo de booleanos."""
+        result = InfixOperations.array_infix('<', Array.from_ints([1, 5, 2]), Integer(3))
+
+        self.assertEqual(list(result), [RuntimePrimitives.TRUE, RuntimePrimitives.FALSE, RuntimePrimitives.TRUE])
+
+    def test_length_mismatch_is_error(self):
+        """Test operar arreglos de distinta longitud devuelve Error."""
+        result = InfixOperations.array_infix('+', Array.from_ints([1, 2]), Array.from_ints([1]))
+
+        self.assertIsInstance(result, Error)
+
+    def test_division_by_zero_element_is_error(self):
+        """Test dividir por un arreglo con ceros devuelve Error."""
+        result = InfixOperations.array_infix('/', Integer(10), Array.from_ints([1, 0]))
+
+        self.assertIsInstance(result, Error)
+
+    def test_boxed_arrays_do_not_broadcast(self):
+        """Test los arreglos no numéricos no admiten operaciones vectorizadas."""
+        result = InfixOperations.array_infix('+', Array([String("a")]), Integer(1))
+
+        self.assertIsInstance(result, Error)
+
+    def test_index(self):
+        """Test indexar admite negativos y reporta fuera de rango."""
+        array = Array.from_ints([4, 5, 6])
+
+        self.assertEqual(IndexOperations.index(array, Integer(-1)).value, 6)
+        self.assertIsInstance(IndexOperations.index(array, Integer(3)), Error)
+        self.assertIsInstance(IndexOperations.index(Integer(1), Integer(0)), Error)
+
+
+class TestHash(unittest.TestCase):
+    """Test suite para Hash."""
+
+    def test_keys_compare_by_content(self):
+        """Test claves iguales por contenido encuentran el mismo valor."""
+        mapping = Hash.from_pairs([(String("a"), Integer(1)), (Integer(2), String("dos"))])
+
+        self.assertEqual(mapping.get(String("a")).value, 1)
+        self.assertEqual(mapping.get(Integer(2)).value, "dos")
+        self.assertIsNone(mapping.get(Boolean(True)))
+
+    def test_set_keeps_value_semantics(self):
+        """Test set devuelve un mapa nuevo y conserva el original."""
+        original = Hash.from_pairs([(String("a"), Integer(1))])
+
+        updated = original.set(String("b"), Integer(2))
+
+        self.assertEqual(len(original), 1)
+        self.assertEqual(len(updated), 2)
+        self.assertEqual(original.inspect(), "{a: 1}")
+
+    def test_index_missing_key_is_null(self):
+        """Test indexar una clave ausente devuelve NULL y una no hashable Error."""
+        mapping = Hash.from_pairs([(Integer(1), Integer(2))])
+
+        self.assertIs(IndexOperations.index(mapping, Integer(3)), RuntimePrimitives.NULL)
+        self.assertIsInstance(IndexOperations.index(mapping, Array([])), Error)
+
+
+if __name__ == '__main__':
+    unittest.main()
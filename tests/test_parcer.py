@@ -17,7 +17,14 @@ from src.astNode import (
     ReturnStatement,
     Identifier,
     Integer,
-    Infix
+    Infix,
+    If,
+    WhileStatement,
+    ForStatement,
+    ArrayLiteral,
+    Index,
+    HashLiteral,
+    YieldStatement
 )
 import logging
 
@@ -221,6 +228,175 @@ class ParcerTest(TestCase):
         self.assertEqual(len(program.statements), expected_statement_count)
         self.assertIsInstance(program.statements[0], ExpressionStatement)
     
+    def test_if_else_expression(self) -> None:
+        """ test_if_else_expression:
+        This function is responsible for testing the if/else expression 
+        """
+        source: str = 'if (x < y) { x; } else { y; }'
+        lexer: Lexer = Lexer(source)
+        parser: Parser = Parser(lexer)
+
+        program: Program = parser.getProgram()
+
+        self.assertEqual(len(parser.errors), 0)
+        self.assertEqual(len(program.statements), 1)
+        expression = cast(ExpressionStatement, program.statements[0]).expression
+        self.assertIsInstance(expression, If)
+        expression = cast(If, expression)
+        self.assertIsInstance(expression.condition, Infix)
+        self.assertEqual(len(expression.consequence.statements), 1)
+        self.assertIsNotNone(expression.alternative)
+        self.assertEqual(len(expression.alternative.statements), 1)
+
+    def test_if_without_else_expression(self) -> None:
+        """ test_if_without_else_expression:
+        This function is responsible for testing the if expression without else 
+        """
+        source: str = 'if (true) { 1; }; 2;'
+        lexer: Lexer = Lexer(source)
+        parser: Parser = Parser(lexer)
+
+        program: Program = parser.getProgram()
+
+        self.assertEqual(len(parser.errors), 0)
+        self.assertEqual(len(program.statements), 2)
+        expression = cast(ExpressionStatement, program.statements[0]).expression
+        self.assertIsInstance(expression, If)
+        self.assertIsNone(cast(If, expression).alternative)
+
+    def test_while_statement(self) -> None:
+        """ test_while_statement:
+        This function is responsible for testing the while statement 
+        """
+        source: str = 'while (i < 10) { let i = i + 1; } i;'
+        lexer: Lexer = Lexer(source)
+        parser: Parser = Parser(lexer)
+
+        program: Program = parser.getProgram()
+
+        self.assertEqual(len(parser.errors), 0)
+        self.assertEqual(len(program.statements), 2)
+        statement = cast(WhileStatement, program.statements[0])
+        self.assertIsInstance(statement, WhileStatement)
+        self.assertIsInstance(statement.condition, Infix)
+        self.assertEqual(len(statement.body.statements), 1)
+
+    def test_for_statement(self) -> None:
+        """ test_for_statement:
+        This function is responsible for testing the for ... in statement 
+        """
+        source: str = 'for (x in range(0, 3)) { x; }'
+        lexer: Lexer = Lexer(source)
+        parser: Parser = Parser(lexer)
+
+        program: Program = parser.getProgram()
+
+        self.assertEqual(len(parser.errors), 0)
+        self.assertEqual(len(program.statements), 1)
+        statement = cast(ForStatement, program.statements[0])
+        self.assertIsInstance(statement, ForStatement)
+        self._test_identifier_expression(statement.variable, 'x')
+        self.assertEqual(str(statement.iterable), 'range(0, 3)')
+        self.assertEqual(len(statement.body.statements), 1)
+
+    def test_array_literal(self) -> None:
+        """ test_array_literal:
+        This function is responsible for testing the array literal expression 
+        """
+        source: str = '[1, 2 * 3, x];'
+        lexer: Lexer = Lexer(source)
+        parser: Parser = Parser(lexer)
+
+        program: Program = parser.getProgram()
+
+        self.assertEqual(len(parser.errors), 0)
+        expression_statement = cast(ExpressionStatement, program.statements[0])
+        array = cast(ArrayLiteral, expression_statement.expression)
+        self.assertIsInstance(array, ArrayLiteral)
+        self.assertEqual(len(array.elements), 3)
+        self._test_integer_expression(array.elements[0], 1)
+        self.assertEqual(str(array.elements[1]), '(2 * 3)')
+        self._test_identifier_expression(array.elements[2], 'x')
+
+    def test_empty_array_literal(self) -> None:
+        """ test_empty_array_literal:
+        This function is responsible for testing the empty array literal 
+        """
+        parser: Parser = Parser(Lexer('[];'))
+
+        program: Program = parser.getProgram()
+
+        self.assertEqual(len(parser.errors), 0)
+        array = cast(ExpressionStatement, program.statements[0]).expression
+        self.assertIsInstance(array, ArrayLiteral)
+        self.assertEqual(cast(ArrayLiteral, array).elements, [])
+
+    def test_index_expression(self) -> None:
+        """ test_index_expression:
+        This function is responsible for testing the index expression and its precedence 
+        """
+        source: str = 'a * xs[1 + 1]; f(x)[0];'
+        lexer: Lexer = Lexer(source)
+        parser: Parser = Parser(lexer)
+
+        program: Program = parser.getProgram()
+
+        self.assertEqual(len(parser.errors), 0)
+        product = cast(Infix, cast(ExpressionStatement, program.statements[0]).expression)
+        index = cast(Index, product.right)
+        self.assertIsInstance(index, Index)
+        self._test_identifier_expression(index.left, 'xs')
+        self.assertEqual(str(index.index), '(1 + 1)')
+        self.assertEqual(str(program.statements[1]), '(f(x)[0])')
+
+    def test_hash_literal(self) -> None:
+        """ test_hash_literal:
+        This function is responsible for testing the hash literal expression 
+        """
+        source: str = "{'uno': 1, 2: 1 + 1, true: x};"
+        lexer: Lexer = Lexer(source)
+        parser: Parser = Parser(lexer)
+
+        program: Program = parser.getProgram()
+
+        self.assertEqual(len(parser.errors), 0)
+        literal = cast(HashLiteral, cast(ExpressionStatement, program.statements[0]).expression)
+        self.assertIsInstance(literal, HashLiteral)
+        self.assertEqual(len(literal.pairs), 3)
+        self.assertEqual([str(key) for key, _ in literal.pairs], ['uno', '2', 'true'])
+        self.assertEqual(str(literal.pairs[1][1]), '(1 + 1)')
+
+    def test_empty_hash_literal(self) -> None:
+        """ test_empty_hash_literal:
+        This function is responsible for testing the empty hash literal 
+        """
+        parser: Parser = Parser(Lexer('{};'))
+
+        program: Program = parser.getProgram()
+
+        self.assertEqual(len(parser.errors), 0)
+        literal = cast(ExpressionStatement, program.statements[0]).expression
+        self.assertIsInstance(literal, HashLiteral)
+        self.assertEqual(cast(HashLiteral, literal).pairs, [])
+
+    def test_yield_statement(self) -> None:
+        """ test_yield_statement:
+        This function is responsible for testing the yield statement 
+        """
+        source: str = 'yield x * 2; yield 5;'
+        lexer: Lexer = Lexer(source)
+        parser: Parser = Parser(lexer)
+
+        program: Program = parser.getProgram()
+
+        self.assertEqual(len(parser.errors), 0)
+        self.assertEqual(len(program.statements), 2)
+        for statement in program.statements:
+            self.assertIsInstance(statement, YieldStatement)
+            self.assertEqual(statement.token_literal(), 'yield')
+        self.assertEqual(str(cast(YieldStatement, program.statements[0]).value), '(x * 2)')
+        self._test_integer_expression(cast(YieldStatement, program.statements[1]).value, 5)
+
     def _test_literal_expression(self, expression:Expression, value:Any) -> None:
         """ _test_literal_expression:
         This function is responsible for testing the literal expression 
@@ -0,0 +1,92 @@
+"""Tests para PreparedProgram y to_object."""
+
+from concurrent.futures import ThreadPoolExecutor
+import unittest
+
+import src.astNode as ast
+from src.builtins import OutputSink
+from src.config.object import Array, Error, Hash, Integer, String, TRUE
+from src.interpreter import Interpreter, PreparedProgram, to_object
+from src.lexer.lexer import Lexer
+from src.parser.parser_core import Parser
+
+
+def parse(source: str) -> ast.Program:
+    parser = Parser(Lexer(source))
+    program = parser.parse_program()
+    assert not parser.errors, parser.errors
+    return program
+
+
+RULE = parse('''
+    let limite = function(cliente) { if (cliente['vip']) { return 1000; } return 100; };
+    if (importe > limite(cliente)) { 'revisar' } else { 'aprobar' };
+''')
+
+
+class TestToObject(unittest.TestCase):
+    """Test suite para to_object."""
+
+    def test_converts_nested_python_values(self):
+        """Test escalares, listas y diccionarios se convierten recursivamente."""
+        value = to_object({"n": [1, "a", True, None]})
+
+        self.assertIsInstance(value, Hash)
+        elements = value.get(String("n"))
+        self.assertIsInstance(elements, Array)
+        self.assertEqual(elements.inspect(), '[1, a, true, null]')
+
+    def test_objects_pass_through_and_unknown_types_fail(self):
+        """Test los Object no se copian y los tipos sin equivalente lanzan TypeError."""
+        integer = Integer(3)
+
+        self.assertIs(to_object(integer), integer)
+        self.assertIs(to_object(True), TRUE)
+        with self.assertRaises(TypeError):
+            to_object(1.5)
+
+
+class TestPreparedProgram(unittest.TestCase):
+    """Test suite para PreparedProgram.run."""
+
+    def setUp(self):
+        self.prepared = PreparedProgram(RULE, ["cliente", "importe"], Interpreter(output=OutputSink.capture()))
+
+    def test_runs_with_different_bindings(self):
+        """Test el mismo programa se evalúa con entradas distintas en cada ejecución."""
+        results = [self.prepared.run({"cliente": {"vip": vip}, "importe": importe}).value
+                   for vip, importe in ((False, 50), (False, 500), (True, 500))]
+
+        self.assertEqual(results, ["aprobar", "revisar", "aprobar"])
+
+    def test_bindings_must_match_declared_inputs(self):
+        """Test faltan o sobran entradas: ValueError con los nombres."""
+        with self.assertRaisesRegex(ValueError, "importe"):
+            self.prepared.run({"cliente": {"vip": True}})
+        with self.assertRaisesRegex(ValueError, "otro"):
+            self.prepared.run({"cliente": {}, "importe": 1, "otro": 2})
+        with self.assertRaises(ValueError):
+            PreparedProgram(RULE, ["a", "a"])
+
+    def test_runs_are_independent_and_use_prelude(self):
+        """Test los let de una ejecución no llegan a la siguiente y se ven las funciones del preludio."""
+        interpreter = Interpreter(output=OutputSink.capture())
+        prelude = interpreter.snapshot(parse('let doble = function(x) { x * 2 };'))
+        prepared = PreparedProgram(parse('let previo = x; doble(x);'), ["x"], interpreter, prelude)
+        leaked = PreparedProgram(parse('previo;'), interpreter=interpreter, prelude=prelude)
+
+        self.assertEqual(prepared.run({"x": 21}).value, 42)
+        self.assertIsInstance(leaked.run(), Error)
+
+    def test_concurrent_runs(self):
+        """Test varios hilos ejecutan el mismo programa preparado con sus propias entradas."""
+        prepared = PreparedProgram(parse('x * x;'), ["x"], Interpreter(output=OutputSink.capture()))
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda x: prepared.run({"x": x}).value, range(50)))
+
+        self.assertEqual(results, [x * x for x in range(50)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+"""Tests para ResultCache y structural_hash."""
+
+import os
+import tempfile
+import unittest
+
+import src.astNode as ast
+from src.builtins import OutputSink
+from src.config.object import FALSE, NULL, TRUE, Array, Error, Hash, Integer, String
+from src.interpreter import Interpreter, PreparedProgram, ResultCache
+from src.interpreter.result_cache import Uncacheable, decode_value, encode_value
+from src.lexer.lexer import Lexer
+from src.parser.parser_core import Parser
+
+
+def parse(source: str) -> ast.Program:
+    parser = Parser(Lexer(source))
+    program = parser.parse_program()
+    assert not parser.errors, parser.errors
+    return program
+
+
+class TestStructuralHash(unittest.TestCase):
+    """Test suite para structural_hash."""
+
+    def test_same_structure_same_hash(self):
+        """Test fuentes que solo difieren en espacios dan el mismo hash."""
+        first = parse('let f = function(x) { x * 2 }; f(21);')
+        second = parse('let f=function(x){x*2};\n\nf( 21 );')
+
+        self.assertEqual(ast.structural_hash(first), ast.structural_hash(second))
+
+    def test_different_structure_different_hash(self):
+        """Test un operador o un literal distinto cambia el hash."""
+        base = ast.structural_hash(parse('1 + 2;'))
+
+        self.assertNotEqual(base, ast.structural_hash(parse('1 - 2;')))
+        self.assertNotEqual(base, ast.structural_hash(parse('1 + 3;')))
+        self.assertNotEqual(base, ast.structural_hash(parse("1 + '2';")))
+
+
+class TestValueEncoding(unittest.TestCase):
+    """Test suite para la codificación de valores de la caché."""
+
+    def test_round_trip_keeps_singletons(self):
+        """Test los valores de datos se reconstruyen y los booleanos y null son las instancias únicas."""
+        value = Hash.from_pairs([(String("a"), Array([Integer(1), TRUE, NULL])),
+                                 (Integer(2), Array.from_ints([1, 2, 3]))])
+
+        decoded = decode_value(encode_value(value))
+
+        self.assertEqual(decoded.inspect(), value.inspect())
+        self.assertIs(decode_value(encode_value(FALSE)), FALSE)
+        self.assertIs(decoded.get(String("a")).items[1], TRUE)
+
+    def test_functions_are_not_encodable(self):
+        """Test una función no puede guardarse ni formar parte de la clave."""
+        function = Interpreter().interpret(parse('function(x) { x };'))
+
+        with self.assertRaises(Uncacheable):
+            encode_value(Array([Integer(1), function]))
+
+
+class TestResultCache(unittest.TestCase):
+    """Test suite para ResultCache integrada en el intérprete."""
+
+    def test_repeated_execution_hits(self):
+        """Test la segunda ejecución del mismo programa se sirve de la caché."""
+        cache = ResultCache()
+        interpreter = Interpreter(result_cache=cache)
+
+        first = interpreter.interpret(parse('let f = function(n) { n * n }; f(12);'))
+        second = interpreter.interpret(parse('let f = function(n) { n * n };  f(12);'))
+
+        self.assertEqual(first.value, 144)
+        self.assertEqual(second.value, 144)
+        self.assertEqual((cache.stats.hits, cache.stats.misses, cache.stats.stores), (1, 1, 1))
+        self.assertEqual(cache.stats.hit_rate, 0.5)
+
+    def test_bindings_and_limits_are_part_of_the_key(self):
+        """Test entradas distintas o un fuel distinto no comparten resultado."""
+        cache = ResultCache()
+        prepared = PreparedProgram(parse('importe * 2;'), ["importe"], Interpreter(result_cache=cache))
+
+        results = [prepared.run({"importe": 1}).value, prepared.run({"importe": 2}).value,
+                   prepared.run({"importe": 1}, fuel=100).value, prepared.run({"importe": 2}).value]
+
+        self.assertEqual(results, [2, 4, 2, 4])
+        self.assertEqual(cache.stats.hits, 1)
+        self.assertEqual(cache.stats.misses, 3)
+
+    def test_nondeterministic_programs_are_not_cached(self):
+        """Test un programa que escribe salida se ejecuta siempre."""
+        sink = OutputSink.capture()
+        cache = ResultCache()
+        interpreter = Interpreter(output=sink, result_cache=cache)
+        program = parse("print('hola'); 1;")
+
+        interpreter.interpret(program)
+        interpreter.interpret(program)
+
+        self.assertEqual(sink.getvalue(), 'hola\nhola\n')
+        self.assertEqual(cache.stats.uncacheable, 2)
+        self.assertEqual(len(cache), 0)
+
+    def test_limit_errors_are_not_stored(self):
+        """Test un resultado cortado por el fuel no se guarda."""
+        cache = ResultCache()
+        interpreter = Interpreter(result_cache=cache)
+        program = parse('let f = function(n) { if (n == 0) { return 0; } f(n - 1) }; f(50);')
+
+        result = interpreter.interpret(program, fuel=10)
+
+        self.assertIsInstance(result, Error)
+        self.assertEqual(cache.stats.stores, 0)
+
+    def test_prelude_is_part_of_the_key(self):
+        """Test el mismo programa con preludios distintos no comparte resultado."""
+        cache = ResultCache()
+        interpreter = Interpreter(result_cache=cache)
+        doble = interpreter.snapshot(parse('let g = function(x) { x * 2 };'))
+        triple = interpreter.snapshot(parse('let g = function(x) { x * 3 };'))
+        program = parse('g(5);')
+
+        results = [interpreter.interpret(program, prelude=doble).value,
+                   interpreter.interpret(program, prelude=triple).value,
+                   interpreter.interpret(program, prelude=doble).value]
+
+        self.assertEqual(results, [10, 15, 10])
+        self.assertEqual(cache.stats.hits, 1)
+
+    def test_memory_tier_evicts_least_recently_used(self):
+        """Test al superar max_bytes se descarta la entrada usada hace más tiempo."""
+        cache = ResultCache(max_bytes=40)
+        interpreter = Interpreter(result_cache=cache)
+        programs = [parse(f"'{letter * 10}';") for letter in "abc"]
+
+        interpreter.interpret(programs[0])
+        interpreter.interpret(programs[1])
+        interpreter.interpret(programs[0])
+        interpreter.interpret(programs[2])
+        interpreter.interpret(programs[1])
+
+        self.assertLessEqual(cache.size_bytes, 40)
+        self.assertEqual(cache.stats.evictions, 2)
+        self.assertEqual(cache.stats.hits, 1)
+
+    def test_disk_tier_survives_instances(self):
+        """Test una caché nueva sobre el mismo fichero SQLite acierta desde disco."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "results.db")
+            program = parse("let h = {'a': [1, 2]}; h['a'];")
+            first = ResultCache(path=path)
+            Interpreter(result_cache=first).interpret(program)
+            first.close()
+
+            second = ResultCache(path=path)
+            result = Interpreter(result_cache=second).interpret(parse("let h = {'a': [1, 2]}; h['a'];"))
+            second.close()
+
+        self.assertEqual(result.inspect(), '[1, 2]')
+        self.assertEqual((second.stats.hits, second.stats.disk_hits), (1, 1))
+
+    def test_disk_tier_is_bounded(self):
+        """Test el nivel en disco respeta disk_max_bytes."""
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ResultCache(path=os.path.join(directory, "results.db"), disk_max_bytes=30)
+            interpreter = Interpreter(result_cache=cache)
+
+            for letter in "abcd":
+                interpreter.interpret(parse(f"'{letter * 10}';"))
+            stored = cache._db.execute("SELECT COUNT(*), SUM(size) FROM results").fetchone()
+            cache.close()
+
+        self.assertEqual(stored[0], 1)
+        self.assertLessEqual(stored[1], 30)
+
+
+if __name__ == '__main__':
+    unittest.main()
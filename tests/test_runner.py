@@ -0,0 +1,174 @@
+"""Tests para el ejecutor por lotes (src.runner)."""
+
+import json
+import multiprocessing
+import os
+import pickle
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.builtins import OutputSink
+from src.config.object import Function
+from src.interpreter.interpreter import Interpreter
+from src.runner import BatchRunner, Job, JobLimits, execute, load_jobs, parse_source
+from src.runner.forkserver import ForkServer, ForkServerClient
+
+
+class TestExecute(unittest.TestCase):
+    """Test suite para execute (lo que hace cada worker con un trabajo)."""
+
+    def setUp(self):
+        self.interpreter = Interpreter(output=OutputSink.capture())
+
+    def test_successful_job_reports_inspect_and_output(self):
+        """Test un trabajo correcto devuelve el valor en forma inspect() y su salida."""
+        result = execute(self.interpreter, Job("a", source="print('hola'); 6 * 7;"))
+
+        self.assertTrue(result.ok)
+        self.assertEqual(result.result, "42")
+        self.assertEqual(result.output, "hola\n")
+
+    def test_syntax_and_runtime_errors_are_reported(self):
+        """Test los errores de parseo y de ejecución van en `error`, sin lanzar."""
+        syntax = execute(self.interpreter, Job("s", source="let = ;"))
+        runtime = execute(self.interpreter, Job("r", source="1 + true;"))
+
+        self.assertFalse(syntax.ok)
+        self.assertIn("Expected", syntax.error)
+        self.assertFalse(runtime.ok)
+        self.assertIn("Discrepancia", runtime.error)
+
+    def test_function_results_and_formatting_failures(self):
+        """Test un resultado función se formatea y un fallo al formatear va en `error`, sin lanzar."""
+        job = Job("f", source="let f = function(x, y) { x }; f;")
+
+        function = execute(self.interpreter, job)
+        with patch.object(Function, "inspect", side_effect=TypeError("sin formato")):
+            failed = execute(self.interpreter, job)
+
+        self.assertTrue(function.ok)
+        self.assertEqual(function.result, "fn(x, y) x")
+        self.assertFalse(failed.ok)
+        self.assertEqual(failed.error, "TypeError: sin formato")
+
+    def test_serialized_ast_runs_like_source(self):
+        """Test un AST serializado con pickle da el mismo resultado que el fuente."""
+        program = pickle.dumps(parse_source("let f = function(n) { n * 2 }; f(21);"))
+
+        result = execute(self.interpreter, Job("p", program=program))
+
+        self.assertEqual(result.result, "42")
+
+    def test_prelude_snapshot_is_visible_to_job(self):
+        """Test el trabajo ve las definiciones de la instantánea de preludio."""
+        prelude = self.interpreter.snapshot(parse_source("let doble = function(x) { x * 2 };"))
+
+        result = execute(self.interpreter, Job("a", source="doble(21);"), prelude=prelude)
+
+        self.assertEqual(result.result, "42")
+
+    def test_limits_apply_per_job(self):
+        """Test el tiempo límite corta un trabajo sin afectar al siguiente."""
+        limits = JobLimits(timeout=0.05)
+
+        slow = execute(self.interpreter, Job("slow", source="while (true) { 1; }"), limits)
+        fast = execute(self.interpreter, Job("fast", source="1;"), limits)
+
+        self.assertFalse(slow.ok)
+        self.assertTrue(fast.ok)
+
+    def test_check_types_rejects_doomed_jobs(self):
+        """Test con check_types un error de tipos seguro se rechaza sin ejecutar el trabajo."""
+        limits = JobLimits(check_types=True)
+        prelude = self.interpreter.snapshot(parse_source("let doble = function(x) { x * 2 };"))
+
+        doomed = execute(self.interpreter, Job("d", source="print('antes'); 1 + 'a';"), limits)
+        fine = execute(self.interpreter, Job("f", source="let n = 6; n * 7;"), limits)
+        external = execute(self.interpreter, Job("e", source="doble(21);"), limits, prelude=prelude)
+
+        self.assertFalse(doomed.ok)
+        self.assertEqual((doomed.error, doomed.output), ('Discrepancia de tipos: INTEGER + STRING', ''))
+        self.assertEqual(fine.result, "42")
+        self.assertEqual(external.result, "42")
+
+
+class TestLoadJobs(unittest.TestCase):
+    """Test suite para load_jobs."""
+
+    def test_directory_and_jsonl_sources(self):
+        """Test se cargan los *.lpp de un directorio y las líneas de un JSONL."""
+        with tempfile.TemporaryDirectory() as directory:
+            for name, source in (("b.lpp", "2;"), ("a.lpp", "1;"), ("notas.txt", "x")):
+                with open(os.path.join(directory, name), "w", encoding="utf-8") as script:
+                    script.write(source)
+            jsonl = os.path.join(directory, "jobs.jsonl")
+            with open(jsonl, "w", encoding="utf-8") as lines:
+                lines.write(json.dumps({"id": "x", "source": "3;"}) + "\n\n")
+                lines.write(json.dumps({"source": "4;"}) + "\n")
+
+            from_directory = list(load_jobs(directory))
+            from_jsonl = list(load_jobs(jsonl))
+
+        self.assertEqual([job.id for job in from_directory], ["a.lpp", "b.lpp"])
+        self.assertEqual([(job.id, job.source) for job in from_jsonl], [("x", "3;"), ("3", "4;")])
+
+
+class TestBatchRunner(unittest.TestCase):
+    """Test suite para BatchRunner con procesos reales."""
+
+    def test_runs_jobs_in_worker_pool(self):
+        """Test el pool ejecuta todos los trabajos, con fuente o con AST, y respeta el orden pedido."""
+        jobs = [Job(str(index), source=f"let x = {index}; x * x;") for index in range(20)]
+        jobs.append(Job("funcion", source="let f = function(x) { x }; f;"))
+        jobs.append(Job("malo", source="let = ;"))
+
+        with BatchRunner(workers=2, ship_ast=True) as runner:
+            results = list(runner.run(jobs, ordered=True))
+
+        self.assertEqual([result.id for result in results], [job.id for job in jobs])
+        self.assertEqual([result.result for result in results[:-2]], [str(index * index) for index in range(20)])
+        self.assertEqual(results[-2].result, "fn(x) x")
+        self.assertFalse(results[-1].ok)
+
+
+@unittest.skipUnless(hasattr(os, "fork"), "requiere os.fork")
+class TestForkServer(unittest.TestCase):
+    """Test suite para ForkServer y ForkServerClient con procesos reales."""
+
+    def _serve(self, jobs, **options):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "lpp.sock")
+        server = ForkServer(path, preludes=["let doble = function(x) { x * 2 };"], spare=2, **options)
+        process = multiprocessing.get_context("fork").Process(target=server.serve_forever, args=(jobs,))
+        process.start()
+        self.addCleanup(process.join, 10)
+        client = ForkServerClient(path)
+        client.wait_ready()
+        return client
+
+    def test_jobs_run_in_children_with_prelude(self):
+        """Test cada trabajo ve el preludio, captura su salida y no deja estado al siguiente."""
+        client = self._serve(3)
+
+        first = client.run("let x = 1; print(doble(x)); doble(21);", "a")
+        second = client.run("x;", "b")
+        syntax = client.run("let = ;", "c")
+
+        self.assertEqual((first.id, first.result, first.output), ("a", "42", "2\n"))
+        self.assertFalse(second.ok)
+        self.assertFalse(syntax.ok)
+
+    def test_limits_apply_in_children(self):
+        """Test el tiempo límite del servidor corta el trabajo del hijo."""
+        client = self._serve(1, limits=JobLimits(timeout=0.05))
+
+        result = client.run("while (true) { 1; }")
+
+        self.assertFalse(result.ok)
+        self.assertIn("Tiempo", result.error)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,174 @@
+"""Tests para la inferencia de tipos estática."""
+
+import unittest
+
+import src.astNode as ast
+from src.builtins import OutputSink
+from src.config.object import ObjectType
+from src.interpreter import Interpreter
+from src.lexer.lexer import Lexer
+from src.optimizer import infer_types
+from src.parser.parser_core import Parser
+
+
+def parse(source: str) -> ast.Program:
+    parser = Parser(Lexer(source))
+    program = parser.parse_program()
+    assert not parser.errors, parser.errors
+    return program
+
+
+def run(program: ast.Program):
+    output = OutputSink.capture()
+    result = Interpreter(output=output).interpret(program)
+    return result.inspect() if result is not None else None, output.getvalue()
+
+
+def assert_equivalent(test: unittest.TestCase, source: str, **options):
+    """Anota `source` y comprueba que da lo mismo que sin anotar; devuelve programa e informe."""
+    program = parse(source)
+    report = infer_types(program, **options)
+    test.assertEqual(run(program), run(parse(source)))
+    return program, report
+
+
+class TestTypeInference(unittest.TestCase):
+    """Test suite para infer_types."""
+
+    def test_expressions_over_bound_names_are_annotated(self):
+        """Test las variables ligadas antes y las operaciones sobre ellas reciben su tipo."""
+        program, report = assert_equivalent(self, '''
+            let n = 5;
+            let s = 'a';
+            [n * 2 + 1, s + 'b', n < 3, -n];
+        ''')
+
+        elements = program.statements[-1].expression.elements
+        self.assertEqual([element._static_type for element in elements],
+                         [ObjectType.INTEGER, ObjectType.STRING, ObjectType.BOOLEAN, ObjectType.INTEGER])
+        self.assertIs(elements[0].left.left._static_type, ObjectType.INTEGER)
+        self.assertGreater(report.annotated, 0)
+        self.assertEqual(report.errors, [])
+
+    def test_parameters_follow_call_sites_until_fixpoint(self):
+        """Test los parámetros toman el tipo de los argumentos, también en llamadas recursivas."""
+        program, report = assert_equivalent(self, '''
+            let fib = function(n) { if (n < 2) { return n; } fib(n - 1) + fib(n - 2) };
+            fib(15);
+        ''')
+
+        body = program.statements[0].value.body.statements
+        self.assertIs(body[0].expression.condition._static_type, ObjectType.BOOLEAN)
+        self.assertIs(body[1].expression._static_type, ObjectType.INTEGER)
+        self.assertIs(program.statements[-1].expression._static_type, ObjectType.INTEGER)
+        self.assertGreater(report.iterations, 1)
+
+    def test_uncertain_names_stay_unknown(self):
+        """Test no se anotan lecturas que pueden no estar ligadas, variables polimórficas ni funciones que escapan."""
+        program, _ = assert_equivalent(self, '''
+            let antes = function() { k + 1 };
+            let k = 1;
+            let v = 1;
+            let v = 'a';
+            let doble = function(x) { x * 2 };
+            let usa = function(y) { y + 1 };
+            [antes(), v + 'b', map([1, 2], doble), usa(1), usa('a')];
+        ''')
+
+        unknown = [
+            program.statements[0].value.body.statements[0].expression,
+            program.statements[-1].expression.elements[1],
+            program.statements[4].value.body.statements[0].expression,
+            program.statements[5].value.body.statements[0].expression,
+        ]
+        self.assertEqual([node._static_type for node in unknown], [None] * 4)
+
+    def test_library_and_external_names(self):
+        """Test un preludio no infiere parámetros globales y los nombres externos ocultan a los builtins."""
+        source = 'let doble = function(x) { x * 2 }; doble(3); for (i in range(3)) { i + 1 };'
+        plain, library, external = parse(source), parse(source), parse(source)
+
+        infer_types(plain)
+        infer_types(library, library=True)
+        infer_types(external, external=['range'])
+
+        self.assertIs(plain.statements[0].value.body.statements[0].expression._static_type, ObjectType.INTEGER)
+        self.assertIs(plain.statements[-1].body.statements[0].expression._static_type, ObjectType.INTEGER)
+        self.assertIsNone(library.statements[0].value.body.statements[0].expression._static_type)
+        self.assertIsNone(external.statements[-1].body.statements[0].expression._static_type)
+
+    def test_definite_errors_use_interpreter_messages(self):
+        """Test los errores seguros se informan con el mensaje del intérprete."""
+        program, report = assert_equivalent(self, '''
+            let nunca = function(x) { [1 + 'a', -'b', true + false, 5(1), nunca(1, 2), {[]: 1}, 1 / 0] };
+            let total = 1;
+            total;
+        ''')
+
+        self.assertEqual([error.message for error in report.errors], [
+            'Discrepancia de tipos: INTEGER + STRING',
+            'Operador desconocido: -STRING',
+            'Operador desconocido: BOOLEAN + BOOLEAN',
+            'No es una funcion: INTEGER',
+            'Número incorrecto de argumentos: se esperaban 1, se recibieron 2',
+            'Clave no hashable: ARRAY',
+            'División por cero',
+        ])
+        self.assertFalse(report.doomed)
+        self.assertEqual(run(program), ('1', ''))
+
+    def test_doomed_programs(self):
+        """Test un programa está condenado si una sentencia global falla seguro antes de un return global."""
+        doomed = infer_types(parse("print('antes'); let f = function(a) { a + 'x' }; f(1);"))
+        returns_first = infer_types(parse("if (true) { return 1; }; 1 + 'a';"))
+        maybe = infer_types(parse("let f = function(a) { a + 1 }; [f(1), f('x')];"))
+        unknown = infer_types(parse('desconocido;'))
+        external = infer_types(parse('desconocido;'), external=['desconocido'])
+
+        self.assertTrue(doomed.doomed)
+        self.assertEqual([error.message for error in doomed.errors], ['Discrepancia de tipos: INTEGER + STRING'])
+        self.assertFalse(returns_first.doomed)
+        self.assertFalse(maybe.doomed)
+        self.assertTrue(unknown.doomed)
+        self.assertFalse(external.doomed)
+
+    def test_returns_inside_operands_are_not_trusted(self):
+        """Test un if con return usado como operando no se trata como entero."""
+        program, _ = assert_equivalent(self, '''
+            let f = function(x) { let y = 1 + if (x) { return 5 } else { 2 }; y };
+            [f(true), f(false)];
+        ''')
+
+        self.assertIsNone(program.statements[0].value.body.statements[0].value._static_type)
+
+    def test_failing_while_conditions_reach_the_result(self):
+        """Test una condición de while que falla hace que la función pueda devolver un Error."""
+        for condition in ('nope', '1 / 0'):
+            with self.subTest(condition=condition):
+                program, _ = assert_equivalent(
+                    self, 'let f = function() { while (%s) { 1; } 5 }; f() + 1;' % condition)
+
+                self.assertIsNone(program.statements[-1].expression.left._static_type)
+                self.assertEqual(run(program)[0], 'Error: Discrepancia de tipos: ERROR + INTEGER')
+
+    def test_shared_subtrees_are_not_annotated_in_place(self):
+        """Test un árbol internado compartido con otro programa no recibe anotaciones ajenas."""
+        interner = ast.Interner()
+        first = parse("let n = 2; let f = function(x) { x * n }; f(3);")
+        second = parse("let n = 'a'; let f = function(x) { x * n }; f(3);")
+        interner.intern(first)
+        interner.intern(second)
+
+        infer_types(first)
+        interner.intern(first)
+        third = parse("let n = 2; let f = function(x) { x * n }; f(3);")
+        interner.intern(third)
+
+        products = [program.statements[1].value.body.statements[0].expression
+                    for program in (first, second, third)]
+        self.assertEqual([product._static_type for product in products], [ObjectType.INTEGER, None, None])
+        self.assertEqual(run(second)[0], 'Error: Discrepancia de tipos: INTEGER * STRING')
+
+
+if __name__ == '__main__':
+    unittest.main()